@@ -17,6 +17,7 @@
 
 """Craft Providers base package."""
 
+from .async_executor import AsyncExecutor
 from .base import Base
 from .errors import ProviderError
 from .executor import Executor
@@ -34,6 +35,7 @@ except ImportError:  # pragma: no cover
 
 __all__ = [
     "__version__",
+    "AsyncExecutor",
     "Base",
     "Executor",
     "ProviderError",
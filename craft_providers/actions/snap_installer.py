@@ -33,6 +33,7 @@ import pydantic
 import requests
 import requests_unixsocket  # type: ignore[import]
 
+from craft_providers import tracing
 from craft_providers.const import TIMEOUT_COMPLEX, TIMEOUT_SIMPLE
 from craft_providers.errors import (
     BaseConfigurationError,
@@ -96,23 +97,30 @@ def _download_host_snap(
     """Download the current host snap using snapd's APIs."""
     quoted_name = urllib.parse.quote(snap_name, safe="")
     url = f"http+unix://%2Frun%2Fsnapd.socket/v2/snaps/{quoted_name}/file"
-    try:
-        resp = requests_unixsocket.get(url)  # type: ignore[reportUnknownMemberType] # requests_unixsocket does not have good types
-    except requests.ConnectionError as error:
-        raise SnapInstallationError(
-            brief="Unable to connect to snapd service."
-        ) from error
+    with tracing.span(
+        category="snapd", name="snapd GET /v2/snaps/{name}/file", command=["GET", url]
+    ) as span:
+        try:
+            resp = requests_unixsocket.get(url)  # type: ignore[reportUnknownMemberType] # requests_unixsocket does not have good types
+        except requests.ConnectionError as error:
+            raise SnapInstallationError(
+                brief="Unable to connect to snapd service."
+            ) from error
 
-    try:
-        resp.raise_for_status()
-    except requests.HTTPError as error:
-        raise SnapInstallationError(
-            brief=f"Unable to download snap {snap_name!r} from snapd."
-        ) from error
+        if span is not None:
+            span.exit_code = resp.status_code
+        try:
+            resp.raise_for_status()
+        except requests.HTTPError as error:
+            raise SnapInstallationError(
+                brief=f"Unable to download snap {snap_name!r} from snapd."
+            ) from error
 
-    with output.open("wb") as stream:
-        for chunk in resp.iter_content(chunk_size):
-            stream.write(chunk)
+        with output.open("wb") as stream:
+            for chunk in resp.iter_content(chunk_size):
+                stream.write(chunk)
+                if span is not None:
+                    span.add_bytes_out(len(chunk))
 
 
 def _pack_host_snap(*, snap_name: str, output: pathlib.Path) -> None:
@@ -131,12 +139,18 @@ def get_host_snap_info(snap_name: str) -> SnapInfo:
     """Get info about a snap installed on the host."""
     quoted_name = urllib.parse.quote(snap_name, safe="")
     url = f"http+unix://%2Frun%2Fsnapd.socket/v2/snaps/{quoted_name}"
-    try:
-        snap_info = requests_unixsocket.get(url)  # type: ignore[reportUnknownMemberType] # requests_unixsocket does not have good types
-    except requests.ConnectionError as error:
-        raise SnapInstallationError(
-            brief="Unable to connect to snapd service."
-        ) from error
+    with tracing.span(
+        category="snapd", name="snapd GET /v2/snaps/{name}", command=["GET", url]
+    ) as span:
+        try:
+            snap_info = requests_unixsocket.get(url)  # type: ignore[reportUnknownMemberType] # requests_unixsocket does not have good types
+        except requests.ConnectionError as error:
+            raise SnapInstallationError(
+                brief="Unable to connect to snapd service."
+            ) from error
+        if span is not None:
+            span.exit_code = snap_info.status_code
+            span.add_bytes_out(len(snap_info.content))
     snap_info.raise_for_status()
     result = snap_info.json()["result"]
     return SnapInfo.model_validate(result)
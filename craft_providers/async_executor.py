@@ -0,0 +1,341 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Executor for asyncio event loops.
+
+Each call spawns its host process with `asyncio.create_subprocess_exec()` and
+waits for it on the event loop, so hundreds of commands can run concurrently
+without a thread per command.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import shlex
+import subprocess
+import uuid
+from abc import ABC, abstractmethod
+from typing import IO, TYPE_CHECKING, Any, ClassVar, cast
+
+from craft_providers import tracing
+from craft_providers.const import TIMEOUT_SIMPLE
+from craft_providers.errors import ProviderError, details_from_called_process_error
+from craft_providers.executor import PUSH_FILE_SCRIPT
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import AsyncIterator, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from a stream at a time when pushing a file.
+PUSH_CHUNK_SIZE = 1024 * 1024
+
+
+def _is_file_not_found(stderr: bytes) -> bool:
+    """Check if a command failed because a file does not exist."""
+    return b"no such file" in stderr.lower()
+
+
+async def _terminate(process: asyncio.subprocess.Process) -> None:
+    """Kill a process that is still running and reap it."""
+    if process.returncode is None:
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+
+
+class AsyncExecutor(ABC):
+    """Interfaces to execute commands and move data in/out of an environment.
+
+    The counterpart of `Executor` for asyncio event loops. Other operations,
+    such as launching, are done with the synchronous executor.
+
+    The number of host processes running at once is capped by
+    ``max_processes``, so gathering many calls does not spawn them all at once.
+
+    :param instance_name: Name of the environment.
+    :param max_processes: Maximum number of host processes to run
+        concurrently, or None for no limit.
+
+    :cvar error_class: Error raised when a file cannot be transferred.
+    :cvar trace_category: Category of the traced calls, e.g. 'lxc'.
+    """
+
+    error_class: ClassVar[type[ProviderError]] = ProviderError
+    trace_category: ClassVar[str] = "exec"
+
+    def __init__(self, *, instance_name: str, max_processes: int | None = None) -> None:
+        self.instance_name = instance_name
+        self._process_slots: asyncio.Semaphore | None = (
+            asyncio.Semaphore(max_processes) if max_processes else None
+        )
+
+    @contextlib.asynccontextmanager
+    async def _process(self, command: list[str]) -> AsyncIterator[tracing.Span | None]:
+        """Wait for a free process slot, then trace the host process.
+
+        :param command: Host command of the process.
+
+        :returns: The span of the process, or None if tracing is disabled.
+        """
+        logger.debug("Executing on host: %s", shlex.join(command))
+        async with self._process_slots or contextlib.nullcontext():
+            with tracing.span(
+                category=self.trace_category,
+                name=f"{self.trace_category} exec",
+                command=command,
+                instance=self.instance_name,
+            ) as span:
+                yield span
+
+    @abstractmethod
+    def get_exec_command(
+        self,
+        command: list[str],
+        *,
+        cwd: pathlib.PurePath | None = None,
+        env: dict[str, str | None] | None = None,
+    ) -> list[str]:
+        """Get the host command executing a command in the environment.
+
+        :param command: Command to execute.
+        :param cwd: Working directory for the process inside the environment.
+        :param env: Additional environment to set for process.
+
+        :returns: The host command.
+        """
+
+    async def execute_run(
+        self,
+        command: list[str],
+        *,
+        cwd: pathlib.PurePath | None = None,
+        env: dict[str, str | None] | None = None,
+        timeout: float | None = None,
+        check: bool = False,
+        capture_output: bool = False,
+        text: bool = False,
+        input: str | bytes | None = None,  # noqa: A002, shadows builtin like subprocess.run
+    ) -> subprocess.CompletedProcess[Any]:
+        """Execute a command in the environment, like `Executor.execute_run()`.
+
+        Unlike `subprocess.run()`, stdin is not inherited: it is empty unless
+        `input` is set, as commands running concurrently cannot share it.
+
+        :param command: Command to execute.
+        :param cwd: Working directory for the process inside the environment.
+        :param env: Additional environment to set for process.
+        :param timeout: Timeout (in seconds) for the command.
+        :param check: Raise an exception if the command fails.
+        :param capture_output: Capture stdout and stderr.
+        :param text: Decode the input and output as text.
+        :param input: Data to send to the stdin of the command.
+
+        :returns: Completed process.
+
+        :raises subprocess.CalledProcessError: if command fails and check is True.
+        :raises subprocess.TimeoutExpired: if the command times out. It is killed.
+        """
+        final_cmd = self.get_exec_command(command, cwd=cwd, env=env)
+        data = input.encode() if isinstance(input, str) else input
+        output = subprocess.PIPE if capture_output else None
+
+        async with self._process(final_cmd) as span:
+            process = await asyncio.create_subprocess_exec(
+                *final_cmd,
+                stdin=subprocess.DEVNULL if data is None else subprocess.PIPE,
+                stdout=output,
+                stderr=output,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(data), timeout
+                )
+            except asyncio.TimeoutError as error:
+                raise subprocess.TimeoutExpired(
+                    final_cmd, cast(float, timeout)
+                ) from error
+            finally:
+                await _terminate(process)
+
+            returncode = cast(int, process.returncode)
+            if span is not None:
+                span.exit_code = returncode
+                if data is not None:
+                    span.add_bytes_in(len(data))
+                for output_data in (stdout, stderr):
+                    if output_data is not None:
+                        span.add_bytes_out(len(output_data))
+
+        result: subprocess.CompletedProcess[Any] = subprocess.CompletedProcess(
+            final_cmd,
+            returncode,
+            stdout.decode() if text and stdout is not None else stdout,
+            stderr.decode() if text and stderr is not None else stderr,
+        )
+        if check:
+            result.check_returncode()
+        return result
+
+    async def push_file_io(
+        self,
+        *,
+        destination: pathlib.PurePath,
+        content: IO[bytes] | Iterable[bytes],
+        file_mode: str,
+        group: str = "root",
+        user: str = "root",
+    ) -> None:
+        """Create or replace file with content and file mode.
+
+        The content is streamed through the stdin of a single exec, which also
+        sets the mode and owner. Once the content is written, the exec is given
+        a limited time to finish.
+
+        :param destination: Path to file.
+        :param content: Contents of file, as a readable binary stream or an
+            iterable of bytes.
+        :param file_mode: File mode string (e.g. '0644').
+        :param group: File group owner/id.
+        :param user: File user owner/id.
+
+        :raises ProviderError: On unexpected error or timeout, as `error_class`.
+        """
+        brief = (
+            f"Failed to create file {destination.as_posix()!r}"
+            f" in instance {self.instance_name!r}."
+        )
+        command = [
+            "sh",
+            "-c",
+            PUSH_FILE_SCRIPT,
+            "sh",
+            destination.as_posix(),
+            file_mode,
+            f"{user}:{group}",
+        ]
+        final_cmd = self.get_exec_command(command)
+        if hasattr(content, "read"):
+            stream = cast("IO[bytes]", content)
+            chunks: Iterable[bytes] = iter(lambda: stream.read(PUSH_CHUNK_SIZE), b"")
+        else:
+            chunks = cast("Iterable[bytes]", content)
+
+        async with self._process(final_cmd) as span:
+            process = await asyncio.create_subprocess_exec(
+                *final_cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+            stdin = cast(asyncio.StreamWriter, process.stdin)
+            try:
+                for chunk in chunks:
+                    stdin.write(chunk)
+                    await stdin.drain()
+                    if span is not None:
+                        span.add_bytes_in(len(chunk))
+                stdin.close()
+            except (BrokenPipeError, ConnectionResetError):
+                # the command failed early, the error is reported below
+                pass
+            except BaseException:
+                await _terminate(process)
+                raise
+
+            try:
+                _, stderr = await asyncio.wait_for(
+                    process.communicate(), TIMEOUT_SIMPLE
+                )
+            except asyncio.TimeoutError:
+                await _terminate(process)
+                expired = subprocess.TimeoutExpired(command, TIMEOUT_SIMPLE)
+                raise self.error_class(brief=brief, details=str(expired)) from expired
+            returncode = cast(int, process.returncode)
+            if span is not None:
+                span.exit_code = returncode
+
+        if returncode != 0:
+            error = subprocess.CalledProcessError(returncode, command, stderr=stderr)
+            raise self.error_class(
+                brief=brief, details=details_from_called_process_error(error)
+            ) from error
+
+    async def pull_file(
+        self, *, source: pathlib.PurePath, destination: pathlib.Path
+    ) -> None:
+        """Copy a file from the environment to host.
+
+        The file is read with `cat` in the environment and written by the host
+        process as it arrives, to a temporary file next to the destination. The
+        destination is only replaced once the whole file is pulled.
+
+        :param source: Environment file to copy.
+        :param destination: Host file path to copy to.  Parent directory
+            (destination.parent) must exist.
+
+        :raises FileNotFoundError: If source file or destination's parent
+            directory does not exist.
+        :raises ProviderError: On unexpected error, as `error_class`.
+        """
+        if not destination.parent.is_dir():
+            raise FileNotFoundError(f"Directory not found: {str(destination.parent)!r}")
+
+        command = ["cat", "--", source.as_posix()]
+        final_cmd = self.get_exec_command(command)
+        partial = destination.with_name(
+            f".{destination.name}.{uuid.uuid4().hex}.partial"
+        )
+
+        try:
+            async with self._process(final_cmd) as span:
+                with partial.open("xb") as stream:
+                    process = await asyncio.create_subprocess_exec(
+                        *final_cmd,
+                        stdin=subprocess.DEVNULL,
+                        stdout=stream,
+                        stderr=subprocess.PIPE,
+                    )
+                    try:
+                        _, stderr = await process.communicate()
+                    finally:
+                        await _terminate(process)
+                    returncode = cast(int, process.returncode)
+                    if span is not None:
+                        span.exit_code = returncode
+                        span.add_bytes_out(os.fstat(stream.fileno()).st_size)
+
+            if returncode == 0:
+                partial.replace(destination)
+                return
+        finally:
+            partial.unlink(missing_ok=True)
+
+        if _is_file_not_found(stderr):
+            raise FileNotFoundError(f"File not found: {source.as_posix()!r}")
+        error = subprocess.CalledProcessError(returncode, command, stderr=stderr)
+        raise self.error_class(
+            brief=(
+                f"Failed to pull file {source.as_posix()!r}"
+                f" from instance {self.instance_name!r}."
+            ),
+            details=details_from_called_process_error(error),
+        ) from error
@@ -19,6 +19,9 @@
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
+import dataclasses
 import io
 import logging
 import math
@@ -27,12 +30,14 @@ import pathlib
 import re
 import subprocess
 import sys
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, final, overload
 
 from pydantic import ValidationError
+from typing_extensions import override
 
 from craft_providers.actions import snap_installer
 from craft_providers.actions.snap_installer import Snap, SnapInstallationError
@@ -49,20 +54,98 @@ from craft_providers.errors import (
     ProviderError,
     details_from_called_process_error,
 )
+from craft_providers.executor import FileEntry
 from craft_providers.instance_config import InstanceConfiguration
+from craft_providers.phases import PhaseEmitter, PhaseObserver
 from craft_providers.util import retry
 from craft_providers.util.os_release import OS_RELEASE_FILE, parse_os_release
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from craft_providers.executor import Executor
 
 logger = logging.getLogger(__name__)
 
 # Needed until on Python 3.12 - see https://github.com/microsoft/pyright/issues/6750.
 _T_enum_co = TypeVar("_T_enum_co", covariant=True, bound=Enum)
+_T = TypeVar("_T")
+
+# The kinds of waits of a base, each retried with its own policy:
+# - os_release: reading /etc/os-release, which fails while the instance is busy
+# - system_ready: waiting for systemd to finish booting the instance
+# - network: waiting for the network of the instance to be up
+# - snap_refresh: waiting for snap refreshes to complete
+# - http: requests to servers outside the instance
+RetryWait = Literal["os_release", "system_ready", "network", "snap_refresh", "http"]
+
+
+@dataclasses.dataclass
+class RunContext:
+    """State of one setup or warmup of an instance.
+
+    A base configuration can set up several instances at once, one per thread,
+    so the state of each run is kept here rather than on the base.
+
+    :param executor: The instance being set up, or None outside of a run.
+    :param simple_timeout: Timeout of simple operations, before the deadline.
+    :param complex_timeout: Timeout of complex operations, before the deadline.
+    :param unpredictable_timeout: Timeout of unpredictable operations, before
+        the deadline.
+    :param deadline: Time, as returned by `time.monotonic()`, by which the run
+        must be done, or None.
+    :param os_release: The os-release of the instance, once read.
+    """
+
+    executor: Executor | None = None
+    simple_timeout: float | None = TIMEOUT_SIMPLE
+    complex_timeout: float | None = TIMEOUT_COMPLEX
+    unpredictable_timeout: float | None = TIMEOUT_UNPREDICTABLE
+    deadline: float | None = None
+    os_release: dict[str, str] | None = None
+
+    @property
+    def timeout_simple(self) -> float | None:
+        """Timeout of simple operations, e.g. running a command."""
+        return self._until_deadline(self.simple_timeout)
+
+    @property
+    def timeout_complex(self) -> float | None:
+        """Timeout of complex operations, e.g. installing a snap."""
+        return self._until_deadline(self.complex_timeout)
+
+    @property
+    def timeout_unpredictable(self) -> float | None:
+        """Timeout of unpredictable operations, e.g. upgrading packages."""
+        return self._until_deadline(self.unpredictable_timeout)
+
+    def check_deadline(self) -> None:
+        """Check that the deadline of the run has not passed.
+
+        :raises BaseConfigurationError: if the deadline has passed.
+        """
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise BaseConfigurationError(
+                brief="Timed out configuring environment.",
+                details="The deadline of the setup has passed.",
+            )
+
+    def _until_deadline(self, timeout: float | None) -> float | None:
+        """Shorten a timeout so that it does not go past the deadline."""
+        if self.deadline is None:
+            return timeout
+        self.check_deadline()
+        remaining = self.deadline - time.monotonic()
+        return remaining if timeout is None else min(timeout, remaining)
+
+
+# The base and state of the run in progress in the current thread, if any.
+_current_run: contextvars.ContextVar[tuple[Base[Any], RunContext] | None] = (
+    contextvars.ContextVar("craft_providers_base_run", default=None)
+)
 
 
-class Base(ABC, Generic[_T_enum_co]):
+class Base(PhaseEmitter, ABC, Generic[_T_enum_co]):
     """Interface for providers to configure instantiated environments.
 
     Defines how to setup/configure an environment that has been instantiated by
@@ -78,6 +161,16 @@ class Base(ABC, Generic[_T_enum_co]):
     installed applications, networking configuration, etc.  This includes any
     environment configuration that the application will assume is available.
 
+    Observers added with `add_phase_observer()` are called at the start and end
+    of `setup()`, `warmup()` and each of their steps, e.g. 'setup_os'. The
+    phases of a run are also reported to the phase observers of its executor,
+    so the runs of each instance can be observed separately.
+
+    A base configuration can set up or warm up several instances at once, each
+    from its own thread. The timeouts and other state of each run are kept in a
+    `RunContext`, available to the steps as `_run_context`, rather than on the
+    base configuration itself.
+
     :cvar compatibility_tag: Tag/Version for variant of build configuration and
         setup.  Any change to this version would indicate that prior [versioned]
         instances are incompatible and must be cleaned.  As such, any new value
@@ -235,9 +328,139 @@ class Base(ABC, Generic[_T_enum_co]):
 
         logger.debug("Instance has already been setup.")
 
+    @property
+    def _run_context(self) -> RunContext:
+        """The state of the setup or warmup in progress in the current thread.
+
+        Outside of a run, a new context with the default timeouts of the base
+        configuration is returned.
+        """
+        current = _current_run.get()
+        if current is not None and current[0] is self:
+            return current[1]
+        return RunContext(
+            simple_timeout=self._timeout_simple,
+            complex_timeout=self._timeout_complex,
+            unpredictable_timeout=self._timeout_unpredictable,
+        )
+
+    @contextlib.contextmanager
+    def _run(
+        self,
+        executor: Executor,
+        *,
+        timeout: float | None,
+        deadline: float | None,
+    ) -> Iterator[RunContext]:
+        """Start a setup or warmup of an instance in the current thread.
+
+        :param executor: Executor for target container.
+        :param timeout: Timeout in seconds of unpredictable operations, or None
+            for no timeouts.
+        :param deadline: Time, as returned by `time.monotonic()`, by which the
+            run must be done, or None.
+
+        :raises BaseConfigurationError: if the timeout is invalid.
+        """
+        if timeout is None:
+            run = RunContext(
+                executor=executor,
+                simple_timeout=None,
+                complex_timeout=None,
+                unpredictable_timeout=None,
+                deadline=deadline,
+            )
+        elif timeout > 0:
+            run = RunContext(
+                executor=executor,
+                simple_timeout=self._timeout_simple,
+                complex_timeout=self._timeout_complex,
+                unpredictable_timeout=timeout,
+                deadline=deadline,
+            )
+        else:
+            raise BaseConfigurationError(f"Invalid timeout value: {timeout}")
+
+        token = _current_run.set((self, run))
+        try:
+            yield run
+        finally:
+            _current_run.reset(token)
+
+    @override
+    def _current_phase_observers(self) -> tuple[PhaseObserver, ...]:
+        """Get the observers of the base and of the executor of the current run."""
+        observers = self._phase_observers
+        executor = self._run_context.executor
+        if isinstance(executor, PhaseEmitter) and executor.phase_observers:
+            # the observers of the base are often added to the executor too
+            observers = tuple(dict.fromkeys((*observers, *executor.phase_observers)))
+        return observers
+
+    def _get_retry_policy(self, wait: RetryWait) -> retry.RetryPolicy:
+        """Get the policy to retry a kind of wait.
+
+        The default policies are multiples of `_retry_wait`. Override this method
+        to tune them.
+
+        :param wait: The kind of wait.
+
+        :returns: The retry policy.
+        """
+        retry_wait = self._retry_wait
+        if wait == "os_release":
+            # usually succeeds at once, so only retry quickly for a short time
+            return retry.FastThenSlow(
+                fast_delay=retry_wait / 5, fast_attempts=10, slow_delay=retry_wait * 2
+            )
+        if wait == "system_ready":
+            # booting takes seconds, so back off but notice the end of the boot soon
+            return retry.ExponentialBackoff(
+                initial=retry_wait / 2, maximum=retry_wait * 4
+            )
+        if wait == "network":
+            return retry.ExponentialBackoff(initial=retry_wait, maximum=retry_wait * 8)
+        if wait == "snap_refresh":
+            # snapd is briefly unavailable after a restart
+            return retry.FastThenSlow(
+                fast_delay=retry_wait, fast_attempts=4, slow_delay=retry_wait * 8
+            )
+        # spread out the requests of concurrent setups to the same server
+        return retry.ExponentialBackoff(
+            initial=retry_wait * 4, maximum=retry_wait * 40, jitter=0.5
+        )
+
+    def _retry(
+        self,
+        wait: RetryWait,
+        func: Callable[[float], _T],
+        *,
+        timeout: float,
+        error: Exception | None = None,
+    ) -> _T:
+        """Retry a function with the policy of a kind of wait.
+
+        :param wait: The kind of wait.
+        :param func: The function to retry, see `retry.retry_until_timeout()`.
+        :param timeout: The length of time (in seconds) before timeout.
+        :param error: Exception to raise on timeout or None to pass the error
+            unchanged.
+
+        :returns: The result of the function.
+        """
+        stats = retry.RetryStats()
+        try:
+            return retry.retry_until_timeout(
+                timeout, self._get_retry_policy(wait), func, error=error, stats=stats
+            )
+        finally:
+            logger.debug("Wait for %s %s", wait.replace("_", " "), stats)
+
     def get_os_release(self, executor: Executor) -> dict[str, str]:
         """Get the OS release information from an instance's /etc/os-release.
 
+        During a setup or warmup, the file is only read once from the instance.
+
         :returns: Dictionary of key-mappings found in os-release.
         """
 
@@ -268,14 +491,18 @@ class Base(ABC, Generic[_T_enum_co]):
                 )
             return proc.stdout
 
-        return parse_os_release(
-            retry.retry_until_timeout(
-                self._timeout_simple or TIMEOUT_SIMPLE,
-                self._retry_wait,
-                getter,
-                error=None,
+        run = self._run_context
+        if run.executor is executor and run.os_release is not None:
+            return run.os_release.copy()
+
+        os_release = parse_os_release(
+            self._retry(
+                "os_release", getter, timeout=run.timeout_simple or TIMEOUT_SIMPLE
             )
         )
+        if run.executor is executor:
+            run.os_release = os_release.copy()
+        return os_release
 
     @abstractmethod
     def _ensure_os_compatible(self, executor: Executor) -> None:
@@ -312,8 +539,8 @@ class Base(ABC, Generic[_T_enum_co]):
             config_path=self._instance_config_path,
         )
 
-    def _setup_environment(self, executor: Executor) -> None:
-        """Configure /etc/environment.
+    def _setup_environment(self) -> FileEntry:
+        """Get /etc/environment, created with the other setup files.
 
         If environment is None, reset /etc/environment to the default.
         """
@@ -324,12 +551,29 @@ class Base(ABC, Generic[_T_enum_co]):
             + "\n"
         ).encode()
 
-        executor.push_file_io(
-            destination=pathlib.PurePosixPath("/etc/environment"),
-            content=io.BytesIO(content),
-            file_mode="0644",
+        return FileEntry(
+            destination=pathlib.PurePosixPath("/etc/environment"), content=content
         )
 
+    def _get_hostname_file(self) -> FileEntry:
+        """Get /etc/hostname."""
+        return FileEntry(
+            destination=pathlib.PurePosixPath("/etc/hostname"),
+            content=(self._hostname + "\n").encode(),
+        )
+
+    def _get_setup_files(self) -> list[FileEntry]:
+        """Get the files to create when setting up the OS.
+
+        The files are created in a single batch, which is much cheaper than
+        pushing them one at a time. Later setup steps rely on them, e.g. the
+        hostname is set from /etc/hostname.
+
+        This should be extended to add files that only depend on the base
+        configuration.
+        """
+        return [self._setup_environment(), self._get_hostname_file()]
+
     def _setup_wait_for_system_ready(self, executor: Executor) -> None:
         """Wait until system is ready."""
         logger.debug("Waiting for environment to be ready...")
@@ -351,26 +595,31 @@ class Base(ABC, Generic[_T_enum_co]):
         error = BaseConfigurationError(
             brief="Timed out waiting for environment to be ready."
         )
-        retry.retry_until_timeout(
-            self._timeout_simple or TIMEOUT_SIMPLE,
-            self._retry_wait,
+        self._retry(
+            "system_ready",
             assert_running,
+            timeout=self._run_context.timeout_simple or TIMEOUT_SIMPLE,
             error=error,
         )
 
     def setup_hostname(self, executor: Executor) -> None:
         """Configure hostname, installing /etc/hostname."""
+        hostname_file = self._get_hostname_file()
         executor.push_file_io(
-            destination=pathlib.PurePosixPath("/etc/hostname"),
-            content=io.BytesIO((self._hostname + "\n").encode()),
-            file_mode="0644",
+            destination=hostname_file.destination,
+            content=io.BytesIO(hostname_file.content),
+            file_mode=hostname_file.file_mode,
         )
 
+        self._apply_hostname(executor=executor)
+
+    def _apply_hostname(self, executor: Executor) -> None:
+        """Set the hostname from /etc/hostname."""
         try:
             self._execute_run(
                 ["hostname", "-F", "/etc/hostname"],
                 executor=executor,
-                timeout=self._timeout_simple,
+                timeout=self._run_context.timeout_simple,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -378,16 +627,12 @@ class Base(ABC, Generic[_T_enum_co]):
                 details=details_from_called_process_error(error),
             ) from error
 
-    def _setup_networkd(self, executor: Executor) -> None:
-        """Configure networkd and start it.
-
-        Installs eth0 network configuration using ipv4.
-        """
-        executor.push_file_io(
+    def _get_networkd_file(self) -> FileEntry:
+        """Get the eth0 network configuration for networkd, using ipv4."""
+        return FileEntry(
             destination=pathlib.PurePosixPath("/etc/systemd/network/10-eth0.network"),
-            content=io.BytesIO(
-                dedent(
-                    """\
+            content=dedent(
+                """\
                 [Match]
                 Name=eth0
 
@@ -399,21 +644,35 @@ class Base(ABC, Generic[_T_enum_co]):
                 RouteMetric=100
                 UseMTU=true
                 """
-                ).encode()
-            ),
-            file_mode="0644",
+            ).encode(),
         )
 
+    def _setup_networkd(self, executor: Executor) -> None:
+        """Configure networkd and start it.
+
+        Installs eth0 network configuration using ipv4.
+        """
+        networkd_file = self._get_networkd_file()
+        executor.push_file_io(
+            destination=networkd_file.destination,
+            content=io.BytesIO(networkd_file.content),
+            file_mode=networkd_file.file_mode,
+        )
+
+        self._start_networkd(executor=executor)
+
+    def _start_networkd(self, executor: Executor) -> None:
+        """Enable and restart networkd."""
         try:
             self._execute_run(
                 ["systemctl", "enable", "systemd-networkd"],
                 executor=executor,
-                timeout=self._timeout_simple,
+                timeout=self._run_context.timeout_simple,
             )
             self._execute_run(
                 ["systemctl", "restart", "systemd-networkd"],
                 executor=executor,
-                timeout=self._timeout_simple,
+                timeout=self._run_context.timeout_simple,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -430,18 +689,20 @@ class Base(ABC, Generic[_T_enum_co]):
                 "/run/systemd/resolve/resolv.conf",
                 "/etc/resolv.conf",
             ]
-            self._execute_run(command, executor=executor, timeout=self._timeout_simple)
+            self._execute_run(
+                command, executor=executor, timeout=self._run_context.timeout_simple
+            )
 
             self._execute_run(
                 ["systemctl", "enable", "systemd-resolved"],
                 executor=executor,
-                timeout=self._timeout_simple,
+                timeout=self._run_context.timeout_simple,
             )
 
             self._execute_run(
                 ["systemctl", "restart", "systemd-resolved"],
                 executor=executor,
-                timeout=self._timeout_simple,
+                timeout=self._run_context.timeout_simple,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -462,10 +723,10 @@ class Base(ABC, Generic[_T_enum_co]):
         error = BaseConfigurationError(
             brief="Timed out waiting for networking to be ready."
         )
-        retry.retry_until_timeout(
-            self._timeout_simple or math.inf,
-            self._retry_wait,
+        self._retry(
+            "network",
             check_network,
+            timeout=self._run_context.timeout_simple or math.inf,
             error=error,
         )
 
@@ -478,7 +739,7 @@ class Base(ABC, Generic[_T_enum_co]):
                 capture_output=True,
                 check=False,
                 text=True,
-                timeout=self._timeout_simple,
+                timeout=self._run_context.timeout_simple,
             )
 
             state = proc.stdout.strip()
@@ -568,7 +829,9 @@ class Base(ABC, Generic[_T_enum_co]):
                 if http_proxy
                 else ["snap", "unset", "system", "proxy.http"]
             )
-            self._execute_run(command, executor=executor, timeout=self._timeout_simple)
+            self._execute_run(
+                command, executor=executor, timeout=self._run_context.timeout_simple
+            )
 
             https_proxy = self._environment.get("https_proxy")
             command = (
@@ -576,7 +839,9 @@ class Base(ABC, Generic[_T_enum_co]):
                 if https_proxy
                 else ["snap", "unset", "system", "proxy.https"]
             )
-            self._execute_run(command, executor=executor, timeout=self._timeout_simple)
+            self._execute_run(
+                command, executor=executor, timeout=self._run_context.timeout_simple
+            )
 
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -602,7 +867,7 @@ class Base(ABC, Generic[_T_enum_co]):
                 ["snap", "refresh", "--hold"],
                 capture_output=True,
                 check=True,
-                timeout=self._timeout_simple,
+                timeout=self._run_context.timeout_simple,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -625,10 +890,10 @@ class Base(ABC, Generic[_T_enum_co]):
             # There is a small time window after restarting the snapd service where snapd
             # claims it's ready but actually isn't (SNAPDENG-36387). The workaround is to
             # retry.
-            retry.retry_until_timeout(
-                self._timeout_complex or TIMEOUT_COMPLEX,
-                self._retry_wait,
+            self._retry(
+                "snap_refresh",
                 snap_watch,
+                timeout=self._run_context.timeout_complex or TIMEOUT_COMPLEX,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -765,9 +1030,13 @@ class Base(ABC, Generic[_T_enum_co]):
     def _setup_os(self, executor: Executor) -> None:
         """Set up the OS environment.
 
+        Creates the files from `_get_setup_files()`, including /etc/hostname,
+        which `_setup_network()` applies. An override that does not call this
+        method must create /etc/hostname itself.
+
         This step should be overridden when needed.
         """
-        self._setup_environment(executor=executor)
+        executor.push_files(self._get_setup_files())
 
     def _post_setup_os(self, executor: Executor) -> None:
         """Do anything after setting up the OS.
@@ -798,9 +1067,11 @@ class Base(ABC, Generic[_T_enum_co]):
         If only part of it needs to be modified you should override only the
         corresponding function.
 
+        The hostname is set from /etc/hostname, created by `_setup_os()`.
+
         This step usually does not need to be overridden.
         """
-        self.setup_hostname(executor=executor)
+        self._apply_hostname(executor=executor)
 
     def _post_setup_network(self, executor: Executor) -> None:
         """Do anything after setting up the basic network.
@@ -1008,6 +1279,14 @@ class Base(ABC, Generic[_T_enum_co]):
         """
         executor.execute_run(["chmod", "go+x", "/root"])
 
+    def _run_phase(
+        self, name: str, step: Callable[..., None], executor: Executor
+    ) -> None:
+        """Run a step of the setup or warmup as a phase."""
+        self._run_context.check_deadline()
+        with self._phase(name):
+            step(executor=executor)
+
     @final
     def setup(
         self,
@@ -1015,6 +1294,7 @@ class Base(ABC, Generic[_T_enum_co]):
         executor: Executor,
         timeout: float | None = TIMEOUT_UNPREDICTABLE,
         mount_cache: bool = True,
+        deadline: float | None = None,
     ) -> None:
         """Prepare base instance for use by the application.
 
@@ -1031,62 +1311,69 @@ class Base(ABC, Generic[_T_enum_co]):
         :param executor: Executor for target container.
         :param timeout: Timeout in seconds.
         :param mount_cache: If true, mount the cache directories.
+        :param deadline: Time, as returned by `time.monotonic()`, by which the
+            setup must be done.
 
         :raises BaseCompatibilityError: if instance is incompatible.
         :raises BaseConfigurationError: on other unexpected error.
         """
-        if timeout is None:
-            self._timeout_simple = None
-            self._timeout_complex = None
-            self._timeout_unpredictable = None
-        elif timeout > 0:
-            self._timeout_unpredictable = timeout
-        else:
-            raise BaseConfigurationError(f"Invalid timeout value: {timeout}")
-
-        self._update_setup_status(executor=executor, status=False)
-
-        self._pre_image_check(executor=executor)
-        self._image_check(executor=executor)
-        self._post_image_check(executor=executor)
-
-        self._update_compatibility_tag(executor=executor)
+        with (
+            self._run(executor, timeout=timeout, deadline=deadline),
+            self._phase("setup"),
+        ):
+            self._update_setup_status(executor=executor, status=False)
+
+            self._run_phase("pre_image_check", self._pre_image_check, executor)
+            self._run_phase("image_check", self._image_check, executor)
+            self._run_phase("post_image_check", self._post_image_check, executor)
+
+            self._run_phase(
+                "update_compatibility_tag", self._update_compatibility_tag, executor
+            )
 
-        if mount_cache:
-            self._mount_shared_cache_dirs(executor=executor)
+            if mount_cache:
+                self._run_phase(
+                    "mount_shared_cache_dirs", self._mount_shared_cache_dirs, executor
+                )
 
-        self._pre_setup_os(executor=executor)
-        self._setup_os(executor=executor)
-        self._post_setup_os(executor=executor)
+            self._run_phase("pre_setup_os", self._pre_setup_os, executor)
+            self._run_phase("setup_os", self._setup_os, executor)
+            self._run_phase("post_setup_os", self._post_setup_os, executor)
 
-        self._setup_wait_for_system_ready(executor=executor)
+            self._run_phase(
+                "setup_wait_for_system_ready",
+                self._setup_wait_for_system_ready,
+                executor,
+            )
 
-        self.setup_permissions(executor=executor)
+            self._run_phase("setup_permissions", self.setup_permissions, executor)
 
-        self._pre_setup_network(executor=executor)
-        self._setup_network(executor=executor)
-        self._post_setup_network(executor=executor)
+            self._run_phase("pre_setup_network", self._pre_setup_network, executor)
+            self._run_phase("setup_network", self._setup_network, executor)
+            self._run_phase("post_setup_network", self._post_setup_network, executor)
 
-        self._setup_wait_for_network(executor=executor)
+            self._run_phase(
+                "setup_wait_for_network", self._setup_wait_for_network, executor
+            )
 
-        self._pre_setup_packages(executor=executor)
-        self._setup_packages(executor=executor)
-        self._post_setup_packages(executor=executor)
+            self._run_phase("pre_setup_packages", self._pre_setup_packages, executor)
+            self._run_phase("setup_packages", self._setup_packages, executor)
+            self._run_phase("post_setup_packages", self._post_setup_packages, executor)
 
-        self._pre_setup_snapd(executor=executor)
-        self._setup_snapd(executor=executor)
-        self._post_setup_snapd(executor=executor)
+            self._run_phase("pre_setup_snapd", self._pre_setup_snapd, executor)
+            self._run_phase("setup_snapd", self._setup_snapd, executor)
+            self._run_phase("post_setup_snapd", self._post_setup_snapd, executor)
 
-        self._pre_setup_snaps(executor=executor)
-        self._setup_snaps(executor=executor)
-        self._post_setup_snaps(executor=executor)
+            self._run_phase("pre_setup_snaps", self._pre_setup_snaps, executor)
+            self._run_phase("setup_snaps", self._setup_snaps, executor)
+            self._run_phase("post_setup_snaps", self._post_setup_snaps, executor)
 
-        self._pre_clean_up(executor=executor)
-        self._clean_up(executor=executor)
-        self._post_clean_up(executor=executor)
+            self._run_phase("pre_clean_up", self._pre_clean_up, executor)
+            self._run_phase("clean_up", self._clean_up, executor)
+            self._run_phase("post_clean_up", self._post_clean_up, executor)
 
-        self._pre_finish(executor=executor)
-        self._finish(executor=executor)
+            self._run_phase("pre_finish", self._pre_finish, executor)
+            self._run_phase("finish", self._finish, executor)
 
     @final
     def warmup(
@@ -1094,6 +1381,7 @@ class Base(ABC, Generic[_T_enum_co]):
         *,
         executor: Executor,
         timeout: float | None = TIMEOUT_UNPREDICTABLE,
+        deadline: float | None = None,
     ) -> None:
         """Prepare a previously created and setup instance for use by the application.
 
@@ -1103,36 +1391,43 @@ class Base(ABC, Generic[_T_enum_co]):
 
         :param executor: Executor for target container.
         :param timeout: Timeout in seconds.
+        :param deadline: Time, as returned by `time.monotonic()`, by which the
+            warmup must be done.
 
         :raises BaseCompatibilityError: if instance is incompatible.
         :raises BaseConfigurationError: on other unexpected error.
         """
-        if timeout is None:
-            self._timeout_simple = None
-            self._timeout_complex = None
-            self._timeout_unpredictable = None
-        elif timeout > 0:
-            self._timeout_unpredictable = timeout
-        else:
-            raise BaseConfigurationError(f"Invalid timeout value: {timeout}")
-
-        self._ensure_setup_completed(executor=executor)
+        with (
+            self._run(executor, timeout=timeout, deadline=deadline),
+            self._phase("warmup"),
+        ):
+            self._run_phase(
+                "ensure_setup_completed", self._ensure_setup_completed, executor
+            )
 
-        self._pre_image_check(executor=executor)
-        self._image_check(executor=executor)
-        self._post_image_check(executor=executor)
+            self._run_phase("pre_image_check", self._pre_image_check, executor)
+            self._run_phase("image_check", self._image_check, executor)
+            self._run_phase("post_image_check", self._post_image_check, executor)
 
-        self._mount_shared_cache_dirs(executor=executor)
+            self._run_phase(
+                "mount_shared_cache_dirs", self._mount_shared_cache_dirs, executor
+            )
 
-        self._setup_wait_for_system_ready(executor=executor)
-        self._setup_wait_for_network(executor=executor)
-        self.setup_permissions(executor=executor)
+            self._run_phase(
+                "setup_wait_for_system_ready",
+                self._setup_wait_for_system_ready,
+                executor,
+            )
+            self._run_phase(
+                "setup_wait_for_network", self._setup_wait_for_network, executor
+            )
+            self._run_phase("setup_permissions", self.setup_permissions, executor)
 
-        self._warmup_snapd(executor=executor)
+            self._run_phase("warmup_snapd", self._warmup_snapd, executor)
 
-        self._pre_setup_snaps(executor=executor)
-        self._setup_snaps(executor=executor)
-        self._post_setup_snaps(executor=executor)
+            self._run_phase("pre_setup_snaps", self._pre_setup_snaps, executor)
+            self._run_phase("setup_snaps", self._setup_snaps, executor)
+            self._run_phase("post_setup_snaps", self._post_setup_snaps, executor)
 
     @staticmethod
     def _network_connected(executor: Executor) -> bool:
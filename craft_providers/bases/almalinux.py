@@ -168,7 +168,7 @@ class AlmaLinuxBase(Base[AlmaLinuxBaseAlias]):
                 command,
                 executor=executor,
                 verify_network=True,
-                timeout=self._timeout_complex,
+                timeout=self._run_context.timeout_complex,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -194,7 +194,7 @@ class AlmaLinuxBase(Base[AlmaLinuxBaseAlias]):
                     ["dnf", "update", "--refresh", "-y"],
                     executor=executor,
                     verify_network=True,
-                    timeout=self._timeout_unpredictable,
+                    timeout=self._run_context.timeout_unpredictable,
                 )
             except subprocess.CalledProcessError as error:
                 raise BaseConfigurationError(
@@ -211,7 +211,7 @@ class AlmaLinuxBase(Base[AlmaLinuxBaseAlias]):
                 command,
                 executor=executor,
                 verify_network=True,
-                timeout=self._timeout_unpredictable,
+                timeout=self._run_context.timeout_unpredictable,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -227,7 +227,7 @@ class AlmaLinuxBase(Base[AlmaLinuxBaseAlias]):
                 ["dnf", "install", "-y", "snapd"],
                 executor=executor,
                 verify_network=True,
-                timeout=self._timeout_complex,
+                timeout=self._run_context.timeout_complex,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -241,10 +241,10 @@ class AlmaLinuxBase(Base[AlmaLinuxBaseAlias]):
         self._execute_run(
             ["dnf", "autoremove", "-y"],
             executor=executor,
-            timeout=self._timeout_complex,
+            timeout=self._run_context.timeout_complex,
         )
         self._execute_run(
             ["dnf", "clean", "packages", "-y"],
             executor=executor,
-            timeout=self._timeout_complex,
+            timeout=self._run_context.timeout_complex,
         )
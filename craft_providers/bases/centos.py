@@ -179,7 +179,7 @@ class CentOSBase(Base[CentOSBaseAlias]):
                 command,
                 executor=executor,
                 verify_network=True,
-                timeout=self._timeout_complex,
+                timeout=self._run_context.timeout_complex,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -202,7 +202,7 @@ class CentOSBase(Base[CentOSBaseAlias]):
                     ["yum", "update", "-y"],
                     executor=executor,
                     verify_network=True,
-                    timeout=self._timeout_unpredictable,
+                    timeout=self._run_context.timeout_unpredictable,
                 )
             except subprocess.CalledProcessError as error:
                 raise BaseConfigurationError(
@@ -219,7 +219,7 @@ class CentOSBase(Base[CentOSBaseAlias]):
                 command,
                 executor=executor,
                 verify_network=True,
-                timeout=self._timeout_unpredictable,
+                timeout=self._run_context.timeout_unpredictable,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -234,7 +234,7 @@ class CentOSBase(Base[CentOSBaseAlias]):
                 ["yum", "install", "-y", "snapd"],
                 executor=executor,
                 verify_network=True,
-                timeout=self._timeout_complex,
+                timeout=self._run_context.timeout_complex,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -247,10 +247,10 @@ class CentOSBase(Base[CentOSBaseAlias]):
         self._execute_run(
             ["yum", "autoremove", "-y"],
             executor=executor,
-            timeout=self._timeout_complex,
+            timeout=self._run_context.timeout_complex,
         )
         self._execute_run(
             ["yum", "clean", "packages", "-y"],
             executor=executor,
-            timeout=self._timeout_complex,
+            timeout=self._run_context.timeout_complex,
         )
@@ -43,7 +43,7 @@ from craft_providers.errors import (
     BaseConfigurationError,
     details_from_called_process_error,
 )
-from craft_providers.util import retry
+from craft_providers.executor import FileEntry
 
 if TYPE_CHECKING:
     from craft_providers.actions.snap_installer import Snap
@@ -163,27 +163,43 @@ class BuilddBase(Base[BuilddBaseAlias]):
 
         self._snaps = snaps
 
-    def _disable_automatic_apt(self, executor: Executor) -> None:
-        """Disable automatic apt actions.
+    def _disable_automatic_apt(self) -> FileEntry:
+        """Get the apt configuration disabling automatic apt actions.
 
-        This should happen as soon as possible in the instance overall setup,
-        to reduce the chances of an automatic apt work being triggered during
-        the setup itself (because it includes apt work which may clash
-        the triggered unattended jobs).
+        It is created with the other setup files, as soon as possible in the
+        instance overall setup, to reduce the chances of an automatic apt work
+        being triggered during the setup itself (because it includes apt work
+        which may clash the triggered unattended jobs).
         """
         # set the verification frequency in 10000 days and disable the upgrade
-        content = dedent(
-            """\
-            APT::Periodic::Update-Package-Lists "10000";
-            APT::Periodic::Unattended-Upgrade "0";
-        """
-        ).encode()
-        executor.push_file_io(
+        return FileEntry(
             destination=pathlib.PurePosixPath("/etc/apt/apt.conf.d/20auto-upgrades"),
-            content=io.BytesIO(content),
-            file_mode="0644",
+            content=dedent(
+                """\
+                APT::Periodic::Update-Package-Lists "10000";
+                APT::Periodic::Unattended-Upgrade "0";
+                """
+            ).encode(),
         )
 
+    @override
+    def _get_setup_files(self) -> list[FileEntry]:
+        """Add the networkd and apt configuration."""
+        apt_conf = pathlib.PurePosixPath("/etc/apt/apt.conf.d")
+        return [
+            *super()._get_setup_files(),
+            self._disable_automatic_apt(),
+            self._get_networkd_file(),
+            FileEntry(
+                destination=apt_conf / "00no-recommends",
+                content=b'APT::Install-Recommends "false";\n',
+            ),
+            FileEntry(
+                destination=apt_conf / "00update-errors",
+                content=b'APT::Update::Error-Mode "any";\n',
+            ),
+        ]
+
     @override
     def _ensure_os_compatible(self, executor: Executor) -> None:
         """Ensure OS is compatible with Base."""
@@ -213,33 +229,19 @@ class BuilddBase(Base[BuilddBaseAlias]):
                 )
             )
 
-    @override
-    def _post_setup_os(self, executor: Executor) -> None:
-        """Ubuntu specific post-setup OS tasks."""
-        self._disable_automatic_apt(executor=executor)
-
     @override
     def _setup_network(self, executor: Executor) -> None:
         """Set up the basic network with systemd-networkd and systemd-resolved."""
-        self.setup_hostname(executor=executor)
+        self._apply_hostname(executor=executor)
         self._setup_resolved(executor=executor)
-        self._setup_networkd(executor=executor)
+        self._start_networkd(executor=executor)
 
     @override
     def _pre_setup_packages(self, executor: Executor) -> None:
-        """Configure apt, update database."""
-        executor.push_file_io(
-            destination=pathlib.Path("/etc/apt/apt.conf.d/00no-recommends"),
-            content=io.BytesIO(b'APT::Install-Recommends "false";\n'),
-            file_mode="0644",
-        )
-
-        executor.push_file_io(
-            destination=pathlib.Path("/etc/apt/apt.conf.d/00update-errors"),
-            content=io.BytesIO(b'APT::Update::Error-Mode "any";\n'),
-            file_mode="0644",
-        )
+        """Update sources for EOL releases and the apt database.
 
+        The apt configuration is created by `_get_setup_files()`.
+        """
         self._update_eol_sources(executor)
 
         try:
@@ -247,7 +249,7 @@ class BuilddBase(Base[BuilddBaseAlias]):
                 ["apt-get", "update"],
                 executor=executor,
                 verify_network=True,
-                timeout=self._timeout_unpredictable,
+                timeout=self._run_context.timeout_unpredictable,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -300,7 +302,7 @@ class BuilddBase(Base[BuilddBaseAlias]):
             self._execute_run(
                 ["bash", "/tmp/craft-sources.sh"],
                 executor=executor,
-                timeout=self._timeout_simple,
+                timeout=self._run_context.timeout_simple,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -340,10 +342,10 @@ class BuilddBase(Base[BuilddBaseAlias]):
             return requests.head(url + slug, allow_redirects=True, timeout=5)
 
         logger.debug(f"Checking for {self.alias.value} ({codename}) on {url}.")
-        response = retry.retry_until_timeout(
-            timeout=self._timeout_simple or const.TIMEOUT_SIMPLE,
-            retry_wait=self._retry_wait,
-            func=_request,
+        response = self._retry(
+            "http",
+            _request,
+            timeout=self._run_context.timeout_simple or const.TIMEOUT_SIMPLE,
             error=BaseConfigurationError(brief=f"Failed to get {url + slug}."),
         )
 
@@ -402,7 +404,7 @@ class BuilddBase(Base[BuilddBaseAlias]):
                     ["apt-get", "-y", "dist-upgrade"],
                     executor=executor,
                     verify_network=True,
-                    timeout=self._timeout_unpredictable,
+                    timeout=self._run_context.timeout_unpredictable,
                 )
             except subprocess.CalledProcessError as error:
                 raise BaseConfigurationError(
@@ -417,7 +419,7 @@ class BuilddBase(Base[BuilddBaseAlias]):
                 command,
                 executor=executor,
                 verify_network=True,
-                timeout=self._timeout_unpredictable,
+                timeout=self._run_context.timeout_unpredictable,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -433,7 +435,7 @@ class BuilddBase(Base[BuilddBaseAlias]):
                 ["apt-get", "install", "-y", "snapd"],
                 executor=executor,
                 verify_network=True,
-                timeout=self._timeout_complex,
+                timeout=self._run_context.timeout_complex,
             )
         except subprocess.CalledProcessError as error:
             raise BaseConfigurationError(
@@ -446,12 +448,12 @@ class BuilddBase(Base[BuilddBaseAlias]):
         self._execute_run(
             ["apt-get", "autoremove", "-y"],
             executor=executor,
-            timeout=self._timeout_complex,
+            timeout=self._run_context.timeout_complex,
         )
         self._execute_run(
             ["apt-get", "clean", "-y"],
             executor=executor,
-            timeout=self._timeout_complex,
+            timeout=self._run_context.timeout_complex,
         )
 
 
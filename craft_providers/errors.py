@@ -134,3 +134,11 @@ class NetworkError(ProviderError):
             f"see {url} for further reference."
         )
         super().__init__(brief=brief, resolution=resolution)
+
+
+class ExecAgentError(ProviderError):
+    """Error communicating with the exec agent of an instance."""
+
+
+class ReplayError(ProviderError):
+    """A call cannot be replayed from a recorded session."""
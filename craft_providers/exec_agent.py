@@ -0,0 +1,400 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Client for the exec agent, which runs many commands over one exec channel."""
+
+from __future__ import annotations
+
+import contextlib
+import errno
+import importlib.resources
+import json
+import locale
+import logging
+import subprocess
+import threading
+from typing import IO, TYPE_CHECKING, Any, cast
+
+from craft_providers.errors import ExecAgentError
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Sequence
+
+    from craft_providers.executor import Executor
+
+logger = logging.getLogger(__name__)
+
+# Protocol version the agent reports when it starts.
+AGENT_VERSION = 1
+
+# Exit codes for commands that cannot be executed, as used by shells.
+_NOT_FOUND_EXIT_CODE = 127
+_NOT_EXECUTABLE_EXIT_CODE = 126
+
+# Keyword arguments of subprocess.run() that the agent can handle.
+_SUPPORTED_KWARGS = {
+    "capture_output",
+    "encoding",
+    "errors",
+    "input",
+    "stderr",
+    "stdin",
+    "stdout",
+    "text",
+    "universal_newlines",
+}
+
+
+def get_agent_command() -> list[str]:
+    """Get the command that starts the agent in an instance.
+
+    :returns: The command, which needs python3 in the instance.
+    """
+    script = (
+        importlib.resources.files("craft_providers.util")
+        .joinpath("exec_agent")
+        .read_text()
+    )
+    return ["python3", "-c", script]
+
+
+def _decode(data: bytes, *, encoding: str | None, errors: str | None) -> str:
+    """Decode output the way subprocess does in text mode."""
+    text = data.decode(
+        encoding or locale.getpreferredencoding(do_setlocale=False), errors or "strict"
+    )
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class ExecAgent:
+    """Run commands and file operations in an instance through a single process.
+
+    Every `lxc exec` or `multipass exec` forks a process on the host and sets
+    up a new process in the instance. The agent is a small Python program
+    started once with a long-lived exec. Requests and responses are framed
+    over its stdin and stdout, so each command only costs a round trip.
+
+    Requests are sent one at a time. The agent is closed on the first
+    communication error.
+
+    :param process: The process running the agent. Its stdin and stdout must
+        be binary pipes.
+    """
+
+    def __init__(self, process: subprocess.Popen[bytes]) -> None:
+        self._process = process
+        self._lock = threading.Lock()
+        self._alive = True
+
+    @classmethod
+    def start(cls, executor: Executor) -> ExecAgent | None:
+        """Start the agent in an instance.
+
+        :param executor: Executor for the instance.
+
+        :returns: The agent, or None if it could not be started.
+        """
+        try:
+            process = executor.execute_popen(
+                get_agent_command(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        # the agent is an optimization, so any failure means not using it
+        except Exception as error:  # noqa: BLE001
+            logger.debug("Could not start exec agent: %s", error)
+            return None
+
+        agent = cls(cast("subprocess.Popen[bytes]", process))
+        try:
+            header, _ = agent._receive()
+        except ExecAgentError as error:
+            logger.debug("Exec agent did not start: %s", error)
+            agent.close()
+            return None
+
+        if header.get("version") != AGENT_VERSION:
+            logger.debug("Unsupported exec agent version: %r", header.get("version"))
+            agent.close()
+            return None
+
+        logger.debug("Started exec agent.")
+        return agent
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the agent can take requests."""
+        return self._alive and self._process.poll() is None
+
+    def close(self) -> None:
+        """Stop the agent."""
+        self._alive = False
+        if self._process.stdin:
+            with contextlib.suppress(OSError):
+                self._process.stdin.close()
+        try:
+            self._process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        if self._process.stdout:
+            self._process.stdout.close()
+
+    def _send(self, header: dict[str, Any], payloads: Sequence[bytes]) -> None:
+        stream = cast("IO[bytes]", self._process.stdin)
+        header = {**header, "sizes": [len(payload) for payload in payloads]}
+        try:
+            stream.write(json.dumps(header).encode() + b"\n")
+            for payload in payloads:
+                stream.write(payload)
+            stream.flush()
+        except (OSError, ValueError) as error:
+            raise ExecAgentError(
+                brief="Failed to send a request to the exec agent.",
+                details=f"* {error}",
+            ) from error
+
+    def _receive(self) -> tuple[dict[str, Any], list[bytes]]:
+        stream = cast("IO[bytes]", self._process.stdout)
+        try:
+            line = stream.readline()
+            header = cast("dict[str, Any]", json.loads(line))
+            sizes = cast("list[int]", header.get("sizes", []))
+            payloads = [stream.read(size) for size in sizes]
+        except (OSError, ValueError) as error:
+            raise ExecAgentError(
+                brief="Failed to receive a response from the exec agent.",
+                details=f"* {error}",
+            ) from error
+
+        if any(len(payload) != size for payload, size in zip(payloads, sizes)):
+            raise ExecAgentError(
+                brief="Failed to receive a response from the exec agent.",
+                details="* The exec agent exited.",
+            )
+        return header, payloads
+
+    def _request(
+        self, header: dict[str, Any], payloads: Sequence[bytes] = ()
+    ) -> tuple[dict[str, Any], list[bytes]]:
+        """Send a request and wait for its response.
+
+        :raises ExecAgentError: If the agent is not running or the request
+            could not be completed.
+        """
+        with self._lock:
+            if not self.is_alive:
+                raise ExecAgentError(brief="The exec agent is not running.")
+            try:
+                self._send(header, payloads)
+                return self._receive()
+            except ExecAgentError:
+                self.close()
+                raise
+
+    def run(
+        self,
+        command: list[str],
+        *,
+        cwd: pathlib.PurePath | None = None,
+        input: bytes = b"",  # noqa: A002 (mirrors subprocess.run)
+        timeout: float | None = None,
+        stderr_to_stdout: bool = False,
+    ) -> tuple[int, bytes, bytes]:
+        """Run a command in the instance.
+
+        :param command: Command to run.
+        :param cwd: Working directory for the command.
+        :param input: Data for the stdin of the command.
+        :param timeout: Timeout (in seconds) for the command.
+        :param stderr_to_stdout: Merge stderr into stdout.
+
+        :returns: The exit code, stdout and stderr of the command.
+
+        :raises subprocess.TimeoutExpired: If the command timed out.
+        :raises ExecAgentError: On communication error.
+        """
+        header, payloads = self._request(
+            {
+                "op": "run",
+                "args": command,
+                "cwd": None if cwd is None else cwd.as_posix(),
+                "timeout": timeout,
+                "stderr_to_stdout": stderr_to_stdout,
+            },
+            [input],
+        )
+
+        if header.get("error") == "timeout":
+            raise subprocess.TimeoutExpired(command, cast(float, timeout))
+        if "error" in header:
+            # like a shell, report commands that cannot be executed with an exit code
+            returncode = (
+                _NOT_FOUND_EXIT_CODE
+                if header.get("errno") == errno.ENOENT
+                else _NOT_EXECUTABLE_EXIT_CODE
+            )
+            return returncode, b"", f"{header['error']}\n".encode()
+
+        stdout, stderr = payloads
+        return cast(int, header["returncode"]), stdout, stderr
+
+    def read_file(self, path: pathlib.PurePath) -> bytes:
+        """Read a file in the instance.
+
+        :param path: Path of the file.
+
+        :returns: The content of the file.
+
+        :raises OSError: If the file cannot be read, such as FileNotFoundError.
+        :raises ExecAgentError: On communication error.
+        """
+        header, payloads = self._request({"op": "read", "path": path.as_posix()})
+        self._raise_for_error(header, path)
+        return payloads[0]
+
+    def write_file(
+        self,
+        path: pathlib.PurePath,
+        content: bytes,
+        *,
+        mode: int | None = None,
+        user: str | None = None,
+        group: str | None = None,
+    ) -> None:
+        """Atomically create or replace a file in the instance.
+
+        :param path: Path of the file.
+        :param content: Content of the file.
+        :param mode: File mode, such as 0o644.
+        :param user: Name of the owner of the file.
+        :param group: Name of the group of the file.
+
+        :raises OSError: If the file cannot be written.
+        :raises ExecAgentError: On communication error, or if the user or group
+            does not exist.
+        """
+        header, _ = self._request(
+            {
+                "op": "write",
+                "path": path.as_posix(),
+                "mode": mode,
+                "user": user,
+                "group": group,
+            },
+            [content],
+        )
+        self._raise_for_error(header, path)
+
+    @staticmethod
+    def _raise_for_error(header: dict[str, Any], path: pathlib.PurePath) -> None:
+        if "error" not in header:
+            return
+        if header.get("errno") is not None:
+            # OSError picks the matching subclass, such as FileNotFoundError
+            raise OSError(header["errno"], header["error"], path.as_posix())
+        raise ExecAgentError(
+            brief=f"Exec agent failed to access {path.as_posix()!r}.",
+            details=f"* {header['error']}",
+        )
+
+    def execute_run(
+        self,
+        command: list[str],
+        *,
+        cwd: pathlib.PurePath | None = None,
+        timeout: float | None = None,
+        check: bool = False,
+        **kwargs: Any,
+    ) -> subprocess.CompletedProcess[Any] | None:
+        """Run a command with the semantics of subprocess.run().
+
+        Only the arguments of subprocess.run() about input and captured output
+        are supported.
+
+        :param command: Command to run.
+        :param cwd: Working directory for the command.
+        :param timeout: Timeout (in seconds) for the command.
+        :param check: Raise an exception if the command fails.
+        :param kwargs: Keyword args of subprocess.run().
+
+        :returns: Completed process, or None if the arguments are not supported
+            or the agent is not running, so the command must run without the agent.
+
+        :raises subprocess.CalledProcessError: if command fails and check is True.
+        :raises subprocess.TimeoutExpired: If the command timed out.
+        :raises ExecAgentError: On communication error.
+        """
+        if not self.is_alive or not _SUPPORTED_KWARGS.issuperset(kwargs):
+            return None
+
+        stdout_target = kwargs.get("stdout")
+        stderr_target = kwargs.get("stderr")
+        if kwargs.get("capture_output"):
+            if stdout_target is not None or stderr_target is not None:
+                return None
+            stdout_target = stderr_target = subprocess.PIPE
+        if (
+            stdout_target not in (subprocess.PIPE, subprocess.DEVNULL)
+            or stderr_target
+            not in (subprocess.PIPE, subprocess.DEVNULL, subprocess.STDOUT)
+            or kwargs.get("stdin") not in (None, subprocess.DEVNULL)
+        ):
+            return None
+
+        encoding = kwargs.get("encoding")
+        errors = kwargs.get("errors")
+        text_mode = bool(
+            kwargs.get("text") or kwargs.get("universal_newlines") or encoding or errors
+        )
+
+        input_data = kwargs.get("input") or b""
+        if isinstance(input_data, str):
+            input_data = input_data.encode(
+                encoding or locale.getpreferredencoding(do_setlocale=False),
+                errors or "strict",
+            )
+
+        returncode, stdout, stderr = self.run(
+            command,
+            cwd=cwd,
+            input=bytes(input_data),
+            timeout=timeout,
+            stderr_to_stdout=stderr_target == subprocess.STDOUT,
+        )
+
+        stdout_result: bytes | str | None = (
+            stdout if stdout_target == subprocess.PIPE else None
+        )
+        stderr_result: bytes | str | None = (
+            stderr if stderr_target == subprocess.PIPE else None
+        )
+        if text_mode:
+            if stdout_result is not None:
+                stdout_result = _decode(stdout, encoding=encoding, errors=errors)
+            if stderr_result is not None:
+                stderr_result = _decode(stderr, encoding=encoding, errors=errors)
+
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(
+                returncode, command, stdout_result, stderr_result
+            )
+        return subprocess.CompletedProcess(
+            command, returncode, stdout_result, stderr_result
+        )
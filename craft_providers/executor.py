@@ -20,9 +20,15 @@
 from __future__ import annotations
 
 import contextlib
+import dataclasses
 import hashlib
+import io
 import logging
+import os
 import re
+import subprocess
+import tarfile
+import time
 from abc import ABC, abstractmethod
 from os import PathLike
 from typing import (
@@ -31,21 +37,22 @@ from typing import (
     Any,
     Literal,
     TypeAlias,
+    cast,
     overload,
 )
 
 from typing_extensions import Buffer
 
 import craft_providers.util.temp_paths
+from craft_providers.const import TIMEOUT_COMPLEX, TIMEOUT_SIMPLE
+from craft_providers.errors import ProviderError, details_from_called_process_error
+from craft_providers.exec_agent import ExecAgent
+from craft_providers.util import dir_pull, dir_sync, popen
 
 if TYPE_CHECKING:
-    import io
     import pathlib
-    import subprocess
     from collections.abc import Callable, Collection, Generator, Iterable
 
-    from craft_providers.errors import ProviderError
-
 logger = logging.getLogger(__name__)
 
 MAX_INSTANCE_NAME_LENGTH = 63
@@ -53,9 +60,86 @@ MAX_INSTANCE_NAME_LENGTH = 63
 StrOrBytesPath: TypeAlias = str | bytes | PathLike[str] | PathLike[bytes]
 
 
+# Exit code of exec when the command is not found.
+_COMMAND_NOT_FOUND = 127
+
+# Shell script writing a file from stdin, then setting its owner and mode. Run
+# as `sh -c PUSH_FILE_SCRIPT sh <path> <mode> <user:group>`. The mode is set
+# after chown, which may clear setuid/setgid bits. A restrictive umask keeps a
+# new file private until its mode is set.
+PUSH_FILE_SCRIPT = 'umask 077 && cat > "$1" && chown "$3" "$1" && chmod "$2" "$1"'
+
+
+@dataclasses.dataclass(frozen=True)
+class FileEntry:
+    """A file to create with `Executor.push_files()`.
+
+    :param destination: Absolute path to file.
+    :param content: Contents of file.
+    :param file_mode: File mode string (e.g. '0644').
+    :param user: File owner user.
+    :param group: File owner group.
+    """
+
+    destination: pathlib.PurePath
+    content: bytes
+    file_mode: str = "0644"
+    user: str = "root"
+    group: str = "root"
+
+
 class Executor(ABC):
     """Interfaces to execute commands and move data in/out of an environment."""
 
+    _exec_agent: ExecAgent | None = None
+
+    @property
+    def exec_agent(self) -> ExecAgent | None:
+        """The exec agent of the environment, if it is running.
+
+        See `start_exec_agent()`.
+        """
+        if self._exec_agent is not None and not self._exec_agent.is_alive:
+            self._exec_agent = None
+        return self._exec_agent
+
+    def start_exec_agent(self) -> bool:
+        """Start an agent that runs commands in the environment.
+
+        The agent is a helper started with a single long-lived exec. Executors
+        that support it run commands through the agent rather than starting
+        a new exec for each one, which is much cheaper for many short commands.
+
+        The agent needs python3 in the environment. If it cannot be started,
+        commands run as usual.
+
+        :returns: True if the agent is running.
+        """
+        if self.exec_agent is None:
+            self._exec_agent = ExecAgent.start(self)
+        return self._exec_agent is not None
+
+    def stop_exec_agent(self) -> None:
+        """Stop the exec agent, if it is running."""
+        agent, self._exec_agent = self._exec_agent, None
+        if agent is not None:
+            agent.close()
+
+    @contextlib.contextmanager
+    def exec_agent_session(self) -> Generator[bool, None, None]:
+        """Run commands through an exec agent within a context.
+
+        The agent is stopped on exit, unless it was already running.
+
+        :returns: True if the agent is running.
+        """
+        was_running = self.exec_agent is not None
+        try:
+            yield self.start_exec_agent()
+        finally:
+            if not was_running:
+                self.stop_exec_agent()
+
     @abstractmethod
     def execute_popen(
         self,
@@ -330,6 +414,22 @@ class Executor(ABC):
         :raises ProviderError: On error copying file.
         """
 
+    def read_file(self, *, source: pathlib.PurePath) -> bytes:
+        """Read the contents of a file in the environment.
+
+        Executors should override this to read the file straight into memory.
+        By default, the file is pulled into a temporary file in the host.
+
+        :param source: Environment file to read.
+
+        :returns: The contents of the file.
+
+        :raises FileNotFoundError: If source file does not exist.
+        :raises ProviderError: On error reading file.
+        """
+        with self.temporarily_pull_file(source=source) as tmp_file:
+            return tmp_file.read_bytes()
+
     @overload
     @contextlib.contextmanager
     def temporarily_pull_file(
@@ -443,6 +543,258 @@ class Executor(ABC):
         :param user: File owner user.
         """
 
+    def push_files(self, files: Iterable[FileEntry]) -> None:
+        """Create or replace many files at once.
+
+        The files are streamed into the environment as a single tar archive
+        and extracted by one command, rather than pushed one at a time. Missing
+        parent directories are created.
+
+        If tar is not available in the environment, the files are pushed one
+        at a time with `push_file_io()`.
+
+        :param files: Files to create.
+
+        :raises ProviderError: On error creating the files.
+        """
+        files = list(files)
+        if not files:
+            return
+
+        archive = io.BytesIO()
+        mtime = int(time.time())
+        with tarfile.open(fileobj=archive, mode="w") as tar:
+            for file in files:
+                info = tarfile.TarInfo(file.destination.as_posix().lstrip("/"))
+                info.size = len(file.content)
+                info.mode = int(file.file_mode, 8)
+                info.mtime = mtime
+                # as root, tar sets the owner by name
+                info.uname = file.user
+                info.gname = file.group
+                tar.addfile(info, io.BytesIO(file.content))
+
+        destinations = ", ".join(repr(file.destination.as_posix()) for file in files)
+        logger.debug("Pushing files: %s", destinations)
+        try:
+            self.execute_run(
+                ["tar", "-x", "-p", "-f", "-", "-C", "/"],
+                input=archive.getvalue(),
+                capture_output=True,
+                check=True,
+                timeout=TIMEOUT_SIMPLE,
+            )
+        except subprocess.CalledProcessError as error:
+            if error.returncode != _COMMAND_NOT_FOUND:
+                raise ProviderError(
+                    brief=f"Failed to create files {destinations}.",
+                    details=details_from_called_process_error(error),
+                ) from error
+
+            logger.debug("tar is not available, pushing files one at a time.")
+            for file in files:
+                self.push_file_io(
+                    destination=file.destination,
+                    content=io.BytesIO(file.content),
+                    file_mode=file.file_mode,
+                    group=file.group,
+                    user=file.user,
+                )
+
+    def sync_directory(
+        self, *, source: pathlib.Path, destination: pathlib.PurePath
+    ) -> None:
+        """Make a directory in the environment match a host directory.
+
+        Files are compared by hash on both sides. Only changed files are
+        transferred, as one compressed tar stream, and files and directories
+        that are not in the source are deleted. Symbolic links are not
+        followed. This is meant for environments where the directory cannot be
+        mounted.
+
+        :param source: Host directory to copy.
+        :param destination: Target environment directory. It is created if it
+            does not exist.
+
+        :raises FileNotFoundError: If source directory does not exist.
+        :raises ProviderError: On error synchronizing the directory.
+        """
+        if not source.is_dir():
+            raise FileNotFoundError(f"Directory not found: {str(source)!r}")
+
+        target = destination.as_posix()
+        brief = f"Failed to synchronize {str(source)!r} to {target!r}."
+        try:
+            proc = self.execute_run(
+                ["sh", "-c", dir_sync.MANIFEST_SCRIPT, "sh", target],
+                capture_output=True,
+                check=True,
+                timeout=TIMEOUT_COMPLEX,
+            )
+        except subprocess.CalledProcessError as error:
+            raise ProviderError(
+                brief=brief, details=details_from_called_process_error(error)
+            ) from error
+
+        manifest = dir_sync.get_host_manifest(source)
+        plan = dir_sync.plan_sync(manifest, *dir_sync.parse_manifest(proc.stdout))
+        logger.debug(
+            "Synchronizing %r to %r: %d files to transfer, %d files and %d"
+            " directories to delete.",
+            str(source),
+            target,
+            len(plan.transfer),
+            len(plan.delete),
+            len(plan.delete_directories),
+        )
+
+        # the stale files are deleted first, then the stale directories once
+        # they are empty
+        stale = [*plan.delete, *plan.delete_directories]
+        if stale:
+            try:
+                self.execute_run(
+                    ["sh", "-c", dir_sync.DELETE_SCRIPT, "sh", target],
+                    input=b"\0".join(os.fsencode(path) for path in stale),
+                    capture_output=True,
+                    check=True,
+                    timeout=TIMEOUT_COMPLEX,
+                )
+            except subprocess.CalledProcessError as error:
+                raise ProviderError(
+                    brief=brief, details=details_from_called_process_error(error)
+                ) from error
+
+        command = ["sh", "-c", dir_sync.EXTRACT_SCRIPT, "sh", target]
+        process = self.execute_popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            # the command failing early is reported by its exit code
+            with popen.streaming(process, timeout=TIMEOUT_SIMPLE) as result:
+                dir_sync.write_archive(
+                    cast("IO[bytes]", process.stdin),
+                    source,
+                    manifest.directories,
+                    plan.transfer,
+                )
+        except subprocess.TimeoutExpired as error:
+            raise ProviderError(brief=brief, details=str(error)) from error
+
+        if result.returncode != 0:
+            raise ProviderError(
+                brief=brief,
+                details=details_from_called_process_error(
+                    subprocess.CalledProcessError(
+                        result.returncode, command, stderr=result.stderr
+                    )
+                ),
+            )
+
+    def pull_directory(
+        self, *, source: pathlib.PurePath, destination: pathlib.Path
+    ) -> None:
+        """Copy a directory from the environment to the host.
+
+        The directory is transferred as one compressed tar stream and
+        extracted on the fly, so memory use does not depend on its size.
+
+        :param source: Target environment directory to copy.
+        :param destination: Host directory to copy into. It is created if it
+            does not exist.
+
+        :raises FileNotFoundError: If source directory does not exist.
+        :raises ProviderError: On error copying the directory.
+        """
+        self._pull_archive(
+            ["sh", "-c", dir_pull.ARCHIVE_SCRIPT, "sh", source.as_posix()],
+            source=source,
+            destination=destination,
+        )
+
+    def pull_glob(
+        self,
+        *,
+        source: pathlib.PurePath,
+        patterns: Iterable[str],
+        destination: pathlib.Path,
+    ) -> list[pathlib.Path]:
+        """Copy the files matching shell patterns from the environment to the host.
+
+        The patterns are expanded by the environment's shell, relative to the
+        source directory. Matching directories are copied with their contents.
+        The files are transferred as one compressed tar stream and extracted
+        on the fly, so memory use does not depend on their size.
+
+        :param source: Target environment directory the patterns are relative
+            to.
+        :param patterns: Shell patterns (e.g. '*.snap') of the paths to copy.
+        :param destination: Host directory to copy into, keeping the paths
+            relative to the source. It is created if it does not exist.
+
+        :returns: The host paths of the copied files that are not directories.
+
+        :raises FileNotFoundError: If source directory does not exist.
+        :raises ProviderError: On error copying the files.
+        """
+        return self._pull_archive(
+            [
+                "sh",
+                "-c",
+                dir_pull.GLOB_ARCHIVE_SCRIPT,
+                "sh",
+                source.as_posix(),
+                *patterns,
+            ],
+            source=source,
+            destination=destination,
+        )
+
+    def _pull_archive(
+        self,
+        command: list[str],
+        *,
+        source: pathlib.PurePath,
+        destination: pathlib.Path,
+    ) -> list[pathlib.Path]:
+        """Run a command writing a tar archive and extract it in the host."""
+        brief = f"Failed to copy {source.as_posix()!r} to {str(destination)!r}."
+        process = self.execute_popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        paths: list[pathlib.Path] = []
+        tar_error: tarfile.TarError | None = None
+        try:
+            with popen.streaming(process, timeout=TIMEOUT_SIMPLE) as result:
+                try:
+                    paths = dir_pull.extract_archive(
+                        cast("IO[bytes]", process.stdout), destination
+                    )
+                except tarfile.TarError as error:
+                    # the command may have failed, which is reported first
+                    tar_error = error
+        except subprocess.TimeoutExpired as error:
+            raise ProviderError(brief=brief, details=str(error)) from error
+
+        if result.returncode == dir_pull.DIRECTORY_NOT_FOUND:
+            raise FileNotFoundError(f"Directory not found: {source.as_posix()!r}")
+        if result.returncode != 0:
+            raise ProviderError(
+                brief=brief,
+                details=details_from_called_process_error(
+                    subprocess.CalledProcessError(
+                        result.returncode, command, stderr=result.stderr
+                    )
+                ),
+            )
+        if tar_error is not None:
+            raise ProviderError(brief=brief, details=str(tar_error)) from tar_error
+
+        return paths
+
     @abstractmethod
     def delete(self) -> None:
         """Delete instance."""
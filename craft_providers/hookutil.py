@@ -35,6 +35,7 @@ from typing import Any, cast
 from typing_extensions import Self
 
 from craft_providers import Base, lxd
+from craft_providers.util import batch
 
 _BASE_INSTANCE_START_STRING = "base-instance"
 _CURRENT_COMPATIBILITY_TAG_REGEX = re.compile(
@@ -191,14 +192,67 @@ class HookHelper:
             json_out=False,
         )
 
+    def delete_instances(self, instances: list[LXDInstance]) -> None:
+        """Delete the specified lxc instances concurrently.
+
+        A failure to delete an instance does not stop the others being deleted.
+
+        :raises HookError: If any instance could not be deleted.
+        """
+        result = batch.run_batch(
+            self.delete_instance, instances, progress=self._print_progress
+        )
+        if result.failed:
+            raise HookError(
+                f"Failed to remove {len(result.failed)} of {len(instances)} LXD "
+                f"instances in {self._project_name} project."
+            )
+
     def _delete_image(self, image_fingerprint: str) -> None:
         """Remove the image."""
-        self.lxc("image", "delete", image_fingerprint, json_out=False)
+        print(
+            f" > Removing image {image_fingerprint} in LXD {self._project_name} project..."
+        )
+        if self.simulate:
+            return
+        self.lxc(
+            "image",
+            "delete",
+            image_fingerprint,
+            fail_msg=f"Failed to remove LXD image {image_fingerprint}.",
+            json_out=False,
+        )
 
     def delete_all_images(self) -> None:
-        """Delete all images of the lxc project."""
-        for image_fingerprint in self._list_images():
-            self._delete_image(image_fingerprint)
+        """Delete all images of the lxc project concurrently.
+
+        A failure to delete an image does not stop the others being deleted.
+
+        :raises HookError: If any image could not be deleted.
+        """
+        images = self._list_images()
+        result = batch.run_batch(
+            self._delete_image, images, progress=self._print_progress
+        )
+        if result.failed:
+            raise HookError(
+                f"Failed to remove {len(result.failed)} of {len(images)} LXD "
+                f"images in {self._project_name} project."
+            )
+
+    def _print_progress(
+        self,
+        item: LXDInstance | str,
+        error: Exception | None,
+        done: int,
+        total: int,
+    ) -> None:
+        """Report the progress of a batch of deletions."""
+        name = item.name if isinstance(item, LXDInstance) else item
+        if error is None:
+            self.dprint(f"Removed {name} ({done}/{total})")
+        else:
+            print(f" > Failed to remove {name} ({done}/{total}): {error}")
 
     def delete_project(self) -> None:
         """Delete this lxc project."""
@@ -242,6 +296,7 @@ class HookHelper:
 def configure_hook(lxc: HookHelper) -> None:
     """Cleanup hook run on snap configure."""
     # Keep the newest base instance with the most recent compatibility tag.
+    delete_instances: list[LXDInstance] = []
     delete_base_full_names: set[str] = set()
     for instance in lxc.list_base_instances():
         if instance.is_current_base_instance():
@@ -251,29 +306,32 @@ def configure_hook(lxc: HookHelper) -> None:
         # This is a base instance but it doesn't match the compat tag, assume it's
         # old (not future) and delete it.
         lxc.dprint(instance, "Base instance uses old compatibility tag, deleting")
-        lxc.delete_instance(instance)
+        delete_instances.append(instance)
         delete_base_full_names.add(instance.base_instance_name())
 
     if not delete_base_full_names:
         lxc.dprint("No base instances were deleted, so no derived instances to delete")
         return
 
-    # Find the child instances of the bases we deleted and delete them too
+    # Find the child instances of the bases to delete and delete them too
     did_delete = False
     for instance in lxc.list_instances():
+        if instance.is_base_instance():
+            continue
         if instance.base_instance_name() not in delete_base_full_names:
             continue
-        lxc.dprint(instance, "Base instance was deleted, deleting derived instance")
-        lxc.delete_instance(instance)
+        lxc.dprint(instance, "Base instance is deleted, deleting derived instance")
+        delete_instances.append(instance)
         did_delete = True
     if not did_delete:
         lxc.dprint("Found no instances derived from deleted base instances")
 
+    lxc.delete_instances(delete_instances)
+
 
 def remove_hook(lxc: HookHelper) -> None:
     """Cleanup hook run on snap removal."""
-    for instance in lxc.list_instances():
-        lxc.delete_instance(instance)
+    lxc.delete_instances(lxc.list_instances())
 
     # Project deletion will fail if images aren't all deleted first
     lxc.delete_all_images()
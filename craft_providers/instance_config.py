@@ -28,7 +28,6 @@ import yaml
 from typing_extensions import Self
 
 from craft_providers.errors import BaseConfigurationError, ProviderError
-from craft_providers.util import temp_paths
 
 if TYPE_CHECKING:
     from craft_providers.executor import Executor
@@ -115,24 +114,22 @@ class InstanceConfiguration(pydantic.BaseModel, extra="forbid"):
         if config_path is None:
             config_path = pathlib.PurePath("/etc/craft-instance.conf")
 
-        with temp_paths.home_temporary_file() as temp_config_file:
-            try:
-                executor.pull_file(source=config_path, destination=temp_config_file)
-            except ProviderError as error:
-                raise BaseConfigurationError(
-                    brief=(
-                        "Failed to read instance config"
-                        f" in environment at {config_path}"
-                    ),
-                ) from error
-            except FileNotFoundError:
-                return None
-            with temp_config_file.open(encoding="utf8") as file:
-                data = yaml.safe_load(file)
-                if data is None:
-                    return None
-
-                return cls.unmarshal(data)
+        try:
+            content = executor.read_file(source=config_path)
+        except ProviderError as error:
+            raise BaseConfigurationError(
+                brief=(
+                    f"Failed to read instance config in environment at {config_path}"
+                ),
+            ) from error
+        except FileNotFoundError:
+            return None
+
+        data = yaml.safe_load(content)
+        if data is None:
+            return None
+
+        return cls.unmarshal(data)
 
     def save(
         self,
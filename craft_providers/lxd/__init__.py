@@ -17,6 +17,7 @@
 
 """LXD environment provider."""
 
+from .async_lxd_instance import AsyncLXDInstance
 from .errors import LXDError, LXDInstallationError, LXDUnstableImageError
 from .installer import (
     ensure_lxd_is_ready,
@@ -25,21 +26,30 @@ from .installer import (
     is_installed,
     is_user_permitted,
 )
-from .launcher import launch
+from .launch_history import LaunchHistory, LaunchPath, LaunchRecord
+from .launcher import launch, launch_many
 from .lxc import LXC
+from .lxc_rest import RestLXC
 from .lxd import LXD
 from .lxd_instance import LXDInstance
+from .lxd_monitor import LXDMonitor
 from .lxd_provider import LXDProvider
 from .remotes import get_remote_image
 
 __all__ = [
+    "AsyncLXDInstance",
     "LXC",
     "LXD",
     "LXDInstance",
+    "LXDMonitor",
     "LXDError",
     "LXDInstallationError",
     "LXDUnstableImageError",
     "LXDProvider",
+    "LaunchHistory",
+    "LaunchPath",
+    "LaunchRecord",
+    "RestLXC",
     "get_remote_image",
     "install",
     "is_installed",
@@ -47,4 +57,5 @@ __all__ = [
     "is_user_permitted",
     "ensure_lxd_is_ready",
     "launch",
+    "launch_many",
 ]
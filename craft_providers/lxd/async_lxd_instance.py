@@ -0,0 +1,63 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Executor of a LXD instance for asyncio event loops."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from craft_providers.async_executor import AsyncExecutor
+from craft_providers.lxd.errors import LXDError
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from craft_providers.lxd.lxd_instance import LXDInstance
+
+
+class AsyncLXDInstance(AsyncExecutor):
+    """Run commands in a LXD instance from an asyncio event loop.
+
+    Commands run with `lxc exec`, like `LXDInstance.execute_run()` without the
+    exec agent. The number of them running at once is capped by the
+    ``max_processes`` of the instance's LXC wrapper.
+
+    :ivar instance: The LXD instance.
+    """
+
+    error_class = LXDError
+    trace_category = "lxc"
+
+    def __init__(self, instance: LXDInstance) -> None:
+        super().__init__(
+            instance_name=instance.instance_name,
+            max_processes=instance.lxc.max_processes,
+        )
+        self.instance = instance
+
+    @override
+    def get_exec_command(
+        self,
+        command: list[str],
+        *,
+        cwd: pathlib.PurePath | None = None,
+        env: dict[str, str | None] | None = None,
+    ) -> list[str]:
+        return self.instance.get_exec_command(command, cwd=cwd, env=env)
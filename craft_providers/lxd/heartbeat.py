@@ -0,0 +1,121 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Heartbeats showing that a process setting up an instance is still running.
+
+A process setting up an instance beats in two places:
+
+- The mtime of a file of the host, touched every few seconds. Touching a file
+  costs no request to LXD and is seen by other processes on the same host.
+- The timer config key of the instance, set at a much coarser interval. Each
+  write is a transaction in the LXD database, but it is seen by processes on
+  other hosts sharing the remote, and by older versions of craft-providers.
+
+A process waiting for the instance considers the setup alive as long as either
+heartbeat changes within `HEARTBEAT_TIMEOUT` seconds.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pathlib
+
+logger = logging.getLogger(__name__)
+
+# Config key of the instance holding the time of the last heartbeat.
+HEARTBEAT_CONFIG_KEY = "user.craft_providers.timer"
+
+# Seconds between touches of the heartbeat file.
+HEARTBEAT_INTERVAL = 3.0
+
+# Seconds between writes of the heartbeat config key.
+HEARTBEAT_CONFIG_INTERVAL = 20.0
+
+# Seconds without a heartbeat after which a setup is considered dead. It must be
+# several times `HEARTBEAT_CONFIG_INTERVAL` for waiters on other hosts.
+HEARTBEAT_TIMEOUT = 60.0
+
+
+def default_heartbeat_directory() -> pathlib.Path:
+    """Get the default directory of heartbeat files, in the user runtime directory."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return pathlib.Path(runtime_dir, "craft-providers", "heartbeats")
+    cache_home = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    return pathlib.Path(cache_home, "craft-providers", "heartbeats")
+
+
+def heartbeat_path(
+    *,
+    instance_name: str,
+    project: str,
+    remote: str,
+    directory: pathlib.Path | None = None,
+) -> pathlib.Path:
+    """Get the path of the heartbeat file of an instance.
+
+    :param instance_name: Name of the instance.
+    :param project: Name of the LXD project of the instance.
+    :param remote: Name of the LXD remote of the instance.
+    :param directory: Directory of heartbeat files. Defaults to
+        `default_heartbeat_directory()`.
+
+    :returns: The path of the heartbeat file.
+    """
+    if directory is None:
+        directory = default_heartbeat_directory()
+    return directory / f"{remote}-{project}-{instance_name}.heartbeat"
+
+
+def beat(path: pathlib.Path) -> None:
+    """Update the mtime of a heartbeat file, creating it if needed.
+
+    Errors are logged and ignored, since waiters fall back to the timer config
+    key of the instance.
+
+    :param path: Path of the heartbeat file.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    except OSError as error:
+        logger.debug("Failed to update heartbeat file %s: %s", path, error)
+
+
+def read(path: pathlib.Path) -> int | None:
+    """Get the time of the last heartbeat written to a file.
+
+    :param path: Path of the heartbeat file.
+
+    :returns: The mtime of the file in nanoseconds, or None if there is no file.
+    """
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def remove(path: pathlib.Path) -> None:
+    """Remove a heartbeat file once the setup is over.
+
+    :param path: Path of the heartbeat file.
+    """
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as error:
+        logger.debug("Failed to remove heartbeat file %s: %s", path, error)
@@ -0,0 +1,328 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""History of the launches of LXD instances.
+
+Each launch is recorded in a SQLite database with the path it took, e.g.
+copying a base instance, and how long it took. The history can be queried, or
+exported for Prometheus' textfile collector, to track how often base instances
+are reused.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import json
+import logging
+import os
+import pathlib
+import sqlite3
+import tempfile
+from collections import Counter, defaultdict
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for another process to release the database.
+DATABASE_TIMEOUT = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS launches (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    instance_name TEXT NOT NULL,
+    base_instance_name TEXT,
+    image TEXT NOT NULL,
+    compatibility_tag TEXT NOT NULL,
+    path TEXT,
+    success INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    phase_durations TEXT NOT NULL
+)
+"""
+
+_COLUMNS = (
+    "timestamp",
+    "instance_name",
+    "base_instance_name",
+    "image",
+    "compatibility_tag",
+    "path",
+    "success",
+    "duration",
+    "phase_durations",
+)
+
+
+class LaunchPath(Enum):
+    """Path taken to launch an instance."""
+
+    EXISTING = "existing"
+    """An existing instance was reused."""
+
+    CREATED = "created"
+    """The instance was created from an image, without a base instance."""
+
+    BASE_CREATED = "base_created"
+    """The base instance did not exist, so it was created from an image."""
+
+    BASE_REBUILT = "base_rebuilt"
+    """The base instance was expired or invalid, so it was recreated."""
+
+    BASE_COPIED = "base_copied"
+    """The instance was copied from a valid base instance."""
+
+    @property
+    def base_hit(self) -> bool | None:
+        """Whether a base instance was reused, or None if none was involved."""
+        if self in (LaunchPath.EXISTING, LaunchPath.CREATED):
+            return None
+        return self == LaunchPath.BASE_COPIED
+
+
+@dataclasses.dataclass
+class LaunchRecord:
+    """A launch of an instance.
+
+    :param timestamp: Start time, in seconds since the epoch.
+    :param instance_name: Name of the instance.
+    :param base_instance_name: Name of the base instance, if base instances
+        are used.
+    :param image: Image of the instance, as 'remote:name'.
+    :param compatibility_tag: Compatibility tag of the base configuration.
+    :param path: Path taken, or None if the launch failed before choosing it.
+    :param success: True if the launch succeeded.
+    :param duration: Duration of the launch in seconds.
+    :param phase_durations: Duration in seconds of the main phases, e.g.
+        'copy' or 'setup'.
+    """
+
+    timestamp: float
+    instance_name: str
+    base_instance_name: str | None
+    image: str
+    compatibility_tag: str
+    path: LaunchPath | None = None
+    success: bool = False
+    duration: float = 0.0
+    phase_durations: dict[str, float] = dataclasses.field(default_factory=dict)
+
+    @property
+    def base_hit(self) -> bool | None:
+        """Whether a base instance was reused, or None if none was involved."""
+        return None if self.path is None else self.path.base_hit
+
+
+def default_history_path() -> pathlib.Path:
+    """Get the default path of the history database, in the user cache directory."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    return pathlib.Path(cache_home, "craft-providers", "launch-history.sqlite3")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    return ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items())
+
+
+class LaunchHistory:
+    """Store of launch records.
+
+    Recording is best effort: errors writing to the database are logged and
+    ignored, so they never fail a launch.
+
+    :param path: Path of the SQLite database. Defaults to
+        `default_history_path()`.
+    """
+
+    def __init__(self, path: pathlib.Path | None = None) -> None:
+        self.path = path or default_history_path()
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=DATABASE_TIMEOUT)
+        try:
+            with connection:
+                connection.execute(_SCHEMA)
+                yield connection
+        finally:
+            connection.close()
+
+    def record(self, record: LaunchRecord) -> None:
+        """Add a launch to the history.
+
+        :param record: Launch to add.
+        """
+        values = dataclasses.asdict(record)
+        values["path"] = None if record.path is None else record.path.value
+        values["phase_durations"] = json.dumps(record.phase_durations)
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    f"INSERT INTO launches ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                    [values[column] for column in _COLUMNS],
+                )
+        except (OSError, sqlite3.Error) as error:
+            logger.debug("Failed to record launch in %s: %s", str(self.path), error)
+
+    def query(
+        self,
+        *,
+        since: datetime | None = None,
+        compatibility_tag: str | None = None,
+        path: LaunchPath | None = None,
+        limit: int | None = None,
+    ) -> list[LaunchRecord]:
+        """Get the recorded launches, most recent first.
+
+        :param since: Only get launches started at or after this time.
+        :param compatibility_tag: Only get launches with this compatibility tag.
+        :param path: Only get launches that took this path.
+        :param limit: Maximum number of launches to get.
+
+        :returns: The launches.
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            params.append(since.timestamp())
+        if compatibility_tag is not None:
+            conditions.append("compatibility_tag = ?")
+            params.append(compatibility_tag)
+        if path is not None:
+            conditions.append("path = ?")
+            params.append(path.value)
+
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM launches"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY timestamp DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._connect() as connection:
+            rows = connection.execute(sql, params).fetchall()
+
+        records = []
+        for row in rows:
+            values = dict(zip(_COLUMNS, row, strict=True))
+            values["path"] = (
+                None if values["path"] is None else LaunchPath(values["path"])
+            )
+            values["success"] = bool(values["success"])
+            values["phase_durations"] = json.loads(values["phase_durations"])
+            records.append(LaunchRecord(**values))
+        return records
+
+    def hit_rate(
+        self, *, since: datetime | None = None, compatibility_tag: str | None = None
+    ) -> float | None:
+        """Get the fraction of launches that reused a base instance.
+
+        Only launches that involved a base instance are counted.
+
+        :param since: Only count launches started at or after this time.
+        :param compatibility_tag: Only count launches with this compatibility tag.
+
+        :returns: The hit rate, or None if no launch involved a base instance.
+        """
+        hits = Counter(
+            record.base_hit
+            for record in self.query(since=since, compatibility_tag=compatibility_tag)
+            if record.base_hit is not None
+        )
+        total = hits[True] + hits[False]
+        return hits[True] / total if total else None
+
+    def format_prometheus(self) -> str:
+        """Format the history in the Prometheus text exposition format."""
+        launches: Counter[tuple[str, str, str]] = Counter()
+        durations: defaultdict[tuple[str, str], float] = defaultdict(float)
+        base: Counter[tuple[str, bool]] = Counter()
+        for record in self.query():
+            path = "unknown" if record.path is None else record.path.value
+            success = "true" if record.success else "false"
+            launches[path, record.compatibility_tag, success] += 1
+            durations[path, record.compatibility_tag] += record.duration
+            if record.base_hit is not None:
+                base[record.compatibility_tag, record.base_hit] += 1
+
+        lines = [
+            "# HELP craft_providers_launches_total Launches of LXD instances.",
+            "# TYPE craft_providers_launches_total counter",
+        ]
+        for (path, tag, success), count in sorted(launches.items()):
+            labels = {"path": path, "compatibility_tag": tag, "success": success}
+            lines.append(
+                f"craft_providers_launches_total{{{_format_labels(labels)}}} {count}"
+            )
+        lines.extend(
+            [
+                (
+                    "# HELP craft_providers_launch_duration_seconds_total "
+                    "Time spent launching LXD instances."
+                ),
+                "# TYPE craft_providers_launch_duration_seconds_total counter",
+            ]
+        )
+        for (path, tag), duration in sorted(durations.items()):
+            labels = {"path": path, "compatibility_tag": tag}
+            lines.append(
+                "craft_providers_launch_duration_seconds_total"
+                f"{{{_format_labels(labels)}}} {duration:.3f}"
+            )
+        for name, hit in (("hits", True), ("misses", False)):
+            metric = f"craft_providers_base_instance_{name}_total"
+            lines.extend(
+                [
+                    (
+                        f"# HELP {metric} Launches that "
+                        f"{'' if hit else 'could not '}reuse a base instance."
+                    ),
+                    f"# TYPE {metric} counter",
+                ]
+            )
+            for tag in sorted({tag for tag, _ in base}):
+                labels = {"compatibility_tag": tag}
+                lines.append(f"{metric}{{{_format_labels(labels)}}} {base[tag, hit]}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus_textfile(self, path: pathlib.Path) -> None:
+        """Write the history for Prometheus' textfile collector.
+
+        The file is replaced atomically, so the collector never reads a
+        partial file.
+
+        :param path: Path of the file to write, usually ending with '.prom'.
+        """
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, prefix=f".{path.name}.", delete=False
+        ) as stream:
+            stream.write(self.format_prometheus())
+        pathlib.Path(stream.name).replace(path)
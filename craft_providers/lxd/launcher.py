@@ -19,6 +19,8 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
 import logging
 import os
 import re
@@ -32,62 +34,167 @@ from typing import TYPE_CHECKING
 
 from craft_providers import Base, ProviderError, bases
 from craft_providers.errors import details_from_called_process_error
+from craft_providers.phases import PhaseEventType
 
+from . import heartbeat
 from .errors import LXDError
+from .launch_history import LaunchHistory, LaunchPath, LaunchRecord
+from .lease import instance_lease
 from .lxc import LXC
 from .lxd_instance import LXDInstance
 from .lxd_instance_status import LXDInstanceState, ProviderInstanceStatus
 from .project import create_with_default_profile
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Generator, Iterator, Sequence
     from enum import Enum
 
     from craft_providers import Executor
+    from craft_providers.phases import PhaseEvent, PhaseObserver
 
 logger = logging.getLogger(__name__)
 
+# Instances launched at a time by `launch_many()`, by default.
+LAUNCH_WORKERS = 8
+
 
 class InstanceTimer(threading.Thread):
-    """Timer for update instance that still alive."""
+    """Timer for update instance that still alive.
+
+    The timer touches a heartbeat file on the host every ``interval`` seconds and
+    sets the timer config key of the instance every ``config_interval`` seconds.
+    Touching the file is cheap, so the config key, which is a write to the LXD
+    database, can be set much less often.
+    """
 
-    __active: bool = True
     __interval: float
+    __config_interval: float
     __instance: LXDInstance
-
-    def __init__(self, instance: LXDInstance, interval: int = 3) -> None:
+    __stopped: threading.Event
+    __path: Path
+
+    def __init__(
+        self,
+        instance: LXDInstance,
+        interval: float = heartbeat.HEARTBEAT_INTERVAL,
+        config_interval: float = heartbeat.HEARTBEAT_CONFIG_INTERVAL,
+    ) -> None:
         """Initialize the timer.
 
         :param instance: LXD instance to update.
-        :param interval: Interval in seconds to update the instance timer.
+        :param interval: Interval in seconds to update the heartbeat file.
+        :param config_interval: Interval in seconds to update the instance timer.
         """
         self.__instance = instance
         self.__interval = interval
+        self.__config_interval = config_interval
+        self.__stopped = threading.Event()
+        self.__path = heartbeat.heartbeat_path(
+            instance_name=instance.instance_name,
+            project=instance.project,
+            remote=instance.remote,
+        )
         super().__init__(daemon=True)
 
     def run(self) -> None:
         """Run the timer."""
-        while self.__active:
-            now = datetime.now(timezone.utc).isoformat()
-            try:
-                self.__instance.config_set("user.craft_providers.timer", now)
-                logger.debug("Set instance timer to %r", now)
-            except LXDError:
-                # Error in timer update is not critical
-                logging.exception("Error updating instance timer")
-            time.sleep(self.__interval)
-
-        try:
-            self.__instance.config_set("user.craft_providers.timer", "DONE")
-            logger.debug("Set instance timer to 'DONE'")
-        except LXDError:
-            # Error in timer update is not critical
-            logging.exception("Error updating instance timer")
+        next_config_update = time.monotonic()
+        while True:
+            heartbeat.beat(self.__path)
+            if time.monotonic() >= next_config_update:
+                now = datetime.now(timezone.utc).isoformat()
+                try:
+                    self.__instance.config_set(heartbeat.HEARTBEAT_CONFIG_KEY, now)
+                    logger.debug("Set instance timer to %r", now)
+                except LXDError:
+                    # Error in timer update is not critical
+                    logging.exception("Error updating instance timer")
+                next_config_update = time.monotonic() + self.__config_interval
+            if self.__stopped.wait(self.__interval):
+                break
+
+        heartbeat.remove(self.__path)
         logger.debug("Instance timer update stopped.")
 
     def stop(self) -> None:
-        """Stop the timer."""
-        self.__active = False
+        """Stop the timer and wait for it to finish.
+
+        The caller sets the instance timer to 'DONE' along with the final status of
+        the instance.
+        """
+        self.__stopped.set()
+        if self.is_alive():
+            self.join()
+
+
+def _create_base_instance(
+    *,
+    base_instance: LXDInstance,
+    base_configuration: Base[Enum],
+    image_name: str,
+    image_remote: str,
+    map_user_uid: bool,
+    uid: int | None,
+    gid: int | None,
+    prepare_instance: Callable[[Executor], None] | None,
+) -> None:
+    """Launch and setup a base instance from an image, then stop it.
+
+    Callers that do not hold the lease on the base instance get an LXDError on
+    launch and wait until the base instance is created.
+
+    :param base_instance: LXD instance to launch and setup.
+    :param base_configuration: Base configuration to apply to the instance.
+    :param image_name: LXD image to use, e.g. "20.04".
+    :param image_remote: LXD image to use, e.g. "ubuntu".
+    :param map_user_uid: Map host uid/gid to instance's root uid/gid.
+    :param uid: The uid to be mapped, if ``map_user_uid`` is enabled.
+    :param gid: The group id to be mapped, if ``map_user_uid`` is enabled.
+    :param prepare_instance: A callback to perform early instance configuration
+    before the base image setup.
+    """
+    logger.info("Creating new base instance from remote")
+    logger.debug(
+        "Creating new base instance from image %r from remote %r",
+        image_name,
+        image_remote,
+    )
+    base_instance.launch(
+        image=image_name,
+        image_remote=image_remote,
+        ephemeral=False,  # base instance should not ephemeral
+        map_user_uid=map_user_uid,
+        uid=uid,
+        gid=gid,
+    )
+    base_instance_status = base_instance.config_get("user.craft_providers.status")
+
+    # Skip the base configuration if the instance is already configured.
+    if base_instance_status != ProviderInstanceStatus.FINISHED.value:
+        logger.debug("Setting up base instance %r", base_instance.instance_name)
+        base_instance.config_set(
+            "user.craft_providers.status", ProviderInstanceStatus.PREPARING.value
+        )
+        config_timer = InstanceTimer(base_instance)
+        config_timer.start()
+
+        if prepare_instance:
+            prepare_instance(base_instance)
+
+        # The base configuration shouldn't mount cache directories because if
+        # they get deleted, copying the base instance will fail.
+        base_configuration.setup(executor=base_instance, mount_cache=False)
+        config_timer.stop()
+        base_instance.config_set_many(
+            {
+                **_get_timezone_config(),
+                # set the full instance name as image description
+                "image.description": base_instance.name,
+                "user.craft_providers.status": ProviderInstanceStatus.FINISHED.value,
+                heartbeat.HEARTBEAT_CONFIG_KEY: "DONE",
+            }
+        )
+        base_instance.stop()
 
 
 def _create_instance(  # noqa: PLR0913, too many arguments
@@ -103,8 +210,8 @@ def _create_instance(  # noqa: PLR0913, too many arguments
     gid: int | None,
     project: str,
     remote: str,
-    lxc: LXC,
     prepare_instance: Callable[[Executor], None] | None = None,
+    base_instance_ready: Callable[[], None] | None = None,
 ) -> None:
     """Launch and setup an instance from an image.
 
@@ -127,57 +234,27 @@ def _create_instance(  # noqa: PLR0913, too many arguments
     :param remote: LXD remote to create instance on.
     :param prepare_instance: A callback to perform early instance configuration
     before the base image setup.
-    :param lxc: LXC client.
+    :param base_instance_ready: A callback called once the base instance is set up
+    and stopped, before it is copied to the instance.
     """
     logger.info("Creating new instance from remote")
+    pending_config: dict[str, str] = {}
 
-    # Lockable base instance creation. Only one caller can create the base instance.
-    # Other callers will will get LXDError and wait until the base instance is created.
     if base_instance:
-        logger.info("Creating new base instance from remote")
-        logger.debug(
-            "Creating new base instance from image %r from remote %r",
-            image_name,
-            image_remote,
-        )
-        base_instance.launch(
-            image=image_name,
+        # the caller holds the lease on the base instance, so other callers wait
+        # until it is created
+        _create_base_instance(
+            base_instance=base_instance,
+            base_configuration=base_configuration,
+            image_name=image_name,
             image_remote=image_remote,
-            ephemeral=False,  # base instance should not ephemeral
             map_user_uid=map_user_uid,
             uid=uid,
             gid=gid,
+            prepare_instance=prepare_instance,
         )
-        base_instance_status = base_instance.config_get("user.craft_providers.status")
-
-        # Skip the base configuration if the instance is already configured.
-        if base_instance_status != ProviderInstanceStatus.FINISHED.value:
-            logger.debug("Setting up base instance %r", base_instance.instance_name)
-            base_instance.config_set(
-                "user.craft_providers.status", ProviderInstanceStatus.PREPARING.value
-            )
-            config_timer = InstanceTimer(base_instance)
-            config_timer.start()
-
-            if prepare_instance:
-                prepare_instance(base_instance)
-
-            # The base configuration shouldn't mount cache directories because if
-            # they get deleted, copying the base instance will fail.
-            base_configuration.setup(executor=base_instance, mount_cache=False)
-            _set_timezone(
-                base_instance,
-                base_instance.project,
-                base_instance.remote,
-                base_instance.lxc,
-            )
-            # set the full instance name as image description
-            base_instance.config_set("image.description", base_instance.name)
-            base_instance.config_set(
-                "user.craft_providers.status", ProviderInstanceStatus.FINISHED.value
-            )
-            config_timer.stop()
-            base_instance.stop()
+        if base_instance_ready:
+            base_instance_ready()
 
         # Copy the base instance to the instance.
         logger.info("Creating new instance from base instance")
@@ -186,14 +263,9 @@ def _create_instance(  # noqa: PLR0913, too many arguments
             instance.instance_name,
             base_instance.instance_name,
         )
-        lxc.copy(
-            source_remote=base_instance.remote,
-            source_instance_name=base_instance.instance_name,
-            destination_remote=remote,
-            destination_instance_name=instance.instance_name,
-            project=project,
-        )
-        _set_timezone(instance, project, remote, instance.lxc)
+        instance.copy(source=base_instance)
+        # set along with the id map, if there is one, to save a call
+        pending_config.update(_get_timezone_config())
     else:
         logger.debug(
             "Creating new instance from image %r from remote %r",
@@ -224,11 +296,16 @@ def _create_instance(  # noqa: PLR0913, too many arguments
                 prepare_instance(instance)
 
             base_configuration.setup(executor=instance)
-            _set_timezone(instance, project, remote, instance.lxc)
-            instance.config_set(
-                "user.craft_providers.status", ProviderInstanceStatus.FINISHED.value
-            )
             config_timer.stop()
+            instance.config_set_many(
+                {
+                    **_get_timezone_config(),
+                    "user.craft_providers.status": (
+                        ProviderInstanceStatus.FINISHED.value
+                    ),
+                    heartbeat.HEARTBEAT_CONFIG_KEY: "DONE",
+                }
+            )
             if not ephemeral:
                 # stop ephemeral instances will delete them immediately
                 instance.stop()
@@ -242,7 +319,10 @@ def _create_instance(  # noqa: PLR0913, too many arguments
             remote=remote,
             uid=uid,
             gid=gid,
+            extra_config=pending_config,
         )
+    elif pending_config:
+        instance.config_set_many(pending_config)
 
     # now restart and wait for the instance to be ready
     if ephemeral:
@@ -256,6 +336,78 @@ def _create_instance(  # noqa: PLR0913, too many arguments
     base_configuration.warmup(executor=instance)
 
 
+def _copy_base_instance(  # noqa: PLR0913, too many arguments
+    *,
+    instance: LXDInstance,
+    base_instance: LXDInstance,
+    base_configuration: Base[Enum],
+    lxc: LXC,
+    project: str,
+    remote: str,
+    map_user_uid: bool,
+    uid: int | None,
+    gid: int | None,
+) -> None:
+    """Create an instance from a valid base instance, then start and warm it up.
+
+    :param instance: LXD instance to create.
+    :param base_instance: LXD instance to copy.
+    :param base_configuration: Base configuration to apply to instance.
+    :param lxc: LXC client.
+    :param project: LXD project to create instance in.
+    :param remote: LXD remote to create instance on.
+    :param map_user_uid: Map host uid/gid to instance's root uid/gid.
+    :param uid: The uid to be mapped, if ``map_user_uid`` is enabled.
+    :param gid: The group id to be mapped, if ``map_user_uid`` is enabled.
+    """
+    logger.info("Creating instance from base instance")
+    logger.debug(
+        "Creating instance from base instance %r.", base_instance.instance_name
+    )
+
+    # the base instance is not expected to be running but check for safety
+    if base_instance.is_running():
+        logger.debug("Stopping base instance.")
+
+    instance.copy(source=base_instance)
+
+    # the newly copied instance should not be running, but check anyways
+    if instance.is_running():
+        logger.debug("Instance is already running.")
+        instance.stop()
+
+    # set the timezone on every launch because the host's timezone may have changed
+    # since the instance was setup
+    timezone_config = _get_timezone_config()
+
+    # set the id map while the instance is not running
+    if map_user_uid:
+        _set_id_map(
+            instance=instance,
+            lxc=lxc,
+            project=project,
+            remote=remote,
+            uid=uid,
+            gid=gid,
+            extra_config=timezone_config,
+        )
+    elif timezone_config:
+        lxc.config_set_many(
+            instance_name=instance.instance_name,
+            config=timezone_config,
+            project=project,
+            remote=remote,
+        )
+
+    # instance is now ready to be started and warmed up
+    instance.start()
+
+    # change the hostname from the base instance's hostname
+    base_configuration.setup_hostname(executor=instance)
+
+    base_configuration.warmup(executor=instance)
+
+
 def _ensure_project_exists(
     *, create: bool, project: str, remote: str, lxc: LXC
 ) -> None:
@@ -357,6 +509,21 @@ def _is_valid(*, instance: LXDInstance, expiration: timedelta) -> bool:
     return True
 
 
+def _is_valid_base_instance(
+    *, base_instance: LXDInstance, expiration: timedelta
+) -> bool:
+    """Check if a base instance exists and is valid.
+
+    :param base_instance: The base instance.
+    :param expiration: How long a base instance will be valid from its creation date.
+
+    :returns: True if the base instance can be copied.
+    """
+    return base_instance.exists() and _is_valid(
+        instance=base_instance, expiration=expiration
+    )
+
+
 def _launch_existing_instance(  # noqa: PLR0913, too many arguments
     *,
     instance: LXDInstance,
@@ -520,6 +687,7 @@ def _set_id_map(
     remote: str = "local",
     uid: int | None = None,
     gid: int | None = None,
+    extra_config: dict[str, str] | None = None,
 ) -> None:
     """Configure the instance's id map.
 
@@ -536,6 +704,7 @@ def _set_id_map(
     :param remote: LXD remote to create instance on.
     :param uid: The uid to be mapped. If not supplied, the current user's uid is used.
     :param gid: The gid to be mapped. If not supplied, the current process's gid is used.
+    :param extra_config: Other configuration keys to set along with the id map.
     """
     if lxc is None:
         lxc = LXC()
@@ -544,10 +713,12 @@ def _set_id_map(
     uid = uid or os.getuid()
     gid = gid or os.getgid()
 
-    lxc.config_set(
+    lxc.config_set_many(
         instance_name=instance.instance_name,
-        key="raw.idmap",
-        value=f"uid {uid!s} 0\ngid {gid!s} 0",
+        config={
+            **(extra_config or {}),
+            "raw.idmap": f"uid {uid!s} 0\ngid {gid!s} 0",
+        },
         project=project,
         remote=remote,
     )
@@ -578,16 +749,19 @@ def _set_id_map(
         )
 
 
-def _set_timezone(instance: LXDInstance, project: str, remote: str, lxc: LXC) -> None:
-    """Set the instance's timezone to match the host's timezone.
+def _get_timezone_config() -> dict[str, str]:
+    """Get the configuration that sets an instance's timezone to the host's timezone.
 
-    Sets the instance timezone only on Linux hosts due to usage of the
+    The timezone is only determined on Linux hosts due to usage of the
     `timedatectl` utility.
+
+    :returns: A dictionary with the ``environment.TZ`` configuration key, or an
+        empty dictionary if the host's timezone could not be determined.
     """
     # no-op on non-linux platforms because `timedatectl` won't exist
     if sys.platform != "linux":
         logger.debug("Not setting timezone because host is not Linux.")
-        return
+        return {}
 
     try:
         timezone = subprocess.run(
@@ -603,18 +777,12 @@ def _set_timezone(instance: LXDInstance, project: str, remote: str, lxc: LXC) ->
             "Not setting instance's timezone because host timezone could not "
             f"be determined: {details_from_called_process_error(error)}"
         )
-        return
+        return {}
 
     logger.debug(f"Setting instance timezone to match host timezone {timezone!r}.")
 
     # set the timezone via the TZ environment variable
-    lxc.config_set(
-        instance_name=instance.instance_name,
-        key="environment.TZ",
-        value=timezone,
-        project=project,
-        remote=remote,
-    )
+    return {"environment.TZ": timezone}
 
 
 def _wait_for_instance_ready(instance: LXDInstance) -> None:
@@ -633,7 +801,8 @@ def _wait_for_instance_ready(instance: LXDInstance) -> None:
     - On any failure to get config data or info from the instance.
     """
     instance_state = instance.info().get("Status")
-    instance_status = instance.config_get("user.craft_providers.status")
+    config = instance.config_snapshot()
+    instance_status = config["user.craft_providers.status"]
 
     # check if the instance is ready
     if (
@@ -653,7 +822,7 @@ def _wait_for_instance_ready(instance: LXDInstance) -> None:
     # LXD is linux-only, but verify the platform anyways
     if sys.platform == "linux":
         # get the PID of the process that created the instance
-        pid = instance.config_get("user.craft_providers.pid")
+        pid = config["user.craft_providers.pid"]
 
         # an empty string means there was no value set
         if pid == "":
@@ -691,6 +860,86 @@ def _wait_for_instance_ready(instance: LXDInstance) -> None:
     )
 
 
+def _observe_phase_durations(record: LaunchRecord) -> PhaseObserver:
+    """Get a phase observer adding up the durations of the phases of a launch.
+
+    :param record: Launch record in which to add the durations.
+
+    :returns: The observer, to add to the instances of the launch.
+    """
+
+    def observe(event: PhaseEvent) -> None:
+        if event.type == PhaseEventType.END and event.duration is not None:
+            durations = record.phase_durations
+            durations[event.name] = durations.get(event.name, 0.0) + event.duration
+
+    return observe
+
+
+def _launch_observers(
+    *,
+    base_configuration: Base[Enum],
+    history: LaunchHistory | None,
+    record: LaunchRecord,
+) -> tuple[PhaseObserver, ...]:
+    """Get the phase observers to add to the instances of a launch.
+
+    :param base_configuration: Base configuration used for the launch.
+    :param history: Launch history, or None if the launch is not recorded.
+    :param record: Launch record, completed by the launch.
+
+    :returns: The observers of the base configuration, and the observer of the
+        durations of the phases if the launch is recorded.
+    """
+    observers = base_configuration.phase_observers
+    if history is not None:
+        observers = (*observers, _observe_phase_durations(record))
+    return observers
+
+
+@contextlib.contextmanager
+def _record_launch(
+    *,
+    history: LaunchHistory | None,
+    record: LaunchRecord,
+    start: float | None = None,
+) -> Generator[None, None, None]:
+    """Record a launch run within the context in the launch history.
+
+    The durations of the phases are collected by the observers from
+    `_launch_observers()`, added to the instances of the launch.
+
+    :param history: Launch history, or None to not record the launch.
+    :param record: Launch record, completed by the launch.
+    :param start: Start of the launch, as returned by `time.monotonic()`.
+        Defaults to the start of the context.
+    """
+    if history is None:
+        yield
+        return
+
+    if start is None:
+        start = time.monotonic()
+    try:
+        yield
+        record.success = True
+    finally:
+        _save_launch_record(history=history, record=record, start=start)
+
+
+def _save_launch_record(
+    *, history: LaunchHistory, record: LaunchRecord, start: float
+) -> None:
+    """Add a launch to the launch history once it is done.
+
+    :param history: Launch history.
+    :param record: Launch record.
+    :param start: Start of the launch, as returned by `time.monotonic()`.
+    """
+    record.duration = time.monotonic() - start
+    history.record(record)
+
+
 def launch(  # noqa: PLR0913, too many arguments
     name: str,
     *,
@@ -709,6 +958,7 @@ def launch(  # noqa: PLR0913, too many arguments
     lxc: LXC | None = None,
     expiration: timedelta = timedelta(days=90),
     prepare_instance: Callable[[Executor], None] | None = None,
+    history: LaunchHistory | None = None,
 ) -> LXDInstance:
     """Create, start, and configure an instance.
 
@@ -727,7 +977,8 @@ def launch(  # noqa: PLR0913, too many arguments
     changed with the `expiration` parameter.
 
     :param name: Name of instance.
-    :param base_configuration: Base configuration to apply to the instance.
+    :param base_configuration: Base configuration to apply to the instance. Its
+    phase observers are also added to the instances.
     :param image_name: LXD image to use, e.g. "20.04".
     :param image_remote: LXD image to use, e.g. "ubuntu".
     :param auto_clean: If true and the existing instance is incompatible, then the
@@ -747,6 +998,8 @@ def launch(  # noqa: PLR0913, too many arguments
     :param expiration: How long a base instance will be valid from its creation date.
     :param prepare_instance: A callback to perform early instance configuration
     before the base image setup.
+    :param history: Launch history in which to record the path taken and the
+    duration of the launch.
 
     :returns: LXD instance.
 
@@ -755,174 +1008,498 @@ def launch(  # noqa: PLR0913, too many arguments
     :raises LXDError: on unexpected LXD error.
     :raises ProviderError: if name of instance collides with base instance name.
     """
-    if lxc is None:
-        lxc = LXC()
-
-    _ensure_project_exists(
-        create=auto_create_project, project=project, remote=remote, lxc=lxc
+    record = LaunchRecord(
+        timestamp=time.time(),
+        instance_name=name,
+        base_instance_name=None,
+        image=f"{image_remote}:{image_name}",
+        compatibility_tag=base_configuration.compatibility_tag,
     )
-    instance = LXDInstance(
-        name=name,
-        project=project,
-        remote=remote,
-        default_command_environment=base_configuration.get_command_environment(),
+    observers = _launch_observers(
+        base_configuration=base_configuration, history=history, record=record
     )
+    with _record_launch(history=history, record=record):
+        if lxc is None:
+            lxc = LXC()
 
-    # If the existing instance could not be launched, then continue on so a new
-    # instance can be created (this can occur when `auto_clean` triggers the
-    # instance to be deleted or if the instance is supposed to be ephemeral)
-    logger.debug(
-        "Checking for instance %r in project %r in remote %r",
-        instance.instance_name,
-        project,
-        remote,
-    )
-    if instance.exists() and _launch_existing_instance(
-        instance=instance,
-        lxc=lxc,
-        project=project,
-        remote=remote,
-        auto_clean=auto_clean,
-        base_configuration=base_configuration,
-        ephemeral=ephemeral,
-        map_user_uid=map_user_uid,
-        uid=uid,
-        gid=gid,
-    ):
-        return instance
-
-    logger.debug("Instance %r does not exist.", instance.instance_name)
+        _ensure_project_exists(
+            create=auto_create_project, project=project, remote=remote, lxc=lxc
+        )
+        instance = LXDInstance(
+            name=name,
+            project=project,
+            remote=remote,
+            default_command_environment=base_configuration.get_command_environment(),
+            lxc=lxc,
+        )
+        record.instance_name = instance.instance_name
+        for observer in observers:
+            instance.add_phase_observer(observer)
 
-    if not use_base_instance:
-        logger.debug("Using base instances is disabled.")
-        _create_instance(
+        # If the existing instance could not be launched, then continue on so a new
+        # instance can be created (this can occur when `auto_clean` triggers the
+        # instance to be deleted or if the instance is supposed to be ephemeral)
+        logger.debug(
+            "Checking for instance %r in project %r in remote %r",
+            instance.instance_name,
+            project,
+            remote,
+        )
+        if instance.exists() and _launch_existing_instance(
             instance=instance,
-            base_instance=None,
+            lxc=lxc,
+            project=project,
+            remote=remote,
+            auto_clean=auto_clean,
             base_configuration=base_configuration,
-            image_name=image_name,
-            image_remote=image_remote,
             ephemeral=ephemeral,
             map_user_uid=map_user_uid,
             uid=uid,
             gid=gid,
+        ):
+            record.path = LaunchPath.EXISTING
+            return instance
+
+        logger.debug("Instance %r does not exist.", instance.instance_name)
+
+        if not use_base_instance:
+            logger.debug("Using base instances is disabled.")
+            record.path = LaunchPath.CREATED
+            _create_instance(
+                instance=instance,
+                base_instance=None,
+                base_configuration=base_configuration,
+                image_name=image_name,
+                image_remote=image_remote,
+                ephemeral=ephemeral,
+                map_user_uid=map_user_uid,
+                uid=uid,
+                gid=gid,
+                project=project,
+                remote=remote,
+                prepare_instance=prepare_instance,
+            )
+            return instance
+
+        base_instance_name = _formulate_base_instance_name(
+            image_name=image_name,
+            image_remote=image_remote,
+            compatibility_tag=base_configuration.compatibility_tag,
+        )
+        base_instance = LXDInstance(
+            name=base_instance_name,
             project=project,
             remote=remote,
+            default_command_environment=base_configuration.get_command_environment(),
             lxc=lxc,
-            prepare_instance=prepare_instance,
         )
-        return instance
-
-    base_instance_name = _formulate_base_instance_name(
-        image_name=image_name,
-        image_remote=image_remote,
-        compatibility_tag=base_configuration.compatibility_tag,
-    )
-    base_instance = LXDInstance(
-        name=base_instance_name,
-        project=project,
-        remote=remote,
-        default_command_environment=base_configuration.get_command_environment(),
-    )
-    logger.debug(
-        "Checking for base instance %r in project %r in remote %r",
-        base_instance.instance_name,
-        project,
-        remote,
-    )
-
-    # an application could formulate an instance name that matches the base instance's
-    # name, which would break calls to `lxc.copy()`
-    if instance.instance_name == base_instance.instance_name:
-        raise ProviderError(
-            brief="instance name cannot match the base instance name: "
-            f"{instance.instance_name!r}",
-            resolution="change name of instance",
+        record.base_instance_name = base_instance.instance_name
+        for observer in observers:
+            base_instance.add_phase_observer(observer)
+        logger.debug(
+            "Checking for base instance %r in project %r in remote %r",
+            base_instance.instance_name,
+            project,
+            remote,
         )
 
-    # the base instance does not exist, so create a new instance and base instance
-    if not base_instance.exists():
-        logger.debug("Base instance %r does not exist.", base_instance.instance_name)
-        _create_instance(
+        # an application could formulate an instance name that matches the base instance's
+        # name, which would break calls to `lxc.copy()`
+        if instance.instance_name == base_instance.instance_name:
+            raise ProviderError(
+                brief="instance name cannot match the base instance name: "
+                f"{instance.instance_name!r}",
+                resolution="change name of instance",
+            )
+
+        # only one process at a time creates the base instance, and the others are
+        # woken once it is ready, so the lease is only taken to create it
+        if not _is_valid_base_instance(
+            base_instance=base_instance, expiration=expiration
+        ):
+            with instance_lease(
+                lxc=lxc,
+                instance_name=base_instance.instance_name,
+                project=project,
+                remote=remote,
+            ) as lease:
+                # the base instance does not exist, so create a new instance and base
+                # instance
+                if not base_instance.exists():
+                    logger.debug(
+                        "Base instance %r does not exist.", base_instance.instance_name
+                    )
+                    record.path = LaunchPath.BASE_CREATED
+                    _create_instance(
+                        instance=instance,
+                        base_instance=base_instance,
+                        base_configuration=base_configuration,
+                        image_name=image_name,
+                        image_remote=image_remote,
+                        ephemeral=ephemeral,
+                        map_user_uid=map_user_uid,
+                        uid=uid,
+                        gid=gid,
+                        project=project,
+                        remote=remote,
+                        prepare_instance=prepare_instance,
+                        base_instance_ready=lease.release,
+                    )
+                    return instance
+
+                # the base instance exists but is not valid, so delete it then create a
+                # new instance and base instance
+                if not _is_valid(instance=base_instance, expiration=expiration):
+                    logger.debug(
+                        "Base instance %r is not valid. Deleting base instance.",
+                        base_instance.instance_name,
+                    )
+                    record.path = LaunchPath.BASE_REBUILT
+                    base_instance.delete()
+                    _create_instance(
+                        instance=instance,
+                        base_instance=base_instance,
+                        base_configuration=base_configuration,
+                        image_name=image_name,
+                        image_remote=image_remote,
+                        ephemeral=ephemeral,
+                        map_user_uid=map_user_uid,
+                        uid=uid,
+                        gid=gid,
+                        project=project,
+                        remote=remote,
+                        prepare_instance=prepare_instance,
+                        base_instance_ready=lease.release,
+                    )
+                    return instance
+
+        # at this point, there is a valid base instance to be copied to a new instance
+        record.path = LaunchPath.BASE_COPIED
+        _copy_base_instance(
             instance=instance,
             base_instance=base_instance,
             base_configuration=base_configuration,
-            image_name=image_name,
-            image_remote=image_remote,
-            ephemeral=ephemeral,
+            lxc=lxc,
+            project=project,
+            remote=remote,
             map_user_uid=map_user_uid,
             uid=uid,
             gid=gid,
-            project=project,
-            remote=remote,
-            lxc=lxc,
-            prepare_instance=prepare_instance,
         )
+
         return instance
 
-    # the base instance exists but is not valid, so delete it then create a new
-    # instance and base instance
-    if not _is_valid(instance=base_instance, expiration=expiration):
-        logger.debug(
-            "Base instance %r is not valid. Deleting base instance.",
-            base_instance.instance_name,
-        )
-        base_instance.delete()
-        _create_instance(
-            instance=instance,
+
+def _prepare_base_instance(  # noqa: PLR0913, too many arguments
+    *,
+    base_instance: LXDInstance,
+    base_configuration: Base[Enum],
+    image_name: str,
+    image_remote: str,
+    lxc: LXC,
+    project: str,
+    remote: str,
+    expiration: timedelta,
+    map_user_uid: bool,
+    uid: int | None,
+    gid: int | None,
+    prepare_instance: Callable[[Executor], None] | None,
+) -> LaunchPath:
+    """Create the base instance if it does not exist or is not valid.
+
+    Only one process at a time creates the base instance.
+
+    :param base_instance: The base instance.
+    :param base_configuration: Base configuration to apply to the base instance.
+    :param image_name: LXD image to use, e.g. "20.04".
+    :param image_remote: LXD image to use, e.g. "ubuntu".
+    :param lxc: LXC client.
+    :param project: LXD project of the base instance.
+    :param remote: LXD remote of the base instance.
+    :param expiration: How long a base instance will be valid from its creation date.
+    :param map_user_uid: Map host uid/gid to instance's root uid/gid.
+    :param uid: The uid to be mapped, if ``map_user_uid`` is enabled.
+    :param gid: The group id to be mapped, if ``map_user_uid`` is enabled.
+    :param prepare_instance: A callback to perform early instance configuration
+    before the base image setup.
+
+    :returns: The path taken to launch from the base instance.
+    """
+    if _is_valid_base_instance(base_instance=base_instance, expiration=expiration):
+        return LaunchPath.BASE_COPIED
+
+    with instance_lease(
+        lxc=lxc,
+        instance_name=base_instance.instance_name,
+        project=project,
+        remote=remote,
+    ):
+        if base_instance.exists():
+            if _is_valid(instance=base_instance, expiration=expiration):
+                return LaunchPath.BASE_COPIED
+            logger.debug(
+                "Base instance %r is not valid. Deleting base instance.",
+                base_instance.instance_name,
+            )
+            base_instance.delete()
+            path = LaunchPath.BASE_REBUILT
+        else:
+            logger.debug(
+                "Base instance %r does not exist.", base_instance.instance_name
+            )
+            path = LaunchPath.BASE_CREATED
+
+        _create_base_instance(
             base_instance=base_instance,
             base_configuration=base_configuration,
             image_name=image_name,
             image_remote=image_remote,
-            ephemeral=ephemeral,
             map_user_uid=map_user_uid,
             uid=uid,
             gid=gid,
-            project=project,
-            remote=remote,
-            lxc=lxc,
             prepare_instance=prepare_instance,
         )
-        return instance
+    return path
 
-    # at this point, there is a valid base instance to be copied to a new instance
-    logger.info("Creating instance from base instance")
-    logger.debug(
-        "Creating instance from base instance %r.", base_instance.instance_name
+
+def launch_many(  # noqa: PLR0913, too many arguments
+    names: Sequence[str],
+    *,
+    base_configuration: Base[Enum],
+    image_name: str,
+    image_remote: str,
+    auto_clean: bool = False,
+    auto_create_project: bool = False,
+    map_user_uid: bool = False,
+    uid: int | None = None,
+    gid: int | None = None,
+    use_base_instance: bool = False,
+    project: str = "default",
+    remote: str = "local",
+    lxc: LXC | None = None,
+    expiration: timedelta = timedelta(days=90),
+    prepare_instance: Callable[[Executor], None] | None = None,
+    max_workers: int = LAUNCH_WORKERS,
+    history: LaunchHistory | None = None,
+) -> Iterator[LXDInstance]:
+    """Create, start, and configure several instances from the same base.
+
+    Unlike calling `launch()` for each instance, the base instance is checked,
+    and created if needed, only once. The instances are then copied from it,
+    started and warmed up concurrently, by up to ``max_workers`` threads.
+    Instances that already exist are started and warmed up as with `launch()`.
+
+    Without base instances, each instance is launched from the image with
+    `launch()`, concurrently.
+
+    The instance names, the project and the base instance are checked, and the
+    base instance prepared, when this function is called. The instances are
+    then launched as the returned iterator is consumed. If an instance fails to
+    launch, the instances not started yet are cancelled, and the error is
+    raised by the iterator once the instances being launched are done.
+
+    :param names: Names of the instances.
+    :param base_configuration: Base configuration to apply to the instances.
+    :param image_name: LXD image to use, e.g. "20.04".
+    :param image_remote: LXD image to use, e.g. "ubuntu".
+    :param auto_clean: If true and an existing instance is incompatible, then the
+    instance will be deleted and rebuilt.
+    :param auto_create_project: Automatically create LXD project, if needed.
+    :param map_user_uid: Map host uid/gid to instance's root uid/gid.
+    :param uid: The uid to be mapped, if ``map_user_uid`` is enabled.
+    :param gid: The group id to be mapped, if ``map_user_uid`` is enabled.
+    :param use_base_instance: Use the base instance mechanisms to reduce setup time.
+    :param project: LXD project to create the instances in.
+    :param remote: LXD remote to create the instances on.
+    :param lxc: LXC client.
+    :param expiration: How long a base instance will be valid from its creation date.
+    :param prepare_instance: A callback to perform early instance configuration
+    before the base image setup.
+    :param max_workers: Maximum number of instances launched at a time.
+    :param history: Launch history in which to record the launch of each
+    instance. The base instance is created or rebuilt as part of the launch of
+    the first instance.
+
+    :returns: An iterator of the LXD instances, in the order they become ready.
+
+    :raises BaseConfigurationError: on unexpected error configuration base.
+    :raises BaseCompatibilityError: if an instance is incompatible with the base.
+    :raises LXDError: on unexpected LXD error.
+    :raises ProviderError: if an instance name is repeated or collides with the
+    base instance name.
+    """
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ProviderError(
+            brief=f"instance names must be unique: {', '.join(duplicates)}",
+            resolution="remove the duplicate instance names",
+        )
+
+    if lxc is None:
+        lxc = LXC()
+
+    _ensure_project_exists(
+        create=auto_create_project, project=project, remote=remote, lxc=lxc
     )
 
-    # the base instance is not expected to be running but check for safety
-    if base_instance.is_running():
-        logger.debug("Stopping base instance.")
+    if not use_base_instance:
+        logger.debug("Using base instances is disabled.")
+
+        def launch_instance(name: str) -> LXDInstance:
+            return launch(
+                name,
+                base_configuration=base_configuration,
+                image_name=image_name,
+                image_remote=image_remote,
+                auto_clean=auto_clean,
+                map_user_uid=map_user_uid,
+                uid=uid,
+                gid=gid,
+                project=project,
+                remote=remote,
+                lxc=lxc,
+                prepare_instance=prepare_instance,
+                history=history,
+            )
+
+        return _launch_concurrently(names, launch_instance, max_workers)
 
-    lxc.copy(
-        source_remote=remote,
-        source_instance_name=base_instance.instance_name,
-        destination_remote=remote,
-        destination_instance_name=instance.instance_name,
+    base_instance = LXDInstance(
+        name=_formulate_base_instance_name(
+            image_name=image_name,
+            image_remote=image_remote,
+            compatibility_tag=base_configuration.compatibility_tag,
+        ),
         project=project,
+        remote=remote,
+        default_command_environment=base_configuration.get_command_environment(),
+        lxc=lxc,
     )
+    instances: dict[str, LXDInstance] = {}
+    records: dict[str, LaunchRecord] = {}
+    for name in names:
+        instance = LXDInstance(
+            name=name,
+            project=project,
+            remote=remote,
+            default_command_environment=base_configuration.get_command_environment(),
+            lxc=lxc,
+        )
+        # an application could formulate an instance name that matches the base
+        # instance's name, which would break calls to `lxc.copy()`
+        if instance.instance_name == base_instance.instance_name:
+            raise ProviderError(
+                brief="instance name cannot match the base instance name: "
+                f"{instance.instance_name!r}",
+                resolution="change name of instance",
+            )
+        record = LaunchRecord(
+            timestamp=time.time(),
+            instance_name=instance.instance_name,
+            base_instance_name=base_instance.instance_name,
+            image=f"{image_remote}:{image_name}",
+            compatibility_tag=base_configuration.compatibility_tag,
+        )
+        for observer in _launch_observers(
+            base_configuration=base_configuration, history=history, record=record
+        ):
+            instance.add_phase_observer(observer)
+        instances[name] = instance
+        records[name] = record
+
+    # the base instance is prepared as part of the launch of the first instance
+    first = names[0] if names else None
+    base_observers = base_configuration.phase_observers
+    if first is not None:
+        base_observers = _launch_observers(
+            base_configuration=base_configuration,
+            history=history,
+            record=records[first],
+        )
+    for observer in base_observers:
+        base_instance.add_phase_observer(observer)
 
-    # the newly copied instance should not be running, but check anyways
-    if instance.is_running():
-        logger.debug("Instance is already running.")
-        instance.stop()
-
-    # set the id map while the instance is not running
-    if map_user_uid:
-        _set_id_map(
-            instance=instance, lxc=lxc, project=project, remote=remote, uid=uid, gid=gid
+    start = time.monotonic()
+    try:
+        base_path = _prepare_base_instance(
+            base_instance=base_instance,
+            base_configuration=base_configuration,
+            image_name=image_name,
+            image_remote=image_remote,
+            lxc=lxc,
+            project=project,
+            remote=remote,
+            expiration=expiration,
+            map_user_uid=map_user_uid,
+            uid=uid,
+            gid=gid,
+            prepare_instance=prepare_instance,
         )
+    except BaseException:
+        if history is not None and first is not None:
+            _save_launch_record(history=history, record=records[first], start=start)
+        raise
 
-    # instance is now ready to be started and warmed up
-    instance.start()
+    def copy_instance(name: str) -> LXDInstance:
+        instance, record = instances[name], records[name]
+        with _record_launch(
+            history=history, record=record, start=start if name == first else None
+        ):
+            if instance.exists() and _launch_existing_instance(
+                instance=instance,
+                lxc=lxc,
+                project=project,
+                remote=remote,
+                auto_clean=auto_clean,
+                base_configuration=base_configuration,
+                ephemeral=False,
+                map_user_uid=map_user_uid,
+                uid=uid,
+                gid=gid,
+            ):
+                record.path = LaunchPath.EXISTING
+                return instance
+
+            record.path = base_path if name == first else LaunchPath.BASE_COPIED
+            _copy_base_instance(
+                instance=instance,
+                base_instance=base_instance,
+                base_configuration=base_configuration,
+                lxc=lxc,
+                project=project,
+                remote=remote,
+                map_user_uid=map_user_uid,
+                uid=uid,
+                gid=gid,
+            )
+            return instance
 
-    # change the hostname from the base instance's hostname
-    base_configuration.setup_hostname(executor=instance)
+    return _launch_concurrently(names, copy_instance, max_workers)
 
-    base_configuration.warmup(executor=instance)
 
-    # set timezone on warmup because the host's timezone may have changed since the
-    # instance was setup
-    _set_timezone(instance, project, remote, lxc)
+def _launch_concurrently(
+    names: Sequence[str],
+    launch_instance: Callable[[str], LXDInstance],
+    max_workers: int,
+) -> Iterator[LXDInstance]:
+    """Launch instances in a pool of threads, yielding them as they are ready.
+
+    If an instance fails to launch, the instances not yet started are cancelled
+    and the error is raised once the running ones are done.
+
+    :param names: Names of the instances.
+    :param launch_instance: Function launching an instance from its name.
+    :param max_workers: Maximum number of instances launched at a time.
 
-    return instance
+    :returns: An iterator of the instances, in the order they become ready.
+    """
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="craft-providers-launch"
+    ) as pool:
+        futures = [pool.submit(launch_instance, name) for name in names]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,590 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Leases giving one process at a time the right to create an instance.
+
+A lease has an owner and an expiry. The owner renews it in the background while
+it is held, so it only expires if the owner stops running. Processes waiting for
+the lease are woken as soon as it is released.
+
+On the local remote, the lease is a lock on a file of the host. On other
+remotes, which can be shared by several hosts, it is a profile of the LXD
+project, which LXD creates only once.
+"""
+
+from __future__ import annotations
+
+import abc
+import dataclasses
+import fcntl
+import json
+import logging
+import os
+import pathlib
+import secrets
+import socket
+import threading
+import time
+from datetime import timedelta
+from typing import IO, TYPE_CHECKING
+
+from typing_extensions import Self
+
+from .errors import LXDError
+from .lxc_rest import LOCAL_REMOTE
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from .lxc import LXC
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_DURATION = timedelta(seconds=60)
+
+# Prefix of the names of the profiles holding the leases of instances.
+LEASE_PROFILE_PREFIX = "craft-providers-lease-"
+
+# Profile config key holding the owner and expiry of a lease.
+LEASE_CONFIG_KEY = "user.craft_providers.lease"
+
+# Seconds between checks of a lease while waiting for it, if it is not released
+# before then.
+LEASE_CHECK_INTERVAL = 5.0
+
+
+def default_owner() -> str:
+    """Get the owner of the leases taken by this process."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def default_lease_directory() -> pathlib.Path:
+    """Get the default directory of host leases, in the user runtime directory."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return pathlib.Path(runtime_dir, "craft-providers", "leases")
+    cache_home = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    return pathlib.Path(cache_home, "craft-providers", "leases")
+
+
+@dataclasses.dataclass(frozen=True)
+class Lease:
+    """The holder of a lease.
+
+    :param owner: Owner of the lease, as `<hostname>:<pid>`.
+    :param expires: Time at which the lease expires unless it is renewed, in
+        seconds since the epoch.
+    """
+
+    owner: str
+    expires: float
+
+    def is_expired(self) -> bool:
+        """Check if the lease has expired."""
+        return self.expires <= time.time()
+
+    def dumps(self) -> str:
+        """Serialize the lease."""
+        return json.dumps(dataclasses.asdict(self), sort_keys=True)
+
+    @classmethod
+    def loads(cls, data: str) -> Lease | None:
+        """Deserialize a lease.
+
+        :param data: Serialized lease.
+
+        :returns: The lease, or None if there is no valid lease.
+        """
+        try:
+            values = json.loads(data)
+            return cls(owner=str(values["owner"]), expires=float(values["expires"]))
+        except (TypeError, ValueError, KeyError):
+            return None
+
+
+class InstanceLease(abc.ABC):
+    """A lease on the creation of an instance.
+
+    Use as a context manager to hold the lease within the context. The lease
+    can also be released early with `release()`.
+
+    :param instance_name: Name of instance.
+    :param project: Name of LXD project.
+    :param remote: Name of LXD remote.
+    :param duration: Time for which the lease is valid after each renewal.
+    :param owner: Owner of the lease. Defaults to `default_owner()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        instance_name: str,
+        project: str,
+        remote: str,
+        duration: timedelta = DEFAULT_LEASE_DURATION,
+        owner: str | None = None,
+    ) -> None:
+        self.instance_name = instance_name
+        self.project = project
+        self.remote = remote
+        self.duration = duration
+        self.owner = owner or default_owner()
+        self.lease: Lease | None = None
+        self._released = threading.Event()
+        self._renewer: threading.Thread | None = None
+
+    @property
+    def held(self) -> bool:
+        """Whether the lease is held."""
+        return self.lease is not None
+
+    def _new_lease(self) -> Lease:
+        return Lease(
+            owner=self.owner, expires=time.time() + self.duration.total_seconds()
+        )
+
+    @abc.abstractmethod
+    def _acquire(self) -> Lease:
+        """Wait for the lease to be free, then take it.
+
+        :returns: The lease taken.
+        """
+
+    @abc.abstractmethod
+    def _renew(self, lease: Lease) -> bool:
+        """Replace the lease held with a renewed one.
+
+        :param lease: The renewed lease.
+
+        :returns: True if the lease was still held.
+        """
+
+    @abc.abstractmethod
+    def _release(self) -> None:
+        """Give up the lease held."""
+
+    def acquire(self) -> None:
+        """Wait for the lease to be free, then take it and keep it renewed.
+
+        :raises LXDError: If the lease cannot be taken.
+        """
+        logger.debug("Acquiring lease on instance %r.", self.instance_name)
+        self.lease = self._acquire()
+        logger.debug("Acquired lease on instance %r.", self.instance_name)
+        self._released.clear()
+        self._renewer = threading.Thread(target=self._keep_renewed, daemon=True)
+        self._renewer.start()
+
+    def renew(self) -> None:
+        """Extend the expiry of the lease held."""
+        if self.lease is None:
+            return
+        lease = self._new_lease()
+        try:
+            renewed = self._renew(lease)
+        except LXDError as error:
+            # the lease is still valid until it expires
+            logger.debug("Failed to renew lease: %s", error)
+            return
+        if renewed:
+            self.lease = lease
+        else:
+            logger.warning(
+                "Lost the lease on instance %r to another process.", self.instance_name
+            )
+
+    def release(self) -> None:
+        """Give up the lease, if it is held."""
+        if self.lease is None:
+            return
+        self._released.set()
+        if self._renewer is not None:
+            self._renewer.join()
+            self._renewer = None
+        try:
+            self._release()
+        finally:
+            self.lease = None
+        logger.debug("Released lease on instance %r.", self.instance_name)
+
+    def _keep_renewed(self) -> None:
+        interval = self.duration.total_seconds() / 3
+        while not self._released.wait(timeout=interval):
+            self.renew()
+
+    def __enter__(self) -> Self:
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.release()
+
+
+class HostLease(InstanceLease):
+    """A lease held with a lock on a file of the host.
+
+    The file holds the owner and expiry of the lease. The lock is released by
+    the kernel if the owner exits, and waiters are woken as soon as it is. If
+    the owner is still running but stops renewing the lease, a waiter takes the
+    lease over once it expires.
+
+    :param instance_name: Name of instance.
+    :param project: Name of LXD project.
+    :param remote: Name of LXD remote.
+    :param duration: Time for which the lease is valid after each renewal.
+    :param owner: Owner of the lease. Defaults to `default_owner()`.
+    :param directory: Directory of the lease files. Defaults to
+        `default_lease_directory()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        instance_name: str,
+        project: str,
+        remote: str,
+        duration: timedelta = DEFAULT_LEASE_DURATION,
+        owner: str | None = None,
+        directory: pathlib.Path | None = None,
+    ) -> None:
+        super().__init__(
+            instance_name=instance_name,
+            project=project,
+            remote=remote,
+            duration=duration,
+            owner=owner,
+        )
+        directory = directory or default_lease_directory()
+        self.path = directory / f"{remote}-{project}-{instance_name}.lease"
+        self._file: IO[str] | None = None
+
+    def read(self) -> Lease | None:
+        """Read the lease last written to the file.
+
+        :returns: The lease, or None if no lease was written.
+        """
+        try:
+            return Lease.loads(self.path.read_text())
+        except FileNotFoundError:
+            return None
+
+    def _write(self, lease: Lease) -> None:
+        if self._file is None:
+            raise RuntimeError("Lease file is not open.")
+        self._file.seek(0)
+        self._file.truncate()
+        self._file.write(lease.dumps())
+        self._file.flush()
+
+    def _acquire(self) -> Lease:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file = self._lock()
+        while file is None:
+            file = self._lock()
+
+        self._file = file
+        lease = self._new_lease()
+        self._write(lease)
+        return lease
+
+    def _lock(self) -> IO[str] | None:
+        """Lock the lease file.
+
+        :returns: The locked file, or None if the lease file was replaced while
+            locking it.
+        """
+        # append mode to not truncate the lease of the current owner
+        file = self.path.open("a+")
+        try:
+            fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            if not self._wait_for_lock(file):
+                return None
+        except BaseException:
+            file.close()
+            raise
+
+        if not self._is_current(file):
+            file.close()
+            return None
+        return file
+
+    def _is_current(self, file: IO[str]) -> bool:
+        """Check if a file is still the lease file, rather than a replaced one."""
+        try:
+            return os.path.samestat(os.fstat(file.fileno()), self.path.stat())
+        except FileNotFoundError:
+            return False
+
+    def _wait_for_lock(self, file: IO[str]) -> bool:
+        """Wait for the lock on the file, or take over the lease once it expires.
+
+        The lock is waited for in a thread, so the expiry can be checked
+        meanwhile. If the wait is abandoned, the thread closes the file once it
+        gets the lock, releasing it.
+
+        :returns: True if the file is locked, False if the wait was abandoned
+            because the lease file was replaced.
+        """
+        guard = threading.Lock()
+        locked = threading.Event()
+        abandoned = False
+
+        def _lock() -> None:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            with guard:
+                if abandoned:
+                    file.close()
+                    return
+                locked.set()
+
+        logger.debug("Waiting for lease %s held by %s.", str(self.path), self.read())
+        threading.Thread(target=_lock, daemon=True).start()
+        try:
+            while not locked.wait(timeout=LEASE_CHECK_INTERVAL):
+                if self._take_over_expired(file):
+                    break
+        finally:
+            with guard:
+                abandoned = not locked.is_set()
+        return not abandoned
+
+    def _take_over_expired(self, file: IO[str]) -> bool:
+        """Remove the lease file if its lease expired without being released.
+
+        The owner of an expired lease may still be running but stuck, so it
+        keeps the lock. The file is removed instead, so waiters lock a new one
+        and the stuck owner finds the lease lost when it renews it. Waiters take
+        over in turn, under a lock on another file, so a single waiter removes
+        the file of an expired lease.
+
+        :param file: The lease file opened by the waiter.
+
+        :returns: True if the lease file was replaced.
+        """
+        takeover_path = self.path.with_suffix(".takeover")
+        with takeover_path.open("a") as takeover:
+            fcntl.flock(takeover, fcntl.LOCK_EX)
+            if not self._is_current(file):
+                # another waiter took over the lease
+                return True
+            lease = self.read()
+            if lease is None or not lease.is_expired():
+                return False
+            logger.debug("Taking over the expired lease of %s.", lease.owner)
+            self.path.unlink()
+            return True
+
+    def _renew(self, lease: Lease) -> bool:
+        if self._file is None or not self._is_current(self._file):
+            return False
+        self._write(lease)
+        return True
+
+    def _release(self) -> None:
+        if self._file is not None:
+            # closing the file releases the lock
+            self._file.close()
+            self._file = None
+
+
+class ProjectLease(InstanceLease):
+    """A lease held by a profile of an LXD project.
+
+    The lease is taken by creating the profile, which LXD refuses to do if it
+    already exists, so a single process holds it. The profile holds the owner
+    and expiry of the lease in a config key. The profile is removed by renaming
+    it first, which a single process can do, so an expired lease is taken over
+    by one waiter. Waiters check the lease again on each LXD event about the
+    instance.
+
+    :param lxc: LXC client.
+    :param instance_name: Name of instance.
+    :param project: Name of LXD project.
+    :param remote: Name of LXD remote.
+    :param duration: Time for which the lease is valid after each renewal.
+    :param owner: Owner of the lease. Defaults to `default_owner()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        lxc: LXC,
+        instance_name: str,
+        project: str,
+        remote: str,
+        duration: timedelta = DEFAULT_LEASE_DURATION,
+        owner: str | None = None,
+    ) -> None:
+        super().__init__(
+            instance_name=instance_name,
+            project=project,
+            remote=remote,
+            duration=duration,
+            owner=owner,
+        )
+        self.lxc = lxc
+        self.profile = LEASE_PROFILE_PREFIX + instance_name
+        self._value = ""
+
+    def _read(self, profile: str) -> str:
+        config = self.lxc.profile_show(
+            profile=profile, project=self.project, remote=self.remote
+        ).get("config")
+        return str((config or {}).get(LEASE_CONFIG_KEY, ""))
+
+    def _create(self) -> bool:
+        lease = self._new_lease()
+        value = lease.dumps()
+        if not self.lxc.profile_create(
+            profile=self.profile,
+            config={LEASE_CONFIG_KEY: value},
+            project=self.project,
+            remote=self.remote,
+        ):
+            return False
+        self.lease = lease
+        self._value = value
+        return True
+
+    def _remove(self, value: str) -> bool:
+        """Remove the profile if it holds a lease.
+
+        :param value: The lease the profile is expected to hold.
+
+        :returns: True if the profile was removed.
+        """
+        removed = f"{self.profile}-removed-{secrets.token_hex(4)}"
+        if not self.lxc.profile_rename(
+            profile=self.profile,
+            new_name=removed,
+            project=self.project,
+            remote=self.remote,
+        ):
+            return False
+        if self._read(removed) != value:
+            # the lease was taken by another process meanwhile, so give it back
+            # unless a third process took it since
+            if not self.lxc.profile_rename(
+                profile=removed,
+                new_name=self.profile,
+                project=self.project,
+                remote=self.remote,
+            ):
+                self.lxc.profile_delete(
+                    profile=removed, project=self.project, remote=self.remote
+                )
+            return False
+        self.lxc.profile_delete(
+            profile=removed, project=self.project, remote=self.remote
+        )
+        return True
+
+    def _try_acquire(self) -> bool:
+        if self._create():
+            return True
+        try:
+            current = self._read(self.profile)
+        except LXDError as error:
+            # the lease may have been released meanwhile
+            logger.debug("Failed to read lease: %s", error)
+            return False
+        holder = Lease.loads(current)
+        if holder is not None and not holder.is_expired():
+            return False
+        if holder is not None:
+            logger.debug("Taking over the expired lease of %s.", holder.owner)
+        return self._remove(current) and self._create()
+
+    def _acquire(self) -> Lease:
+        monitor = self.lxc.monitor(project=self.project, remote=self.remote)
+        while True:
+            if monitor:
+                acquired = monitor.wait(
+                    self.instance_name,
+                    self._try_acquire,
+                    timeout=self.duration.total_seconds(),
+                    poll_interval=LEASE_CHECK_INTERVAL,
+                )
+            else:
+                acquired = self._try_acquire()
+                if not acquired:
+                    time.sleep(LEASE_CHECK_INTERVAL)
+            if acquired and self.lease is not None:
+                return self.lease
+
+    def _renew(self, lease: Lease) -> bool:
+        # the lease can only be taken over once it expired, so there is no
+        # concurrent writer between the check and the update of a held lease
+        if self._read(self.profile) != self._value:
+            return False
+        value = lease.dumps()
+        self.lxc.profile_edit(
+            profile=self.profile,
+            config={"config": {LEASE_CONFIG_KEY: value}},
+            project=self.project,
+            remote=self.remote,
+        )
+        self._value = value
+        return True
+
+    def _release(self) -> None:
+        try:
+            self._remove(self._value)
+        except LXDError as error:
+            # the lease expires on its own
+            logger.debug("Failed to release lease: %s", error)
+        self._value = ""
+
+
+def instance_lease(
+    *,
+    lxc: LXC,
+    instance_name: str,
+    project: str,
+    remote: str,
+    duration: timedelta = DEFAULT_LEASE_DURATION,
+) -> InstanceLease:
+    """Get the lease on the creation of an instance.
+
+    :param lxc: LXC client.
+    :param instance_name: Name of instance.
+    :param project: Name of LXD project.
+    :param remote: Name of LXD remote.
+    :param duration: Time for which the lease is valid after each renewal.
+
+    :returns: A host lease for the local remote, or a project lease otherwise.
+    """
+    if remote == LOCAL_REMOTE:
+        return HostLease(
+            instance_name=instance_name,
+            project=project,
+            remote=remote,
+            duration=duration,
+        )
+    return ProjectLease(
+        lxc=lxc,
+        instance_name=instance_name,
+        project=project,
+        remote=remote,
+        duration=duration,
+    )
@@ -29,35 +29,42 @@ import shlex
 import subprocess
 import threading
 import time
-from collections import deque
+import warnings
+import weakref
 from datetime import datetime, timezone
 from typing import (
     TYPE_CHECKING,
     Any,
     Literal,
+    TypedDict,
     cast,
     overload,
 )
+from urllib import parse
 
 import yaml
 
-from craft_providers import errors
+from craft_providers import errors, replay, tracing
 from craft_providers.lxd.lxd_instance_status import (
     LXDInstanceState,
     ProviderInstanceStatus,
 )
 
+from . import heartbeat, lxd_monitor
 from .errors import LXDError
 
 if TYPE_CHECKING:
     import builtins
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
 
 logger = logging.getLogger(__name__)
 
 # Times to attempt launching an instance before failing.
 MAX_RETRIES = 3
 
+# Default limit of lxc processes run concurrently by an LXC object.
+MAX_CONCURRENT_PROCESSES = 16
+
 
 class StdinType(enum.Enum):
     """Mappings for input stream to pass to stdin for lxc commands."""
@@ -66,6 +73,68 @@ class StdinType(enum.Enum):
     NULL = None
 
 
+# lxc commands that take a subcommand, e.g. 'lxc config get'.
+_COMMAND_GROUPS = frozenset(
+    {"config", "file", "image", "network", "operation", "profile", "project", "remote"}
+)
+
+
+def _get_trace_name(command: Sequence[str]) -> str:
+    """Get the type of an lxc command for tracing, e.g. 'lxc config get'."""
+    words = ["lxc", *command[:1]]
+    if command and command[0] in _COMMAND_GROUPS and len(command) > 1:
+        words.append(command[1])
+    return " ".join(words)
+
+
+# lxc commands whose arguments do not name an instance.
+_NO_INSTANCE_COMMANDS = frozenset(
+    {"image", "network", "operation", "profile", "project", "query", "remote"}
+)
+
+
+def _get_trace_instance(command: Sequence[str]) -> str | None:
+    """Get the instance of an lxc command from its first remote:name argument."""
+    if not command or command[0] in _NO_INSTANCE_COMMANDS:
+        return None
+    # the first argument of launch is the image
+    args = command[2:] if command[0] == "launch" else command[1:]
+    for arg in args:
+        if not arg.startswith("-") and ":" in arg:
+            name = arg.partition(":")[2].partition("/")[0]
+            return name or None
+    return None
+
+
+def _is_file_not_found(error: subprocess.CalledProcessError) -> bool:
+    """Check if a failed file transfer failed because the file does not exist.
+
+    A missing instance or project is reported as e.g. "Error: Instance not
+    found", which is not a missing file.
+    """
+    stderr = error.stderr
+    if isinstance(stderr, bytes):
+        stderr = stderr.decode(errors="replace")
+    lines = [line.strip().lower() for line in (stderr or "").splitlines()]
+    return any(
+        line == "error: not found" or "no such file or directory" in line
+        for line in lines
+    )
+
+
+def _error_mentions(error: subprocess.CalledProcessError, *messages: str) -> bool:
+    """Check if the error output of a failed command mentions any of the messages.
+
+    :param error: The error of the failed command.
+    :param messages: Lowercase messages to look for.
+    """
+    stderr = error.stderr
+    if isinstance(stderr, bytes):
+        stderr = stderr.decode(errors="replace")
+    stderr = (stderr or "").lower()
+    return any(message in stderr for message in messages)
+
+
 def load_yaml_flat(data: str) -> dict[str, Any]:
     """Load yaml without additional resolvers.
 
@@ -101,16 +170,198 @@ def load_yaml_list(data: str) -> list[dict[str, Any]]:
     raise ValueError("Internal error: Malformed YAML input")
 
 
+def stringify(data: object) -> object:
+    """Convert the scalars in decoded JSON to strings.
+
+    YAML is parsed with the base loader (see `load_yaml_flat()`), so every
+    scalar is a string. Converting JSON the same way keeps results the same
+    regardless of the output format of a command.
+
+    :param data: Decoded JSON.
+
+    :returns: The data with scalars converted to strings.
+    """
+    if isinstance(data, dict):
+        return {
+            str(key): stringify(value)
+            for key, value in cast("dict[object, object]", data).items()
+        }
+    if isinstance(data, list):
+        return [stringify(value) for value in cast("list[object]", data)]
+    if isinstance(data, bool):
+        return "true" if data else "false"
+    if data is None:
+        return ""
+    return str(data)
+
+
+def load_json_flat(data: str) -> dict[str, Any]:
+    """Load a JSON object, converting scalars to strings.
+
+    :raises ValueError: If the data is not a JSON object.
+    """
+    result = json.loads(data)
+    if isinstance(result, dict):
+        return cast("dict[str, Any]", stringify(result))
+
+    logger.debug(f"Expected to receive a JSON object, instead received: {result}")
+    raise ValueError("Internal error: Malformed JSON input")
+
+
+def load_json_list(data: str) -> list[dict[str, Any]]:
+    """Load a JSON list, converting scalars to strings.
+
+    :raises ValueError: If the data is not a JSON list.
+    """
+    result = json.loads(data)
+    if isinstance(result, list):
+        return cast("list[dict[str, Any]]", stringify(result))
+
+    logger.debug(f"Expected to receive a JSON list, instead received: {result}")
+    raise ValueError("Internal error: Malformed JSON input")
+
+
+class InstanceListEntry(TypedDict, total=False):
+    """An instance returned by `LXC.list()`.
+
+    As with all results of the LXC wrapper, scalar values are strings.
+    """
+
+    name: str
+    status: str
+    type: str
+    architecture: str
+    ephemeral: str
+    stateful: str
+    description: str
+    created_at: str
+    last_used_at: str
+    location: str
+    project: str
+    profiles: list[str]
+    config: dict[str, str]
+    devices: dict[str, dict[str, str]]
+    expanded_config: dict[str, str]
+    expanded_devices: dict[str, dict[str, str]]
+    state: dict[str, Any]
+
+
+class ImageListEntry(TypedDict, total=False):
+    """An image returned by `LXC.image_list()`.
+
+    As with all results of the LXC wrapper, scalar values are strings.
+    """
+
+    fingerprint: str
+    aliases: list[dict[str, str]]
+    architecture: str
+    type: str
+    public: str
+    size: str
+    filename: str
+    created_at: str
+    uploaded_at: str
+    expires_at: str
+    last_used_at: str
+    properties: dict[str, str]
+
+
+class _InstanceLock:
+    """Lock of an instance, which can be weakly referenced."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+
+
 class LXC:
-    """Wrapper for lxc command-line interface."""
+    """Wrapper for lxc command-line interface.
+
+    The wrapper is safe to share between threads. Read-only queries run
+    concurrently, while commands that modify an instance are serialized per
+    instance. The number of lxc processes running at once is capped by
+    ``max_processes``; commands run through ``exec`` are not counted, as they
+    can run for as long as a build step does.
+
+    :param lxc_path: Path to the lxc executable.
+    :param max_processes: Maximum number of lxc processes to run concurrently,
+        or None for no limit.
+    """
 
     def __init__(
         self,
         *,
         lxc_path: pathlib.Path = pathlib.Path("lxc"),
+        max_processes: int | None = MAX_CONCURRENT_PROCESSES,
     ) -> None:
         self.lxc_path = lxc_path
-        self.lxc_lock = threading.Lock()
+        self.max_processes = max_processes
+        self._process_slots: threading.BoundedSemaphore | None = (
+            threading.BoundedSemaphore(max_processes) if max_processes else None
+        )
+        # a lock only lives while an operation holds or waits for it
+        self._instance_locks: weakref.WeakValueDictionary[
+            tuple[str, str, str], _InstanceLock
+        ] = weakref.WeakValueDictionary()
+        self._instance_locks_guard = threading.Lock()
+        self._lxc_lock = threading.Lock()
+
+    @property
+    def lxc_lock(self) -> threading.Lock:
+        """Lock that used to be held while running any lxc command.
+
+        Deprecated: commands no longer take this lock. Commands that modify an
+        instance are serialized per instance instead.
+        """
+        warnings.warn(
+            "LXC.lxc_lock is deprecated and no longer serializes lxc commands.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self._lxc_lock
+
+    def monitor(
+        self, *, project: str = "default", remote: str = "local"
+    ) -> lxd_monitor.LXDMonitor | None:
+        """Get the monitor for lifecycle events of instances in a project.
+
+        The monitor is started on first use and shared by the whole process,
+        see `lxd_monitor.get_monitor()`.
+
+        :param project: Name of LXD project.
+        :param remote: Name of LXD remote.
+
+        :returns: The monitor, or None if events are unavailable and callers
+            should poll instead.
+        """
+        return lxd_monitor.get_monitor(
+            lxc_path=self.lxc_path, project=project, remote=remote
+        )
+
+    def close(self) -> None:
+        """Release the resources held by this object.
+
+        The event monitors are shared by the process and keep running.
+        """
+
+    @contextlib.contextmanager
+    def _instance_lock(
+        self, *, instance_name: str, project: str, remote: str
+    ) -> Iterator[None]:
+        """Serialize operations that modify an instance.
+
+        :param instance_name: Name of instance.
+        :param project: Name of LXD project.
+        :param remote: Name of LXD remote.
+        """
+        key = (remote, project, instance_name)
+        with self._instance_locks_guard:
+            instance_lock = self._instance_locks.get(key)
+            if instance_lock is None:
+                instance_lock = _InstanceLock()
+                self._instance_locks[key] = instance_lock
+
+        with instance_lock.lock:
+            yield
 
     # Overloads are based on overloads on typeshed
     # https://github.com/python/typeshed/blob/main/stdlib/subprocess.pyi#L89
@@ -198,10 +449,17 @@ class LXC:
 
         logger.debug("Executing on host: %s", shlex.join(lxc_cmd))
 
-        with self.lxc_lock:
+        name = _get_trace_name(command)
+        runner = tracing.traced(
+            replay.wrap(subprocess.run, name=name),
+            category="lxc",
+            name=name,
+            instance=_get_trace_instance(command),
+        )
+        with self._process_slots or contextlib.nullcontext():
             # for subprocess, input takes priority over stdin
             if "input" in kwargs:
-                return subprocess.run(
+                return runner(
                     lxc_cmd,
                     check=check,
                     text=text,
@@ -210,7 +468,7 @@ class LXC:
                     **kwargs,
                 )
 
-            return subprocess.run(
+            return runner(
                 lxc_cmd,
                 check=check,
                 text=text,
@@ -220,6 +478,34 @@ class LXC:
                 **kwargs,
             )
 
+    def _query(
+        self, path: str, *, brief: str, project: str, remote: str
+    ) -> subprocess.CompletedProcess[str]:
+        """Query the LXD API with `lxc query`.
+
+        Used for commands that cannot output JSON.
+
+        :param path: API path, such as ``/1.0/profiles/default``.
+        :param brief: Brief for the error raised if the query fails.
+        :param project: Name of LXD project.
+        :param remote: Name of LXD remote.
+
+        :returns: Completed process, with the JSON response as stdout.
+
+        :raises LXDError: on unexpected error.
+        """
+        # `lxc query` does not apply --project to the path
+        query = parse.urlencode({"project": project})
+        command = ["query", f"{remote}:{path}?{query}"]
+
+        try:
+            return self._run_lxc(command, capture_output=True, text=True)
+        except subprocess.CalledProcessError as error:
+            raise LXDError(
+                brief=brief,
+                details=errors.details_from_called_process_error(error),
+            ) from error
+
     def config_device_add_disk(
         self,
         *,
@@ -253,7 +539,10 @@ class LXC:
         ]
 
         try:
-            self._run_lxc(command, capture_output=True, project=project)
+            with self._instance_lock(
+                instance_name=instance_name, project=project, remote=remote
+            ):
+                self._run_lxc(command, capture_output=True, project=project)
         except subprocess.CalledProcessError as error:
             raise LXDError(
                 brief=f"Failed to add disk to instance {instance_name!r}.",
@@ -280,7 +569,10 @@ class LXC:
         command = ["config", "device", "remove", f"{remote}:{instance_name}", device]
 
         try:
-            self._run_lxc(command, capture_output=True, project=project)
+            with self._instance_lock(
+                instance_name=instance_name, project=project, remote=remote
+            ):
+                self._run_lxc(command, capture_output=True, project=project)
         except subprocess.CalledProcessError as error:
             raise LXDError(
                 brief=f"Failed to remove device from instance {instance_name!r}.",
@@ -371,7 +663,10 @@ class LXC:
         command = ["config", "set", f"{remote}:{instance_name}", key, value]
 
         try:
-            self._run_lxc(command, capture_output=True, project=project)
+            with self._instance_lock(
+                instance_name=instance_name, project=project, remote=remote
+            ):
+                self._run_lxc(command, capture_output=True, project=project)
         except subprocess.CalledProcessError as error:
             raise LXDError(
                 brief=(
@@ -381,6 +676,96 @@ class LXC:
                 details=errors.details_from_called_process_error(error),
             ) from error
 
+    def config_get_many(
+        self,
+        *,
+        instance_name: str,
+        keys: Iterable[str] | None = None,
+        project: str = "default",
+        remote: str = "local",
+    ) -> dict[str, str]:
+        """Get the values of several of an instance's config keys at once.
+
+        Reads the instance's configuration with a single `lxc config show`.
+
+        :param instance_name: Name of instance.
+        :param keys: Config key names. If None, all keys are returned.
+        :param project: Name of LXD project.
+        :param remote: Name of LXD remote.
+
+        :returns: Dictionary mapping each key to its value. Keys that do not exist
+            map to an empty string, like with `config_get`.
+
+        :raises LXDError: on unexpected error.
+        """
+        command = ["config", "show", f"{remote}:{instance_name}"]
+
+        try:
+            proc = self._run_lxc(
+                command, project=project, check=True, text=True, capture_output=True
+            )
+        except subprocess.CalledProcessError as error:
+            raise LXDError(
+                brief=f"Failed to get config for instance {instance_name!r}.",
+                details=errors.details_from_called_process_error(error),
+            ) from error
+
+        try:
+            config: dict[str, str] = load_yaml_flat(proc.stdout).get("config") or {}
+        except (ValueError, yaml.YAMLError) as error:
+            raise LXDError(
+                brief="Failed to parse lxc config show.",
+                details=(
+                    f"* Command that failed: {shlex.join(proc.args)!r}\n"
+                    f"* Command output: {proc.stdout!r}"
+                ),
+            ) from error
+
+        if keys is None:
+            return config
+        return {key: config.get(key, "").rstrip() for key in keys}
+
+    def config_set_many(
+        self,
+        *,
+        instance_name: str,
+        config: dict[str, str],
+        project: str = "default",
+        remote: str = "local",
+    ) -> None:
+        """Set several of an instance's config keys at once.
+
+        :param instance_name: Name of instance.
+        :param config: Dictionary mapping config key names to their values.
+        :param project: Name of LXD project.
+        :param remote: Name of LXD remote.
+
+        :raises LXDError: on unexpected error.
+        """
+        if not config:
+            return
+
+        command = [
+            "config",
+            "set",
+            f"{remote}:{instance_name}",
+            *(f"{key}={value}" for key, value in config.items()),
+        ]
+
+        try:
+            with self._instance_lock(
+                instance_name=instance_name, project=project, remote=remote
+            ):
+                self._run_lxc(command, capture_output=True, project=project)
+        except subprocess.CalledProcessError as error:
+            raise LXDError(
+                brief=(
+                    f"Failed to set config keys {sorted(config)!r}"
+                    f" for instance {instance_name!r}."
+                ),
+                details=errors.details_from_called_process_error(error),
+            ) from error
+
     def copy(
         self,
         *,
@@ -411,7 +796,12 @@ class LXC:
         command = ["copy", source, destination]
 
         try:
-            self._run_lxc(command, capture_output=True, project=project)
+            with self._instance_lock(
+                instance_name=destination_instance_name,
+                project=project,
+                remote=destination_remote,
+            ):
+                self._run_lxc(command, capture_output=True, project=project)
         except subprocess.CalledProcessError as error:
             raise LXDError(
                 brief=(f"Failed to copy instance {source!r} to {destination!r}."),
@@ -441,13 +831,54 @@ class LXC:
             command.append("--force")
 
         try:
-            self._run_lxc(command, capture_output=True, project=project)
+            with self._instance_lock(
+                instance_name=instance_name, project=project, remote=remote
+            ):
+                self._run_lxc(command, capture_output=True, project=project)
         except subprocess.CalledProcessError as error:
             raise LXDError(
                 brief=f"Failed to delete instance {instance_name!r}.",
                 details=errors.details_from_called_process_error(error),
             ) from error
 
+    def exec_command(
+        self,
+        *,
+        command: Sequence[str],
+        instance_name: str,
+        cwd: str | None = None,
+        mode: str | None = None,
+        project: str = "default",
+        remote: str = "local",
+    ) -> list[str]:
+        """Get the host command executing a command in instance_name.
+
+        :param command: Command to execute in the instance.
+        :param instance_name: Name of instance to execute in.
+        :param cwd: Optional current working directory for command.
+        :param mode: Override terminal mode Valid options include: "auto",
+            "interactive", "non-interactive". lxd default is "auto".
+        :param project: Name of LXD project.
+        :param remote: Name of LXD remote.
+
+        :returns: The `lxc exec` command.
+        """
+        final_cmd = [
+            str(self.lxc_path),
+            "--project",
+            project,
+            "exec",
+            f"{remote}:{instance_name}",
+        ]
+
+        if cwd is not None:
+            final_cmd.extend(["--cwd", cwd])
+
+        if mode is not None:
+            final_cmd.extend(["--mode", mode])
+
+        return [*final_cmd, "--", *command]
+
     @overload
     def exec(
         self,
@@ -513,28 +944,27 @@ class LXC:
 
         :raises subprocess.CalledProcessError: if command fails and check is True.
         """
-        final_cmd = [
-            str(self.lxc_path),
-            "--project",
-            project,
-            "exec",
-            f"{remote}:{instance_name}",
-        ]
-
-        if cwd is not None:
-            final_cmd.extend(["--cwd", cwd])
-
-        if mode is not None:
-            final_cmd.extend(["--mode", mode])
-
-        final_cmd += ["--", *command]
+        final_cmd = self.exec_command(
+            command=command,
+            instance_name=instance_name,
+            cwd=cwd,
+            mode=mode,
+            project=project,
+            remote=remote,
+        )
 
         logger.debug("Executing in container: %s", shlex.join(final_cmd))
 
+        traced_runner = tracing.traced(
+            replay.wrap(runner, name="lxc exec"),
+            category="lxc",
+            name="lxc exec",
+            instance=instance_name,
+        )
         if runner is subprocess.run:
-            return runner(final_cmd, timeout=timeout, check=check, **kwargs)
+            return traced_runner(final_cmd, timeout=timeout, check=check, **kwargs)
 
-        return runner(final_cmd, **kwargs)
+        return traced_runner(final_cmd, **kwargs)
 
     def file_pull(
         self,
@@ -575,6 +1005,10 @@ class LXC:
         try:
             self._run_lxc(command, capture_output=True, project=project)
         except subprocess.CalledProcessError as error:
+            if _is_file_not_found(error):
+                raise FileNotFoundError(
+                    f"File not found: {source.as_posix()!r}"
+                ) from error
             raise LXDError(
                 brief=(
                     f"Failed to pull file {source.as_posix()!r}"
@@ -583,6 +1017,50 @@ class LXC:
                 details=errors.details_from_called_process_error(error),
             ) from error
 
+    def file_read(
+        self,
+        *,
+        instance_name: str,
+        source: pathlib.PurePath,
+        project: str = "default",
+        remote: str = "local",
+    ) -> bytes:
+        """Read file from instance_name.
+
+        :param instance_name: Name of instance.
+        :param source: Path in environment to read.
+        :param project: Name of LXD project.
+        :param remote: Name of LXD remote.
+
+        :returns: The contents of the file.
+
+        :raises FileNotFoundError: If source does not exist.
+        :raises LXDError: on unexpected error.
+        """
+        command = [
+            "file",
+            "pull",
+            f"{remote}:{instance_name}{source.as_posix()}",
+            "-",
+        ]
+
+        try:
+            proc = self._run_lxc(command, capture_output=True, project=project)
+        except subprocess.CalledProcessError as error:
+            if _is_file_not_found(error):
+                raise FileNotFoundError(
+                    f"File not found: {source.as_posix()!r}"
+                ) from error
+            raise LXDError(
+                brief=(
+                    f"Failed to read file {source.as_posix()!r}"
+                    f" from instance {instance_name!r}."
+                ),
+                details=errors.details_from_called_process_error(error),
+            ) from error
+
+        return proc.stdout
+
     def file_push(  # noqa: PLR0913, too many arguments
         self,
         *,
@@ -682,24 +1160,28 @@ class LXC:
 
         :raises LXDError: on unexpected error.
         """
-        if instance_name is None:
-            instance_name = ""
-
-        command = ["info", remote + ":" + instance_name]
-
-        try:
-            proc = self._run_lxc(
-                command, capture_output=True, text=True, project=project
-            )
-        except subprocess.CalledProcessError as error:
-            raise LXDError(
-                brief=f"Failed to get info for remote {remote!r}.",
-                details=errors.details_from_called_process_error(error),
-            ) from error
+        brief = f"Failed to get info for remote {remote!r}."
+        if instance_name:
+            # `lxc info` adds the state, resources and snapshots of the instance
+            command = ["info", f"{remote}:{instance_name}"]
+            try:
+                proc = self._run_lxc(
+                    command, capture_output=True, text=True, project=project
+                )
+            except subprocess.CalledProcessError as error:
+                raise LXDError(
+                    brief=brief,
+                    details=errors.details_from_called_process_error(error),
+                ) from error
+            load: Callable[[str], dict[str, Any]] = load_yaml_flat
+        else:
+            # the server info is the API object, so skip the YAML output
+            proc = self._query("/1.0", brief=brief, project=project, remote=remote)
+            load = load_json_flat
 
         try:
-            return load_yaml_flat(proc.stdout)
-        except yaml.YAMLError as error:
+            return load(proc.stdout)
+        except (yaml.YAMLError, ValueError) as error:
             raise LXDError(
                 brief="Failed to parse lxc info.",
                 details=(
@@ -759,12 +1241,15 @@ class LXC:
         while retry_count < MAX_RETRIES:
             try:
                 # Try to launch instance
-                self._run_lxc(
-                    command,
-                    capture_output=True,
-                    stdin=StdinType.INTERACTIVE,
-                    project=project,
-                )
+                with self._instance_lock(
+                    instance_name=instance_name, project=project, remote=remote
+                ):
+                    self._run_lxc(
+                        command,
+                        capture_output=True,
+                        stdin=StdinType.INTERACTIVE,
+                        project=project,
+                    )
             except subprocess.CalledProcessError as error:
                 logger.debug(
                     "Failed to launch instance %s, retrying %s.",
@@ -874,13 +1359,13 @@ class LXC:
 
     def image_list(
         self, *, project: str = "default", remote: str = "local"
-    ) -> Sequence[dict[str, Any]]:
+    ) -> Sequence[ImageListEntry]:
         """List images.
 
         :param project: Name of LXD project.
         :param remote: Name of LXD remote.
         """
-        command = ["image", "list", f"{remote}:", "--format=yaml"]
+        command = ["image", "list", f"{remote}:", "--format=json"]
 
         try:
             proc = self._run_lxc(
@@ -893,8 +1378,8 @@ class LXC:
             ) from error
 
         try:
-            return load_yaml_list(proc.stdout)
-        except yaml.YAMLError as error:
+            return cast("builtins.list[ImageListEntry]", load_json_list(proc.stdout))
+        except ValueError as error:
             raise LXDError(
                 brief="Failed to parse lxc image list.",
                 details=(
@@ -908,17 +1393,23 @@ class LXC:
         *,
         project: str = "default",
         remote: str = "local",
-    ) -> Sequence[dict[str, Any]]:
+        instance_name: str | None = None,
+    ) -> Sequence[InstanceListEntry]:
         """List instances and their status.
 
         :param project: Name of LXD project.
         :param remote: Name of LXD remote.
+        :param instance_name: Only list the instance with this name. This is much
+            cheaper than listing every instance in a large project.
 
         :returns: List of containers and their info.
 
         :raises LXDError: on unexpected error.
         """
-        command = ["list", f"{remote}:", "--format=yaml"]
+        command = ["list", f"{remote}:", "--format=json"]
+        if instance_name is not None:
+            # an anchored regex, as a plain filter also matches names by prefix
+            command.insert(2, f"^{instance_name}$")
 
         try:
             proc = self._run_lxc(
@@ -931,8 +1422,10 @@ class LXC:
             ) from error
 
         try:
-            return load_yaml_list(proc.stdout)
-        except yaml.YAMLError as error:
+            instances = cast(
+                "builtins.list[InstanceListEntry]", load_json_list(proc.stdout)
+            )
+        except ValueError as error:
             raise LXDError(
                 brief="Failed to parse lxc list.",
                 details=(
@@ -941,6 +1434,10 @@ class LXC:
                 ),
             ) from error
 
+        if instance_name is not None:
+            return [i for i in instances if i.get("name") == instance_name]
+        return instances
+
     def list_names(
         self, *, project: str = "default", remote: str = "local"
     ) -> builtins.list[str]:
@@ -965,6 +1462,71 @@ class LXC:
                 details=(f"* Data received from lxc list: {instances!r}"),
             ) from error
 
+    def profile_create(
+        self,
+        *,
+        profile: str,
+        config: dict[str, str],
+        project: str = "default",
+        remote: str = "local",
+    ) -> bool:
+        """Create a profile, unless it already exists.
+
+        The profile is created with its config in a single request, so a single
+        caller can create it.
+
+        :param profile: Name of profile.
+        :param config: Config keys of the profile.
+        :param project: Name of LXD project.
+        :param remote: Name of LXD remote.
+
+        :returns: True if the profile was created, False if it already exists.
+
+        :raises LXDError: on unexpected error.
+        """
+        query = parse.urlencode({"project": project})
+        data = json.dumps({"name": profile, "config": config})
+        command = [
+            "query",
+            "--request",
+            "POST",
+            "--data",
+            data,
+            f"{remote}:/1.0/profiles?{query}",
+        ]
+
+        try:
+            self._run_lxc(command, capture_output=True)
+        except subprocess.CalledProcessError as error:
+            if _error_mentions(error, "already exists"):
+                return False
+            raise LXDError(
+                brief=f"Failed to create profile {profile!r}.",
+                details=errors.details_from_called_process_error(error),
+            ) from error
+        return True
+
+    def profile_delete(
+        self, *, profile: str, project: str = "default", remote: str = "local"
+    ) -> None:
+        """Delete a profile.
+
+        :param profile: Name of profile.
+        :param project: Name of LXD project.
+        :param remote: Name of LXD remote.
+
+        :raises LXDError: on unexpected error.
+        """
+        command = ["profile", "delete", f"{remote}:{profile}"]
+
+        try:
+            self._run_lxc(command, capture_output=True, project=project)
+        except subprocess.CalledProcessError as error:
+            raise LXDError(
+                brief=f"Failed to delete profile {profile!r}.",
+                details=errors.details_from_called_process_error(error),
+            ) from error
+
     def profile_edit(
         self,
         *,
@@ -994,6 +1556,42 @@ class LXC:
                 details=errors.details_from_called_process_error(error),
             ) from error
 
+    def profile_rename(
+        self,
+        *,
+        profile: str,
+        new_name: str,
+        project: str = "default",
+        remote: str = "local",
+    ) -> bool:
+        """Rename a profile.
+
+        LXD renames the profile in a single operation, so when several callers
+        rename the same profile, a single one succeeds.
+
+        :param profile: Name of profile.
+        :param new_name: New name of the profile.
+        :param project: Name of LXD project.
+        :param remote: Name of LXD remote.
+
+        :returns: True if the profile was renamed, False if it does not exist or
+            the new name is already in use.
+
+        :raises LXDError: on unexpected error.
+        """
+        command = ["profile", "rename", f"{remote}:{profile}", new_name]
+
+        try:
+            self._run_lxc(command, capture_output=True, project=project)
+        except subprocess.CalledProcessError as error:
+            if _error_mentions(error, "not found", "already in use", "already exists"):
+                return False
+            raise LXDError(
+                brief=f"Failed to rename profile {profile!r} to {new_name!r}.",
+                details=errors.details_from_called_process_error(error),
+            ) from error
+        return True
+
     def profile_show(
         self, *, profile: str, project: str = "default", remote: str = "local"
     ) -> dict[str, Any]:
@@ -1005,18 +1603,24 @@ class LXC:
 
         :raises LXDError: on unexpected error.
         """
-        command = ["profile", "show", f"{remote}:{profile}"]
+        proc = self._query(
+            f"/1.0/profiles/{parse.quote(profile, safe='')}",
+            brief=f"Failed to show profile {profile!r}.",
+            project=project,
+            remote=remote,
+        )
 
         try:
-            proc = self._run_lxc(command, capture_output=True, project=project)
-        except subprocess.CalledProcessError as error:
+            return load_json_flat(proc.stdout)
+        except ValueError as error:
             raise LXDError(
-                brief=f"Failed to show profile {profile!r}.",
-                details=errors.details_from_called_process_error(error),
+                brief="Failed to parse lxc profile.",
+                details=(
+                    f"* Command that failed: {shlex.join(proc.args)!r}\n"
+                    f"* Command output: {proc.stdout!r}"
+                ),
             ) from error
 
-        return load_yaml_flat(proc.stdout.decode())
-
     def project_create(self, *, project: str, remote: str = "local") -> None:
         """Create project.
 
@@ -1071,7 +1675,7 @@ class LXC:
 
         :raises LXDError: on unexpected error.
         """
-        command = ["project", "list", f"{remote}:", "--format=yaml"]
+        command = ["project", "list", f"{remote}:", "--format=json"]
 
         try:
             proc = self._run_lxc(command, capture_output=True, text=True)
@@ -1082,9 +1686,9 @@ class LXC:
             ) from error
 
         try:
-            projects = load_yaml_list(proc.stdout)
+            projects = load_json_list(proc.stdout)
             return sorted([p["name"] for p in projects])
-        except (KeyError, yaml.YAMLError) as error:
+        except (KeyError, ValueError) as error:
             raise LXDError(
                 brief="Failed to parse lxc project list.",
                 details=(
@@ -1123,7 +1727,10 @@ class LXC:
             command.append("--force")
 
         try:
-            self._run_lxc(command, capture_output=True, project=project)
+            with self._instance_lock(
+                instance_name=instance_name, project=project, remote=remote
+            ):
+                self._run_lxc(command, capture_output=True, project=project)
         except subprocess.CalledProcessError as error:
             raise LXDError(
                 brief=f"Failed to publish image from {instance_name!r}.",
@@ -1191,7 +1798,10 @@ class LXC:
         command = ["start", f"{remote}:{instance_name}"]
 
         try:
-            self._run_lxc(command, capture_output=True, project=project)
+            with self._instance_lock(
+                instance_name=instance_name, project=project, remote=remote
+            ):
+                self._run_lxc(command, capture_output=True, project=project)
         except subprocess.CalledProcessError as error:
             raise LXDError(
                 brief=f"Failed to start {instance_name!r}.",
@@ -1212,7 +1822,10 @@ class LXC:
         command = ["restart", f"{remote}:{instance_name}"]
 
         try:
-            self._run_lxc(command, capture_output=True, project=project)
+            with self._instance_lock(
+                instance_name=instance_name, project=project, remote=remote
+            ):
+                self._run_lxc(command, capture_output=True, project=project)
         except subprocess.CalledProcessError as error:
             raise LXDError(
                 brief=f"Failed to restart {instance_name!r}.",
@@ -1247,7 +1860,10 @@ class LXC:
             command.append(f"--timeout={timeout}")
 
         try:
-            self._run_lxc(command, capture_output=True, project=project)
+            with self._instance_lock(
+                instance_name=instance_name, project=project, remote=remote
+            ):
+                self._run_lxc(command, capture_output=True, project=project)
         except subprocess.CalledProcessError as error:
             raise LXDError(
                 brief=f"Failed to stop {instance_name!r}.",
@@ -1263,10 +1879,11 @@ class LXC:
     ) -> None:
         """Repeatedly check if an instance is ready until the function times out.
 
-        If another process is setting up an instance, the instance's timer will keep
-        incrementing. This function will wait until the other process finishes setting
-        up the instance or times out and stops incrementing the timer. In the latter
-        case, a timeout will occur after 60 seconds of the timer not being incremented.
+        If another process is setting up an instance, it keeps beating a heartbeat
+        file on its host and, less often, the instance's timer. This function will
+        wait until the other process finishes setting up the instance or stops
+        beating. In the latter case, a timeout will occur after 60 seconds without
+        a change to either heartbeat.
 
         The possible status are:
         - None: Either the instance is downloading or old that this is not set.
@@ -1283,13 +1900,20 @@ class LXC:
         instance_status: str | None = None
         instance_info: dict[str, Any] = {"Status": ""}
         start_time = time.monotonic()
-
-        # 20 * 3 seconds = 1 minute no change in timer
-        timer_queue: deque[str] = deque(["-2", "-1"], maxlen=20)
-
-        # retry until the instance's timer hasn't changed for the last 20 iterations
-        while len(set(timer_queue)) > 1:
+        monitor = self.monitor(project=project, remote=remote)
+        heartbeat_file = heartbeat.heartbeat_path(
+            instance_name=instance_name, project=project, remote=remote
+        )
+        last_beat: tuple[str, int | None] | None = None
+        last_beat_time = start_time
+
+        # retry until neither heartbeat has changed for a minute
+        while (
+            last_beat is None
+            or time.monotonic() - last_beat_time <= heartbeat.HEARTBEAT_TIMEOUT
+        ):
             logger.debug("Checking if instance is ready.")
+            since = monitor.generation(instance_name) if monitor else 0
             try:
                 # Get instance info
                 instance_info = self.info(
@@ -1297,23 +1921,28 @@ class LXC:
                 )
                 logger.debug("Instance info: %s", instance_info)
 
-                # Get build status
-                instance_status = self.config_get(
+                # Get build status and timer
+                config = self.config_get_many(
                     instance_name=instance_name,
-                    key="user.craft_providers.status",
+                    keys=[
+                        "user.craft_providers.status",
+                        heartbeat.HEARTBEAT_CONFIG_KEY,
+                    ],
                     project=project,
                     remote=remote,
                 )
+                instance_status = config["user.craft_providers.status"]
                 logger.debug("Instance status: %s", instance_status)
 
-                timer = self.config_get(
-                    instance_name=instance_name,
-                    key="user.craft_providers.timer",
-                    project=project,
-                    remote=remote,
+                # the heartbeat file is only seen by processes on the same host
+                beat = (
+                    config[heartbeat.HEARTBEAT_CONFIG_KEY],
+                    heartbeat.read(heartbeat_file),
                 )
-                timer_queue.append(timer)
-                logger.debug("Timer: %s", timer)
+                if beat != last_beat:
+                    last_beat = beat
+                    last_beat_time = time.monotonic()
+                logger.debug("Timer: %s, heartbeat: %s", *beat)
             except LXDError:
                 # Keep retrying since the instance might not be ready yet
                 # Max retry time is 10 minutes
@@ -1331,7 +1960,11 @@ class LXC:
                 return
 
             logger.debug("Instance is not ready.")
-            time.sleep(3)
+            # wake up early if the instance changes, such as its status being set
+            if monitor and monitor.is_connected:
+                monitor.wait_for_event(instance_name, since=since, timeout=3)
+            else:
+                time.sleep(3)
 
         raise LXDError(brief="Timed out waiting for instance to be ready.")
 
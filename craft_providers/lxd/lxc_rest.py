@@ -0,0 +1,1081 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""LXC wrapper backed by the LXD REST API."""
+
+from __future__ import annotations
+
+import logging
+import os
+import pathlib
+import shutil
+import threading
+from http import HTTPStatus
+from typing import IO, TYPE_CHECKING, Any, NoReturn, cast
+from urllib import parse
+
+import pylxd  # type: ignore[import-untyped]
+import requests
+from pylxd.client import (  # type: ignore[import-untyped]
+    _UnixAdapter,  # pyright: ignore[reportPrivateUsage]
+)
+from typing_extensions import override
+
+from craft_providers.const import TIMEOUT_COMPLEX, TIMEOUT_UNPREDICTABLE
+
+from .errors import LXDError
+from .lxc import (
+    LXC,
+    MAX_CONCURRENT_PROCESSES,
+    ImageListEntry,
+    InstanceListEntry,
+    stringify,
+)
+
+if TYPE_CHECKING:
+    import builtins
+    from collections.abc import Collection, Iterable, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Remote name that maps to the LXD daemon listening on the local unix socket.
+LOCAL_REMOTE = "local"
+
+
+def default_socket_path() -> pathlib.Path:
+    """Get the path of the local LXD unix socket.
+
+    Follows the same lookup order as the lxc client and pylxd.
+
+    :returns: Path to the unix socket.
+    """
+    if "LXD_DIR" in os.environ:
+        return pathlib.Path(os.environ["LXD_DIR"], "unix.socket")
+
+    snap_socket = pathlib.Path("/var/snap/lxd/common/lxd/unix.socket")
+    if snap_socket.exists():
+        return snap_socket
+
+    return pathlib.Path("/var/lib/lxd/unix.socket")
+
+
+class _PooledUnixAdapter(_UnixAdapter):  # type: ignore[misc]
+    """Unix socket adapter that keeps one connection pool per socket.
+
+    pylxd's adapter keys its pools by the full request URL, which opens a new
+    connection for every distinct API path.
+    """
+
+    def get_connection(self, url: str, proxies: object = None) -> object:
+        parsed = parse.urlparse(url)
+        return super().get_connection(f"{parsed.scheme}://{parsed.netloc}", proxies)
+
+
+class RestLXC(LXC):
+    """Wrapper for LXC that talks to the local LXD daemon over its REST API.
+
+    Operations on the ``local`` remote are sent over a single pooled connection
+    to the LXD unix socket instead of spawning an ``lxc`` process per call.
+    Operations on other remotes, and the few operations that rely on client-side
+    configuration or interactive sessions (``launch``, ``exec``, ``image_copy``,
+    ``publish``, instance ``info``, remotes and Pro checks), are delegated to
+    the ``lxc`` CLI.
+
+    :param lxc_path: Path to the lxc executable used for delegated commands.
+    :param max_processes: Maximum number of lxc processes to run concurrently
+        for delegated commands, or None for no limit.
+    :param socket_path: Path to the LXD unix socket. Defaults to the socket of
+        the local LXD daemon.
+    """
+
+    def __init__(
+        self,
+        *,
+        lxc_path: pathlib.Path = pathlib.Path("lxc"),
+        max_processes: int | None = MAX_CONCURRENT_PROCESSES,
+        socket_path: pathlib.Path | None = None,
+    ) -> None:
+        super().__init__(lxc_path=lxc_path, max_processes=max_processes)
+        self.socket_path = socket_path or default_socket_path()
+        self._endpoint = f"http+unix://{parse.quote(str(self.socket_path), safe='')}"
+        self._session: requests.Session | None = None
+        self._session_lock = threading.Lock()
+        self._clients: dict[str, pylxd.Client] = {}
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled session used for every request to the LXD socket."""
+        with self._session_lock:
+            if self._session is None:
+                self._session = requests.Session()
+                self._session.mount("http+unix://", _PooledUnixAdapter())
+            return self._session
+
+    def get_client(self, project: str = "default") -> pylxd.Client:
+        """Get a pylxd client that shares this wrapper's connection pool.
+
+        :param project: Name of LXD project.
+
+        :returns: The pylxd client for the project.
+        """
+        with self._session_lock:
+            client = self._clients.get(project)
+        if client is None:
+            client = pylxd.Client(
+                endpoint=self._endpoint, project=project, session=self.session
+            )
+            with self._session_lock:
+                self._clients[project] = client
+        return client
+
+    @override
+    def close(self) -> None:
+        """Close the pooled connection to the LXD socket."""
+        super().close()
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            self._clients.clear()
+
+    def _request(  # noqa: PLR0913
+        self,
+        method: str,
+        path: str,
+        *,
+        brief: str,
+        project: str | None = None,
+        params: dict[str, str] | None = None,
+        json: dict[str, Any] | None = None,
+        data: IO[bytes] | None = None,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+        timeout: float = TIMEOUT_COMPLEX,
+        accept: Collection[int] = (),
+    ) -> requests.Response:
+        """Send a request to the LXD API and check the response.
+
+        :param method: HTTP method.
+        :param path: API path, e.g. ``/1.0/instances``.
+        :param brief: Brief description used if the request fails.
+        :param project: Name of LXD project.
+        :param params: Additional query parameters.
+        :param json: JSON body to send.
+        :param data: Raw body to send.
+        :param headers: Additional headers.
+        :param stream: Do not read the response body immediately.
+        :param timeout: Timeout (in seconds) for the response.
+        :param accept: Error statuses for which the response is returned instead
+            of raising an LXDError, e.g. 412 for a failed precondition.
+
+        :returns: The response.
+
+        :raises LXDError: If the request fails or LXD returns an error.
+        """
+        query = dict(params or {})
+        if project is not None:
+            query["project"] = project
+
+        logger.debug("Executing LXD API request: %s %s %s", method, path, query)
+
+        try:
+            response = self.session.request(
+                method,
+                f"{self._endpoint}{path}",
+                params=query,
+                json=json,
+                data=data,
+                headers=headers,
+                stream=stream,
+                timeout=timeout,
+            )
+        except requests.RequestException as error:
+            raise LXDError(
+                brief=brief,
+                details=f"* Failed to reach LXD at {str(self.socket_path)!r}: {error}",
+                resolution="Ensure LXD is installed and running.",
+            ) from error
+
+        if response.ok or response.status_code in accept:
+            return response
+
+        try:
+            message = response.json().get("error") or response.reason
+        except ValueError:
+            message = response.reason
+        raise LXDError(
+            brief=brief,
+            details=f"* LXD API error ({response.status_code}): {message}",
+        )
+
+    def _call(
+        self,
+        method: str,
+        path: str,
+        *,
+        brief: str,
+        project: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Send a request to the LXD API and return its metadata.
+
+        Asynchronous operations are waited on until they complete.
+
+        :returns: The ``metadata`` field of the response.
+
+        :raises LXDError: If the request or the operation fails.
+        """
+        response = self._request(method, path, brief=brief, project=project, **kwargs)
+        payload = response.json()
+
+        if payload.get("type") == "async":
+            return self._wait_operation(
+                payload["operation"], brief=brief, project=project
+            )
+
+        return payload.get("metadata") or {}
+
+    def _get_list(
+        self,
+        path: str,
+        *,
+        brief: str,
+        project: str | None = None,
+        recursion: int = 1,
+        params: dict[str, str] | None = None,
+    ) -> builtins.list[dict[str, Any]]:
+        """List a collection of the LXD API with its entries expanded.
+
+        :param path: API path of the collection, e.g. ``/1.0/images``.
+        :param brief: Brief description used if the request fails.
+        :param project: Name of LXD project.
+        :param recursion: Recursion level of the returned entries.
+        :param params: Additional query parameters.
+
+        :returns: The entries of the collection.
+
+        :raises LXDError: If the request fails.
+        """
+        response = self._request(
+            "GET",
+            path,
+            brief=brief,
+            project=project,
+            params={**(params or {}), "recursion": str(recursion)},
+        )
+        return cast(
+            "builtins.list[dict[str, Any]]", response.json().get("metadata") or []
+        )
+
+    def _wait_operation(
+        self, operation: str, *, brief: str, project: str | None
+    ) -> dict[str, Any]:
+        """Wait for a background operation to finish.
+
+        :param operation: Operation URL, e.g. ``/1.0/operations/<id>``.
+        :param brief: Brief description used if the operation fails.
+        :param project: Name of LXD project.
+
+        :returns: The operation's metadata.
+
+        :raises LXDError: If the operation fails.
+        """
+        response = self._request(
+            "GET",
+            f"{parse.urlparse(operation).path}/wait",
+            brief=brief,
+            project=project,
+            params={"timeout": str(TIMEOUT_UNPREDICTABLE)},
+            timeout=TIMEOUT_UNPREDICTABLE + TIMEOUT_COMPLEX,
+        )
+        metadata = response.json().get("metadata") or {}
+
+        if metadata.get("status_code", 200) >= 400 or metadata.get("err"):  # noqa: PLR2004
+            raise LXDError(
+                brief=brief,
+                details=f"* LXD operation failed: {metadata.get('err')}",
+            )
+
+        return metadata.get("metadata") or {}
+
+    def _raise_file_not_found(
+        self,
+        *,
+        instance_name: str,
+        source: pathlib.PurePath,
+        project: str,
+        brief: str,
+    ) -> NoReturn:
+        """Raise the error for a request of a file that LXD answered with 404.
+
+        LXD also answers 404 if the instance or project does not exist, which
+        is an LXDError rather than a missing file.
+
+        :raises FileNotFoundError: If the instance exists.
+        :raises LXDError: If the instance or project does not exist.
+        """
+        self._request(
+            "GET", self._instance_path(instance_name), brief=brief, project=project
+        )
+        raise FileNotFoundError(f"File not found: {source.as_posix()!r}")
+
+    @staticmethod
+    def _instance_path(instance_name: str) -> str:
+        return f"/1.0/instances/{parse.quote(instance_name, safe='')}"
+
+    def _change_state(
+        self,
+        *,
+        instance_name: str,
+        action: str,
+        brief: str,
+        project: str,
+        force: bool = False,
+        timeout: int = -1,
+    ) -> None:
+        self._call(
+            "PUT",
+            f"{self._instance_path(instance_name)}/state",
+            brief=brief,
+            project=project,
+            json={"action": action, "force": force, "timeout": timeout},
+        )
+
+    @override
+    def config_device_add_disk(
+        self,
+        *,
+        instance_name: str,
+        source: pathlib.Path,
+        path: pathlib.PurePath,
+        device: str,
+        project: str = "default",
+        remote: str = "local",
+    ) -> None:
+        if remote != LOCAL_REMOTE:
+            super().config_device_add_disk(
+                instance_name=instance_name,
+                source=source,
+                path=path,
+                device=device,
+                project=project,
+                remote=remote,
+            )
+            return
+
+        with self._instance_lock(
+            instance_name=instance_name, project=project, remote=remote
+        ):
+            self._call(
+                "PATCH",
+                self._instance_path(instance_name),
+                brief=f"Failed to add disk to instance {instance_name!r}.",
+                project=project,
+                json={
+                    "devices": {
+                        device: {
+                            "type": "disk",
+                            "source": source.as_posix(),
+                            "path": path.as_posix(),
+                        }
+                    }
+                },
+            )
+
+    @override
+    def config_device_remove(
+        self,
+        *,
+        instance_name: str,
+        device: str,
+        project: str = "default",
+        remote: str = "local",
+    ) -> None:
+        if remote != LOCAL_REMOTE:
+            super().config_device_remove(
+                instance_name=instance_name,
+                device=device,
+                project=project,
+                remote=remote,
+            )
+            return
+
+        brief = f"Failed to remove device from instance {instance_name!r}."
+        # read-modify-write, so keep other writers to this instance out
+        with self._instance_lock(
+            instance_name=instance_name, project=project, remote=remote
+        ):
+            response = self._request(
+                "GET", self._instance_path(instance_name), brief=brief, project=project
+            )
+            instance = response.json()["metadata"]
+            devices = instance.get("devices") or {}
+
+            if device not in devices:
+                raise LXDError(
+                    brief=brief,
+                    details=f"* Device {device!r} does not exist.",
+                )
+
+            del devices[device]
+            instance["devices"] = devices
+            headers = {}
+            if etag := response.headers.get("ETag"):
+                headers["If-Match"] = etag
+
+            self._call(
+                "PUT",
+                self._instance_path(instance_name),
+                brief=brief,
+                project=project,
+                json=instance,
+                headers=headers,
+            )
+
+    @override
+    def config_device_show(
+        self, *, instance_name: str, project: str = "default", remote: str = "local"
+    ) -> dict[str, Any]:
+        if remote != LOCAL_REMOTE:
+            return super().config_device_show(
+                instance_name=instance_name, project=project, remote=remote
+            )
+
+        instance = self._call(
+            "GET",
+            self._instance_path(instance_name),
+            brief=f"Failed to show devices for instance {instance_name!r}.",
+            project=project,
+        )
+        return cast("dict[str, Any]", stringify(instance.get("devices") or {}))
+
+    @override
+    def config_get(
+        self,
+        *,
+        instance_name: str,
+        key: str,
+        project: str = "default",
+        remote: str = "local",
+    ) -> str:
+        if remote != LOCAL_REMOTE:
+            return super().config_get(
+                instance_name=instance_name, key=key, project=project, remote=remote
+            )
+
+        instance = self._call(
+            "GET",
+            self._instance_path(instance_name),
+            brief=(
+                f"Failed to get value for config key {key!r} "
+                f"for instance {instance_name!r}."
+            ),
+            project=project,
+        )
+        return cast("str", stringify((instance.get("config") or {}).get(key, "")))
+
+    @override
+    def config_set(
+        self,
+        *,
+        instance_name: str,
+        key: str,
+        value: str,
+        project: str = "default",
+        remote: str = "local",
+    ) -> None:
+        if remote != LOCAL_REMOTE:
+            super().config_set(
+                instance_name=instance_name,
+                key=key,
+                value=value,
+                project=project,
+                remote=remote,
+            )
+            return
+
+        with self._instance_lock(
+            instance_name=instance_name, project=project, remote=remote
+        ):
+            self._call(
+                "PATCH",
+                self._instance_path(instance_name),
+                brief=(
+                    f"Failed to set config key {key!r} to {value!r}"
+                    f" for instance {instance_name!r}."
+                ),
+                project=project,
+                json={"config": {key: value}},
+            )
+
+    @override
+    def config_get_many(
+        self,
+        *,
+        instance_name: str,
+        keys: Iterable[str] | None = None,
+        project: str = "default",
+        remote: str = "local",
+    ) -> dict[str, str]:
+        if remote != LOCAL_REMOTE:
+            return super().config_get_many(
+                instance_name=instance_name, keys=keys, project=project, remote=remote
+            )
+
+        instance = self._call(
+            "GET",
+            self._instance_path(instance_name),
+            brief=f"Failed to get config for instance {instance_name!r}.",
+            project=project,
+        )
+        config = cast("dict[str, str]", stringify(instance.get("config") or {}))
+
+        if keys is None:
+            return config
+        return {key: config.get(key, "") for key in keys}
+
+    @override
+    def config_set_many(
+        self,
+        *,
+        instance_name: str,
+        config: dict[str, str],
+        project: str = "default",
+        remote: str = "local",
+    ) -> None:
+        if remote != LOCAL_REMOTE:
+            super().config_set_many(
+                instance_name=instance_name,
+                config=config,
+                project=project,
+                remote=remote,
+            )
+            return
+
+        if not config:
+            return
+
+        with self._instance_lock(
+            instance_name=instance_name, project=project, remote=remote
+        ):
+            self._call(
+                "PATCH",
+                self._instance_path(instance_name),
+                brief=(
+                    f"Failed to set config keys {sorted(config)!r}"
+                    f" for instance {instance_name!r}."
+                ),
+                project=project,
+                json={"config": config},
+            )
+
+    @override
+    def copy(
+        self,
+        *,
+        source_remote: str = "local",
+        source_instance_name: str,
+        destination_remote: str = "local",
+        destination_instance_name: str,
+        project: str = "default",
+    ) -> None:
+        if source_remote != LOCAL_REMOTE or destination_remote != LOCAL_REMOTE:
+            super().copy(
+                source_remote=source_remote,
+                source_instance_name=source_instance_name,
+                destination_remote=destination_remote,
+                destination_instance_name=destination_instance_name,
+                project=project,
+            )
+            return
+
+        source = f"{source_remote}:{source_instance_name}"
+        destination = f"{destination_remote}:{destination_instance_name}"
+        with self._instance_lock(
+            instance_name=destination_instance_name,
+            project=project,
+            remote=destination_remote,
+        ):
+            self._call(
+                "POST",
+                "/1.0/instances",
+                brief=f"Failed to copy instance {source!r} to {destination!r}.",
+                project=project,
+                json={
+                    "name": destination_instance_name,
+                    "source": {"type": "copy", "source": source_instance_name},
+                },
+            )
+
+    @override
+    def delete(
+        self,
+        *,
+        instance_name: str,
+        force: bool = False,
+        project: str = "default",
+        remote: str = "local",
+    ) -> None:
+        if remote != LOCAL_REMOTE:
+            super().delete(
+                instance_name=instance_name,
+                force=force,
+                project=project,
+                remote=remote,
+            )
+            return
+
+        brief = f"Failed to delete instance {instance_name!r}."
+
+        with self._instance_lock(
+            instance_name=instance_name, project=project, remote=remote
+        ):
+            if force:
+                instance = self._call(
+                    "GET",
+                    self._instance_path(instance_name),
+                    brief=brief,
+                    project=project,
+                )
+                if instance.get("status") != "Stopped":
+                    self._change_state(
+                        instance_name=instance_name,
+                        action="stop",
+                        brief=brief,
+                        project=project,
+                        force=True,
+                    )
+
+            self._call(
+                "DELETE",
+                self._instance_path(instance_name),
+                brief=brief,
+                project=project,
+            )
+
+    @override
+    def file_pull(
+        self,
+        *,
+        instance_name: str,
+        source: pathlib.PurePath,
+        destination: pathlib.Path,
+        create_dirs: bool = False,
+        recursive: bool = False,
+        project: str = "default",
+        remote: str = "local",
+    ) -> None:
+        if remote != LOCAL_REMOTE or recursive:
+            super().file_pull(
+                instance_name=instance_name,
+                source=source,
+                destination=destination,
+                create_dirs=create_dirs,
+                recursive=recursive,
+                project=project,
+                remote=remote,
+            )
+            return
+
+        brief = f"Failed to pull file {source.as_posix()!r} from instance {instance_name!r}."
+        response = self._request(
+            "GET",
+            f"{self._instance_path(instance_name)}/files",
+            brief=brief,
+            project=project,
+            params={"path": source.as_posix()},
+            stream=True,
+            accept=(HTTPStatus.NOT_FOUND,),
+        )
+
+        with response:
+            if response.status_code == HTTPStatus.NOT_FOUND:
+                response.close()
+                self._raise_file_not_found(
+                    instance_name=instance_name,
+                    source=source,
+                    project=project,
+                    brief=brief,
+                )
+            if response.headers.get("X-LXD-type", "file") != "file":
+                raise LXDError(
+                    brief=brief,
+                    details=f"* {source.as_posix()!r} is not a regular file.",
+                )
+
+            if create_dirs:
+                destination.parent.mkdir(parents=True, exist_ok=True)
+
+            try:
+                with destination.open("wb") as stream:
+                    shutil.copyfileobj(response.raw, stream)
+            except OSError as error:
+                raise LXDError(brief=brief, details=f"* {error}") from error
+
+    @override
+    def file_read(
+        self,
+        *,
+        instance_name: str,
+        source: pathlib.PurePath,
+        project: str = "default",
+        remote: str = "local",
+    ) -> bytes:
+        if remote != LOCAL_REMOTE:
+            return super().file_read(
+                instance_name=instance_name,
+                source=source,
+                project=project,
+                remote=remote,
+            )
+
+        brief = f"Failed to read file {source.as_posix()!r} from instance {instance_name!r}."
+        response = self._request(
+            "GET",
+            f"{self._instance_path(instance_name)}/files",
+            brief=brief,
+            project=project,
+            params={"path": source.as_posix()},
+            accept=(HTTPStatus.NOT_FOUND,),
+        )
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            self._raise_file_not_found(
+                instance_name=instance_name,
+                source=source,
+                project=project,
+                brief=brief,
+            )
+
+        if response.headers.get("X-LXD-type", "file") != "file":
+            raise LXDError(
+                brief=brief,
+                details=f"* {source.as_posix()!r} is not a regular file.",
+            )
+
+        return response.content
+
+    @override
+    def file_push(
+        self,
+        *,
+        instance_name: str,
+        source: pathlib.Path,
+        destination: pathlib.PurePath,
+        create_dirs: bool = False,
+        recursive: bool = False,
+        gid: int | None = None,
+        uid: int | None = None,
+        mode: str | None = None,
+        project: str = "default",
+        remote: str = "local",
+    ) -> None:
+        if remote != LOCAL_REMOTE or recursive or create_dirs:
+            super().file_push(
+                instance_name=instance_name,
+                source=source,
+                destination=destination,
+                create_dirs=create_dirs,
+                recursive=recursive,
+                gid=gid,
+                uid=uid,
+                mode=mode,
+                project=project,
+                remote=remote,
+            )
+            return
+
+        brief = (
+            f"Failed to push file {source.as_posix()!r} to instance {instance_name!r}."
+        )
+        headers = {"X-LXD-type": "file", "X-LXD-write": "overwrite"}
+        if mode is not None:
+            headers["X-LXD-mode"] = mode
+        if gid is not None:
+            headers["X-LXD-gid"] = str(gid)
+        if uid is not None:
+            headers["X-LXD-uid"] = str(uid)
+
+        try:
+            with source.open("rb") as stream:
+                self._request(
+                    "POST",
+                    f"{self._instance_path(instance_name)}/files",
+                    brief=brief,
+                    project=project,
+                    params={"path": destination.as_posix()},
+                    data=stream,
+                    headers=headers,
+                )
+        except OSError as error:
+            raise LXDError(brief=brief, details=f"* {error}") from error
+
+    @override
+    def info(
+        self,
+        *,
+        instance_name: str | None = None,
+        project: str = "default",
+        remote: str = "local",
+    ) -> dict[str, Any]:
+        # the instance info of `lxc info` is assembled by the client
+        if remote != LOCAL_REMOTE or instance_name:
+            return super().info(
+                instance_name=instance_name, project=project, remote=remote
+            )
+
+        server = self._call(
+            "GET",
+            "/1.0",
+            brief=f"Failed to get info for remote {remote!r}.",
+            project=project,
+        )
+        return cast("dict[str, Any]", stringify(server))
+
+    @override
+    def image_delete(
+        self, *, image: str, project: str = "default", remote: str = "local"
+    ) -> None:
+        if remote != LOCAL_REMOTE:
+            super().image_delete(image=image, project=project, remote=remote)
+            return
+
+        brief = f"Failed to delete image {image!r}."
+        fingerprint = image
+
+        # like the CLI, accept an alias in place of a fingerprint
+        aliases = self._get_list("/1.0/images/aliases", brief=brief, project=project)
+        for alias in aliases:
+            if alias.get("name") == image:
+                fingerprint = alias["target"]
+                break
+
+        self._call(
+            "DELETE",
+            f"/1.0/images/{parse.quote(fingerprint, safe='')}",
+            brief=brief,
+            project=project,
+        )
+
+    @override
+    def image_list(
+        self, *, project: str = "default", remote: str = "local"
+    ) -> Sequence[ImageListEntry]:
+        if remote != LOCAL_REMOTE:
+            return super().image_list(project=project, remote=remote)
+
+        images = self._get_list(
+            "/1.0/images",
+            brief=f"Failed to list images for project {project!r}.",
+            project=project,
+        )
+        return cast("list[ImageListEntry]", stringify(images))
+
+    @override
+    def list(
+        self,
+        *,
+        project: str = "default",
+        remote: str = "local",
+        instance_name: str | None = None,
+    ) -> Sequence[InstanceListEntry]:
+        if remote != LOCAL_REMOTE:
+            return super().list(
+                project=project, remote=remote, instance_name=instance_name
+            )
+
+        instances = self._get_list(
+            "/1.0/instances",
+            brief=f"Failed to list instances for project {project!r}.",
+            project=project,
+            recursion=2,
+            # servers without the 'api_filtering' extension ignore the filter
+            params={"filter": f"name eq {instance_name}"} if instance_name else None,
+        )
+        if instance_name is not None:
+            instances = [i for i in instances if i.get("name") == instance_name]
+        return cast("list[InstanceListEntry]", stringify(instances))
+
+    @override
+    def profile_edit(
+        self,
+        *,
+        profile: str,
+        config: dict[str, Any],
+        project: str = "default",
+        remote: str = "local",
+    ) -> None:
+        if remote != LOCAL_REMOTE:
+            super().profile_edit(
+                profile=profile, config=config, project=project, remote=remote
+            )
+            return
+
+        self._call(
+            "PUT",
+            f"/1.0/profiles/{parse.quote(profile, safe='')}",
+            brief=f"Failed to set profile {profile!r}.",
+            project=project,
+            json={
+                "config": config.get("config") or {},
+                "description": config.get("description", ""),
+                "devices": config.get("devices") or {},
+            },
+        )
+
+    @override
+    def profile_show(
+        self, *, profile: str, project: str = "default", remote: str = "local"
+    ) -> dict[str, Any]:
+        if remote != LOCAL_REMOTE:
+            return super().profile_show(profile=profile, project=project, remote=remote)
+
+        result = self._call(
+            "GET",
+            f"/1.0/profiles/{parse.quote(profile, safe='')}",
+            brief=f"Failed to show profile {profile!r}.",
+            project=project,
+        )
+        return cast("dict[str, Any]", stringify(result))
+
+    @override
+    def project_create(self, *, project: str, remote: str = "local") -> None:
+        if remote != LOCAL_REMOTE:
+            super().project_create(project=project, remote=remote)
+            return
+
+        try:
+            self._call(
+                "POST",
+                "/1.0/projects",
+                brief=f"Failed to create project {project!r}.",
+                json={"name": project},
+            )
+        except LXDError as error:
+            # handle the race condition where two processes check and
+            # create the same project at the same time
+            if project not in self.project_list(remote=remote):
+                raise
+            logger.debug(
+                "Remote %s is present on second check, ignoring exception %s.",
+                project,
+                str(error),
+            )
+
+    @override
+    def project_delete(self, *, project: str, remote: str = "local") -> None:
+        if remote != LOCAL_REMOTE:
+            super().project_delete(project=project, remote=remote)
+            return
+
+        self._call(
+            "DELETE",
+            f"/1.0/projects/{parse.quote(project, safe='')}",
+            brief=f"Failed to delete project {project!r}.",
+        )
+
+    @override
+    def project_list(self, remote: str = "local") -> builtins.list[str]:
+        if remote != LOCAL_REMOTE:
+            return super().project_list(remote=remote)
+
+        projects = self._get_list(
+            "/1.0/projects", brief=f"Failed to list projects on remote {remote!r}."
+        )
+        return sorted(p["name"] for p in projects)
+
+    @override
+    def start(
+        self, *, instance_name: str, project: str = "default", remote: str = "local"
+    ) -> None:
+        if remote != LOCAL_REMOTE:
+            super().start(instance_name=instance_name, project=project, remote=remote)
+            return
+
+        with self._instance_lock(
+            instance_name=instance_name, project=project, remote=remote
+        ):
+            self._change_state(
+                instance_name=instance_name,
+                action="start",
+                brief=f"Failed to start {instance_name!r}.",
+                project=project,
+            )
+
+    @override
+    def restart(
+        self, *, instance_name: str, project: str = "default", remote: str = "local"
+    ) -> None:
+        if remote != LOCAL_REMOTE:
+            super().restart(instance_name=instance_name, project=project, remote=remote)
+            return
+
+        with self._instance_lock(
+            instance_name=instance_name, project=project, remote=remote
+        ):
+            self._change_state(
+                instance_name=instance_name,
+                action="restart",
+                brief=f"Failed to restart {instance_name!r}.",
+                project=project,
+            )
+
+    @override
+    def stop(
+        self,
+        *,
+        instance_name: str,
+        force: bool = False,
+        timeout: int = -1,
+        project: str = "default",
+        remote: str = "local",
+    ) -> None:
+        if remote != LOCAL_REMOTE:
+            super().stop(
+                instance_name=instance_name,
+                force=force,
+                timeout=timeout,
+                project=project,
+                remote=remote,
+            )
+            return
+
+        with self._instance_lock(
+            instance_name=instance_name, project=project, remote=remote
+        ):
+            self._change_state(
+                instance_name=instance_name,
+                action="stop",
+                brief=f"Failed to stop {instance_name!r}.",
+                project=project,
+                force=force,
+                timeout=timeout,
+            )
+
+    @override
+    def get_server_version(self, remote: str = "local") -> str:
+        if remote != LOCAL_REMOTE:
+            return super().get_server_version(remote=remote)
+
+        server = self._call("GET", "/1.0", brief="Could not determine lxd version.")
+        version = server.get("environment", {}).get("server_version")
+        if not version:
+            raise LXDError(
+                brief="Could not determine lxd version.",
+                details="'environment.server_version' field missing from LXD info.",
+                resolution="Ensure you have a new enough version of lxd installed.",
+            )
+        return cast(str, version)
@@ -24,36 +24,64 @@ import json
 import logging
 import os
 import pathlib
-import shutil
 import subprocess
-import tempfile
+import time
 import warnings
-from typing import TYPE_CHECKING, Any, cast
+from typing import IO, TYPE_CHECKING, Any, cast
 
 import pylxd  # type: ignore[import-untyped]
 import yaml
 from typing_extensions import override
 
-from craft_providers.const import RETRY_WAIT, TIMEOUT_SIMPLE
+from craft_providers import replay
+from craft_providers.const import TIMEOUT_SIMPLE
 from craft_providers.errors import ProviderError, details_from_called_process_error
-from craft_providers.executor import Executor, get_instance_name
+from craft_providers.executor import PUSH_FILE_SCRIPT, Executor, get_instance_name
 from craft_providers.lxd.errors import LXDError
-from craft_providers.lxd.lxc import LXC
+from craft_providers.lxd.lxc import LXC, InstanceListEntry
+from craft_providers.lxd.lxc_rest import LOCAL_REMOTE, RestLXC
 from craft_providers.lxd.lxd_instance_status import (
     LXDInstanceState,
     ProviderInstanceStatus,
 )
-from craft_providers.util import env_cmd, retry
+from craft_providers.phases import PhaseEmitter
+from craft_providers.util import env_cmd, popen, retry
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
+
+    from craft_providers.lxd.lxd_monitor import LXDMonitor
 
 logger = logging.getLogger(__name__)
 
 PRO_SERVICES_YAML = pathlib.PurePosixPath("/root/pro-services.yaml")
 
+# Bytes read from a stream at a time when pushing a file.
+PUSH_CHUNK_SIZE = 1024 * 1024
+
+# Seconds the state of an instance is cached for.
+STATE_CACHE_TTL = 1.0
+
+# Policies to poll the state of an instance while it starts or stops, if LXD
+# events are unavailable. An instance usually starts within a second, while
+# shutting down its services takes several seconds.
+START_RETRY_POLICY = retry.FastThenSlow(
+    fast_delay=0.1, fast_attempts=10, slow_delay=1.0
+)
+STOP_RETRY_POLICY = retry.ExponentialBackoff(initial=0.5, maximum=5.0)
+
+# Configuration keys read by `LXDInstance.config_snapshot()`.
+CONFIG_SNAPSHOT_KEYS = (
+    "user.craft_providers.status",
+    "user.craft_providers.timer",
+    "user.craft_providers.pid",
+    "raw.idmap",
+    "environment.TZ",
+    "image.description",
+)
+
 
-class LXDInstance(Executor):
+class LXDInstance(Executor, PhaseEmitter):
     """Wrapper for a LXD Instance.
 
     :ivar name: The provided name for the instance.
@@ -61,11 +89,20 @@ class LXDInstance(Executor):
     :ivar project: The name of the LXD project.
     :ivar remote: The name of the LXD remote.
     :ivar lxc: The LXC wrapper to use.
+
+    Observers added with `add_phase_observer()` are called at the start and end
+    of `launch()`, `copy()` and `start()`.
     """
 
     _pro_services: set[str]
     """Pro services enabled in the instance."""
 
+    _start_retry_policy: retry.RetryPolicy = START_RETRY_POLICY
+    """Policy to poll the instance while it starts, if LXD events are unavailable."""
+
+    _stop_retry_policy: retry.RetryPolicy = STOP_RETRY_POLICY
+    """Policy to poll the instance while it stops, if LXD events are unavailable."""
+
     def __init__(
         self,
         *,
@@ -104,13 +141,27 @@ class LXDInstance(Executor):
         self.project = project
         self.remote = remote
         self._intercept_mknod = intercept_mknod
+        # monotonic time and result of the last instance lookup
+        self._cached_information: tuple[float, InstanceListEntry | None] | None = None
 
         if lxc is None:
             self.lxc = LXC()
         else:
             self.lxc = lxc
 
-        self._client = client or pylxd.Client(project=self.project)
+        # created on first use, as connecting to the API takes a request
+        self._pylxd_client = client
+
+    @property
+    def _client(self) -> pylxd.Client:
+        """The pylxd client used to look up the instance."""
+        if self._pylxd_client is None:
+            if isinstance(self.lxc, RestLXC) and self.remote == LOCAL_REMOTE:
+                # share the connection pool of the REST backend
+                self._pylxd_client = self.lxc.get_client(self.project)
+            else:
+                self._pylxd_client = pylxd.Client(project=self.project)
+        return self._pylxd_client
 
     def _finalize_lxc_command(
         self,
@@ -146,53 +197,68 @@ class LXDInstance(Executor):
         self,
         *,
         destination: pathlib.PurePath,
-        content: io.BytesIO,
+        content: IO[bytes] | Iterable[bytes],
         file_mode: str,
         group: str = "root",
         user: str = "root",
     ) -> None:
         """Create or replace file with content and file mode.
 
+        The content is streamed to the instance through the stdin of a single
+        exec, which also sets the mode and owner, so it is never fully held in
+        memory or written to a temporary file on the host.
+
         :param destination: Path to file.
-        :param content: Contents of file.
+        :param content: Contents of file, as a readable binary stream or an
+            iterable of bytes.
         :param file_mode: File mode string (e.g. '0644').
         :param group: File group owner/id.
         :param user: File user owner/id.
 
         :raises LXDError: On unexpected error.
         """
-        with tempfile.NamedTemporaryFile() as temp_file:
-            shutil.copyfileobj(content, temp_file)
-            # Ensure the file is written to disk.
-            temp_file.flush()
+        command = [
+            "sh",
+            "-c",
+            PUSH_FILE_SCRIPT,
+            "sh",
+            destination.as_posix(),
+            file_mode,
+            f"{user}:{group}",
+        ]
+        if hasattr(content, "read"):
+            stream = cast("IO[bytes]", content)
+            chunks: Iterable[bytes] = iter(lambda: stream.read(PUSH_CHUNK_SIZE), b"")
+        else:
+            chunks = content
 
-            temp_path = pathlib.Path(temp_file.name)
-            self.lxc.file_push(
-                instance_name=self.instance_name,
-                source=temp_path,
-                destination=destination,
-                mode=file_mode,
-                project=self.project,
-                remote=self.remote,
+        process = self.execute_popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        brief = (
+            f"Failed to create file {destination.as_posix()!r}"
+            f" in instance {self.instance_name!r}."
+        )
+        try:
+            # the command failing early is reported by its exit code
+            with popen.streaming(process, timeout=TIMEOUT_SIMPLE) as result:
+                # the Popen is binary as no text mode or encoding is requested
+                stdin = cast("IO[bytes]", process.stdin)
+                for chunk in chunks:
+                    stdin.write(chunk)
+        except subprocess.TimeoutExpired as error:
+            raise LXDError(brief=brief, details=str(error)) from error
+
+        if result.returncode != 0:
+            error = subprocess.CalledProcessError(
+                result.returncode, command, stderr=result.stderr
             )
-
-            # We don't use gid/uid for file_push() in case we don't know the
-            # user/group IDs in advance.  Just chown it.
-            try:
-                self.execute_run(
-                    ["chown", f"{user}:{group}", destination.as_posix()],
-                    capture_output=True,
-                    check=True,
-                    timeout=TIMEOUT_SIMPLE,
-                )
-            except subprocess.CalledProcessError as error:
-                raise LXDError(
-                    brief=(
-                        f"Failed to create file {destination.as_posix()!r}"
-                        f" in instance {self.instance_name!r}."
-                    ),
-                    details=details_from_called_process_error(error),
-                ) from error
+            raise LXDError(
+                brief=brief, details=details_from_called_process_error(error)
+            ) from error
 
     @override
     def delete(self, *, force: bool = True) -> None:
@@ -202,6 +268,8 @@ class LXDInstance(Executor):
 
         :raises LXDError: On unexpected error.
         """
+        self.stop_exec_agent()
+        self._invalidate_state()
         return self.lxc.delete(
             instance_name=self.instance_name,
             project=self.project,
@@ -263,6 +331,9 @@ class LXDInstance(Executor):
         default environment (PATH, etc.), but can be additionally configured via
         env parameter.
 
+        If the exec agent is running, the command runs through it unless it
+        needs arguments the agent does not support, such as a stdin stream.
+
         :param command: Command to execute.
         :param cwd: Working directory for the process inside the instance.
         :param env: Additional environment to set for process.
@@ -275,11 +346,20 @@ class LXDInstance(Executor):
         :raises subprocess.CalledProcessError: if command fails and check is
             True.
         """
+        final_command = self._finalize_lxc_command(command=command, env=env)
+
+        if (agent := self.exec_agent) is not None:
+            result = agent.execute_run(
+                final_command, cwd=cwd, timeout=timeout, check=check, **kwargs
+            )
+            if result is not None:
+                return result
+
         cwd_path = None if cwd is None else cwd.as_posix()
 
         return self.lxc.exec(
             instance_name=self.instance_name,
-            command=self._finalize_lxc_command(command=command, env=env),
+            command=final_command,
             project=self.project,
             remote=self.remote,
             runner=subprocess.run,
@@ -289,14 +369,44 @@ class LXDInstance(Executor):
             **kwargs,
         )
 
+    def get_exec_command(
+        self,
+        command: list[str],
+        *,
+        cwd: pathlib.PurePath | None = None,
+        env: dict[str, str | None] | None = None,
+    ) -> list[str]:
+        """Get the host command executing a command in the instance.
+
+        The command runs the same way as with `execute_run()`, for callers that
+        spawn the host process themselves.
+
+        :param command: Command to execute.
+        :param cwd: Working directory for the process inside the instance.
+        :param env: Additional environment to set for process.
+
+        :returns: The `lxc exec` command.
+        """
+        return self.lxc.exec_command(
+            command=self._finalize_lxc_command(command=command, env=env),
+            instance_name=self.instance_name,
+            cwd=None if cwd is None else cwd.as_posix(),
+            project=self.project,
+            remote=self.remote,
+        )
+
     def exists(self) -> bool:
         """Check if instance exists.
 
         :returns: True if the instance exists.
         """
-        return cast(
-            bool,
-            self._client.instances.exists(self.instance_name),  # type: ignore[reportUnknownVariableType]  # ty: ignore[unresolved-attribute]
+        return replay.call(
+            lambda: cast(
+                bool,
+                self._client.instances.exists(self.instance_name),  # type: ignore[reportUnknownVariableType]  # ty: ignore[unresolved-attribute]
+            ),
+            name="lxd instances exists",
+            command=[self.project, self.instance_name],
         )
 
     def _get_disk_devices(self) -> dict[str, Any]:
@@ -319,21 +429,37 @@ class LXDInstance(Executor):
 
         return disks
 
-    def _get_instance_information(self) -> dict[str, Any] | None:
+    def _get_instance_information(self) -> InstanceListEntry | None:
         """Get information for a LXD instance.
 
+        The result is cached for `STATE_CACHE_TTL` seconds. Methods that change the
+        state of the instance invalidate the cache.
+
         :returns: A dictionary of all information for an instance, including the
             instance's profile, devices, configuration, and status.
 
         :raises LXDError: On unexpected error.
         """
-        instances = self.lxc.list(project=self.project, remote=self.remote)
+        cached = self._cached_information
+        if cached is not None and time.monotonic() - cached[0] < STATE_CACHE_TTL:
+            return cached[1]
 
+        instances = self.lxc.list(
+            project=self.project, remote=self.remote, instance_name=self.instance_name
+        )
+
+        information = None
         for instance in instances:
             if instance["name"] == self.instance_name:
-                return instance
+                information = instance
+                break
+
+        self._cached_information = (time.monotonic(), information)
+        return information
 
-        return None
+    def _invalidate_state(self) -> None:
+        """Forget the cached information of the instance."""
+        self._cached_information = None
 
     def _get_state(self) -> LXDInstanceState:
         """Get the state of an instance.
@@ -419,15 +545,34 @@ class LXDInstance(Executor):
             else:
                 config_keys["security.syscalls.intercept.mknod"] = "true"
 
-        self.lxc.launch(
-            config_keys=config_keys,
-            ephemeral=ephemeral,
-            instance_name=self.instance_name,
-            image=image,
-            image_remote=image_remote,
-            project=self.project,
-            remote=self.remote,
-        )
+        self._invalidate_state()
+        with self._phase("launch"):
+            self.lxc.launch(
+                config_keys=config_keys,
+                ephemeral=ephemeral,
+                instance_name=self.instance_name,
+                image=image,
+                image_remote=image_remote,
+                project=self.project,
+                remote=self.remote,
+            )
+
+    def copy(self, *, source: LXDInstance) -> None:
+        """Create the instance as a copy of another instance.
+
+        :param source: Instance to copy, in the same project.
+
+        :raises LXDError: On unexpected error.
+        """
+        self._invalidate_state()
+        with self._phase("copy"):
+            self.lxc.copy(
+                source_remote=source.remote,
+                source_instance_name=source.instance_name,
+                destination_remote=self.remote,
+                destination_instance_name=self.instance_name,
+                project=self.project,
+            )
 
     def mount(self, *, host_source: pathlib.Path, target: pathlib.PurePath) -> None:
         """Mount host source directory to target mount point.
@@ -479,24 +624,63 @@ class LXDInstance(Executor):
             directory does not exist.
         :raises LXDError: On unexpected error copying file.
         """
-        proc = self.execute_run(
-            ["test", "-f", source.as_posix()],
-            check=False,
-            timeout=TIMEOUT_SIMPLE,
-        )
-        if proc.returncode != 0:
-            raise FileNotFoundError(f"File not found: {source.as_posix()!r}")
-
         if not destination.parent.is_dir():
             raise FileNotFoundError(f"Directory not found: {str(destination.parent)!r}")
 
-        self.lxc.file_pull(
-            instance_name=self.instance_name,
-            source=source,
-            destination=destination,
-            project=self.project,
-            remote=self.remote,
+        try:
+            self.lxc.file_pull(
+                instance_name=self.instance_name,
+                source=source,
+                destination=destination,
+                project=self.project,
+                remote=self.remote,
+            )
+        except LXDError as error:
+            self._check_is_not_directory(source, error)
+            raise
+
+    @override
+    def read_file(self, *, source: pathlib.PurePath) -> bytes:
+        """Read the contents of a file in the environment.
+
+        :param source: Environment file to read.
+
+        :returns: The contents of the file.
+
+        :raises FileNotFoundError: If source file does not exist.
+        :raises LXDError: On unexpected error reading file.
+        """
+        try:
+            return self.lxc.file_read(
+                instance_name=self.instance_name,
+                source=source,
+                project=self.project,
+                remote=self.remote,
+            )
+        except LXDError as error:
+            self._check_is_not_directory(source, error)
+            raise
+
+    def _check_is_not_directory(
+        self, source: pathlib.PurePath, error: LXDError
+    ) -> None:
+        """Raise FileNotFoundError if a file could not be read as it is a directory.
+
+        Only called once reading the file failed, to report a directory the same
+        way as a missing file.
+
+        :param source: Environment file that could not be read.
+        :param error: The error reading the file.
+
+        :raises FileNotFoundError: If source is a directory.
+        """
+        proc = self.execute_run(
+            ["test", "-d", source.as_posix()],
+            check=False,
+            timeout=TIMEOUT_SIMPLE,
         )
+        if proc.returncode == 0:
+            raise FileNotFoundError(f"File not found: {source.as_posix()!r}") from error
 
     def push_file(self, *, source: pathlib.Path, destination: pathlib.PurePath) -> None:
         """Copy a file from the host into the environment.
@@ -557,12 +741,69 @@ class LXDInstance(Executor):
         """Cancel any scheduled shutdown on the instance."""
         self.execute_run(["shutdown", "-c"])
 
+    def _wait_until(
+        self,
+        condition: Callable[[], bool],
+        *,
+        monitor: LXDMonitor | None,
+        retry_policy: retry.RetryPolicy,
+        error: LXDError,
+    ) -> None:
+        """Wait until a condition on the instance is met.
+
+        The condition is checked as soon as LXD reports a change to the instance.
+        If events are unavailable, the condition is polled instead.
+
+        :param condition: Callable that returns True once the condition is met.
+        :param monitor: Monitor for LXD events or None to poll.
+        :param retry_policy: Policy giving the time between checks when polling.
+        :param error: Error to raise if the condition isn't met in time.
+
+        :raises LXDError: If the condition isn't met before the timeout.
+        """
+
+        def _fresh_condition() -> bool:
+            """Check the condition against the current state of the instance."""
+            self._invalidate_state()
+            return condition()
+
+        if monitor is not None:
+            if not monitor.wait(
+                self.instance_name,
+                _fresh_condition,
+                timeout=TIMEOUT_SIMPLE,
+                poll_interval=retry_policy,
+            ):
+                raise error
+            return
+
+        def _check(_timeout: float) -> None:
+            """Raise an error if the condition isn't met."""
+            if not _fresh_condition():
+                raise LXDError(brief="Instance is not ready.")
+
+        stats = retry.RetryStats()
+        try:
+            retry.retry_until_timeout(
+                timeout=TIMEOUT_SIMPLE,
+                retry_wait=retry_policy,
+                func=_check,
+                error=error,
+                stats=stats,
+            )
+        finally:
+            logger.debug("Polled instance %r: %s", self.instance_name, stats)
+
     def start(self) -> None:
         """Start the instance.
 
         :raises LXDError: If the instance fails to start.
         """
         logger.info("Starting instance")
+        with self._phase("start"):
+            self._start()
+
+    def _start(self) -> None:
         if self.info().get("Status") == LXDInstanceState.RUNNING.value:
             if (
                 state := self.config_get("user.craft_providers.status")
@@ -579,22 +820,20 @@ class LXDInstance(Executor):
                 resolution="The same instance cannot be used by multiple processes.",
             )
 
+        # get the monitor before changing the instance, so that once connected
+        # it sees the changes; until then, the wait polls
+        monitor = self.lxc.monitor(project=self.project, remote=self.remote)
+        self._invalidate_state()
         self.lxc.start(
             instance_name=self.instance_name, project=self.project, remote=self.remote
         )
 
-        def _is_running(_timeout: float) -> None:
-            """Raise an error if the instance isn't running."""
-            if self.is_running():
-                return
-            raise LXDError("Instance isn't running")
-
         # `lxc start` is an asynchronous operation, so wait until the instance
         # starts before returning.
-        retry.retry_until_timeout(
-            timeout=TIMEOUT_SIMPLE,
-            retry_wait=RETRY_WAIT,
-            func=_is_running,
+        self._wait_until(
+            self.is_running,
+            monitor=monitor,
+            retry_policy=self._start_retry_policy,
             error=LXDError(brief="Instance failed to start."),
         )
         self.config_set(
@@ -606,22 +845,19 @@ class LXDInstance(Executor):
 
         :raises LXDError: If the instance fails to restart.
         """
+        monitor = self.lxc.monitor(project=self.project, remote=self.remote)
+        self.stop_exec_agent()
+        self._invalidate_state()
         self.lxc.restart(
             instance_name=self.instance_name, project=self.project, remote=self.remote
         )
 
-        def _is_running(_timeout: float) -> None:
-            """Raise an error if the instance isn't running."""
-            if self.is_running():
-                return
-            raise LXDError(brief="Instance isn't running.")
-
         # `lxc restart` is an asynchronous operation, so wait until the instance
         # restarts before returning.
-        retry.retry_until_timeout(
-            timeout=TIMEOUT_SIMPLE,
-            retry_wait=RETRY_WAIT,
-            func=_is_running,
+        self._wait_until(
+            self.is_running,
+            monitor=monitor,
+            retry_policy=self._start_retry_policy,
             error=LXDError(brief="Instance failed to restart."),
         )
 
@@ -642,23 +878,24 @@ class LXDInstance(Executor):
             self._shutdown(delay_mins)
             return
 
+        monitor = self.lxc.monitor(project=self.project, remote=self.remote)
+        self.stop_exec_agent()
+        self._invalidate_state()
         self.lxc.stop(
             instance_name=self.instance_name, project=self.project, remote=self.remote
         )
 
-        def _is_stopped(_timeout: float) -> None:
-            """Raise an error if the instance exists or isn't stopped."""
+        def _is_stopped() -> bool:
+            """Check if the instance is stopped or no longer exists."""
             # ephemeral instances are deleted when 'stop' completes
-            if not self.exists() or self._get_state() == LXDInstanceState.STOPPED:
-                return
-            raise LXDError(brief="Instance hasn't stopped.")
+            return not self.exists() or self._get_state() == LXDInstanceState.STOPPED
 
         # `lxc stop` is an asynchronous operation, so wait until the instance
         # stops before returning.
-        retry.retry_until_timeout(
-            timeout=TIMEOUT_SIMPLE,
-            retry_wait=5,
-            func=_is_stopped,
+        self._wait_until(
+            _is_stopped,
+            monitor=monitor,
+            retry_policy=self._stop_retry_policy,
             error=LXDError(brief="Instance failed to stop."),
         )
         if self.exists():
@@ -751,6 +988,35 @@ class LXDInstance(Executor):
             remote=self.remote,
         )
 
+    def config_set_many(self, config: dict[str, str]) -> None:
+        """Set several instance configuration values at once.
+
+        :param config: Dictionary mapping configuration keys to their values.
+
+        :raises LXDError: On unexpected error.
+        """
+        self.lxc.config_set_many(
+            instance_name=self.instance_name,
+            config=config,
+            project=self.project,
+            remote=self.remote,
+        )
+
+    def config_snapshot(self) -> dict[str, str]:
+        """Get the configuration values craft-providers manages, in one call.
+
+        :returns: Dictionary mapping each key in ``CONFIG_SNAPSHOT_KEYS`` to its
+            value. Keys that are not set map to an empty string.
+
+        :raises LXDError: On unexpected error.
+        """
+        return self.lxc.config_get_many(
+            instance_name=self.instance_name,
+            keys=CONFIG_SNAPSHOT_KEYS,
+            project=self.project,
+            remote=self.remote,
+        )
+
     def info(self) -> dict[str, Any]:
         """Get info for an instance."""
         return self.lxc.info(
@@ -0,0 +1,328 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Watcher for LXD lifecycle events."""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import pathlib
+import subprocess
+import threading
+import time
+from typing import IO, TYPE_CHECKING
+from urllib import parse
+
+from craft_providers import replay
+from craft_providers.util import retry
+
+from .errors import LXDError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks while waiting, in case an event is missed.
+EVENT_RECHECK_INTERVAL = 5.0
+
+# Monitors shared by the process, by remote and project.
+_monitors: dict[tuple[str, str], LXDMonitor] = {}
+_monitors_lock = threading.Lock()
+
+
+def _get_instance_name(event: object) -> str | None:
+    """Get the name of the instance a lifecycle event is about.
+
+    :param event: Event decoded from the output of `lxc monitor`.
+
+    :returns: The instance name or None if the event is not about an instance.
+    """
+    if not isinstance(event, dict) or event.get("type") != "lifecycle":
+        return None
+
+    metadata = event.get("metadata")
+    if not isinstance(metadata, dict):
+        return None
+
+    source = metadata.get("source")
+    if not isinstance(source, str):
+        return None
+
+    parts = parse.urlparse(source).path.split("/")
+    # the source of an instance event is "/1.0/instances/<name>[/...]"
+    if len(parts) < 4 or parts[:3] != ["", "1.0", "instances"]:  # noqa: PLR2004
+        return None
+    return parse.unquote(parts[3])
+
+
+class LXDMonitor:
+    """Watch the lifecycle events of instances in an LXD project.
+
+    Events are read from a long-running `lxc monitor` process. Each event
+    about an instance, such as a state or configuration change, wakes the
+    threads waiting on that instance so they can check it again right away.
+
+    `lxc monitor` does not report when it has connected to LXD, so events may
+    be missed right after it starts. Waiters keep polling until the first
+    event confirms that the monitor is connected, and also if `lxc monitor`
+    cannot be run or exits.
+
+    Use `get_monitor()` to share one monitor per project in the process.
+
+    :param lxc_path: Path to the lxc executable.
+    :param project: Name of LXD project.
+    :param remote: Name of LXD remote.
+    """
+
+    def __init__(
+        self,
+        *,
+        lxc_path: pathlib.Path = pathlib.Path("lxc"),
+        project: str = "default",
+        remote: str = "local",
+    ) -> None:
+        self.lxc_path = lxc_path
+        self.project = project
+        self.remote = remote
+        self._process: subprocess.Popen[str] | None = None
+        self._condition = threading.Condition()
+        self._generations: dict[str, int] = {}
+        self._alive = False
+        self._connected = False
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether `lxc monitor` is running."""
+        with self._condition:
+            return self._alive
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether events are being received.
+
+        True once an event has been received, until `lxc monitor` exits.
+        """
+        with self._condition:
+            return self._alive and self._connected
+
+    def start(self) -> bool:
+        """Start watching events.
+
+        :returns: True if `lxc monitor` was started.
+        """
+        command = [
+            str(self.lxc_path),
+            "--project",
+            self.project,
+            "monitor",
+            f"{self.remote}:",
+            "--type=lifecycle",
+            "--format=json",
+        ]
+        if replay.get_session() is not None:
+            # events arrive at different times in each session, unlike polls
+            logger.debug("LXD events are not used while recording or replaying.")
+            return False
+
+        logger.debug("Starting LXD event monitor: %s", command)
+        try:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        # events are an optimization, so any failure means falling back to polling
+        except Exception as error:  # noqa: BLE001
+            logger.debug("LXD events are unavailable: %s", error)
+            return False
+
+        with self._condition:
+            self._process = process
+            self._alive = True
+        threading.Thread(
+            target=self._read_events, args=(process.stdout,), daemon=True
+        ).start()
+        atexit.register(self.close)
+        return True
+
+    def close(self) -> None:
+        """Stop watching events."""
+        with self._condition:
+            process, self._process = self._process, None
+            self._alive = False
+            self._condition.notify_all()
+        if process is None:
+            return
+
+        atexit.unregister(self.close)
+        process.terminate()
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    def _read_events(self, stream: IO[str] | None) -> None:
+        """Wake waiters for each event until `lxc monitor` exits.
+
+        :param stream: Output of `lxc monitor`.
+        """
+        for line in stream or ():
+            try:
+                instance_name = _get_instance_name(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+
+            with self._condition:
+                if not self._connected:
+                    logger.debug("LXD event monitor is connected.")
+                    self._connected = True
+                if instance_name is not None:
+                    self._generations[instance_name] = (
+                        self._generations.get(instance_name, 0) + 1
+                    )
+                self._condition.notify_all()
+
+        logger.debug("LXD event monitor exited, falling back to polling.")
+        with self._condition:
+            self._alive = False
+            self._condition.notify_all()
+
+    def generation(self, instance_name: str) -> int:
+        """Get the number of events received for an instance.
+
+        :param instance_name: Name of instance.
+
+        :returns: A counter to pass to `wait_for_event()`.
+        """
+        with self._condition:
+            return self._generations.get(instance_name, 0)
+
+    def wait_for_event(self, instance_name: str, *, since: int, timeout: float) -> bool:
+        """Wait for an event about an instance.
+
+        Returns early if events stop being received, so callers can go back to
+        polling.
+
+        :param instance_name: Name of instance.
+        :param since: Value returned by `generation()` before the instance was
+            last checked.
+        :param timeout: Maximum time to wait, in seconds.
+
+        :returns: True if an event was received.
+        """
+        with self._condition:
+            alive = self._alive
+            self._condition.wait_for(
+                lambda: (
+                    self._generations.get(instance_name, 0) != since
+                    or self._alive != alive
+                ),
+                timeout=timeout,
+            )
+            return self._generations.get(instance_name, 0) != since
+
+    def wait(
+        self,
+        instance_name: str,
+        condition: Callable[[], bool],
+        *,
+        timeout: float,
+        poll_interval: float | retry.RetryPolicy,
+    ) -> bool:
+        """Wait until a condition on an instance is met.
+
+        The condition is checked after every event about the instance. It is
+        also checked every `EVENT_RECHECK_INTERVAL` seconds in case an event was
+        missed, or every `poll_interval` seconds until the monitor is connected
+        or if events are unavailable.
+        An LXDError raised by the condition counts as the condition not being
+        met.
+
+        :param instance_name: Name of instance.
+        :param condition: Callable that returns True once the condition is met.
+        :param timeout: Maximum time to wait, in seconds.
+        :param poll_interval: Time between checks if events are unavailable, or a
+            policy giving the time before each check.
+
+        :returns: True if the condition was met before the timeout.
+        """
+        if not isinstance(poll_interval, retry.RetryPolicy):
+            poll_interval = retry.FixedDelay(poll_interval)
+        poll_delays = poll_interval.delays()
+        deadline = time.monotonic() + timeout
+        while True:
+            since = self.generation(instance_name)
+            try:
+                if condition():
+                    return True
+            except LXDError as error:
+                logger.debug("Instance %r is not ready: %s", instance_name, error)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            interval = (
+                EVENT_RECHECK_INTERVAL if self.is_connected else next(poll_delays)
+            )
+            self.wait_for_event(
+                instance_name, since=since, timeout=min(interval, remaining)
+            )
+
+
+def get_monitor(
+    *,
+    lxc_path: pathlib.Path = pathlib.Path("lxc"),
+    project: str = "default",
+    remote: str = "local",
+) -> LXDMonitor | None:
+    """Get the monitor of a project shared by the process.
+
+    The monitor is started on first use and runs until the process exits, so
+    a single `lxc monitor` process runs per project however many instances
+    and `LXC` objects there are.
+
+    :param lxc_path: Path to the lxc executable, used to start the monitor.
+    :param project: Name of LXD project.
+    :param remote: Name of LXD remote.
+
+    :returns: The monitor, or None if events are unavailable and callers
+        should poll instead.
+    """
+    key = (remote, project)
+    with _monitors_lock:
+        monitor = _monitors.get(key)
+        if monitor is None:
+            monitor = LXDMonitor(lxc_path=lxc_path, project=project, remote=remote)
+            monitor.start()
+            _monitors[key] = monitor
+
+    return monitor if monitor.is_alive else None
+
+
+def close_monitors() -> None:
+    """Stop the monitors shared by the process."""
+    with _monitors_lock:
+        monitors = list(_monitors.values())
+        _monitors.clear()
+    for monitor in monitors:
+        monitor.close()
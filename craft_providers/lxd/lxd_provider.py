@@ -22,29 +22,33 @@ import contextlib
 import logging
 from datetime import timedelta
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from typing_extensions import override
 
 from craft_providers import Executor, Provider, bases
 from craft_providers.base import Base
 from craft_providers.errors import BaseConfigurationError
+from craft_providers.util import batch
 
+from .async_lxd_instance import AsyncLXDInstance
 from .errors import LXDError, LXDUnstableImageError
 from .installer import ensure_lxd_is_ready, install, is_installed
-from .launcher import launch
+from .launcher import LAUNCH_WORKERS, launch, launch_many
 from .lxc import LXC
 from .lxd_instance import LXDInstance
 from .remotes import get_remote_image
 
 if TYPE_CHECKING:
     import pathlib
-    from collections.abc import Callable, Collection, Iterator
+    from collections.abc import Callable, Collection, Iterator, Sequence
     from enum import Enum
 
     from craft_providers import Executor
     from craft_providers.base import Base
 
+    from .launch_history import LaunchHistory
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,6 +62,7 @@ class LXDProvider(Provider):
     :param lxd_project: LXD project to use (default is default).
     :param lxd_remote: LXD remote to use (default is local).
     :param intercept_mknod: If the host can, tell LXD instance to intercept mknod
+    :param launch_history: Optional launch history in which to record launches.
     """
 
     def __init__(
@@ -67,11 +72,13 @@ class LXDProvider(Provider):
         lxd_project: str = "default",
         lxd_remote: str = "local",
         intercept_mknod: bool = True,
+        launch_history: LaunchHistory | None = None,
     ) -> None:
         self.lxc = lxc or LXC()
         self.lxd_project = lxd_project
         self.lxd_remote = lxd_remote
         self._intercept_mknod = intercept_mknod
+        self.launch_history = launch_history
 
     @property
     def name(self) -> str:
@@ -108,15 +115,43 @@ class LXDProvider(Provider):
         project_name: str,
         prune_templates: bool = False,
     ) -> None:
-        """Remove instances for a LXD project."""
+        """Remove instances for a LXD project.
+
+        Instances are deleted concurrently. A failure to delete one of them does
+        not stop the others being deleted, and the failures are reported once
+        all are done.
+
+        :param project_name: The name of the LXD project.
+        :param prune_templates: Also delete the base instances.
+
+        :raises LXDError: If any instance could not be deleted.
+        """
         logger.debug(f"Pruning {self.name} {self.lxd_project} instances")
-        instances = self.list_instances(
-            project_name=project_name or self.lxd_project,
-            include_base_instances=prune_templates,
+        instances = {
+            instance.name: instance
+            for instance in self.list_instances(
+                project_name=project_name or self.lxd_project,
+                include_base_instances=prune_templates,
+            )
+        }
+
+        def log_progress(
+            name: str, error: Exception | None, done: int, total: int
+        ) -> None:
+            if error is None:
+                logger.debug(f"Pruned {name} ({done}/{total})")
+            else:
+                logger.debug(f"Failed to prune {name} ({done}/{total}): {error}")
+
+        result = batch.run_batch(
+            lambda name: instances[name].delete(), instances, progress=log_progress
         )
-        for instance in instances:
-            logger.debug(f"Pruning {instance.name}")
-            instance.delete()
+        if result.failed:
+            raise LXDError(
+                brief=f"Failed to prune {len(result.failed)} of {len(instances)}"
+                " instances.",
+                details=result.format_failures(),
+            )
 
     @override
     def list_instances(
@@ -157,9 +192,61 @@ class LXDProvider(Provider):
             name=instance_name,
             project=self.lxd_project,
             remote=self.lxd_remote,
+            lxc=self.lxc,
             intercept_mknod=self._intercept_mknod,
         )
 
+    @override
+    def create_async_executor(self, executor: Executor) -> AsyncLXDInstance:
+        """Get an executor for asyncio event loops of an instance.
+
+        :param executor: The LXD instance.
+
+        :returns: The async executor of the instance.
+        """
+        return AsyncLXDInstance(cast(LXDInstance, executor))
+
+    def _get_image(
+        self,
+        *,
+        base_configuration: Base[Enum],
+        allow_unstable: bool,
+        instance_architecture: str | None,
+    ) -> tuple[str, str, timedelta]:
+        """Get the image to launch instances of a base from.
+
+        :param base_configuration: Base configuration of the instances.
+        :param allow_unstable: If true, allow unstable images to be launched.
+        :param instance_architecture: The architecture to request, if any.
+
+        :returns: The name and remote of the image, and how long base instances
+            created from it are valid.
+
+        :raises LXDUnstableImageError: If the image is unstable and unstable
+            images are not allowed.
+        """
+        image = get_remote_image(base_configuration)
+        image.add_remote(lxc=self.lxc)
+
+        # only allow launching unstable images when opted-in with `allow_unstable`
+        if not image.is_stable and not allow_unstable:
+            raise LXDUnstableImageError(
+                brief=(
+                    f"Cannot launch an unstable image {image.image_name!r} from remote "
+                    f"{image.remote_name!r}"
+                ),
+            )
+
+        # unstable images should be refreshed more often
+        expiration = timedelta(days=90) if image.is_stable else timedelta(days=14)
+
+        image_name = (
+            image.image_name
+            if instance_architecture is None
+            else f"{image.image_name}/{instance_architecture}"
+        )
+        return image_name, image.remote_name, expiration
+
     @override
     @contextlib.contextmanager
     def launched_environment(
@@ -196,25 +283,10 @@ class LXDProvider(Provider):
 
         :raises LXDError: if instance cannot be configured and launched.
         """
-        image = get_remote_image(base_configuration)
-        image.add_remote(lxc=self.lxc)
-
-        # only allow launching unstable images when opted-in with `allow_unstable`
-        if not image.is_stable and not allow_unstable:
-            raise LXDUnstableImageError(
-                brief=(
-                    f"Cannot launch an unstable image {image.image_name!r} from remote "
-                    f"{image.remote_name!r}"
-                ),
-            )
-
-        # unstable images should be refreshed more often
-        expiration = timedelta(days=90) if image.is_stable else timedelta(days=14)
-
-        image_name = (
-            image.image_name
-            if instance_architecture is None
-            else f"{image.image_name}/{instance_architecture}"
+        image_name, image_remote, expiration = self._get_image(
+            base_configuration=base_configuration,
+            allow_unstable=allow_unstable,
+            instance_architecture=instance_architecture,
         )
 
         try:
@@ -222,7 +294,7 @@ class LXDProvider(Provider):
                 name=instance_name,
                 base_configuration=base_configuration,
                 image_name=image_name,
-                image_remote=image.remote_name,
+                image_remote=image_remote,
                 auto_clean=True,
                 auto_create_project=True,
                 map_user_uid=True,
@@ -230,8 +302,10 @@ class LXDProvider(Provider):
                 use_base_instance=use_base_instance,
                 project=self.lxd_project,
                 remote=self.lxd_remote,
+                lxc=self.lxc,
                 expiration=expiration,
                 prepare_instance=prepare_instance,
+                history=self.launch_history,
             )
         except BaseConfigurationError as error:
             raise LXDError(str(error)) from error
@@ -251,3 +325,97 @@ class LXDProvider(Provider):
             # Ensure to unmount everything and stop instance upon completion.
             instance.unmount_all()
             instance.stop(delay_mins=shutdown_delay_mins)
+
+    @override
+    def launch_many(
+        self,
+        *,
+        project_name: str,
+        project_path: pathlib.Path,
+        base_configuration: Base[Enum],
+        instance_names: Sequence[str],
+        allow_unstable: bool = False,
+        use_base_instance: bool = True,
+        prepare_instance: Callable[[Executor], None] | None = None,
+        instance_architecture: str | None = None,
+        max_workers: int | None = None,
+    ) -> Iterator[Executor]:
+        """Configure and launch several instances for the same base concurrently.
+
+        The base instance is created or validated once, then copied to all the
+        instances, which are started and warmed up in parallel. The instances are
+        left running: stop or delete them once done.
+
+        :param project_name: Name of project.
+        :param project_path: Path to project.
+        :param base_configuration: Base configuration to apply to the instances.
+        :param instance_names: Names of the instances to launch.
+        :param allow_unstable: If true, allow unstable images to be launched.
+        :param use_base_instance: Enable base instances to reduce setup time.
+        :param prepare_instance: A callback to perform early instance configuration
+            before the base image setup.
+        :param instance_architecture: A string representing the architecture to request.
+            For example, on amd64 both ``amd64`` and ``i386`` are valid.
+        :param max_workers: Maximum number of instances launched at a time.
+
+        :returns: An iterator of the instances, in the order they become ready.
+
+        :raises LXDError: if an instance cannot be configured and launched.
+        """
+        image_name, image_remote, expiration = self._get_image(
+            base_configuration=base_configuration,
+            allow_unstable=allow_unstable,
+            instance_architecture=instance_architecture,
+        )
+
+        try:
+            instances = launch_many(
+                instance_names,
+                base_configuration=base_configuration,
+                image_name=image_name,
+                image_remote=image_remote,
+                auto_clean=True,
+                auto_create_project=True,
+                map_user_uid=True,
+                uid=project_path.stat().st_uid,
+                use_base_instance=use_base_instance,
+                project=self.lxd_project,
+                remote=self.lxd_remote,
+                lxc=self.lxc,
+                expiration=expiration,
+                prepare_instance=prepare_instance,
+                max_workers=LAUNCH_WORKERS if max_workers is None else max_workers,
+                history=self.launch_history,
+            )
+        except BaseConfigurationError as error:
+            raise LXDError(str(error)) from error
+
+        return self._check_launched(instances, base_configuration=base_configuration)
+
+    def _check_launched(
+        self, instances: Iterator[LXDInstance], *, base_configuration: Base[Enum]
+    ) -> Iterator[Executor]:
+        """Check the guest of instances launched together as they become ready.
+
+        :param instances: The instances being launched.
+        :param base_configuration: Base configuration applied to the instances.
+
+        :returns: An iterator of the instances, in the order they become ready.
+
+        :raises LXDError: if an instance cannot be configured and launched.
+        """
+        checked = False
+        try:
+            for instance in instances:
+                # all the instances are created from the same image, so the guest
+                # is checked once
+                if not checked:
+                    bases.ensure_guest_compatible(
+                        base_configuration,
+                        instance,
+                        self.lxc.get_server_version(),
+                    )
+                    checked = True
+                yield instance
+        except BaseConfigurationError as error:
+            raise LXDError(str(error)) from error
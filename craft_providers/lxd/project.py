@@ -22,7 +22,13 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from craft_providers.util import batch
+
+from .errors import LXDError
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .lxc import LXC
 
 logger = logging.getLogger(__name__)
@@ -57,12 +63,47 @@ def create_with_default_profile(
     lxc.profile_edit(profile="default", project=project, config=config, remote=remote)
 
 
+def _log_progress(
+    kind: str, *, project: str, remote: str
+) -> Callable[[str, Exception | None, int, int], None]:
+    """Get a function logging the progress of deleting a batch of items."""
+
+    def log_progress(item: str, error: Exception | None, done: int, total: int) -> None:
+        if error is None:
+            logger.debug(
+                "Deleted %s %r from project %r on remote %r (%d/%d).",
+                kind,
+                item,
+                project,
+                remote,
+                done,
+                total,
+            )
+        else:
+            logger.debug(
+                "Failed to delete %s %r from project %r on remote %r (%d/%d): %s",
+                kind,
+                item,
+                project,
+                remote,
+                done,
+                total,
+                error,
+            )
+
+    return log_progress
+
+
 def purge(*, lxc: LXC, project: str, remote: str = "local") -> None:
     """Purge a project including its instances and images.
 
     The lxc command does not provide a straight-forward option to purge a
     project.  This helper will purge anything related to a specified one.
 
+    Instances and images are deleted concurrently. A failure to delete one of
+    them does not stop the others being deleted, and the failures are reported
+    once all are done.
+
     :param project: Name of project to delete.
     :param remote: Name of remote.
 
@@ -76,28 +117,36 @@ def purge(*, lxc: LXC, project: str, remote: str = "local") -> None:
         )
         return
 
-    # Cleanup any outstanding instance_names.
-    for instance_name in lxc.list_names(project=project, remote=remote):
-        logger.debug(
-            "Deleting instance %r from project %r on remote %r.",
-            instance_name,
-            project,
-            remote,
-        )
-        lxc.delete(
+    # Cleanup any outstanding instances and images, carrying on past failures so
+    # that as much as possible is cleaned up.
+    instances = batch.run_batch(
+        lambda instance_name: lxc.delete(
             instance_name=instance_name,
             project=project,
             remote=remote,
             force=True,
+        ),
+        lxc.list_names(project=project, remote=remote),
+        progress=_log_progress("instance", project=project, remote=remote),
+    )
+
+    images = batch.run_batch(
+        lambda fingerprint: lxc.image_delete(
+            image=fingerprint, project=project, remote=remote
+        ),
+        [image["fingerprint"] for image in lxc.image_list(project=project)],
+        progress=_log_progress("image", project=project, remote=remote),
+    )
+
+    failures = [
+        result.format_failures() for result in (instances, images) if result.failed
+    ]
+    if failures:
+        raise LXDError(
+            brief=f"Failed to purge project {project!r} on remote {remote!r}.",
+            details="\n".join(failures),
         )
 
-    # Cleanup any outstanding images.
-    for image in lxc.image_list(project=project):
-        logger.debug(
-            "Deleting image %r from project %r on remote %r.", image, project, remote
-        )
-        lxc.image_delete(image=image["fingerprint"], project=project, remote=remote)
-
     # Cleanup project.
     logger.debug("Deleting project %r on remote %r.", project, remote)
     lxc.project_delete(project=project, remote=remote)
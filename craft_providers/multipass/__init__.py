@@ -17,8 +17,9 @@
 
 """Multipass provider support package."""
 
-from ._launch import launch
+from ._launch import launch, launch_many
 from ._ready import ensure_multipass_is_ready
+from .async_multipass_instance import AsyncMultipassInstance
 from .errors import MultipassError, MultipassInstallationError
 from .installer import install, is_installed
 from .multipass import Multipass
@@ -26,6 +27,7 @@ from .multipass_instance import MultipassInstance
 from .multipass_provider import MultipassProvider
 
 __all__ = [
+    "AsyncMultipassInstance",
     "Multipass",
     "MultipassInstance",
     "MultipassError",
@@ -35,4 +37,5 @@ __all__ = [
     "is_installed",
     "ensure_multipass_is_ready",
     "launch",
+    "launch_many",
 ]
@@ -19,21 +19,27 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 from enum import Enum
 from typing import TYPE_CHECKING
 
 from craft_providers import Base, bases
+from craft_providers.errors import ProviderError
 from craft_providers.multipass.multipass_instance import MultipassInstance
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator, Sequence
     from enum import Enum
 
     from craft_providers import Executor
 
 logger = logging.getLogger(__name__)
 
+# Instances launched at a time by `launch_many()`, by default. Each instance
+# is a VM, so fewer are launched at once than LXD containers.
+LAUNCH_WORKERS = 4
+
 
 def launch(
     name: str,
@@ -97,3 +103,92 @@ def launch(
 
     base_configuration.setup(executor=instance)
     return instance
+
+
+def launch_many(  # noqa: PLR0913, too many arguments
+    names: Sequence[str],
+    *,
+    base_configuration: Base[Enum],
+    image_name: str,
+    cpus: int = 2,
+    disk_gb: int = 64,
+    mem_gb: int = 2,
+    auto_clean: bool = False,
+    prepare_instance: Callable[[Executor], None] | None = None,
+    max_workers: int = LAUNCH_WORKERS,
+) -> Iterator[MultipassInstance]:
+    """Create, start, and configure several instances concurrently.
+
+    Each instance is launched with `launch()`, by up to ``max_workers``
+    threads. The instance names are checked when this function is called, and
+    the instances launched as the returned iterator is consumed. If an
+    instance fails to launch, the instances not started yet are cancelled, and
+    the error is raised by the iterator once the instances being launched are
+    done.
+
+    :param names: Names of the instances.
+    :param base_configuration: Base configuration to apply to the instances.
+    :param image_name: Multipass image to use, e.g. snapcraft:core22.
+    :param cpus: Number of CPUs of each instance.
+    :param disk_gb: Disk allocation of each instance in gigabytes.
+    :param mem_gb: Memory allocation of each instance in gigabytes.
+    :param auto_clean: Automatically clean instances, if incompatible.
+    :param prepare_instance: A callback to perform early instance configuration
+        before the base image setup.
+    :param max_workers: Maximum number of instances launched at a time.
+
+    :returns: An iterator of the Multipass instances, in the order they become
+        ready.
+
+    :raises BaseConfigurationError: on unexpected error configuration base.
+    :raises MultipassError: on unexpected Multipass error.
+    :raises ProviderError: if an instance name is repeated.
+    """
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ProviderError(
+            brief=f"instance names must be unique: {', '.join(duplicates)}",
+            resolution="remove the duplicate instance names",
+        )
+
+    def launch_instance(name: str) -> MultipassInstance:
+        return launch(
+            name,
+            base_configuration=base_configuration,
+            image_name=image_name,
+            cpus=cpus,
+            disk_gb=disk_gb,
+            mem_gb=mem_gb,
+            auto_clean=auto_clean,
+            prepare_instance=prepare_instance,
+        )
+
+    return _launch_concurrently(names, launch_instance, max_workers)
+
+
+def _launch_concurrently(
+    names: Sequence[str],
+    launch_instance: Callable[[str], MultipassInstance],
+    max_workers: int,
+) -> Iterator[MultipassInstance]:
+    """Launch instances in a pool of threads, yielding them as they are ready.
+
+    If an instance fails to launch, the instances not yet started are cancelled
+    and the error is raised once the running ones are done.
+
+    :param names: Names of the instances.
+    :param launch_instance: Function launching an instance from its name.
+    :param max_workers: Maximum number of instances launched at a time.
+
+    :returns: An iterator of the instances, in the order they become ready.
+    """
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="craft-providers-launch"
+    ) as pool:
+        futures = [pool.submit(launch_instance, name) for name in names]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
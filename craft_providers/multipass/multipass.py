@@ -34,7 +34,7 @@ from typing import IO, TYPE_CHECKING, Any, TypeVar, cast
 
 import packaging.version
 
-from craft_providers import errors
+from craft_providers import errors, replay, tracing
 from craft_providers.const import RETRY_WAIT
 
 from .errors import MultipassError
@@ -49,6 +49,32 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+def _is_file_not_found(stderr: bytes | str | None) -> bool:
+    """Check if a failed transfer failed because the file does not exist."""
+    if isinstance(stderr, bytes):
+        stderr = stderr.decode(errors="replace")
+    stderr = (stderr or "").lower()
+    return "no such file" in stderr or "file does not exist" in stderr
+
+
+# multipass commands whose first argument is an instance name.
+_INSTANCE_COMMANDS = frozenset({"delete", "exec", "info", "start", "stop"})
+
+
+def _get_trace_instance(command: Sequence[str]) -> str | None:
+    """Get the instance of a multipass command, for tracing."""
+    if "--name" in command[:-1]:
+        return command[command.index("--name") + 1]
+    args = [arg for arg in command[1:] if not arg.startswith("-")]
+    for arg in args:
+        # a path in an instance, e.g. 'name:/root/file'
+        if ":" in arg:
+            return arg.partition(":")[0] or None
+    if command and command[0] in _INSTANCE_COMMANDS and args:
+        return args[0]
+    return None
+
+
 class Multipass:
     """Wrapper for multipass command.
 
@@ -71,11 +97,17 @@ class Multipass:
         It always checks the result (as no errors should pass silently) and captures the
         output (so `multipass` does not pollute the terminal).
         """
+        runner = tracing.traced(
+            replay.wrap(subprocess.run, name=f"multipass {command[0]}"),
+            category="multipass",
+            name=f"multipass {command[0]}",
+            instance=_get_trace_instance(command),
+        )
         command = [str(self.multipass_path), *command]
 
         logger.debug("Executing on host: %s", shlex.join(command))
         # Mypy detects this correctly, but pyright thinks the return type is unknown.
-        return subprocess.run(  # pyright: ignore[reportUnknownVariableType]
+        return runner(  # pyright: ignore[reportUnknownVariableType]
             command,
             check=True,
             capture_output=True,
@@ -103,6 +135,16 @@ class Multipass:
                 details=errors.details_from_called_process_error(error),
             ) from error
 
+    def exec_command(self, *, command: Sequence[str], instance_name: str) -> list[str]:
+        """Get the host command executing a command in instance_name.
+
+        :param command: Command to execute in the instance.
+        :param instance_name: Name of instance to execute in.
+
+        :returns: The `multipass exec` command.
+        """
+        return [str(self.multipass_path), "exec", instance_name, "--", *command]
+
     def exec(
         self,
         *,
@@ -136,16 +178,22 @@ class Multipass:
 
         :returns: Runner's instance.
         """
-        final_cmd = [str(self.multipass_path), "exec", instance_name, "--", *command]
+        final_cmd = self.exec_command(command=command, instance_name=instance_name)
 
         quoted_final_cmd = shlex.join(final_cmd)
         logger.debug("Executing on host: %s", quoted_final_cmd)
 
+        traced_runner = tracing.traced(
+            replay.wrap(runner, name="multipass exec"),
+            category="multipass",
+            name="multipass exec",
+            instance=instance_name,
+        )
         # Only subprocess.run supports timeout
         if runner is subprocess.run:
-            return runner(final_cmd, timeout=timeout, check=check, **kwargs)
+            return traced_runner(final_cmd, timeout=timeout, check=check, **kwargs)
 
-        return runner(final_cmd, **kwargs)
+        return traced_runner(final_cmd, **kwargs)
 
     def info(self, *, instance_name: str) -> dict[str, Any]:
         """Get information/state for instance.
@@ -341,6 +389,7 @@ class Multipass:
         :param destination: The destination path, prefixed with <name:> for a
             path inside the instance.
 
+        :raises FileNotFoundError: If source does not exist.
         :raises MultipassError: On error.
         """
         command = ["transfer", source, destination]
@@ -348,6 +397,8 @@ class Multipass:
         try:
             self._run(command)
         except subprocess.CalledProcessError as error:
+            if _is_file_not_found(error.stderr):
+                raise FileNotFoundError(f"File not found: {source!r}") from error
             raise MultipassError(
                 brief=f"Failed to transfer {source!r} to {destination!r}.",
                 details=errors.details_from_called_process_error(error),
@@ -366,27 +417,42 @@ class Multipass:
         :param chunk_size: Number of bytes to transfer at a time.  Defaults to
             4096.
 
+        :raises FileNotFoundError: If source does not exist.
         :raises MultipassError: On error.
         """
         command = [str(self.multipass_path), "transfer", source, "-"]
-        with subprocess.Popen(
-            command,
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        ) as proc:
-            while True:
-                data = cast("IO[bytes]", proc.stdout).read(chunk_size)
-                if not data:
-                    break
-
-                destination.write(data)
-
-            # Take one read of stderr in case there is anything useful
-            # for debugging an error.
-            stderr = cast("IO[bytes]", proc.stderr).read()
+        with tracing.span(
+            category="multipass",
+            name="multipass transfer",
+            command=command,
+            instance=_get_trace_instance(command[1:]),
+        ) as span:
+            popen = replay.wrap(subprocess.Popen, name="multipass transfer")
+            with popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            ) as proc:
+                while True:
+                    data = cast("IO[bytes]", proc.stdout).read(chunk_size)
+                    if not data:
+                        break
+
+                    destination.write(data)
+                    if span is not None:
+                        span.add_bytes_out(len(data))
+
+                # Take one read of stderr in case there is anything useful
+                # for debugging an error.
+                stderr = cast("IO[bytes]", proc.stderr).read()
+
+            if span is not None:
+                span.exit_code = proc.returncode
 
         if proc.returncode != 0:
+            if _is_file_not_found(stderr):
+                raise FileNotFoundError(f"File not found: {source!r}")
             raise MultipassError(
                 brief=f"Failed to transfer file {source!r}.",
                 details=errors.details_from_command_error(
@@ -410,25 +476,35 @@ class Multipass:
         :raises MultipassError: On error.
         """
         command = [str(self.multipass_path), "transfer", "-", destination]
-        with subprocess.Popen(
-            command, stdin=subprocess.PIPE, stderr=subprocess.PIPE
-        ) as proc:
-            stdin_buf = cast("IO[bytes]", proc.stdin)
-            stderr_buf = cast("IO[bytes]", proc.stderr)
-            while True:
-                data = source.read(chunk_size)
-                if not data:
-                    break
-
-                stdin_buf.write(data)
-
-            # Close stdin before reading stderr, otherwise read() will hang
-            # because process is waiting for more data.
-            stdin_buf.close()
-
-            # Take one read of stderr in case there is anything useful
-            # for debugging an error.
-            stderr = stderr_buf.read()
+        with tracing.span(
+            category="multipass",
+            name="multipass transfer",
+            command=command,
+            instance=_get_trace_instance(command[1:]),
+        ) as span:
+            popen = replay.wrap(subprocess.Popen, name="multipass transfer")
+            with popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+                stdin_buf = cast("IO[bytes]", proc.stdin)
+                stderr_buf = cast("IO[bytes]", proc.stderr)
+                while True:
+                    data = source.read(chunk_size)
+                    if not data:
+                        break
+
+                    stdin_buf.write(data)
+                    if span is not None:
+                        span.add_bytes_in(len(data))
+
+                # Close stdin before reading stderr, otherwise read() will hang
+                # because process is waiting for more data.
+                stdin_buf.close()
+
+                # Take one read of stderr in case there is anything useful
+                # for debugging an error.
+                stderr = stderr_buf.read()
+
+            if span is not None:
+                span.exit_code = proc.returncode
 
         if proc.returncode != 0:
             raise MultipassError(
@@ -19,6 +19,7 @@
 
 from __future__ import annotations
 
+import io
 import logging
 import subprocess
 from typing import (
@@ -38,7 +39,6 @@ from .errors import MultipassError
 from .multipass import Multipass
 
 if TYPE_CHECKING:
-    import io
     import pathlib
 
 logger = logging.getLogger(__name__)
@@ -291,6 +291,29 @@ class MultipassInstance(Executor):
             **kwargs,
         )
 
+    def get_exec_command(
+        self,
+        command: list[str],
+        *,
+        cwd: pathlib.PurePath | None = None,
+        env: dict[str, str | None] | None = None,
+    ) -> list[str]:
+        """Get the host command executing a command in the instance.
+
+        The command runs as root via sudo, the same way as with `execute_run()`,
+        for callers that spawn the host process themselves.
+
+        :param command: Command to execute.
+        :param cwd: working directory to execute the command
+        :param env: Additional environment to set for process.
+
+        :returns: The `multipass exec` command.
+        """
+        return self._multipass.exec_command(
+            command=_rootify_multipass_command(command, cwd=cwd, env=env),
+            instance_name=self.instance_name,
+        )
+
     def exists(self) -> bool:
         """Check if instance exists.
 
@@ -418,14 +441,6 @@ class MultipassInstance(Executor):
             directory does not exist.
         :raises MultipassError: On unexpected error copying file.
         """
-        proc = self.execute_run(
-            ["test", "-f", source.as_posix()],
-            check=False,
-            timeout=TIMEOUT_SIMPLE,
-        )
-        if proc.returncode != 0:
-            raise FileNotFoundError(f"File not found: {source.as_posix()!r}")
-
         if not destination.parent.is_dir():
             raise FileNotFoundError(f"Directory not found: {str(destination.parent)!r}")
 
@@ -434,6 +449,24 @@ class MultipassInstance(Executor):
             destination=str(destination),
         )
 
+    @override
+    def read_file(self, *, source: pathlib.PurePath) -> bytes:
+        """Read the contents of a file in the environment.
+
+        :param source: Environment file to read.
+
+        :returns: The contents of the file.
+
+        :raises FileNotFoundError: If source file does not exist.
+        :raises MultipassError: On unexpected error reading file.
+        """
+        content = io.BytesIO()
+        self._multipass.transfer_destination_io(
+            source=f"{self.instance_name}:{source.as_posix()}",
+            destination=content,
+        )
+        return content.getvalue()
+
     def push_file(self, *, source: pathlib.Path, destination: pathlib.PurePath) -> None:
         """Copy a file from the host into the environment.
 
@@ -22,7 +22,7 @@ import contextlib
 import logging
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from typing_extensions import override
 
@@ -30,8 +30,9 @@ from craft_providers import Base, Executor, Provider, base
 from craft_providers.bases import ubuntu
 from craft_providers.errors import BaseConfigurationError
 
-from ._launch import launch
+from ._launch import LAUNCH_WORKERS, launch, launch_many
 from ._ready import ensure_multipass_is_ready
+from .async_multipass_instance import AsyncMultipassInstance
 from .errors import MultipassError
 from .installer import install, is_installed
 from .multipass import Multipass
@@ -39,7 +40,7 @@ from .multipass_instance import MultipassInstance
 
 if TYPE_CHECKING:
     import pathlib
-    from collections.abc import Callable, Collection, Iterator
+    from collections.abc import Callable, Collection, Iterator, Sequence
 
     from craft_providers import Executor
 
@@ -225,6 +226,16 @@ class MultipassProvider(Provider):
         """
         return MultipassInstance(name=instance_name)
 
+    @override
+    def create_async_executor(self, executor: Executor) -> AsyncMultipassInstance:
+        """Get an executor for asyncio event loops of an instance.
+
+        :param executor: The Multipass instance.
+
+        :returns: The async executor of the instance.
+        """
+        return AsyncMultipassInstance(cast(MultipassInstance, executor))
+
     @classmethod
     def is_provider_installed(cls) -> bool:
         """Check if provider is installed.
@@ -233,6 +244,47 @@ class MultipassProvider(Provider):
         """
         return is_installed()
 
+    def _get_image(
+        self,
+        *,
+        base_configuration: base.Base[Enum],
+        allow_unstable: bool,
+        instance_architecture: str | None,
+    ) -> RemoteImage:
+        """Get the image to launch instances of a base from.
+
+        :param base_configuration: Base configuration of the instances.
+        :param allow_unstable: If true, allow unstable images to be launched.
+        :param instance_architecture: The architecture requested, if any.
+
+        :returns: The remote image.
+
+        :raises MultipassError: If an architecture is requested, or if the image
+            is unstable and unstable images are not allowed.
+        """
+        if instance_architecture is not None:
+            raise MultipassError(
+                brief="the Multipass provider cannot use non-host architectures.",
+                details=f"Architecture {instance_architecture!r} was requested.",
+                resolution="Unset the CRAFT_BUILD_ON environment variable.",
+            )
+
+        image = _get_remote_image(base_configuration)
+
+        # only allow launching unstable images when opted-in with `allow_unstable`
+        if not image.is_stable and not allow_unstable:
+            raise MultipassError(
+                brief=f"Cannot launch unstable image {image.name!r}.",
+                details=(
+                    "Devel or daily images are not guaranteed and are intended for "
+                    "experimental use only."
+                ),
+                resolution=(
+                    "Set parameter `allow_unstable` to True to launch unstable images."
+                ),
+            )
+        return image
+
     @override
     @contextlib.contextmanager
     def launched_environment(
@@ -270,28 +322,12 @@ class MultipassProvider(Provider):
 
         :raises MultipassError: If the instance cannot be launched or configured.
         """
-        if instance_architecture is not None:
-            raise MultipassError(
-                brief="the Multipass provider cannot use non-host architectures.",
-                details=f"Architecture {instance_architecture!r} was requested.",
-                resolution="Unset the CRAFT_BUILD_ON environment variable.",
-            )
-
+        image = self._get_image(
+            base_configuration=base_configuration,
+            allow_unstable=allow_unstable,
+            instance_architecture=instance_architecture,
+        )
         shutdown_delay_mins = 0 if shutdown_delay_mins is None else shutdown_delay_mins
-        image = _get_remote_image(base_configuration)
-
-        # only allow launching unstable images when opted-in with `allow_unstable`
-        if not image.is_stable and not allow_unstable:
-            raise MultipassError(
-                brief=f"Cannot launch unstable image {image.name!r}.",
-                details=(
-                    "Devel or daily images are not guaranteed and are intended for "
-                    "experimental use only."
-                ),
-                resolution=(
-                    "Set parameter `allow_unstable` to True to launch unstable images."
-                ),
-            )
         try:
             instance = launch(
                 name=instance_name,
@@ -312,3 +348,75 @@ class MultipassProvider(Provider):
             # Ensure to unmount everything and stop instance upon completion.
             instance.unmount_all()
             instance.stop(delay_mins=shutdown_delay_mins)
+
+    @override
+    def launch_many(
+        self,
+        *,
+        project_name: str,
+        project_path: pathlib.Path,
+        base_configuration: base.Base[Enum],
+        instance_names: Sequence[str],
+        allow_unstable: bool = False,
+        use_base_instance: bool = False,
+        prepare_instance: Callable[[Executor], None] | None = None,
+        instance_architecture: str | None = None,
+        max_workers: int | None = None,
+    ) -> Iterator[Executor]:
+        """Configure and launch several instances for the same base concurrently.
+
+        Each instance is launched from the image and set up in parallel, as base
+        instances are not supported by this provider. The instances are left
+        running: stop or delete them once done.
+
+        :param project_name: Name of the project.
+        :param project_path: Path to project.
+        :param base_configuration: Base configuration to apply to the instances.
+        :param instance_names: Names of the instances to launch.
+        :param allow_unstable: If true, allow unstable images to be launched.
+        :param use_base_instance: Enable base instances for faster setup (not supported
+            by this provider).
+        :param prepare_instance: A callback to perform early instance configuration
+            before the base image setup.
+        :param instance_architecture: A string representing the architecture to request.
+            Cannot be used with the Multipass provider.
+        :param max_workers: Maximum number of instances launched at a time.
+
+        :returns: An iterator of the instances, in the order they become ready.
+
+        :raises MultipassError: If an instance cannot be launched or configured.
+        """
+        image = self._get_image(
+            base_configuration=base_configuration,
+            allow_unstable=allow_unstable,
+            instance_architecture=instance_architecture,
+        )
+        instances = launch_many(
+            instance_names,
+            base_configuration=base_configuration,
+            image_name=image.name,
+            cpus=2,
+            disk_gb=64,
+            mem_gb=2,
+            auto_clean=True,
+            prepare_instance=prepare_instance,
+            max_workers=LAUNCH_WORKERS if max_workers is None else max_workers,
+        )
+        return self._map_launch_errors(instances)
+
+    @staticmethod
+    def _map_launch_errors(
+        instances: Iterator[MultipassInstance],
+    ) -> Iterator[Executor]:
+        """Report base configuration errors of instances launched together.
+
+        :param instances: The instances being launched.
+
+        :returns: An iterator of the instances, in the order they become ready.
+
+        :raises MultipassError: If an instance cannot be launched or configured.
+        """
+        try:
+            yield from instances
+        except BaseConfigurationError as error:
+            raise MultipassError(str(error)) from error
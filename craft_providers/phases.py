@@ -0,0 +1,145 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Progress and timing events for the phases of long operations."""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import logging
+import threading
+import time
+from enum import Enum
+from typing import TYPE_CHECKING, ClassVar, TypeAlias
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+logger = logging.getLogger(__name__)
+
+
+class PhaseEventType(Enum):
+    """Type of a phase event."""
+
+    START = "start"
+    END = "end"
+
+
+@dataclasses.dataclass(frozen=True)
+class PhaseEvent:
+    """A phase of an operation started or ended.
+
+    :param name: Name of the phase, e.g. 'setup_os'.
+    :param type: Whether the phase started or ended.
+    :param timestamp: Time of the event, as returned by `time.monotonic()`.
+    :param duration: Duration of the phase in seconds, for end events.
+    :param failed: True if the phase ended with an error.
+    """
+
+    name: str
+    type: PhaseEventType
+    timestamp: float
+    duration: float | None = None
+    failed: bool = False
+
+
+PhaseObserver: TypeAlias = "Callable[[PhaseEvent], None]"
+
+
+class PhaseEmitter:
+    """Mixin for objects that report the phases of their operations.
+
+    Observers are called synchronously, in the thread running the operation.
+    An observer that raises does not interrupt the operation. Observers can be
+    added and removed from any thread.
+    """
+
+    _phase_observers: tuple[PhaseObserver, ...] = ()
+
+    # Guards the changes of the observers. They are replaced rather than changed
+    # in place, so they are read without it.
+    _phase_observers_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @property
+    def phase_observers(self) -> tuple[PhaseObserver, ...]:
+        """The observers called on each phase event."""
+        return self._phase_observers
+
+    def add_phase_observer(self, observer: PhaseObserver) -> None:
+        """Call an observer on each phase event.
+
+        :param observer: Function called with each `PhaseEvent`.
+        """
+        with self._phase_observers_lock:
+            self._phase_observers = (*self._phase_observers, observer)
+
+    def remove_phase_observer(self, observer: PhaseObserver) -> None:
+        """Stop calling an observer.
+
+        :param observer: Observer previously added.
+
+        :raises ValueError: If the observer was not added.
+        """
+        with self._phase_observers_lock:
+            observers = list(self._phase_observers)
+            observers.remove(observer)
+            self._phase_observers = tuple(observers)
+
+    def _current_phase_observers(self) -> tuple[PhaseObserver, ...]:
+        """Get the observers of the phases starting now."""
+        return self._phase_observers
+
+    @staticmethod
+    def _emit_phase_event(
+        event: PhaseEvent, observers: tuple[PhaseObserver, ...]
+    ) -> None:
+        for observer in observers:
+            try:
+                observer(event)
+            except Exception:  # noqa: PERF203
+                logger.debug("Phase observer %r failed.", observer, exc_info=True)
+
+    @contextlib.contextmanager
+    def _phase(self, name: str) -> Generator[None, None, None]:
+        """Report the start and end of a phase run within the context."""
+        observers = self._current_phase_observers()
+        if not observers:
+            yield
+            return
+
+        start = time.monotonic()
+        self._emit_phase_event(
+            PhaseEvent(name=name, type=PhaseEventType.START, timestamp=start),
+            observers,
+        )
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            end = time.monotonic()
+            self._emit_phase_event(
+                PhaseEvent(
+                    name=name,
+                    type=PhaseEventType.END,
+                    timestamp=end,
+                    duration=end - start,
+                    failed=failed,
+                ),
+                observers,
+            )
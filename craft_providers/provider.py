@@ -23,6 +23,7 @@ of craft-providers 2.0.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import logging
 from abc import ABC, abstractmethod
@@ -40,9 +41,10 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     import pathlib
-    from collections.abc import Generator
+    from collections.abc import AsyncIterator, Generator, Iterator, Sequence
     from enum import Enum
 
+    from .async_executor import AsyncExecutor
     from .base import Base
     from .executor import Executor
 
@@ -163,3 +165,106 @@ class Provider(ABC):
         :param instance_architecture: A string representing the architecture to request
             if the provider allows selecting the architecture.
         """
+
+    @abstractmethod
+    def create_async_executor(self, executor: Executor) -> AsyncExecutor:
+        """Get an executor for asyncio event loops of an environment.
+
+        :param executor: An environment of this provider.
+
+        :returns: The async executor of the environment.
+        """
+
+    @contextlib.asynccontextmanager
+    async def async_launched_environment(  # noqa: PLR0913, too many arguments
+        self,
+        *,
+        project_name: str,
+        project_path: pathlib.Path,
+        base_configuration: Base[Enum],
+        instance_name: str,
+        allow_unstable: bool = False,
+        shutdown_delay_mins: int | None = None,
+        use_base_instance: bool = True,
+        prepare_instance: Callable[[Executor], None] | None = None,
+        instance_architecture: str | None = None,
+    ) -> AsyncIterator[AsyncExecutor]:
+        """Configure and launch environment for specified base, on an event loop.
+
+        The counterpart of `launched_environment()` for asyncio. Launching and
+        tearing down the environment run in a worker thread, while the commands
+        of the returned executor run on the event loop.
+
+        The executor is the one `create_async_executor()` gets for the
+        launched environment.
+
+        :param project_name: Name of project.
+        :param project_path: Path to project.
+        :param base_configuration: Base configuration to apply to instance.
+        :param instance_name: Name of the instance to launch.
+        :param allow_unstable: If true, allow unstable images to be launched.
+        :param shutdown_delay_mins: Minutes by which to delay shutdown when exiting
+            the instance.
+        :param use_base_instance: Enable base instances if supported by the provider.
+        :param prepare_instance: A callback to perform early instance configuration
+            before the base image setup.
+        :param instance_architecture: A string representing the architecture to request
+            if the provider allows selecting the architecture.
+        """
+        context = self.launched_environment(
+            project_name=project_name,
+            project_path=project_path,
+            base_configuration=base_configuration,
+            instance_name=instance_name,
+            allow_unstable=allow_unstable,
+            shutdown_delay_mins=shutdown_delay_mins,
+            use_base_instance=use_base_instance,
+            prepare_instance=prepare_instance,
+            instance_architecture=instance_architecture,
+        )
+        instance = await asyncio.to_thread(context.__enter__)
+        try:
+            yield self.create_async_executor(instance)
+        except BaseException as error:
+            if not await asyncio.to_thread(
+                context.__exit__, type(error), error, error.__traceback__
+            ):
+                raise
+        else:
+            await asyncio.to_thread(context.__exit__, None, None, None)
+
+    @abstractmethod
+    def launch_many(  # noqa: PLR0913, too many arguments
+        self,
+        *,
+        project_name: str,
+        project_path: pathlib.Path,
+        base_configuration: Base[Enum],
+        instance_names: Sequence[str],
+        allow_unstable: bool = False,
+        use_base_instance: bool = True,
+        prepare_instance: Callable[[Executor], None] | None = None,
+        instance_architecture: str | None = None,
+        max_workers: int | None = None,
+    ) -> Iterator[Executor]:
+        """Configure and launch several environments for the same base concurrently.
+
+        The base is built or validated once, then the environments are created,
+        started and warmed up in parallel. Unlike `launched_environment()`, the
+        environments are left running: stop or delete them once done.
+
+        :param project_name: Name of project.
+        :param project_path: Path to project.
+        :param base_configuration: Base configuration to apply to the instances.
+        :param instance_names: Names of the instances to launch.
+        :param allow_unstable: If true, allow unstable images to be launched.
+        :param use_base_instance: Enable base instances if supported by the provider.
+        :param prepare_instance: A callback to perform early instance configuration
+            before the base image setup.
+        :param instance_architecture: A string representing the architecture to request
+            if the provider allows selecting the architecture.
+        :param max_workers: Maximum number of instances launched at a time. Defaults
+            to a number suited to the provider.
+
+        :returns: An iterator of the executors, in the order they become ready.
+        """
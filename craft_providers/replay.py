@@ -0,0 +1,611 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Recording and replay of the calls made to LXD and Multipass.
+
+Recording is enabled by setting ``CRAFT_PROVIDERS_RECORD`` to the path of a
+recording file, or by calling `start_recording()`. Every lxc and multipass
+command, and every instance lookup through the LXD API, is then recorded with
+its output, exit code and duration. The recording is written on exit.
+
+Replay is enabled by setting ``CRAFT_PROVIDERS_REPLAY`` to the path of a
+recording, or by calling `start_replay()`. Calls are then answered from the
+recording, without running any command, so a session can be reproduced without
+LXD or Multipass, e.g. to profile craft-providers itself or to compare the
+number of calls between releases.
+
+Calls are matched to the recorded ones by their command. When no recorded call
+has the same command, e.g. because it contains a timestamp or the path of a
+temporary file, the first unused call of the same type and length is used.
+
+Files written on the host by a command, e.g. by `lxc file pull` to a path,
+are not recorded. The LXD event monitor is not used while recording or
+replaying, so instances are polled the same way in both.
+"""
+
+from __future__ import annotations
+
+import atexit
+import base64
+import dataclasses
+import io
+import json
+import logging
+import os
+import pathlib
+import subprocess
+import threading
+import time
+from typing import IO, TYPE_CHECKING, Any, TypeVar, cast
+
+from typing_extensions import Self
+
+from craft_providers.errors import ReplayError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RECORD_ENV = "CRAFT_PROVIDERS_RECORD"
+REPLAY_ENV = "CRAFT_PROVIDERS_REPLAY"
+
+RECORDING_VERSION = 1
+
+
+def _encode(data: str | bytes | None) -> dict[str, str] | None:
+    if data is None:
+        return None
+    if isinstance(data, str):
+        return {"text": data}
+    return {"base64": base64.b64encode(data).decode()}
+
+
+def _decode(data: dict[str, str] | None) -> str | bytes | None:
+    if data is None:
+        return None
+    if "text" in data:
+        return data["text"]
+    return base64.b64decode(data["base64"])
+
+
+@dataclasses.dataclass
+class Interaction:
+    """A call made to LXD or Multipass.
+
+    :param name: Type of call, e.g. 'lxc exec'.
+    :param command: Full command.
+    :param returncode: Exit code, or None if the call timed out or is not a
+        command.
+    :param stdout: Standard output, if captured.
+    :param stderr: Standard error output, if captured.
+    :param value: Result of a call that is not a command, e.g. an API request.
+    :param duration: Duration in seconds.
+    """
+
+    name: str
+    command: list[str]
+    returncode: int | None = None
+    stdout: str | bytes | None = None
+    stderr: str | bytes | None = None
+    value: Any = None
+    duration: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        data = dataclasses.asdict(self)
+        data["stdout"] = _encode(self.stdout)
+        data["stderr"] = _encode(self.stderr)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Interaction:
+        """Create from a dictionary returned by `to_dict()`."""
+        return cls(
+            **{
+                **data,
+                "stdout": _decode(data.get("stdout")),
+                "stderr": _decode(data.get("stderr")),
+            }
+        )
+
+
+def load(path: pathlib.Path) -> list[Interaction]:
+    """Load the interactions of a recording.
+
+    :param path: Path of the recording.
+
+    :returns: The interactions, in the order they finished.
+
+    :raises ReplayError: If the recording is not supported.
+    """
+    data = json.loads(path.read_text())
+    if data.get("version") != RECORDING_VERSION:
+        raise ReplayError(
+            brief=f"Unsupported recording {str(path)!r}.",
+            details=f"Version {data.get('version')!r} is not supported.",
+        )
+    return [Interaction.from_dict(item) for item in data["interactions"]]
+
+
+class Recorder:
+    """Record the calls made to LXD and Multipass.
+
+    :param path: Path of the recording written by `close()`, if any.
+    """
+
+    def __init__(self, path: pathlib.Path | None = None) -> None:
+        self.path = path
+        self._interactions: list[Interaction] = []
+        self._lock = threading.Lock()
+
+    @property
+    def interactions(self) -> list[Interaction]:
+        """The calls recorded so far."""
+        with self._lock:
+            return list(self._interactions)
+
+    def add(self, interaction: Interaction) -> None:
+        """Record a call."""
+        with self._lock:
+            self._interactions.append(interaction)
+
+    def write(self, path: pathlib.Path) -> None:
+        """Write the calls to a recording."""
+        data = {
+            "version": RECORDING_VERSION,
+            "interactions": [item.to_dict() for item in self.interactions],
+        }
+        path.write_text(json.dumps(data, indent=1))
+
+    def close(self) -> None:
+        """Write the recording, if any."""
+        if self.path is not None:
+            self.write(self.path)
+            logger.debug("Wrote recording to %s", str(self.path))
+
+    def wrap(self, runner: Callable[..., T], *, name: str) -> Callable[..., T]:
+        """Wrap a runner, such as subprocess.run or Popen, to record its command."""
+
+        def run(command: Sequence[str], *args: Any, **kwargs: Any) -> T:
+            start = time.perf_counter()
+            interaction = Interaction(name=name, command=[str(arg) for arg in command])
+            try:
+                result = runner(command, *args, **kwargs)
+            except subprocess.CalledProcessError as error:
+                interaction.returncode = error.returncode
+                interaction.stdout = error.stdout
+                interaction.stderr = error.stderr
+                interaction.duration = time.perf_counter() - start
+                self.add(interaction)
+                raise
+            except subprocess.TimeoutExpired:
+                interaction.duration = time.perf_counter() - start
+                self.add(interaction)
+                raise
+
+            if isinstance(result, subprocess.CompletedProcess):
+                interaction.returncode = result.returncode
+                interaction.stdout = result.stdout
+                interaction.stderr = result.stderr
+                interaction.duration = time.perf_counter() - start
+                self.add(interaction)
+            else:
+                # a Popen object, recorded once it is seen to exit
+                self._record_popen(
+                    interaction, start, cast("subprocess.Popen[Any]", result)
+                )
+            return result
+
+        return run
+
+    def call(self, function: Callable[[], T], *, name: str, command: list[str]) -> T:
+        """Call a function that is not a command, recording its result."""
+        start = time.perf_counter()
+        value = function()
+        self.add(
+            Interaction(
+                name=name,
+                command=command,
+                value=value,
+                duration=time.perf_counter() - start,
+            )
+        )
+        return value
+
+    def _record_popen(
+        self, interaction: Interaction, start: float, process: subprocess.Popen[Any]
+    ) -> None:
+        stdout = _TeeReader(process.stdout) if process.stdout is not None else None
+        stderr = _TeeReader(process.stderr) if process.stderr is not None else None
+        if stdout is not None:
+            process.stdout = cast("IO[Any]", stdout)
+        if stderr is not None:
+            process.stderr = cast("IO[Any]", stderr)
+        wait = process.wait
+        poll = process.poll
+        recorded = False
+
+        def finish(returncode: int) -> None:
+            nonlocal recorded
+            if recorded:
+                return
+            recorded = True
+            interaction.returncode = returncode
+            interaction.stdout = None if stdout is None else stdout.captured()
+            interaction.stderr = None if stderr is None else stderr.captured()
+            interaction.duration = time.perf_counter() - start
+            self.add(interaction)
+
+        def recorded_wait(timeout: float | None = None) -> int:
+            returncode = wait(timeout)
+            finish(returncode)
+            return returncode
+
+        def recorded_poll() -> int | None:
+            returncode = poll()
+            if returncode is not None:
+                finish(returncode)
+            return returncode
+
+        process.wait = recorded_wait  # type: ignore[method-assign]
+        process.poll = recorded_poll  # type: ignore[method-assign]
+
+
+class _TeeReader:
+    """Keep a copy of the data read from a stream."""
+
+    def __init__(self, stream: IO[Any]) -> None:
+        self._stream = stream
+        self._chunks: list[Any] = []
+
+    def captured(self) -> str | bytes:
+        """Get the data read so far."""
+        empty = "" if isinstance(self._stream, io.TextIOBase) else b""
+        return empty.join(self._chunks)
+
+    def _keep(self, data: T) -> T:
+        if data:
+            self._chunks.append(data)
+        return data
+
+    def read(self, size: int = -1) -> str | bytes:
+        return self._keep(self._stream.read(size))
+
+    def read1(self, size: int = -1) -> str | bytes:
+        return self._keep(self._stream.read1(size))  # type: ignore[attr-defined]
+
+    def readline(self, size: int = -1) -> str | bytes:
+        return self._keep(self._stream.readline(size))
+
+    def __iter__(self) -> Iterator[str | bytes]:
+        return self
+
+    def __next__(self) -> str | bytes:
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._stream.close()
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._stream, name)
+
+
+class ReplayedProcess:
+    """Replacement of a `subprocess.Popen` object for a replayed command."""
+
+    def __init__(
+        self,
+        interaction: Interaction,
+        *,
+        stdin: int | IO[Any] | None,
+        stdout: int | IO[Any] | None,
+        stderr: int | IO[Any] | None,
+    ) -> None:
+        self.args = interaction.command
+        self.pid = 0
+        self.returncode: int | None = None
+        self._returncode = interaction.returncode or 0
+        self.stdin = _Sink() if stdin == subprocess.PIPE else None
+        self.stdout = _stream(interaction.stdout) if stdout == subprocess.PIPE else None
+        self.stderr = _stream(interaction.stderr) if stderr == subprocess.PIPE else None
+
+    def poll(self) -> int | None:
+        """Get the recorded exit code."""
+        self.returncode = self._returncode
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:  # noqa: ARG002
+        """Get the recorded exit code."""
+        self.returncode = self._returncode
+        return self.returncode
+
+    def communicate(
+        self,
+        input: str | bytes | None = None,  # noqa: A002, ARG002
+        timeout: float | None = None,  # noqa: ARG002
+    ) -> tuple[str | bytes | None, str | bytes | None]:
+        """Get the recorded output."""
+        stdout = None if self.stdout is None else self.stdout.read()
+        stderr = None if self.stderr is None else self.stderr.read()
+        self.wait()
+        return stdout, stderr
+
+    def send_signal(self, signal: int) -> None:
+        """Do nothing, as no process is running."""
+
+    def terminate(self) -> None:
+        """Do nothing, as no process is running."""
+
+    def kill(self) -> None:
+        """Do nothing, as no process is running."""
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        for stream in (self.stdin, self.stdout, self.stderr):
+            if stream is not None:
+                stream.close()
+        self.wait()
+
+
+class _Sink:
+    """Discard the input of a replayed command."""
+
+    closed = False
+
+    def write(self, data: str | bytes) -> int:
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _stream(data: str | bytes | None) -> IO[Any]:
+    if isinstance(data, str):
+        return io.StringIO(data)
+    return io.BytesIO(data or b"")
+
+
+class Replayer:
+    """Answer the calls made to LXD and Multipass from a recording.
+
+    :param path: Path of the recording.
+    :param realtime: Wait for the recorded duration of each call, to reproduce
+        the wall time of the session.
+    """
+
+    def __init__(self, path: pathlib.Path, *, realtime: bool = False) -> None:
+        self.path = path
+        self.realtime = realtime
+        self._pending = load(path)
+        self._lock = threading.Lock()
+
+    @property
+    def unused(self) -> list[Interaction]:
+        """The recorded calls that were not replayed."""
+        with self._lock:
+            return list(self._pending)
+
+    def take(self, *, name: str, command: Sequence[str]) -> Interaction:
+        """Get the recorded call matching a call.
+
+        :param name: Type of call, e.g. 'lxc exec'.
+        :param command: Full command.
+
+        :returns: The recorded call, which is not used again.
+
+        :raises ReplayError: If no recorded call matches.
+        """
+        command = [str(arg) for arg in command]
+        with self._lock:
+            match = next(
+                (item for item in self._pending if item.command == command), None
+            )
+            if match is None:
+                match = next(
+                    (
+                        item
+                        for item in self._pending
+                        if item.name == name and len(item.command) == len(command)
+                    ),
+                    None,
+                )
+            if match is None:
+                raise ReplayError(
+                    brief=f"No recorded call matches {name!r}.",
+                    details=f"Command: {command!r}",
+                    resolution="Record the session again.",
+                )
+            self._pending.remove(match)
+
+        if self.realtime:
+            time.sleep(match.duration)
+        return match
+
+    def close(self) -> None:
+        """Log the recorded calls that were not replayed."""
+        unused = self.unused
+        if unused:
+            logger.debug("%d recorded calls were not replayed.", len(unused))
+
+    def wrap(self, runner: Callable[..., T], *, name: str) -> Callable[..., T]:
+        """Wrap a runner, such as subprocess.run or Popen, to replay its command."""
+
+        def run(command: Sequence[str], *_args: Any, **kwargs: Any) -> object:
+            interaction = self.take(name=name, command=command)
+            if runner is not subprocess.run:
+                return ReplayedProcess(
+                    interaction,
+                    stdin=kwargs.get("stdin"),
+                    stdout=kwargs.get("stdout"),
+                    stderr=kwargs.get("stderr"),
+                )
+
+            if interaction.returncode is None:
+                raise subprocess.TimeoutExpired(
+                    interaction.command, kwargs.get("timeout") or 0
+                )
+            if kwargs.get("check") and interaction.returncode != 0:
+                raise subprocess.CalledProcessError(
+                    interaction.returncode,
+                    interaction.command,
+                    output=interaction.stdout,
+                    stderr=interaction.stderr,
+                )
+            return subprocess.CompletedProcess(
+                interaction.command,
+                interaction.returncode,
+                stdout=interaction.stdout,
+                stderr=interaction.stderr,
+            )
+
+        return cast("Callable[..., T]", run)
+
+    def call(
+        self,
+        function: Callable[[], T],  # noqa: ARG002
+        *,
+        name: str,
+        command: list[str],
+    ) -> T:
+        """Get the recorded result of a function that is not a command."""
+        return cast("T", self.take(name=name, command=command).value)
+
+
+Session = Recorder | Replayer
+
+_session: Session | None = None
+_session_lock = threading.Lock()
+_env_checked = False
+
+
+def _start(session: Session) -> None:
+    global _session  # noqa: PLW0603
+
+    with _session_lock:
+        _session = session
+    atexit.register(_close_at_exit, session)
+
+
+def start_recording(path: pathlib.Path | None = None) -> Recorder:
+    """Start recording the calls made to LXD and Multipass.
+
+    :param path: Path of the recording to write on exit, if any.
+
+    :returns: The recorder.
+    """
+    recorder = Recorder(path)
+    _start(recorder)
+    return recorder
+
+
+def start_replay(path: pathlib.Path, *, realtime: bool = False) -> Replayer:
+    """Start answering the calls made to LXD and Multipass from a recording.
+
+    :param path: Path of the recording.
+    :param realtime: Wait for the recorded duration of each call.
+
+    :returns: The replayer.
+    """
+    replayer = Replayer(path, realtime=realtime)
+    _start(replayer)
+    return replayer
+
+
+def stop() -> Session | None:
+    """Stop recording or replaying, writing the recording if any.
+
+    :returns: The recorder or replayer that was in use, if any.
+    """
+    global _session
+
+    with _session_lock:
+        session, _session = _session, None
+    if session is not None:
+        atexit.unregister(_close_at_exit)
+        session.close()
+    return session
+
+
+def get_session() -> Session | None:
+    """Get the recorder or replayer in use.
+
+    Recording or replay is started on first use if ``CRAFT_PROVIDERS_RECORD``
+    or ``CRAFT_PROVIDERS_REPLAY`` is set.
+
+    :returns: The recorder or replayer, or None if neither is in use.
+    """
+    global _env_checked  # noqa: PLW0603
+
+    if not _env_checked:
+        _env_checked = True
+        if os.environ.get(REPLAY_ENV):
+            start_replay(pathlib.Path(os.environ[REPLAY_ENV]))
+        elif os.environ.get(RECORD_ENV):
+            start_recording(pathlib.Path(os.environ[RECORD_ENV]))
+    return _session
+
+
+def _close_at_exit(session: Session) -> None:
+    if session is _session:
+        session.close()
+
+
+def wrap(runner: Callable[..., T], *, name: str) -> Callable[..., T]:
+    """Wrap a runner, such as subprocess.run or Popen, to record or replay it.
+
+    The runner is returned as is if neither recording nor replaying.
+
+    :param runner: Function called with the command and keyword arguments.
+    :param name: Type of command, e.g. 'lxc exec'.
+
+    :returns: The wrapped runner.
+    """
+    session = get_session()
+    if session is None:
+        return runner
+    return session.wrap(runner, name=name)
+
+
+def call(function: Callable[[], T], *, name: str, command: list[str]) -> T:
+    """Call a function that is not a command, e.g. an API request.
+
+    Its result is recorded, or replayed, so it must be JSON-serializable.
+
+    :param function: Function to call.
+    :param name: Type of call, e.g. 'lxd instances exists'.
+    :param command: Arguments identifying the call.
+
+    :returns: The result of the function.
+    """
+    session = get_session()
+    if session is None:
+        return function()
+    return session.call(function, name=name, command=command)
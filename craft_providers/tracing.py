@@ -0,0 +1,432 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Tracing of the commands and requests run on the host.
+
+Tracing is enabled by setting ``CRAFT_PROVIDERS_TRACE`` to the path of a trace
+file, or by calling `enable()`. Every lxc and multipass command, file transfer
+and snapd request is then recorded with its duration, exit code and size. On
+exit, the trace is written in the Chrome trace event format, which can be
+opened in Perfetto or chrome://tracing, and a summary of the calls per command
+type is logged.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import dataclasses
+import json
+import logging
+import os
+import pathlib
+import subprocess
+import threading
+import time
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Sequence
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+TRACE_ENV = "CRAFT_PROVIDERS_TRACE"
+
+
+@dataclasses.dataclass
+class TraceEvent:
+    """A command or request run on the host.
+
+    :param category: Kind of call, e.g. 'lxc', 'multipass' or 'snapd'.
+    :param name: Type of command, e.g. 'lxc exec'.
+    :param command: Full command, or method and URL of a request.
+    :param instance: Name of the instance, if known.
+    :param start: Start time, as returned by `time.perf_counter()`.
+    :param duration: Duration in seconds.
+    :param exit_code: Exit code of the command, or status of the request.
+    :param bytes_in: Number of bytes sent to the command.
+    :param bytes_out: Number of bytes received from the command.
+    :param thread_id: Identifier of the thread that made the call.
+    """
+
+    category: str
+    name: str
+    command: list[str]
+    instance: str | None
+    start: float
+    duration: float
+    exit_code: int | None
+    bytes_in: int | None
+    bytes_out: int | None
+    thread_id: int
+
+
+@dataclasses.dataclass
+class CallSummary:
+    """Calls of a type of command.
+
+    :param count: Number of calls.
+    :param total: Total duration in seconds.
+    :param longest: Duration of the longest call in seconds.
+    """
+
+    count: int = 0
+    total: float = 0.0
+    longest: float = 0.0
+
+
+class Span:
+    """A call being traced.
+
+    The exit code and sizes are set by the caller before the span finishes.
+    """
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        *,
+        category: str,
+        name: str,
+        command: Sequence[str],
+        instance: str | None,
+    ) -> None:
+        self._tracer = tracer
+        self.category = category
+        self.name = name
+        self.command = [str(arg) for arg in command]
+        self.instance = instance
+        self.exit_code: int | None = None
+        self.bytes_in: int | None = None
+        self.bytes_out: int | None = None
+        self._thread_id = threading.get_ident()
+        self._start = time.perf_counter()
+        self._finished = False
+
+    def add_bytes_in(self, size: int) -> None:
+        """Count bytes sent to the command."""
+        self.bytes_in = (self.bytes_in or 0) + size
+
+    def add_bytes_out(self, size: int) -> None:
+        """Count bytes received from the command."""
+        self.bytes_out = (self.bytes_out or 0) + size
+
+    def finish(self) -> None:
+        """Record the call. Only the first call has an effect."""
+        if self._finished:
+            return
+        self._finished = True
+        self._tracer.record(
+            TraceEvent(
+                category=self.category,
+                name=self.name,
+                command=self.command,
+                instance=self.instance,
+                start=self._start,
+                duration=time.perf_counter() - self._start,
+                exit_code=self.exit_code,
+                bytes_in=self.bytes_in,
+                bytes_out=self.bytes_out,
+                thread_id=self._thread_id,
+            )
+        )
+
+
+class Tracer:
+    """Collect the calls made on the host.
+
+    :param path: Path of the trace file written by `close()`, if any.
+    """
+
+    def __init__(self, path: pathlib.Path | None = None) -> None:
+        self.path = path
+        self._events: list[TraceEvent] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    @property
+    def events(self) -> list[TraceEvent]:
+        """The calls recorded so far."""
+        with self._lock:
+            return list(self._events)
+
+    def record(self, event: TraceEvent) -> None:
+        """Record a call."""
+        with self._lock:
+            self._events.append(event)
+
+    @contextlib.contextmanager
+    def span(
+        self,
+        *,
+        category: str,
+        name: str,
+        command: Sequence[str],
+        instance: str | None = None,
+    ) -> Generator[Span, None, None]:
+        """Trace a call within a context.
+
+        :returns: The span, to set its exit code and sizes.
+        """
+        span = Span(
+            self, category=category, name=name, command=command, instance=instance
+        )
+        try:
+            yield span
+        finally:
+            span.finish()
+
+    def summary(self) -> dict[str, CallSummary]:
+        """Get the number and duration of the calls per type of command."""
+        summary: dict[str, CallSummary] = {}
+        for event in self.events:
+            calls = summary.setdefault(event.name, CallSummary())
+            calls.count += 1
+            calls.total += event.duration
+            calls.longest = max(calls.longest, event.duration)
+        return summary
+
+    def format_summary(self) -> str:
+        """Format the summary as a table, most frequent commands first."""
+        summary = sorted(
+            self.summary().items(), key=lambda item: (-item[1].count, item[0])
+        )
+        width = max([len("command")] + [len(name) for name, _ in summary])
+        lines = [f"{'command':<{width}}  {'count':>6}  {'total':>9}  {'longest':>9}"]
+        lines.extend(
+            f"{name:<{width}}  {calls.count:>6}  {calls.total:>8.3f}s  "
+            f"{calls.longest:>8.3f}s"
+            for name, calls in summary
+        )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Get the calls in the Chrome trace event format."""
+        pid = os.getpid()
+        trace_events: list[dict[str, Any]] = []
+        for event in self.events:
+            args: dict[str, Any] = {"command": event.command}
+            for key in ("instance", "exit_code", "bytes_in", "bytes_out"):
+                value = getattr(event, key)
+                if value is not None:
+                    args[key] = value
+            trace_events.append(
+                {
+                    "name": event.name,
+                    "cat": event.category,
+                    "ph": "X",
+                    "ts": round((event.start - self._origin) * 1_000_000),
+                    "dur": round(event.duration * 1_000_000),
+                    "pid": pid,
+                    "tid": event.thread_id,
+                    "args": args,
+                }
+            )
+        return {
+            "traceEvents": trace_events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                name: dataclasses.asdict(calls)
+                for name, calls in self.summary().items()
+            },
+        }
+
+    def write(self, path: pathlib.Path) -> None:
+        """Write the calls to a trace file in the Chrome trace event format."""
+        path.write_text(json.dumps(self.chrome_trace()))
+
+    def close(self) -> None:
+        """Write the trace file, if any, and log the summary."""
+        if self.path is not None:
+            self.write(self.path)
+            logger.debug("Wrote trace to %s", str(self.path))
+        logger.debug("Host calls:\n%s", self.format_summary())
+
+
+_tracer: Tracer | None = None
+_tracer_lock = threading.Lock()
+_env_checked = False
+
+
+def enable(path: pathlib.Path | None = None) -> Tracer:
+    """Start tracing the calls made on the host.
+
+    :param path: Path of the trace file to write on exit, if any.
+
+    :returns: The tracer.
+    """
+    global _tracer  # noqa: PLW0603
+
+    tracer = Tracer(path)
+    with _tracer_lock:
+        _tracer = tracer
+    if path is not None:
+        atexit.register(_close_at_exit, tracer)
+    return tracer
+
+
+def disable() -> Tracer | None:
+    """Stop tracing and write the trace file, if any.
+
+    :returns: The tracer that was in use, if any.
+    """
+    global _tracer
+
+    with _tracer_lock:
+        tracer, _tracer = _tracer, None
+    if tracer is not None:
+        atexit.unregister(_close_at_exit)
+        tracer.close()
+    return tracer
+
+
+def get_tracer() -> Tracer | None:
+    """Get the tracer in use.
+
+    Tracing is enabled on first use if ``CRAFT_PROVIDERS_TRACE`` is set.
+
+    :returns: The tracer, or None if tracing is disabled.
+    """
+    global _env_checked  # noqa: PLW0603
+
+    if not _env_checked:
+        _env_checked = True
+        path = os.environ.get(TRACE_ENV)
+        if path:
+            enable(pathlib.Path(path))
+    return _tracer
+
+
+def _close_at_exit(tracer: Tracer) -> None:
+    if tracer is _tracer:
+        tracer.close()
+
+
+@contextlib.contextmanager
+def span(
+    *,
+    category: str,
+    name: str,
+    command: Sequence[str],
+    instance: str | None = None,
+) -> Generator[Span | None, None, None]:
+    """Trace a call within a context, if tracing is enabled.
+
+    :returns: The span, or None if tracing is disabled.
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        yield None
+        return
+
+    with tracer.span(
+        category=category, name=name, command=command, instance=instance
+    ) as current:
+        yield current
+
+
+def _size(data: str | bytes | None) -> int | None:
+    if data is None:
+        return None
+    if isinstance(data, str):
+        return len(data.encode(errors="replace"))
+    return len(data)
+
+
+def _add_output(
+    span: Span, stdout: str | bytes | None, stderr: str | bytes | None
+) -> None:
+    for data in (stdout, stderr):
+        size = _size(data)
+        if size is not None:
+            span.add_bytes_out(size)
+
+
+def _trace_popen(span: Span, process: subprocess.Popen[Any]) -> None:
+    """Finish a span when the process is seen to exit."""
+    wait = process.wait
+    poll = process.poll
+
+    def traced_wait(timeout: float | None = None) -> int:
+        returncode = wait(timeout)
+        span.exit_code = returncode
+        span.finish()
+        return returncode
+
+    def traced_poll() -> int | None:
+        returncode = poll()
+        if returncode is not None:
+            span.exit_code = returncode
+            span.finish()
+        return returncode
+
+    process.wait = traced_wait  # type: ignore[method-assign]
+    process.poll = traced_poll  # type: ignore[method-assign]
+
+
+def traced(
+    runner: Callable[..., T],
+    *,
+    category: str,
+    name: str,
+    instance: str | None = None,
+) -> Callable[..., T]:
+    """Wrap a runner, such as subprocess.run or Popen, to trace its command.
+
+    For `subprocess.Popen`, the call lasts until the process is waited for.
+    The runner is returned as is if tracing is disabled.
+
+    :param runner: Function called with the command and keyword arguments.
+    :param category: Kind of call, e.g. 'lxc'.
+    :param name: Type of command, e.g. 'lxc exec'.
+    :param instance: Name of the instance, if any.
+
+    :returns: The wrapped runner.
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        return runner
+
+    def run(command: Sequence[str], *args: Any, **kwargs: Any) -> T:
+        current = Span(
+            tracer, category=category, name=name, command=command, instance=instance
+        )
+        current.bytes_in = _size(kwargs.get("input"))
+        try:
+            result = runner(command, *args, **kwargs)
+        except subprocess.CalledProcessError as error:
+            current.exit_code = error.returncode
+            _add_output(current, error.stdout, error.stderr)
+            current.finish()
+            raise
+        except BaseException:
+            current.finish()
+            raise
+
+        if isinstance(result, subprocess.CompletedProcess):
+            current.exit_code = result.returncode
+            _add_output(current, result.stdout, result.stderr)
+            current.finish()
+        elif callable(getattr(result, "wait", None)):
+            # a Popen object, or a replacement of one
+            _trace_popen(current, cast("subprocess.Popen[Any]", result))
+        else:
+            current.finish()
+        return result
+
+    return run
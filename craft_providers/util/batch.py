@@ -0,0 +1,96 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Helpers to run an operation on a batch of items concurrently."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+T = TypeVar("T")
+
+# Items processed at a time by `run_batch()`, by default.
+BATCH_WORKERS = 8
+
+
+@dataclasses.dataclass
+class BatchResult(Generic[T]):
+    """Outcome of running an operation on a batch of items.
+
+    :param succeeded: Items the operation succeeded for, in completion order.
+    :param failed: Items the operation failed for, with their error.
+    """
+
+    succeeded: list[T] = dataclasses.field(default_factory=list)
+    failed: list[tuple[T, Exception]] = dataclasses.field(default_factory=list)
+
+    def format_failures(self) -> str:
+        """Describe the failed items, one per line."""
+        return "\n".join(f"* {item}: {error}" for item, error in self.failed)
+
+
+def run_batch(
+    operation: Callable[[T], object],
+    items: Iterable[T],
+    *,
+    max_workers: int = BATCH_WORKERS,
+    progress: Callable[[T, Exception | None, int, int], None] | None = None,
+) -> BatchResult[T]:
+    """Run an operation on each item, up to ``max_workers`` at a time.
+
+    An item failing does not stop the others: the error is collected in the
+    result and the batch carries on.
+
+    :param operation: Function called with each item.
+    :param items: Items to run the operation on.
+    :param max_workers: Maximum number of items processed at a time.
+    :param progress: Function called in the calling thread as each item is
+        done, with the item, its error if it failed, the number of items done
+        and the total number of items.
+
+    :returns: The items that succeeded and failed.
+    """
+    items = list(items)
+    result: BatchResult[T] = BatchResult()
+    if not items:
+        return result
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)),
+        thread_name_prefix="craft-providers-batch",
+    ) as pool:
+        futures = {pool.submit(operation, item): item for item in items}
+        for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            item = futures[future]
+            raised = future.exception()
+            if raised is not None and not isinstance(raised, Exception):
+                # e.g. KeyboardInterrupt in a worker
+                raise raised
+            error = cast("Exception | None", raised)
+            if error is None:
+                result.succeeded.append(item)
+            else:
+                result.failed.append((item, error))
+            if progress is not None:
+                progress(item, error, done, len(items))
+
+    return result
@@ -0,0 +1,108 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Helpers to copy files from an environment to the host."""
+
+from __future__ import annotations
+
+import tarfile
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pathlib
+
+# Exit code of the scripts when the source directory does not exist.
+DIRECTORY_NOT_FOUND = 66
+
+# Script writing a gzip-compressed tar archive of the directory $1 to stdout.
+ARCHIVE_SCRIPT = (
+    f'cd -- "$1" 2>/dev/null || exit {DIRECTORY_NOT_FOUND}; tar -c -z -f - .'
+)
+
+# Script writing a gzip-compressed tar archive of the paths in the directory
+# $1 matching the shell patterns in the remaining arguments to stdout.
+GLOB_ARCHIVE_SCRIPT = (
+    f'cd -- "$1" 2>/dev/null || exit {DIRECTORY_NOT_FOUND}; shift; IFS=; '
+    'for pattern in "$@"; do for path in $pattern; do '
+    '{ [ -e "$path" ] || [ -L "$path" ]; } && printf "%s\\0" "$path"; '
+    "done; done | tar -c -z -f - --null -T -"
+)
+
+
+def extract_archive(stream: IO[bytes], destination: pathlib.Path) -> list[pathlib.Path]:
+    """Extract a gzip-compressed tar archive from a stream.
+
+    The archive is read as a stream, one member at a time, so it is never
+    fully held in memory. Members that would be written outside of the
+    destination, and special files, are rejected.
+
+    :param stream: Stream to read from.
+    :param destination: Directory to extract into.
+
+    :returns: The host paths of the extracted files that are not directories.
+
+    :raises tarfile.TarError: If the archive is invalid or has unsafe members.
+    """
+    destination.mkdir(parents=True, exist_ok=True)
+    paths: list[pathlib.Path] = []
+    # extraction filters are missing from Python releases without PEP 706
+    data_filter = getattr(tarfile, "data_filter", None)
+    with tarfile.open(fileobj=stream, mode="r|gz") as tar:
+        if data_filter is not None:
+            tar.extraction_filter = data_filter
+        for member in tar:
+            if data_filter is None:
+                _check_member(member, destination)
+            tar.extract(member, destination)
+            if not member.isdir():
+                # the filter extracts absolute paths relative to the destination
+                paths.append(destination / member.name.lstrip("/"))
+    return paths
+
+
+def _check_member(member: tarfile.TarInfo, destination: pathlib.Path) -> None:
+    """Make a member safe to extract, like `tarfile.data_filter` does.
+
+    Leading slashes are stripped from the member name, and the permissions
+    that are not safe for data files are cleared.
+
+    :param member: Member about to be extracted. It is modified in place.
+    :param destination: Directory the member is extracted into.
+
+    :raises tarfile.TarError: If the member is a special file, or it or its
+        link target would be outside of the destination.
+    """
+    if not (member.isreg() or member.isdir() or member.issym() or member.islnk()):
+        raise tarfile.TarError(f"{member.name!r} is a special file")
+
+    root = destination.resolve()
+    member.name = member.name.lstrip("/")
+    path = (root / member.name).resolve()
+    if not path.is_relative_to(root):
+        raise tarfile.TarError(f"{member.name!r} would be extracted outside")
+
+    if member.issym() or member.islnk():
+        if member.linkname.startswith("/"):
+            raise tarfile.TarError(f"{member.name!r} links to an absolute path")
+        # symbolic links are relative to their directory, hard links to the root
+        base = path.parent if member.issym() else root
+        if not (base / member.linkname).resolve().is_relative_to(root):
+            raise tarfile.TarError(f"{member.name!r} links outside")
+
+    member.mode &= 0o755
+    member.uid = member.gid = 0
+    member.uname = member.gname = ""
@@ -0,0 +1,211 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Helpers to synchronize a host directory into an environment."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import pathlib
+import re
+import tarfile
+from typing import IO
+
+# Script listing the directory $1 in the environment. It prints every path
+# that is not a directory, then every subdirectory, each list null-separated
+# and terminated by an empty path, then the sha256sum of every regular file.
+# Nothing is printed if the directory does not exist.
+MANIFEST_SCRIPT = (
+    'cd -- "$1" 2>/dev/null || exit 0; '
+    "find . ! -type d -print0 && printf '\\0' && "
+    "find . -mindepth 1 -type d -print0 && printf '\\0' && "
+    "find . -type f -exec sha256sum -- {} +"
+)
+
+# Script deleting the null-separated paths read from stdin, relative to $1, in
+# order. Directories are only deleted if they are empty.
+DELETE_SCRIPT = 'cd -- "$1" && xargs -0 rm -f -d --'
+
+# Script extracting a gzip-compressed tar archive read from stdin into $1.
+EXTRACT_SCRIPT = 'mkdir -p -- "$1" && tar -x -z -f - --no-same-owner -C "$1"'
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+_SHA256SUM_ESCAPES = {"n": "\n", "r": "\r", "\\": "\\"}
+
+
+@dataclasses.dataclass
+class Manifest:
+    """Contents of a directory.
+
+    :param files: Hash of each regular file, keyed by relative path. Symbolic
+        links have no hash.
+    :param directories: Relative paths of the subdirectories.
+    """
+
+    files: dict[str, str | None] = dataclasses.field(default_factory=dict)
+    directories: list[str] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class SyncPlan:
+    """Changes needed to make a directory match another.
+
+    :param transfer: Relative paths of the files to transfer.
+    :param delete: Relative paths of the files to delete.
+    :param delete_directories: Relative paths of the directories to delete,
+        deepest first.
+    """
+
+    transfer: list[str]
+    delete: list[str]
+    delete_directories: list[str] = dataclasses.field(default_factory=list)
+
+
+def hash_file(path: pathlib.Path) -> str:
+    """Get the sha256 hash of a file."""
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_host_manifest(root: pathlib.Path) -> Manifest:
+    """List the contents of a directory in the host.
+
+    Symbolic links are not followed. Special files, such as sockets, are
+    ignored.
+
+    :param root: Directory to list.
+
+    :returns: The contents of the directory.
+    """
+    manifest = Manifest()
+    for dirpath, dirnames, filenames in os.walk(root):
+        parent = pathlib.Path(dirpath)
+        relative_parent = parent.relative_to(root)
+        for name in dirnames:
+            path = parent / name
+            relative = relative_parent.joinpath(name).as_posix()
+            if path.is_symlink():
+                manifest.files[relative] = None
+            else:
+                manifest.directories.append(relative)
+
+        for name in filenames:
+            path = parent / name
+            relative = relative_parent.joinpath(name).as_posix()
+            if path.is_symlink():
+                manifest.files[relative] = None
+            elif path.is_file():
+                manifest.files[relative] = hash_file(path)
+
+    return manifest
+
+
+def _strip_dot(path: str) -> str:
+    return path[2:] if path.startswith("./") else path
+
+
+def _unescape_sha256sum(path: str) -> str:
+    return re.sub(
+        r"\\(.)", lambda match: _SHA256SUM_ESCAPES.get(match[1], match[1]), path
+    )
+
+
+def parse_manifest(output: bytes) -> tuple[set[str], set[str], dict[str, str]]:
+    """Parse the output of `MANIFEST_SCRIPT`.
+
+    :param output: Output of the script.
+
+    :returns: The relative paths that are not directories, the relative paths
+        of the subdirectories, and the hash of each regular file keyed by
+        relative path.
+    """
+    entries = output.split(b"\0")
+    try:
+        paths_end = entries.index(b"")
+        directories_end = entries.index(b"", paths_end + 1)
+    except ValueError:
+        # the directory does not exist
+        return set(), set(), {}
+
+    paths = {_strip_dot(os.fsdecode(entry)) for entry in entries[:paths_end]}
+    directories = {
+        _strip_dot(os.fsdecode(entry))
+        for entry in entries[paths_end + 1 : directories_end]
+    }
+
+    hashes: dict[str, str] = {}
+    for line in os.fsdecode(b"\0".join(entries[directories_end + 1 :])).splitlines():
+        # sha256sum escapes the line if the path has a backslash or newline
+        escaped = line.startswith("\\")
+        digest, _, path = line.removeprefix("\\").partition("  ")
+        if escaped:
+            path = _unescape_sha256sum(path)
+        hashes[_strip_dot(path)] = digest
+
+    return paths, directories, hashes
+
+
+def plan_sync(
+    source: Manifest, paths: set[str], directories: set[str], hashes: dict[str, str]
+) -> SyncPlan:
+    """Get the changes needed to make a directory match the source.
+
+    Symbolic links are always transferred, as they have no hash.
+
+    :param source: Contents of the source directory.
+    :param paths: Relative paths in the destination that are not directories.
+    :param directories: Relative paths of the subdirectories in the destination.
+    :param hashes: Hash of each regular file in the destination.
+
+    :returns: The files to transfer, and the files and directories to delete.
+    """
+    transfer = sorted(
+        path
+        for path, digest in source.files.items()
+        if digest is None or hashes.get(path) != digest
+    )
+    delete = sorted(path for path in paths if path not in source.files)
+    delete_directories = sorted(
+        directories.difference(source.directories),
+        key=lambda path: (-path.count("/"), path),
+    )
+    return SyncPlan(
+        transfer=transfer, delete=delete, delete_directories=delete_directories
+    )
+
+
+def write_archive(
+    stream: IO[bytes], root: pathlib.Path, directories: list[str], files: list[str]
+) -> None:
+    """Write a gzip-compressed tar archive to a stream.
+
+    The archive is written as a stream, so it is never fully held in memory.
+
+    :param stream: Stream to write to.
+    :param root: Directory the paths are relative to.
+    :param directories: Relative paths of the directories to add.
+    :param files: Relative paths of the files to add.
+    """
+    with tarfile.open(fileobj=stream, mode="w|gz") as tar:
+        for path in [*directories, *files]:
+            tar.add(root / path, arcname=path, recursive=False)
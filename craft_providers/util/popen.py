@@ -0,0 +1,97 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Helpers to stream data to or from a running process."""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import threading
+from typing import IO, TYPE_CHECKING, Any, cast
+
+from craft_providers.const import TIMEOUT_SIMPLE
+
+if TYPE_CHECKING:
+    import subprocess
+    from collections.abc import Iterator
+
+
+@dataclasses.dataclass
+class StreamResult:
+    """Outcome of a process streamed with `streaming()`.
+
+    :param returncode: Exit code of the process.
+    :param stderr: Everything the process wrote to its standard error.
+    """
+
+    returncode: int = 0
+    stderr: bytes = b""
+
+
+@contextlib.contextmanager
+def streaming(
+    process: subprocess.Popen[Any], *, timeout: float = TIMEOUT_SIMPLE
+) -> Iterator[StreamResult]:
+    """Reap a process once its stdin or stdout has been streamed.
+
+    Its standard error, if piped, is drained in a thread while the block runs,
+    so the process never blocks on a full stderr pipe. When the block ends,
+    the process' stdin and stdout are closed and it is waited for. The result
+    is filled in once the process has exited.
+
+    If the block raises, the process is killed and reaped before the error
+    propagates. A broken pipe is not an error: the process exited early and
+    its exit code reports why.
+
+    :param process: Process started with binary pipes.
+    :param timeout: Seconds to wait for the process to exit after the block.
+
+    :raises subprocess.TimeoutExpired: If the process did not exit in time. It
+        is killed.
+    """
+    result = StreamResult()
+    chunks: list[bytes] = []
+    drain: threading.Thread | None = None
+    if process.stderr is not None:
+        stderr = cast("IO[bytes]", process.stderr)
+        drain = threading.Thread(
+            target=lambda: chunks.extend(iter(stderr.read1, b"")),
+            name="craft-providers-stderr",
+            daemon=True,
+        )
+        drain.start()
+
+    try:
+        try:
+            yield result
+        except BrokenPipeError:
+            pass
+        finally:
+            for stream in (process.stdin, process.stdout):
+                if stream is not None:
+                    with contextlib.suppress(BrokenPipeError):
+                        stream.close()
+        result.returncode = process.wait(timeout=timeout)
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        if drain is not None:
+            drain.join(timeout)
+        result.stderr = b"".join(chunks)
@@ -18,44 +18,177 @@
 
 from __future__ import annotations
 
+import abc
+import dataclasses
+import itertools
+import random
 import time
 from typing import TYPE_CHECKING, TypeVar
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
 T = TypeVar("T")
 
 
+class RetryPolicy(abc.ABC):
+    """How long to wait between the attempts of a retried call."""
+
+    @abc.abstractmethod
+    def delays(self) -> Iterator[float]:
+        """Get the times to wait before each retry of a call.
+
+        :returns: An endless iterator of times to wait, in seconds.
+        """
+
+
+@dataclasses.dataclass(frozen=True)
+class FixedDelay(RetryPolicy):
+    """Wait the same time before each retry.
+
+    :param delay: Time to wait, in seconds.
+    """
+
+    delay: float
+
+    def delays(self) -> Iterator[float]:
+        """Get the times to wait before each retry of a call."""
+        return itertools.repeat(self.delay)
+
+
+@dataclasses.dataclass(frozen=True)
+class ExponentialBackoff(RetryPolicy):
+    """Wait exponentially longer before each retry, up to a maximum.
+
+    Each wait is shortened by a random fraction of up to `jitter`, so processes
+    retrying at the same time spread out.
+
+    :param initial: Time to wait before the first retry, in seconds.
+    :param maximum: Maximum time to wait, in seconds.
+    :param factor: Factor applied to the time to wait after each retry.
+    :param jitter: Maximum fraction of each wait removed at random.
+    """
+
+    initial: float
+    maximum: float
+    factor: float = 2.0
+    jitter: float = 0.1
+
+    def delays(self) -> Iterator[float]:
+        """Get the times to wait before each retry of a call."""
+        delay = min(self.initial, self.maximum)
+        while True:
+            # the jitter isn't used for cryptography
+            yield delay * (1 - self.jitter * random.random())  # noqa: S311
+            delay = min(delay * self.factor, self.maximum)
+
+
+@dataclasses.dataclass(frozen=True)
+class FastThenSlow(RetryPolicy):
+    """Retry quickly a few times, then wait longer before each retry.
+
+    This suits conditions that are often met right away but may take a while,
+    such as a service that is usually already running.
+
+    :param fast_delay: Time to wait before each of the first retries, in seconds.
+    :param fast_attempts: Number of retries after `fast_delay`.
+    :param slow_delay: Time to wait before each later retry, in seconds.
+    """
+
+    fast_delay: float
+    fast_attempts: int
+    slow_delay: float
+
+    def delays(self) -> Iterator[float]:
+        """Get the times to wait before each retry of a call."""
+        return itertools.chain(
+            itertools.repeat(self.fast_delay, self.fast_attempts),
+            itertools.repeat(self.slow_delay),
+        )
+
+
+@dataclasses.dataclass
+class RetryStats:
+    """Statistics of the attempts of a call to `retry_until_timeout()`.
+
+    :ivar latencies: Time taken by each attempt, in seconds.
+    :ivar wait_time: Total time waited between attempts, in seconds.
+    :ivar elapsed: Total time of the call, in seconds.
+    :ivar succeeded: Whether an attempt succeeded.
+    """
+
+    latencies: list[float] = dataclasses.field(default_factory=list)
+    wait_time: float = 0.0
+    elapsed: float = 0.0
+    succeeded: bool = False
+
+    @property
+    def attempts(self) -> int:
+        """Number of attempts made."""
+        return len(self.latencies)
+
+    def __str__(self) -> str:
+        outcome = "succeeded" if self.succeeded else "failed"
+        return (
+            f"{outcome} after {self.attempts} attempt(s) in {self.elapsed:.3f}s "
+            f"({self.wait_time:.3f}s waiting)"
+        )
+
+
+def _attempt(func: Callable[[float], T], timeout: float, stats: RetryStats) -> T:
+    """Call a function once, recording its latency."""
+    start = time.perf_counter()
+    try:
+        result = func(timeout)
+    finally:
+        stats.latencies.append(time.perf_counter() - start)
+    stats.succeeded = True
+    return result
+
+
 def retry_until_timeout(
     timeout: float,
-    retry_wait: float,
+    retry_wait: float | RetryPolicy,
     func: Callable[[float], T],
     *,
     error: Exception | None = None,
+    stats: RetryStats | None = None,
 ) -> T:
     """Re-run a function until it either succeeds or it times out.
 
     :param timeout: The length of time (in seconds) before timeout.
-    :param retry_wait: The length of time (in seconds) before retrying.
+    :param retry_wait: The length of time (in seconds) before retrying, or a policy
+        giving the length of time before each retry.
     :param func: The callable. May only take a timeout parameter.
         Must raise an exception on failure, may return anything on success.
     :param error: Exception to raise on timeout or None to pass the error unchanged.
+    :param stats: Statistics to fill with the attempts made by this call.
     :returns: The result of the function
     :raises: the passed error from the last exception
     """
+    if not isinstance(retry_wait, RetryPolicy):
+        retry_wait = FixedDelay(retry_wait)
+    if stats is None:
+        stats = RetryStats()
+    delays = retry_wait.delays()
+    wait = next(delays)
+    start = time.perf_counter()
     deadline = time.monotonic() + timeout
-    soft_deadline = deadline - retry_wait
 
-    while (now := time.monotonic()) < soft_deadline:
-        try:
-            return func(deadline - now)
-        except Exception:  # noqa: BLE001, PERF203
-            if time.monotonic() < soft_deadline:
-                time.sleep(retry_wait)
     try:
-        return func(retry_wait)
-    except Exception as exc:
-        if error is None:
-            raise
-        raise error from exc
+        while (now := time.monotonic()) < deadline - wait:
+            try:
+                return _attempt(func, deadline - now, stats)
+            except Exception:  # noqa: BLE001, PERF203
+                if time.monotonic() < deadline - wait:
+                    time.sleep(wait)
+                    stats.wait_time += wait
+                    wait = next(delays)
+        try:
+            return _attempt(func, wait, stats)
+        except Exception as exc:
+            if error is None:
+                raise
+            raise error from exc
+    finally:
+        stats.elapsed = time.perf_counter() - start
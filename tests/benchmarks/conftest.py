@@ -0,0 +1,139 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Fixtures for benchmarks.
+
+Environment variables:
+
+- CRAFT_PROVIDERS_BENCHMARK_LATENCY: Latency of each simulated call, in
+  seconds. Defaults to 0.
+- CRAFT_PROVIDERS_BENCHMARK_REPORT: Path of a JSON file in which to write the
+  results.
+- CRAFT_PROVIDERS_BENCHMARK_CONTENDERS: Number of processes launching instances
+  at the same time in the contention benchmarks. Defaults to 4.
+"""
+
+import contextlib
+import dataclasses
+import json
+import os
+import pathlib
+import time
+from collections.abc import Callable, Iterator
+
+import pytest
+from craft_providers.actions import snap_installer
+
+from .fake_host import FakeHost, FakeSnapd
+
+LATENCY_ENV = "CRAFT_PROVIDERS_BENCHMARK_LATENCY"
+REPORT_ENV = "CRAFT_PROVIDERS_BENCHMARK_REPORT"
+CONTENDERS_ENV = "CRAFT_PROVIDERS_BENCHMARK_CONTENDERS"
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    """Result of a benchmark.
+
+    :param name: Name of the benchmark.
+    :param wall_time: Wall time in seconds.
+    :param subprocesses: Number of host subprocesses.
+    :param api_requests: Number of requests to the LXD and snapd APIs.
+    :param commands: Number of host subprocesses per command, e.g. 'lxc exec'.
+    :param metrics: Other measures specific to the benchmark.
+    """
+
+    name: str
+    wall_time: float = 0.0
+    subprocesses: int = 0
+    api_requests: int = 0
+    commands: dict[str, int] = dataclasses.field(default_factory=dict)
+    metrics: dict[str, float] = dataclasses.field(default_factory=dict)
+
+
+_results: list[BenchmarkResult] = []
+
+
+@pytest.fixture
+def fake_host(tmp_path, monkeypatch) -> Iterator[FakeHost]:
+    """A simulated host, used by the commands run by craft-providers."""
+    host = FakeHost(tmp_path, latency=float(os.environ.get(LATENCY_ENV, "0")))
+    for key, value in host.environment.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.setenv("PYLXD_WARNINGS", "none")
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    (tmp_path / "home").mkdir()
+    with host.serve_lxd():
+        yield host
+
+
+@pytest.fixture
+def fake_snapd(fake_host, monkeypatch) -> FakeSnapd:
+    """The snapd API of the simulated host."""
+    snapd = FakeSnapd(fake_host, snaps={}, snap_size=1024 * 1024)
+    monkeypatch.setattr(snap_installer.requests_unixsocket, "get", snapd.get)
+    return snapd
+
+
+@pytest.fixture
+def benchmark(
+    request, fake_host
+) -> Callable[[], contextlib.AbstractContextManager[BenchmarkResult]]:
+    """Measure the wall time and host subprocesses of a block of code.
+
+    The calls made before the block, e.g. to prepare an instance, are ignored.
+    """
+
+    @contextlib.contextmanager
+    def _benchmark() -> Iterator[BenchmarkResult]:
+        result = BenchmarkResult(name=request.node.name)
+        fake_host.reset_calls()
+        start = time.perf_counter()
+        yield result
+        result.wall_time = time.perf_counter() - start
+        result.subprocesses = len(fake_host.calls())
+        result.api_requests = fake_host.api_requests
+        result.commands = dict(sorted(fake_host.call_counts().items()))
+        _results.append(result)
+
+    return _benchmark
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config) -> None:
+    """Report the results of the benchmarks."""
+    if not _results:
+        return
+
+    terminalreporter.section("benchmarks")
+    width = max(len(result.name) for result in _results)
+    terminalreporter.write_line(
+        f"{'benchmark':<{width}}  {'wall time':>10}  {'subprocesses':>12}  "
+        f"{'api requests':>12}"
+    )
+    for result in _results:
+        terminalreporter.write_line(
+            f"{result.name:<{width}}  {result.wall_time:>9.3f}s  "
+            f"{result.subprocesses:>12}  {result.api_requests:>12}"
+        )
+        for metric, value in result.metrics.items():
+            terminalreporter.write_line(f"  {metric}: {value:g}")
+
+    report = os.environ.get(REPORT_ENV)
+    if report:
+        pathlib.Path(report).write_text(
+            json.dumps([dataclasses.asdict(result) for result in _results], indent=2)
+        )
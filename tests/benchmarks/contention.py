@@ -0,0 +1,237 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Concurrent launches of instances from the same base instance.
+
+Each contender is a process launching its own instance with
+`lxd.launch(use_base_instance=True)`. The contenders start at the same time, so
+they race to create the base instance on the simulated host.
+"""
+
+import dataclasses
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .fake_host import FakeHost
+
+BASE_INSTANCE_PREFIX = "local:base-instance-"
+
+
+@dataclasses.dataclass
+class Contender:
+    """Result of a contender.
+
+    :param name: Name of the instance launched by the contender.
+    :param time_to_ready: Time from the start of the race until the instance is
+        launched, in seconds.
+    :param sleep_time: Time spent sleeping in the main thread, in seconds.
+    :param wait_time: Time spent waiting for the base instance to be created by
+        another contender, in seconds.
+    :param error: The error raised by the launch, if any.
+    """
+
+    name: str
+    time_to_ready: float
+    sleep_time: float
+    wait_time: float
+    error: str | None = None
+
+
+@dataclasses.dataclass
+class ContentionResult:
+    """Result of concurrent launches.
+
+    :param contenders: Results of the contenders.
+    :param base_builds: Number of times the base instance was created.
+    """
+
+    contenders: list[Contender]
+    base_builds: int
+
+    @property
+    def duplicate_base_builds(self) -> int:
+        """Number of times the base instance was created more than needed."""
+        return max(self.base_builds - 1, 0)
+
+    @property
+    def wasted_sleep_time(self) -> float:
+        """Total time spent sleeping by the contenders, in seconds."""
+        return sum(contender.sleep_time for contender in self.contenders)
+
+    @property
+    def failures(self) -> list[Contender]:
+        """The contenders that failed to launch their instance."""
+        return [contender for contender in self.contenders if contender.error]
+
+    def metrics(self) -> dict[str, float]:
+        """Summarize the result for the benchmark report."""
+        times = sorted(contender.time_to_ready for contender in self.contenders)
+        return {
+            "contenders": len(self.contenders),
+            "failures": len(self.failures),
+            "base builds": self.base_builds,
+            "duplicate base builds": self.duplicate_base_builds,
+            "max time to ready": times[-1],
+            "median time to ready": times[len(times) // 2],
+            "wasted sleep time": self.wasted_sleep_time,
+            "wait time": sum(contender.wait_time for contender in self.contenders),
+        }
+
+
+def contend(
+    fake_host: FakeHost,
+    *,
+    contenders: int,
+    cache_path: pathlib.Path,
+    timeout: float = 600,
+) -> ContentionResult:
+    """Launch instances from the same base instance in concurrent processes.
+
+    The environment of the simulated host must be set.
+
+    :param fake_host: The simulated host.
+    :param contenders: Number of processes.
+    :param cache_path: Cache path of the base configuration.
+    :param timeout: Maximum time for all the launches, in seconds.
+
+    :returns: The result of the launches.
+    """
+    environment = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(
+            [str(pathlib.Path(__file__).parents[2]), os.environ.get("PYTHONPATH", "")]
+        ),
+    }
+    processes = [
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                __name__,
+                f"contender-{index}",
+                str(cache_path),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=environment,
+            text=True,
+        )
+        for index in range(contenders)
+    ]
+
+    try:
+        # start the race once every contender is ready, not while some are
+        # still importing craft-providers
+        for process in processes:
+            assert process.stdout is not None
+            if process.stdout.readline() != "ready\n":
+                raise RuntimeError("Contender failed to start.")
+        for process in processes:
+            assert process.stdin is not None
+            process.stdin.write("go\n")
+            process.stdin.flush()
+
+        results = []
+        for process in processes:
+            stdout, _ = process.communicate(timeout=timeout)
+            results.append(Contender(**json.loads(stdout)))
+    finally:
+        for process in processes:
+            process.kill()
+            process.wait()
+
+    base_builds = sum(
+        1
+        for call in fake_host.calls()
+        if call.name == "lxc launch"
+        and call.returncode == 0
+        and any(arg.startswith(BASE_INSTANCE_PREFIX) for arg in call.argv)
+    )
+    return ContentionResult(contenders=results, base_builds=base_builds)
+
+
+def _timed(function: Callable[..., Any], add: Callable[[float], None]) -> Any:
+    """Wrap a function to add its duration in the main thread with `add`."""
+    main_thread = threading.main_thread()
+
+    def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        if threading.current_thread() is not main_thread:
+            return function(*args, **kwargs)
+        start = time.monotonic()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            add(time.monotonic() - start)
+
+    return _wrapper
+
+
+def _run_contender(name: str, cache_path: str) -> Contender:
+    from craft_providers import lxd  # noqa: PLC0415
+    from craft_providers.bases import ubuntu  # noqa: PLC0415
+    from craft_providers.errors import ProviderError  # noqa: PLC0415
+
+    totals = {"sleep": 0.0, "wait": 0.0}
+
+    def _add(key: str) -> Callable[[float], None]:
+        def _add_duration(duration: float) -> None:
+            totals[key] += duration
+
+        return _add_duration
+
+    # the timer of the instance sleeps in its own thread, which is not wasted
+    time.sleep = _timed(time.sleep, _add("sleep"))
+    lxd.LXC.check_instance_status = _timed(  # type: ignore[method-assign]
+        lxd.LXC.check_instance_status, _add("wait")
+    )
+    base_configuration = ubuntu.BuilddBase(
+        alias=ubuntu.BuilddBaseAlias.JAMMY, cache_path=pathlib.Path(cache_path)
+    )
+
+    print("ready", flush=True)
+    sys.stdin.readline()
+    start = time.monotonic()
+    error = None
+    try:
+        lxd.launch(
+            name,
+            base_configuration=base_configuration,
+            image_name="22.04",
+            image_remote="local",
+            use_base_instance=True,
+        )
+    except ProviderError as raised:
+        error = str(raised)
+    return Contender(
+        name=name,
+        time_to_ready=time.monotonic() - start,
+        sleep_time=totals["sleep"],
+        wait_time=totals["wait"],
+        error=error,
+    )
+
+
+if __name__ == "__main__":
+    contender = _run_contender(*sys.argv[1:])
+    print(json.dumps(dataclasses.asdict(contender)), flush=True)
@@ -0,0 +1,620 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Stand-ins for the lxc, multipass, snap and timedatectl commands.
+
+Each stand-in is a small executable that calls `main()` with its name. The
+instances and their files live in a state directory shared with the
+benchmarks, and each call sleeps for the configured latency then is appended
+to a call log.
+
+Commands run in an instance are simulated: the few commands whose output is
+parsed get a plausible answer, files are read and written in a directory per
+instance, and everything else succeeds without output.
+
+Only the standard library is used, to keep the start up of each call short.
+"""
+
+import contextlib
+import fcntl
+import json
+import os
+import pathlib
+import re
+import shutil
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import Any
+
+STATE_DIR_ENV = "FAKE_HOST_STATE_DIR"
+
+SNAPD_SOCKET_URL = re.compile(r"^http://localhost/v2/snaps/(?P<name>[^/?]+)$")
+
+
+class CommandError(Exception):
+    """A simulated command failed."""
+
+    def __init__(self, message: str, returncode: int = 1) -> None:
+        super().__init__(message)
+        self.returncode = returncode
+
+
+class Host:
+    """State of the simulated host.
+
+    :param state_dir: Directory holding the state, the files of the instances,
+        the latencies and the call log.
+    """
+
+    def __init__(self, state_dir: pathlib.Path) -> None:
+        self.state_dir = state_dir
+        self.state: dict[str, Any] = {}
+
+    @contextlib.contextmanager
+    def locked(self) -> Iterator[dict[str, Any]]:
+        """Load the state, and save it back when the context exits."""
+        with (self.state_dir / "lock").open("w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            state_path = self.state_dir / "state.json"
+            self.state = json.loads(state_path.read_text())
+            yield self.state
+            state_path.write_text(json.dumps(self.state))
+
+    def rootfs(self, namespace: str, name: str) -> pathlib.Path:
+        """Get the directory holding the files of an instance."""
+        return self.state_dir / "rootfs" / namespace / name
+
+    def sleep(self, command: str) -> None:
+        """Sleep for the latency configured for a command."""
+        latencies = json.loads((self.state_dir / "latency.json").read_text())
+        time.sleep(latencies.get(command, latencies.get("*", 0.0)))
+
+    def log_call(self, argv: list[str], start: float, returncode: int) -> None:
+        """Append a call to the call log."""
+        entry = {
+            "argv": argv,
+            "start": start,
+            "duration": time.time() - start,
+            "returncode": returncode,
+        }
+        data = (json.dumps(entry) + "\n").encode()
+        fd = os.open(
+            self.state_dir / "calls.jsonl", os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        )
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _guest_path(rootfs: pathlib.Path, path: str) -> pathlib.Path:
+    return rootfs / os.path.normpath("/" + path).lstrip("/")
+
+
+def create_rootfs(rootfs: pathlib.Path, os_release: str) -> None:
+    """Create the files of a new instance."""
+    shutil.rmtree(rootfs, ignore_errors=True)
+    for directory in ("/etc", "/root", "/tmp", "/home/ubuntu"):
+        _guest_path(rootfs, directory).mkdir(parents=True)
+    _guest_path(rootfs, "/etc/os-release").write_text(os_release)
+
+
+def _strip_wrappers(command: list[str]) -> list[str]:
+    """Remove the sudo and env commands wrapping a command."""
+    if command[:1] == ["sudo"]:
+        command = command[1:]
+        while command and command[0].startswith("-"):
+            option = command.pop(0)
+            if option == "--":
+                break
+    if command[:1] == ["env"]:
+        command = command[1:]
+        while command:
+            if command[0] == "-u":
+                command = command[2:]
+            elif command[0].startswith("-") or "=" in command[0]:
+                command = command[1:]
+            else:
+                break
+    return command
+
+
+def run_guest(rootfs: pathlib.Path, command: list[str], stdin: Any) -> int:  # noqa: PLR0911, PLR0912
+    """Simulate a command run in an instance.
+
+    :param rootfs: Directory holding the files of the instance.
+    :param command: Command to run.
+    :param stdin: Binary stream of the input of the command.
+
+    :returns: The exit code.
+    """
+    command = _strip_wrappers(command)
+    if not command:
+        return 0
+    program, args = command[0], command[1:]
+
+    if program == "cat" and args:
+        path = _guest_path(rootfs, args[0])
+        if not path.is_file():
+            sys.stderr.write(f"cat: {args[0]}: No such file or directory\n")
+            return 1
+        sys.stdout.buffer.write(path.read_bytes())
+        return 0
+    if program == "test" and len(args) == 2:
+        path = _guest_path(rootfs, args[1])
+        checks = {"-f": path.is_file, "-d": path.is_dir, "-e": path.exists}
+        return 0 if checks.get(args[0], path.exists)() else 1
+    if program == "sh" and args[:1] == ["-c"] and 'cat > "$1"' in args[1]:
+        # the script used to push a file through the stdin of an exec
+        path = _guest_path(rootfs, args[3])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as stream:
+            shutil.copyfileobj(stdin, stream)
+        return 0
+    if program == "bash" and args[:1] == ["-c"] and "XDG_CACHE_HOME" in args[1]:
+        sys.stdout.write("/root/.cache")
+        return 0
+    if program == "systemctl" and args[:1] == ["is-system-running"]:
+        sys.stdout.write("running\n")
+        return 0
+    if program == "systemctl" and args[:1] == ["is-active"]:
+        sys.stdout.write("active\n")
+        return 0
+    if program == "curl":
+        return _snapd_request(rootfs, args)
+    if program == "snap":
+        return _snap(rootfs, args)
+    if program == "mktemp":
+        fd, path = tempfile.mkstemp(dir=_guest_path(rootfs, "/tmp"))
+        os.close(fd)
+        sys.stdout.write("/" + str(pathlib.Path(path).relative_to(rootfs)) + "\n")
+        return 0
+    if program == "mv" and len(args) == 2:
+        destination = _guest_path(rootfs, args[1])
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        _guest_path(rootfs, args[0]).replace(destination)
+        return 0
+    if program == "mkdir":
+        for arg in args:
+            if not arg.startswith("-"):
+                _guest_path(rootfs, arg).mkdir(parents=True, exist_ok=True)
+        return 0
+    if program == "rm":
+        for arg in args:
+            path = _guest_path(rootfs, arg)
+            if arg.startswith("-"):
+                continue
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink(missing_ok=True)
+        return 0
+    return 0
+
+
+def _guest_snaps(rootfs: pathlib.Path) -> tuple[pathlib.Path, dict[str, str]]:
+    path = _guest_path(rootfs, "/var/lib/snapd/fake-snaps.json")
+    snaps = json.loads(path.read_text()) if path.exists() else {}
+    return path, snaps
+
+
+def _snapd_request(rootfs: pathlib.Path, args: list[str]) -> int:
+    match = SNAPD_SOCKET_URL.match(args[-1])
+    if match is None:
+        return 0
+    _, snaps = _guest_snaps(rootfs)
+    name = match.group("name")
+    if name in snaps:
+        response = {
+            "type": "sync",
+            "status-code": 200,
+            "status": "OK",
+            "result": {"id": f"{name}-id", "name": name, "revision": snaps[name]},
+        }
+    else:
+        response = {
+            "type": "error",
+            "status-code": 404,
+            "status": "Not Found",
+            "result": {"message": "snap not installed", "kind": "snap-not-found"},
+        }
+    sys.stdout.write(json.dumps(response))
+    return 0
+
+
+def _snap(rootfs: pathlib.Path, args: list[str]) -> int:
+    if args[:1] not in (["install"], ["refresh"], ["remove"]):
+        return 0
+    names = [arg for arg in args[1:] if not arg.startswith("-")]
+    if not names:
+        return 0
+    path, snaps = _guest_snaps(rootfs)
+    name = pathlib.PurePath(names[0]).name.removesuffix(".snap")
+    if args[0] == "remove":
+        snaps.pop(name, None)
+    else:
+        snaps[name] = str(int(snaps.get(name, "0")) + 1)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(snaps))
+    return 0
+
+
+def _split_instance(target: str) -> tuple[str, str]:
+    """Split 'remote:name/path' into the name and the path."""
+    name = target.partition(":")[2]
+    name, slash, path = name.partition("/")
+    return name, slash + path
+
+
+class LXC:
+    """Stand-in for the lxc command."""
+
+    def __init__(self, host: Host, project: str) -> None:
+        self.host = host
+        self.project = project
+
+    def _instances(self, state: dict[str, Any]) -> dict[str, Any]:
+        return state["lxd"]["instances"].setdefault(self.project, {})
+
+    def _get(self, state: dict[str, Any], target: str) -> dict[str, Any]:
+        name, _ = _split_instance(target)
+        try:
+            return self._instances(state)[name]
+        except KeyError:
+            raise CommandError("Error: Instance not found") from None
+
+    def _rootfs(self, name: str) -> pathlib.Path:
+        return self.host.rootfs(f"lxd-{self.project}", name)
+
+    def run(self, args: list[str]) -> int:  # noqa: PLR0912
+        """Run a command."""
+        command, args = args[0], args[1:]
+        if command == "exec":
+            return self._exec(args)
+        if command == "file":
+            return self._file(args)
+        if command == "monitor":
+            # without events, craft-providers polls the state of instances
+            return 1
+        if command == "launch":
+            self._launch(args)
+            return 0
+
+        with self.host.locked() as state:
+            if command == "copy":
+                self._copy(state, args)
+            elif command in ("start", "restart"):
+                self._get(state, args[0])["status"] = "Running"
+            elif command == "stop":
+                self._get(state, args[0])["status"] = "Stopped"
+            elif command == "delete":
+                instance = self._get(state, args[0])
+                if instance["status"] == "Running" and "--force" not in args:
+                    raise CommandError("Error: The instance is currently running")
+                del self._instances(state)[instance["name"]]
+                shutil.rmtree(self._rootfs(instance["name"]), ignore_errors=True)
+            elif command == "list":
+                self._list(state, args)
+            elif command == "info":
+                self._info(state, args[0])
+            elif command == "query":
+                self._query(state, args[0])
+            elif command == "config":
+                self._config(state, args)
+            elif command == "project":
+                self._project(state, args)
+            elif command == "remote":
+                self._remote(state, args)
+            elif command == "image" and args[:1] == ["list"]:
+                sys.stdout.write("[]")
+        return 0
+
+    def _launch(self, args: list[str]) -> None:
+        name, _ = _split_instance(args[1])
+        operation = f"{self.project}/{name}"
+        config = {}
+        for index, arg in enumerate(args):
+            if arg == "--config":
+                key, _, value = args[index + 1].partition("=")
+                config[key] = value
+
+        with self.host.locked() as state:
+            if name in self._instances(state):
+                if operation in state["lxd"]["operations"]:
+                    raise CommandError(
+                        'Error: Instance is busy running a "create" operation'
+                    )
+                raise CommandError(
+                    "Error: Failed instance creation: Failed creating instance "
+                    'record: This "instances" entry already exists'
+                )
+            now = _now()
+            self._instances(state)[name] = {
+                "name": name,
+                "status": "Stopped",
+                "type": "container",
+                "architecture": "x86_64",
+                "created_at": now,
+                "last_used_at": now,
+                "ephemeral": "--ephemeral" in args,
+                "config": config,
+                "devices": {},
+            }
+            state["lxd"]["operations"][operation] = "create"
+            os_release = state["os_release"]
+
+        # the instance is created without holding the lock, so that concurrent
+        # launches of the same instance find it busy, as with LXD
+        self.host.sleep("lxd create")
+        create_rootfs(self._rootfs(name), os_release)
+        with self.host.locked() as state:
+            del state["lxd"]["operations"][operation]
+            self._get(state, args[1])["status"] = "Running"
+
+    def _copy(self, state: dict[str, Any], args: list[str]) -> None:
+        source = self._get(state, args[0])
+        name, _ = _split_instance(args[1])
+        now = _now()
+        self._instances(state)[name] = {
+            **source,
+            "name": name,
+            "status": "Stopped",
+            "created_at": now,
+            "last_used_at": now,
+            "config": {
+                key: value
+                for key, value in source["config"].items()
+                if not key.startswith("volatile.")
+            },
+        }
+        shutil.rmtree(self._rootfs(name), ignore_errors=True)
+        shutil.copytree(self._rootfs(source["name"]), self._rootfs(name))
+
+    def _list(self, state: dict[str, Any], args: list[str]) -> None:
+        filters = [re.compile(arg) for arg in args[1:] if not arg.startswith("-")]
+        sys.stdout.write(
+            json.dumps(
+                [
+                    instance
+                    for name, instance in sorted(self._instances(state).items())
+                    if all(pattern.search(name) for pattern in filters)
+                ]
+            )
+        )
+
+    def _info(self, state: dict[str, Any], target: str) -> None:
+        instance = self._get(state, target)
+        created = datetime.strptime(instance["created_at"], "%Y-%m-%dT%H:%M:%S.%fZ")
+        sys.stdout.write(
+            f"Name: {instance['name']}\n"
+            f"Status: {instance['status'].upper()}\n"
+            f"Type: {instance['type']}\n"
+            f"Architecture: {instance['architecture']}\n"
+            f"Created: {created:%Y/%m/%d %H:%M} UTC\n"
+        )
+
+    def _query(self, state: dict[str, Any], target: str) -> None:
+        path = target.partition(":")[2].partition("?")[0]
+        if path == "/1.0":
+            sys.stdout.write(json.dumps({"environment": {"server_version": "5.21"}}))
+        elif path.startswith("/1.0/instances/"):
+            name = path.removeprefix("/1.0/instances/")
+            sys.stdout.write(json.dumps(self._get(state, f":{name}")))
+        elif path.startswith("/1.0/profiles/"):
+            profile = {"name": "default", "config": {}, "devices": {}}
+            sys.stdout.write(json.dumps(profile))
+        else:
+            raise CommandError("Error: not found")
+
+    def _config(self, state: dict[str, Any], args: list[str]) -> None:
+        if args[0] == "device":
+            instance = self._get(state, args[2])
+            if args[1] == "show":
+                sys.stdout.write(json.dumps(instance["devices"]))
+            elif args[1] == "add":
+                instance["devices"][args[3]] = {
+                    "type": args[4],
+                    **dict(arg.partition("=")[::2] for arg in args[5:]),
+                }
+            elif args[1] == "remove":
+                instance["devices"].pop(args[3], None)
+            return
+
+        instance = self._get(state, args[1])
+        config = instance["config"]
+        if args[0] == "get":
+            sys.stdout.write(config.get(args[2], "") + "\n")
+        elif args[0] == "show":
+            sys.stdout.write(json.dumps({"config": config}))
+        elif args[0] == "unset":
+            config.pop(args[2], None)
+        elif args[0] == "set" and len(args) == 4 and "=" not in args[2]:
+            config[args[2]] = args[3]
+        elif args[0] == "set":
+            config.update(arg.partition("=")[::2] for arg in args[2:])
+
+    def _project(self, state: dict[str, Any], args: list[str]) -> None:
+        projects = state["lxd"]["projects"]
+        if args[0] == "list":
+            sys.stdout.write(json.dumps([{"name": name} for name in projects]))
+        elif args[0] == "create":
+            projects.append(args[1].partition(":")[2])
+        elif args[0] == "delete":
+            projects.remove(args[1].partition(":")[2])
+
+    def _remote(self, state: dict[str, Any], args: list[str]) -> None:
+        remotes = state["lxd"]["remotes"]
+        if args[0] == "list":
+            # JSON is also valid YAML
+            sys.stdout.write(json.dumps(remotes))
+        elif args[0] == "add":
+            protocol = args[3].partition("=")[2]
+            remotes[args[1]] = {"addr": args[2], "protocol": protocol}
+
+    def _exec(self, args: list[str]) -> int:
+        with self.host.locked() as state:
+            instance = self._get(state, args[0])
+        if instance["status"] != "Running":
+            raise CommandError("Error: Instance is not running")
+        command = args[args.index("--") + 1 :]
+        return run_guest(self._rootfs(instance["name"]), command, sys.stdin.buffer)
+
+    def _file(self, args: list[str]) -> int:
+        positional = [arg for arg in args[1:] if not arg.startswith("--")]
+        if args[0] == "push":
+            source, target = positional
+        else:
+            target, source = positional
+        name, path = _split_instance(target)
+        with self.host.locked() as state:
+            self._get(state, target)
+        guest_path = _guest_path(self._rootfs(name), path)
+
+        if args[0] == "push":
+            guest_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source, guest_path)
+        elif not guest_path.is_file():
+            raise CommandError("Error: Not Found")
+        elif source == "-":
+            sys.stdout.buffer.write(guest_path.read_bytes())
+        else:
+            shutil.copyfile(guest_path, source)
+        return 0
+
+
+class Multipass:
+    """Stand-in for the multipass command."""
+
+    def __init__(self, host: Host) -> None:
+        self.host = host
+
+    def _get(self, state: dict[str, Any], name: str) -> dict[str, Any]:
+        try:
+            return state["multipass"][name]
+        except KeyError:
+            raise CommandError(f'instance "{name}" does not exist') from None
+
+    def run(self, args: list[str]) -> int:
+        """Run a command."""
+        command, args = args[0], args[1:]
+        if command == "exec":
+            with self.host.locked() as state:
+                self._get(state, args[0])
+            return run_guest(
+                self.host.rootfs("multipass", args[0]),
+                args[args.index("--") + 1 :],
+                sys.stdin.buffer,
+            )
+        if command == "transfer":
+            return self._transfer(args)
+
+        with self.host.locked() as state:
+            instances = state["multipass"]
+            if command == "version":
+                sys.stdout.write("multipass   1.16.0\nmultipassd  1.16.0\n")
+            elif command == "list":
+                listing = [
+                    {"name": name, "state": instance["state"]}
+                    for name, instance in sorted(instances.items())
+                ]
+                sys.stdout.write(json.dumps({"list": listing}))
+            elif command == "info":
+                instance = self._get(state, args[0])
+                sys.stdout.write(
+                    json.dumps({"errors": [], "info": {args[0]: instance}})
+                )
+            elif command == "launch":
+                name = args[args.index("--name") + 1]
+                instances[name] = {"state": "Running", "mounts": {}}
+                create_rootfs(self.host.rootfs("multipass", name), state["os_release"])
+            elif command == "start":
+                self._get(state, args[0])["state"] = "Running"
+            elif command == "stop":
+                self._get(state, args[0])["state"] = "Stopped"
+            elif command == "delete":
+                self._get(state, args[0])
+                del instances[args[0]]
+                shutil.rmtree(self.host.rootfs("multipass", args[0]))
+        return 0
+
+    def _transfer(self, args: list[str]) -> int:
+        source, destination = args[-2:]
+        if source == "-":
+            name, _, path = destination.partition(":")
+            guest_path = _guest_path(self.host.rootfs("multipass", name), path)
+            guest_path.parent.mkdir(parents=True, exist_ok=True)
+            with guest_path.open("wb") as stream:
+                shutil.copyfileobj(sys.stdin.buffer, stream)
+            return 0
+
+        name, _, path = source.partition(":")
+        guest_path = _guest_path(self.host.rootfs("multipass", name), path)
+        if not guest_path.is_file():
+            raise CommandError(f"[sftp] source {path!r}: No such file or directory")
+        if destination == "-":
+            sys.stdout.buffer.write(guest_path.read_bytes())
+        else:
+            shutil.copyfile(guest_path, destination)
+        return 0
+
+
+def _run(program: str, host: Host, args: list[str]) -> int:
+    if program == "lxc":
+        project = "default"
+        if args[:1] == ["--project"]:
+            project, args = args[1], args[2:]
+        return LXC(host, project).run(args)
+    if program == "multipass":
+        return Multipass(host).run(args)
+    if program == "snap" and args[:1] == ["known"]:
+        sys.stdout.write(f"type: {args[1]}\n{' '.join(args[2:])}\n\nsignature\n")
+        return 0
+    if program == "timedatectl":
+        sys.stdout.write("Etc/UTC\n")
+        return 0
+    raise CommandError(f"{program}: unsupported command {args!r}")
+
+
+def main(program: str, args: list[str]) -> int:
+    """Run a stand-in command.
+
+    :param program: Name of the command, e.g. 'lxc'.
+    :param args: Arguments of the command.
+
+    :returns: The exit code.
+    """
+    start = time.time()
+    host = Host(pathlib.Path(os.environ[STATE_DIR_ENV]))
+    subcommand = args[2:3] if args[:1] == ["--project"] else args[:1]
+    host.sleep(" ".join([program, *subcommand]))
+    returncode = 1
+    try:
+        returncode = _run(program, host, args)
+    except CommandError as error:
+        sys.stderr.write(f"{error}\n")
+        returncode = error.returncode
+    finally:
+        sys.stdout.flush()
+        host.log_call([program, *args], start, returncode)
+    return returncode
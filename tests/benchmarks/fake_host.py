@@ -0,0 +1,309 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""A simulated host with LXD, Multipass and snapd."""
+
+import contextlib
+import dataclasses
+import http.server
+import json
+import os
+import pathlib
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from textwrap import dedent
+from typing import Any
+from urllib import parse
+
+import requests
+
+from . import fake_commands
+
+COMMANDS = ("lxc", "multipass", "snap", "timedatectl")
+
+OS_RELEASE = dedent(
+    """\
+    NAME="Ubuntu"
+    ID=ubuntu
+    ID_LIKE=debian
+    VERSION_ID="22.04"
+    VERSION_CODENAME=jammy
+    UBUNTU_CODENAME=jammy
+    """
+)
+
+_STUB = """\
+#!{python} -S
+import sys
+sys.path.insert(0, {directory!r})
+import fake_commands
+sys.exit(fake_commands.main({program!r}, sys.argv[1:]))
+"""
+
+
+@dataclasses.dataclass
+class Call:
+    """A command run on the host.
+
+    :param argv: The command.
+    :param start: Start time, in seconds since the epoch.
+    :param duration: Duration in seconds.
+    :param returncode: Exit code of the command.
+    """
+
+    argv: list[str]
+    start: float
+    duration: float
+    returncode: int = 0
+
+    @property
+    def name(self) -> str:
+        """Name of the command, e.g. 'lxc exec'."""
+        args = self.argv[1:]
+        if args[:1] == ["--project"]:
+            args = args[2:]
+        return " ".join([self.argv[0], *args[:1]])
+
+
+class _LXDRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serve the part of the LXD API used by pylxd to look up instances."""
+
+    server: "_LXDServer"
+
+    def do_GET(self) -> None:
+        url = parse.urlsplit(self.path)
+        project = parse.parse_qs(url.query).get("project", ["default"])[0]
+        self.server.fake_host.api_requests += 1
+        self.server.fake_host.sleep("lxd api")
+
+        if url.path == "/1.0":
+            self._send(
+                200,
+                {
+                    "api_extensions": ["projects", "instances"],
+                    "auth": "trusted",
+                    "environment": {"server_version": "5.21"},
+                },
+            )
+            return
+
+        name = url.path.removeprefix("/1.0/instances/")
+        with self.server.fake_host.locked() as state:
+            instance = state["lxd"]["instances"].get(project, {}).get(name)
+        if url.path.startswith("/1.0/instances/") and instance is not None:
+            self._send(200, instance)
+        else:
+            self._send(404, None)
+
+    def _send(self, status: int, metadata: Any) -> None:
+        if status == 200:
+            body = {"type": "sync", "status_code": 200, "metadata": metadata}
+        else:
+            body = {"type": "error", "error": "not found", "error_code": status}
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+
+class _LXDServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: pathlib.Path, fake_host: "FakeHost") -> None:
+        self.fake_host = fake_host
+        super().__init__(str(path), _LXDRequestHandler)
+
+    def get_request(self) -> tuple[Any, Any]:
+        # BaseHTTPRequestHandler expects a client address
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+class FakeHost:
+    """A host whose lxc, multipass, snap and timedatectl commands are simulated.
+
+    The commands are executables in `bin_dir`, which must be first in the PATH.
+    The LXD API used by pylxd is served from `lxd_dir`.
+
+    :param root: Directory to hold the state of the host.
+    :param latency: Default latency of each call, in seconds.
+    """
+
+    def __init__(self, root: pathlib.Path, *, latency: float = 0.0) -> None:
+        self.root = root
+        self.state_dir = root / "state"
+        self.bin_dir = root / "bin"
+        # unix socket paths are limited to about 100 characters
+        self.lxd_dir = pathlib.Path(tempfile.mkdtemp(prefix="fake-lxd-"))
+        self.api_requests = 0
+        self._host = fake_commands.Host(self.state_dir)
+        self._latencies: dict[str, float] = {"*": latency}
+
+        self.state_dir.mkdir(parents=True)
+        self.bin_dir.mkdir()
+        (self.state_dir / "state.json").write_text(
+            json.dumps(
+                {
+                    "os_release": OS_RELEASE,
+                    "lxd": {
+                        "projects": ["default"],
+                        "remotes": {"local": {"addr": "unix://", "protocol": "lxd"}},
+                        "instances": {},
+                        "operations": {},
+                    },
+                    "multipass": {},
+                }
+            )
+        )
+        self.set_latency(latency)
+        directory = pathlib.Path(fake_commands.__file__).parent
+        for program in COMMANDS:
+            stub = self.bin_dir / program
+            stub.write_text(
+                _STUB.format(
+                    python=sys.executable, directory=str(directory), program=program
+                )
+            )
+            stub.chmod(0o755)
+
+    @property
+    def environment(self) -> dict[str, str]:
+        """Environment variables to use the simulated host."""
+        return {
+            "PATH": f"{self.bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            "LXD_DIR": str(self.lxd_dir),
+            fake_commands.STATE_DIR_ENV: str(self.state_dir),
+        }
+
+    def set_latency(self, default: float | None = None, **commands: float) -> None:
+        """Set the latency of the calls, in seconds.
+
+        :param default: Latency of the calls without a specific latency.
+        :param commands: Latency of specific calls, with the spaces of the call name
+            replaced with underscores, e.g. `lxc_exec=0.05`. The time taken by LXD
+            to create an instance, during which other launches of the instance
+            fail as busy, is set with `lxd_create`.
+        """
+        if default is not None:
+            self._latencies["*"] = default
+        self._latencies.update(
+            {name.replace("_", " "): latency for name, latency in commands.items()}
+        )
+        (self.state_dir / "latency.json").write_text(json.dumps(self._latencies))
+
+    def sleep(self, name: str) -> None:
+        """Sleep for the latency of a call."""
+        time.sleep(self._latencies.get(name, self._latencies["*"]))
+
+    @contextlib.contextmanager
+    def locked(self) -> Iterator[dict[str, Any]]:
+        """Get the state of the host, and save it when the context exits."""
+        with self._host.locked() as state:
+            yield state
+
+    @contextlib.contextmanager
+    def serve_lxd(self) -> Iterator[None]:
+        """Serve the LXD API within the context."""
+        server = _LXDServer(self.lxd_dir / "unix.socket", self)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            server.shutdown()
+            server.server_close()
+            (self.lxd_dir / "unix.socket").unlink()
+            self.lxd_dir.rmdir()
+
+    def calls(self) -> list[Call]:
+        """Get the commands run on the host so far."""
+        log = self.state_dir / "calls.jsonl"
+        if not log.exists():
+            return []
+        return [Call(**json.loads(line)) for line in log.read_text().splitlines()]
+
+    def call_counts(self) -> Counter[str]:
+        """Get the number of calls of each command, e.g. 'lxc exec'."""
+        return Counter(call.name for call in self.calls())
+
+    def reset_calls(self) -> None:
+        """Forget the commands run so far."""
+        (self.state_dir / "calls.jsonl").unlink(missing_ok=True)
+        self.api_requests = 0
+
+
+class _SnapdResponse:
+    """Response of the host snapd API, as returned by requests."""
+
+    def __init__(self, status_code: int, content: bytes) -> None:
+        self.status_code = status_code
+        self.content = content
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error", response=self)  # type: ignore[arg-type]
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        for offset in range(0, len(self.content), chunk_size):
+            yield self.content[offset : offset + chunk_size]
+
+
+class FakeSnapd:
+    """The snapd API of the simulated host.
+
+    :param fake_host: The simulated host.
+    :param snaps: Revision of the snaps installed on the host.
+    :param snap_size: Size of the snap files, in bytes.
+    """
+
+    def __init__(
+        self, fake_host: FakeHost, snaps: dict[str, str], snap_size: int
+    ) -> None:
+        self.fake_host = fake_host
+        self.snaps = snaps
+        self.snap_size = snap_size
+
+    def get(self, url: str) -> _SnapdResponse:
+        """Replacement for `requests_unixsocket.get`."""
+        self.fake_host.api_requests += 1
+        self.fake_host.sleep("snapd api")
+        path = parse.unquote(parse.urlsplit(url).path)
+        name, _, suffix = path.removeprefix("/v2/snaps/").partition("/")
+        if name not in self.snaps:
+            return _SnapdResponse(404, b'{"type": "error"}')
+        if suffix == "file":
+            return _SnapdResponse(200, b"\0" * self.snap_size)
+        result = {
+            "id": f"{name}-id",
+            "name": name,
+            "revision": self.snaps[name],
+            "publisher": {"id": "publisher-id"},
+        }
+        return _SnapdResponse(200, json.dumps({"result": result}).encode())
@@ -0,0 +1,188 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Benchmarks of craft-providers against a simulated host.
+
+The number of host subprocesses is deterministic, so the benchmarks fail when
+it grows over a budget. Lower the budget when an improvement reduces it.
+"""
+
+import time
+
+import pytest
+from craft_providers import lxd, multipass, replay
+from craft_providers.actions import snap_installer
+from craft_providers.bases import ubuntu
+
+pytestmark = pytest.mark.slow
+
+# Budgets of host subprocesses, as measured. Lower them when they are reduced.
+LXD_SETUP_BUDGET = 37
+LXD_WARMUP_BUDGET = 11
+MULTIPASS_SETUP_BUDGET = 52
+MULTIPASS_WARMUP_BUDGET = 12
+INJECT_BUDGET = 13
+LAUNCH_FROM_BASE_BUDGET = 28
+PRUNE_BUDGET = 11
+
+
+@pytest.fixture
+def base_configuration(tmp_path):
+    return ubuntu.BuilddBase(
+        alias=ubuntu.BuilddBaseAlias.JAMMY, cache_path=tmp_path / "cache"
+    )
+
+
+@pytest.fixture
+def lxd_instance(fake_host):
+    lxc = lxd.LXC()
+    lxc.launch(
+        instance_name="benchmark", image="22.04", image_remote="local", remote="local"
+    )
+    return lxd.LXDInstance(name="benchmark", lxc=lxc)
+
+
+@pytest.fixture
+def multipass_instance(fake_host):
+    instance = multipass.MultipassInstance(name="benchmark")
+    instance.launch(image="22.04")
+    return instance
+
+
+def _launch(base_configuration):
+    return lxd.launch(
+        "benchmark",
+        base_configuration=base_configuration,
+        image_name="22.04",
+        image_remote="local",
+        use_base_instance=True,
+    )
+
+
+def _wait_for_timer(fake_host):
+    """Wait for the timer of the base instance to stop updating its config."""
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        with fake_host.locked() as state:
+            timers = [
+                instance["config"].get("user.craft_providers.timer")
+                for instance in state["lxd"]["instances"]["default"].values()
+            ]
+        if timers == ["DONE"]:
+            return
+        time.sleep(0.1)
+    pytest.fail(f"Timer of the base instance not stopped: {timers}")
+
+
+def test_lxd_setup(benchmark, base_configuration, lxd_instance):
+    with benchmark() as result:
+        base_configuration.setup(executor=lxd_instance)
+
+    assert result.subprocesses <= LXD_SETUP_BUDGET, result.commands
+
+
+def test_lxd_warmup(benchmark, base_configuration, lxd_instance):
+    base_configuration.setup(executor=lxd_instance)
+
+    with benchmark() as result:
+        base_configuration.warmup(executor=lxd_instance)
+
+    assert result.subprocesses <= LXD_WARMUP_BUDGET, result.commands
+
+
+def test_multipass_setup(benchmark, base_configuration, multipass_instance):
+    with benchmark() as result:
+        base_configuration.setup(executor=multipass_instance)
+
+    assert result.subprocesses <= MULTIPASS_SETUP_BUDGET, result.commands
+
+
+def test_multipass_warmup(benchmark, base_configuration, multipass_instance):
+    base_configuration.setup(executor=multipass_instance)
+
+    with benchmark() as result:
+        base_configuration.warmup(executor=multipass_instance)
+
+    assert result.subprocesses <= MULTIPASS_WARMUP_BUDGET, result.commands
+
+
+def test_inject_from_host(benchmark, fake_snapd, base_configuration, lxd_instance):
+    fake_snapd.snaps["craft-tool"] = "42"
+    base_configuration.setup(executor=lxd_instance)
+
+    with benchmark() as result:
+        snap_installer.inject_from_host(
+            executor=lxd_instance, snap_name="craft-tool", classic=True
+        )
+
+    assert result.subprocesses <= INJECT_BUDGET, result.commands
+
+
+def test_launch_creating_base_instance(benchmark, base_configuration):
+    with benchmark():
+        _launch(base_configuration)
+
+
+def test_launch_from_base_instance(benchmark, base_configuration, fake_host):
+    _launch(base_configuration).delete()
+    _wait_for_timer(fake_host)
+
+    with benchmark() as result:
+        _launch(base_configuration)
+
+    assert result.subprocesses <= LAUNCH_FROM_BASE_BUDGET, result.commands
+
+
+def test_prune(benchmark, fake_host):
+    lxc = lxd.LXC()
+    for index in range(10):
+        lxc.launch(
+            instance_name=f"instance-{index}",
+            image="22.04",
+            image_remote="local",
+        )
+    provider = lxd.LXDProvider(lxc=lxc)
+
+    with benchmark() as result:
+        provider.prune(project_name="default")
+
+    assert lxc.list_names(project="default") == []
+    assert result.subprocesses <= PRUNE_BUDGET, result.commands
+
+
+def test_replay_launch_from_base_instance(
+    benchmark, base_configuration, fake_host, tmp_path
+):
+    """Replay a recorded launch, to measure the overhead of craft-providers."""
+    recording = tmp_path / "recording.json"
+    _launch(base_configuration).delete()
+    _wait_for_timer(fake_host)
+    replay.start_recording(recording)
+    try:
+        _launch(base_configuration)
+    finally:
+        replay.stop()
+
+    replayer = replay.start_replay(recording)
+    try:
+        with benchmark() as result:
+            _launch(base_configuration)
+    finally:
+        replay.stop()
+
+    assert replayer.unused == []
+    assert [name for name in result.commands if name.startswith("lxc")] == []
@@ -0,0 +1,55 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+"""Benchmarks of processes racing to create the same base instance.
+
+The benchmarks report the time to ready of the slowest contender, the number of
+times the base instance was built and the time wasted sleeping while waiting for
+it, to measure changes to the handling of contention.
+"""
+
+import os
+
+import pytest
+
+from .conftest import CONTENDERS_ENV
+from .contention import contend
+
+pytestmark = pytest.mark.slow
+
+# time taken by LXD to create an instance, long enough for the launches to overlap
+CREATE_LATENCY = 1.0
+
+
+@pytest.fixture
+def contenders():
+    return int(os.environ.get(CONTENDERS_ENV, "4"))
+
+
+def test_concurrent_launch_creating_base_instance(
+    benchmark, fake_host, contenders, tmp_path
+):
+    fake_host.set_latency(lxd_create=CREATE_LATENCY)
+
+    with benchmark() as result:
+        contention = contend(
+            fake_host, contenders=contenders, cache_path=tmp_path / "cache"
+        )
+    result.metrics = contention.metrics()
+
+    assert contention.failures == []
+    assert contention.base_builds == 1
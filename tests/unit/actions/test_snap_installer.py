@@ -1018,6 +1018,24 @@ def test_get_host_snap_info_ok(responses):
     assert result == "15"
 
 
+def test_get_host_snap_info_traced(responses, tracer):
+    responses.add(
+        responses.GET,
+        "http+unix://%2Frun%2Fsnapd.socket/v2/snaps/test-snap",
+        body=b"{}",
+        status=404,
+    )
+
+    with pytest.raises(requests.HTTPError):
+        snap_installer.get_host_snap_info("test-snap")
+
+    [event] = tracer.events
+    assert event.category == "snapd"
+    assert event.name == "snapd GET /v2/snaps/{name}"
+    assert event.exit_code == 404
+    assert event.bytes_out == 2
+
+
 def test_get_host_snap_info_connection_error(responses):
     """Error when connecting to snapd.
 
@@ -371,20 +371,6 @@ def test_setup(
             "group": "root",
             "user": "root",
         },
-        {
-            "destination": "/etc/environment",
-            "content": etc_environment_content,
-            "file_mode": "0644",
-            "group": "root",
-            "user": "root",
-        },
-        {
-            "destination": "/etc/hostname",
-            "content": b"test-hostname\n",
-            "file_mode": "0644",
-            "group": "root",
-            "user": "root",
-        },
         {
             "destination": "/etc/craft-instance.conf",
             "content": (f"compatibility_tag: {expected_tag}\nsetup: true\n").encode(),
@@ -393,21 +379,54 @@ def test_setup(
             "user": "root",
         },
     ]
-    expected_push_file = []
-    if no_cdn:
-        expected_push_file.append(
+    expected_push_file = (
+        [
             {
                 "source": Path("/etc/systemd/system/snapd.service.d/no-cdn.conf"),
                 "destination": Path("/etc/systemd/system/snapd.service.d/no-cdn.conf"),
             }
-        )
+        ]
+        if no_cdn
+        else []
+    )
 
     assert fake_executor.records_of_push_file_io == expected_push_file_io
+    assert fake_executor.records_of_push_files[0]["content"] == etc_environment_content
     assert fake_executor.records_of_pull_file == []
     assert fake_executor.records_of_push_file == expected_push_file
     assert mock_install_from_store.mock_calls == expected_snap_call
 
 
+def test_setup_os(fake_executor):
+    """Verify /etc/environment and /etc/hostname are created in one batch."""
+    base_config = almalinux.AlmaLinuxBase(
+        alias=almalinux.AlmaLinuxBaseAlias.NINE, hostname="test-hostname"
+    )
+
+    base_config._setup_os(executor=fake_executor)
+
+    assert fake_executor.records_of_push_files == [
+        {
+            "destination": "/etc/environment",
+            "content": (
+                b"PATH=/usr/local/sbin:/usr/local/bin:"
+                b"/usr/sbin:/usr/bin:/sbin:/bin:/snap/bin\n"
+            ),
+            "file_mode": "0644",
+            "group": "root",
+            "user": "root",
+        },
+        {
+            "destination": "/etc/hostname",
+            "content": b"test-hostname\n",
+            "file_mode": "0644",
+            "group": "root",
+            "user": "root",
+        },
+    ]
+    assert fake_executor.records_of_push_file_io == []
+
+
 def test_snaps_no_channel_raises_errors(fake_executor):
     """Verify the Snap model raises an error when the channel is an empty string."""
     with pytest.raises(BaseConfigurationError) as exc_info:
@@ -325,20 +325,6 @@ def test_setup(
             "group": "root",
             "user": "root",
         },
-        {
-            "destination": "/etc/environment",
-            "content": etc_environment_content,
-            "file_mode": "0644",
-            "group": "root",
-            "user": "root",
-        },
-        {
-            "destination": "/etc/hostname",
-            "content": b"test-hostname\n",
-            "file_mode": "0644",
-            "group": "root",
-            "user": "root",
-        },
         {
             "destination": "/etc/craft-instance.conf",
             "content": (f"compatibility_tag: {expected_tag}\nsetup: true\n").encode(),
@@ -357,6 +343,22 @@ def test_setup(
         )
 
     assert fake_executor.records_of_push_file_io == expected_push_file_io
+    assert fake_executor.records_of_push_files == [
+        {
+            "destination": "/etc/environment",
+            "content": etc_environment_content,
+            "file_mode": "0644",
+            "group": "root",
+            "user": "root",
+        },
+        {
+            "destination": "/etc/hostname",
+            "content": b"test-hostname\n",
+            "file_mode": "0644",
+            "group": "root",
+            "user": "root",
+        },
+    ]
     assert fake_executor.records_of_pull_file == []
     assert fake_executor.records_of_push_file == expected_push_file
     assert mock_install_from_store.mock_calls == expected_snap_call
@@ -43,18 +43,6 @@ def mock_executor():
     return mock.Mock(spec=Executor)
 
 
-@pytest.fixture
-def config_fixture(fake_home_temporary_file):
-    """Creates an instance config file containing data passed to the fixture."""
-
-    def _config_fixture(**kwargs):
-        fake_home_temporary_file.write_text(**kwargs)
-
-        return fake_home_temporary_file
-
-    return _config_fixture
-
-
 def test_instance_config_defaults():
     """Verify default values for instance configuration objects."""
     config = InstanceConfiguration()
@@ -83,7 +71,7 @@ def test_save(mock_executor):
 
 
 def test_load_missing_config_returns_none(mock_executor):
-    mock_executor.pull_file.side_effect = [FileNotFoundError]
+    mock_executor.read_file.side_effect = [FileNotFoundError]
     config_path = pathlib.PurePosixPath("/test/foo")
     config_instance = InstanceConfiguration.load(
         executor=mock_executor, config_path=config_path
@@ -92,8 +80,8 @@ def test_load_missing_config_returns_none(mock_executor):
     assert config_instance is None
 
 
-def test_load_empty_config_returns_none(mock_executor, config_fixture):
-    config_fixture(data="")
+def test_load_empty_config_returns_none(mock_executor):
+    mock_executor.read_file.return_value = b""
     config_path = pathlib.PurePosixPath("/etc/crafty-crafty.conf")
     config_instance = InstanceConfiguration.load(
         executor=mock_executor, config_path=config_path
@@ -102,18 +90,15 @@ def test_load_empty_config_returns_none(mock_executor, config_fixture):
     assert config_instance is None
 
 
-def test_load_with_valid_config(mock_executor, config_fixture, default_config_data):
-    config_file = config_fixture(data=yaml.dump(default_config_data))
+def test_load_with_valid_config(mock_executor, default_config_data):
+    mock_executor.read_file.return_value = yaml.dump(default_config_data).encode()
     config_path = pathlib.PurePosixPath("/etc/crafty-crafty.conf")
     config_instance = InstanceConfiguration.load(
         executor=mock_executor, config_path=config_path
     )
 
     assert mock_executor.mock_calls == [
-        mock.call.pull_file(
-            source=config_path,
-            destination=config_file,
-        ),
+        mock.call.read_file(source=config_path),
     ]
 
     assert config_instance is not None
@@ -124,8 +109,8 @@ def test_load_with_valid_config(mock_executor, config_fixture, default_config_da
     }
 
 
-def test_load_with_invalid_config_raises_error(mock_executor, config_fixture):
-    config_fixture(data="invalid: data")
+def test_load_with_invalid_config_raises_error(mock_executor):
+    mock_executor.read_file.return_value = b"invalid: data"
 
     config_path = pathlib.PurePosixPath("/etc/crafty-crafty.conf")
 
@@ -138,8 +123,8 @@ def test_load_with_invalid_config_raises_error(mock_executor, config_fixture):
     assert error[0]["type"] in ("value_error.extra", "extra_forbidden")
 
 
-def test_load_failure_to_pull_file_raises_error(mock_executor):
-    mock_executor.pull_file.side_effect = [ProviderError(brief="foo")]
+def test_load_failure_to_read_file_raises_error(mock_executor):
+    mock_executor.read_file.side_effect = [ProviderError(brief="foo")]
 
     config_path = pathlib.PurePosixPath("/test/foo")
 
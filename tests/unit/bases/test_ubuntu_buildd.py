@@ -236,6 +236,8 @@ def test_setup(
             ID=ubuntu
             ID_LIKE=debian
             VERSION_ID="{alias.value}"
+            VERSION_CODENAME="test-name"
+            UBUNTU_CODENAME="noble"
             """
         ),
     )
@@ -274,19 +276,6 @@ def test_setup(
     fake_process.register_subprocess(
         [*DEFAULT_FAKE_CMD, "getent", "hosts", "snapcraft.io"]
     )
-    fake_process.register_subprocess(
-        [*DEFAULT_FAKE_CMD, "cat", "/etc/os-release"],
-        stdout=dedent(
-            f"""\
-            NAME="Ubuntu"
-            ID=ubuntu
-            ID_LIKE=debian
-            VERSION_ID="{alias.value}"
-            VERSION_CODENAME="test-name"
-            UBUNTU_CODENAME="noble"
-            """
-        ),
-    )
     fake_process.register_subprocess(
         [*DEFAULT_FAKE_CMD, "apt-get", "install", "-y", *expected_packages]
     )
@@ -346,6 +335,8 @@ def test_setup(
 
     base_config.setup(executor=fake_executor)
 
+    # os-release is read once and reused by the later steps
+    assert fake_process.call_count([*DEFAULT_FAKE_CMD, "cat", "/etc/os-release"]) == 1
     expected_push_file_io = [
         {
             "destination": "/etc/craft-instance.conf",
@@ -361,9 +352,57 @@ def test_setup(
             "group": "root",
             "user": "root",
         },
+        {
+            "destination": "/etc/craft-instance.conf",
+            "content": (f"compatibility_tag: {expected_tag}\nsetup: true\n").encode(),
+            "file_mode": "0644",
+            "group": "root",
+            "user": "root",
+        },
+    ]
+    expected_push_file = (
+        [
+            {
+                "source": Path("/etc/systemd/system/snapd.service.d/no-cdn.conf"),
+                "destination": Path("/etc/systemd/system/snapd.service.d/no-cdn.conf"),
+            }
+        ]
+        if no_cdn
+        else []
+    )
+
+    assert fake_executor.records_of_push_file_io == expected_push_file_io
+    assert fake_executor.records_of_push_files[0]["content"] == etc_environment_content
+    assert fake_executor.records_of_pull_file == []
+    assert fake_executor.records_of_push_file == expected_push_file
+    assert mock_install_from_store.mock_calls == expected_snap_call
+
+
+def test_setup_os(fake_executor):
+    """Verify the setup files are created in one batch."""
+    base_config = ubuntu.BuilddBase(
+        alias=ubuntu.BuilddBaseAlias.NOBLE, hostname="test-hostname"
+    )
+
+    base_config._setup_os(executor=fake_executor)
+
+    assert fake_executor.records_of_push_files == [
         {
             "destination": "/etc/environment",
-            "content": etc_environment_content,
+            "content": (
+                b"PATH=/usr/local/sbin:/usr/local/bin:"
+                b"/usr/sbin:/usr/bin:/sbin:/bin:/snap/bin\n"
+                b"DEBIAN_FRONTEND=noninteractive\n"
+                b"DEBCONF_NONINTERACTIVE_SEEN=true\n"
+                b"DEBIAN_PRIORITY=critical\n"
+            ),
+            "file_mode": "0644",
+            "group": "root",
+            "user": "root",
+        },
+        {
+            "destination": "/etc/hostname",
+            "content": b"test-hostname\n",
             "file_mode": "0644",
             "group": "root",
             "user": "root",
@@ -380,13 +419,6 @@ def test_setup(
             "group": "root",
             "user": "root",
         },
-        {
-            "destination": "/etc/hostname",
-            "content": b"test-hostname\n",
-            "file_mode": "0644",
-            "group": "root",
-            "user": "root",
-        },
         {
             "destination": "/etc/systemd/network/10-eth0.network",
             "content": dedent(
@@ -421,27 +453,8 @@ def test_setup(
             "group": "root",
             "user": "root",
         },
-        {
-            "destination": "/etc/craft-instance.conf",
-            "content": (f"compatibility_tag: {expected_tag}\nsetup: true\n").encode(),
-            "file_mode": "0644",
-            "group": "root",
-            "user": "root",
-        },
     ]
-    expected_push_file = []
-    if no_cdn:
-        expected_push_file.append(
-            {
-                "source": Path("/etc/systemd/system/snapd.service.d/no-cdn.conf"),
-                "destination": Path("/etc/systemd/system/snapd.service.d/no-cdn.conf"),
-            }
-        )
-
-    assert fake_executor.records_of_push_file_io == expected_push_file_io
-    assert fake_executor.records_of_pull_file == []
-    assert fake_executor.records_of_push_file == expected_push_file
-    assert mock_install_from_store.mock_calls == expected_snap_call
+    assert fake_executor.records_of_push_file_io == []
 
 
 def test_install_snaps_install_from_store(fake_executor, mock_install_from_store):
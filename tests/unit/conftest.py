@@ -18,11 +18,14 @@ import contextlib
 import io
 import pathlib
 import subprocess
+from collections.abc import Iterable
 from typing import Any
 
 import pytest
 import responses as responses_module
-from craft_providers.executor import Executor
+from craft_providers import tracing
+from craft_providers.executor import Executor, FileEntry
+from craft_providers.lxd import lxd_monitor
 from craft_providers.util import env_cmd
 from pydantic import ValidationError
 from pydantic_core import InitErrorDetails
@@ -44,6 +47,7 @@ class FakeExecutor(Executor):
 
     def __init__(self) -> None:
         self.records_of_push_file_io: list[dict[str, Any]] = []
+        self.records_of_push_files: list[dict[str, Any]] = []
         self.records_of_pull_file: list[dict[str, Any]] = []
         self.records_of_push_file: list[dict[str, Any]] = []
         self.records_of_delete: list[dict[str, Any]] = []
@@ -71,6 +75,19 @@ class FakeExecutor(Executor):
             }
         )
 
+    @override
+    def push_files(self, files: Iterable[FileEntry]) -> None:
+        self.records_of_push_files.extend(
+            {
+                "destination": file.destination.as_posix(),
+                "content": file.content,
+                "file_mode": file.file_mode,
+                "group": file.group,
+                "user": file.user,
+            }
+            for file in files
+        )
+
     @override
     def execute_popen(
         self,
@@ -170,7 +187,7 @@ def fake_home_temporary_directory(monkeypatch, tmp_path):
         yield tmp_path
 
     monkeypatch.setattr(
-        "craft_providers.instance_config.temp_paths.home_temporary_directory",
+        "craft_providers.util.temp_paths.home_temporary_directory",
         home_temporary_directory,
     )
     return tmp_path
@@ -187,12 +204,35 @@ def fake_home_temporary_file(monkeypatch, tmp_path):
         temp_file.unlink(missing_ok=True)
 
     monkeypatch.setattr(
-        "craft_providers.instance_config.temp_paths.home_temporary_file",
+        "craft_providers.util.temp_paths.home_temporary_file",
         home_temporary_file,
     )
     return temp_file
 
 
+@pytest.fixture(autouse=True)
+def fake_runtime_directory(monkeypatch, tmp_path):
+    """Keep the lease and heartbeat files of tests out of the user's directories."""
+    runtime_dir = tmp_path / "runtime"
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime_dir))
+    return runtime_dir
+
+
+@pytest.fixture(autouse=True)
+def close_lxd_monitors():
+    """Stop the LXD event monitors shared by the process after each test."""
+    yield
+    lxd_monitor.close_monitors()
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    """Enable tracing of host calls."""
+    monkeypatch.setattr(tracing, "_env_checked", True)
+    yield tracing.enable()
+    monkeypatch.setattr(tracing, "_tracer", None)
+
+
 @pytest.fixture
 def stub_verify_network(fake_process):
     """Ensures network check for Executor.execute_run(verify_network=True) succeeds."""
@@ -0,0 +1,411 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+"""Fixtures for LXD tests."""
+
+import http.server
+import json
+import pathlib
+import re
+import shutil
+import socketserver
+import tempfile
+import threading
+import uuid
+from typing import Any
+from urllib import parse
+
+import pytest
+
+
+class FakeLXDServer:
+    """In-memory LXD REST API served over a unix socket.
+
+    Implements the subset of the API used by `RestLXC`. Every request is
+    recorded in `requests` as a `(method, path, query)` tuple.
+    """
+
+    def __init__(self, socket_path: pathlib.Path) -> None:
+        self.socket_path = socket_path
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        self.connections = 0
+        self.bytes_sent = 0
+        # whether the "filter" query parameter is supported
+        self.api_filtering = True
+        self.server_info: dict[str, Any] = {
+            "api_extensions": ["projects"],
+            "auth": "trusted",
+            "environment": {
+                "server_version": "5.21.1",
+                "kernel_features": {"seccomp_listener": "true"},
+            },
+        }
+        self.projects: dict[str, dict[str, Any]] = {
+            "default": {"name": "default", "config": {}}
+        }
+        self.profiles: dict[tuple[str, str], dict[str, Any]] = {
+            ("default", "default"): {
+                "name": "default",
+                "description": "Default LXD profile",
+                "config": {},
+                "devices": {"root": {"path": "/", "pool": "default", "type": "disk"}},
+                "used_by": [],
+            }
+        }
+        self.instances: dict[tuple[str, str], dict[str, Any]] = {}
+        self.files: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self.images: dict[tuple[str, str], dict[str, Any]] = {}
+        self.failures: dict[tuple[str, str], tuple[int, str]] = {}
+        self.operations: dict[str, str] = {}
+        self.operation_error = ""
+        self._server: socketserver.UnixStreamServer | None = None
+
+    def add_instance(
+        self,
+        name: str,
+        *,
+        project: str = "default",
+        status: str = "Stopped",
+        config: dict[str, Any] | None = None,
+        devices: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        instance = {
+            "name": name,
+            "status": status,
+            "type": "container",
+            "architecture": "x86_64",
+            "ephemeral": False,
+            "profiles": ["default"],
+            "created_at": "2026-01-02T03:04:05.678901234Z",
+            "last_used_at": "2026-01-03T04:05:06Z",
+            "config": dict(config or {}),
+            "devices": dict(devices or {}),
+            "state": {"status": status, "pid": 0},
+        }
+        self.instances[(project, name)] = instance
+        return instance
+
+    def add_image(
+        self, fingerprint: str, *, aliases: list[str], project: str = "default"
+    ) -> None:
+        self.images[(project, fingerprint)] = {
+            "fingerprint": fingerprint,
+            "aliases": [{"name": alias, "description": ""} for alias in aliases],
+            "public": False,
+            "size": 1024,
+        }
+
+    def fail(self, method: str, path: str, *, code: int, message: str) -> None:
+        """Make all requests for `method` and `path` fail."""
+        self.failures[(method, path)] = (code, message)
+
+    def start(self) -> None:
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                server.connections += 1
+
+            def address_string(self) -> str:
+                return "fake-lxd"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _handle(self) -> None:
+                url = parse.urlparse(self.path)
+                query = dict(parse.parse_qsl(url.query))
+                server.requests.append((self.command, url.path, query))
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                failure = server.failures.get((self.command, url.path))
+                if failure:
+                    self._send_error(*failure)
+                    return
+                server.route(self, self.command, url.path, query, body)
+
+            def _send(
+                self,
+                payload: bytes,
+                *,
+                code: int = 200,
+                headers: dict[str, str] | None = None,
+            ) -> None:
+                self.send_response(code)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+                server.bytes_sent += len(payload)
+
+            def _send_sync(self, metadata: Any = None) -> None:
+                self._send(
+                    json.dumps(
+                        {
+                            "type": "sync",
+                            "status": "Success",
+                            "status_code": 200,
+                            "metadata": metadata,
+                        }
+                    ).encode(),
+                    headers={"Content-Type": "application/json", "ETag": "etag"},
+                )
+
+            def _send_async(self) -> None:
+                operation = f"/1.0/operations/{uuid.uuid4()}"
+                server.operations[operation] = server.operation_error
+                self._send(
+                    json.dumps(
+                        {
+                            "type": "async",
+                            "status": "Operation created",
+                            "status_code": 100,
+                            "operation": operation,
+                            "metadata": {"id": operation.rsplit("/", 1)[-1]},
+                        }
+                    ).encode(),
+                    code=202,
+                    headers={"Content-Type": "application/json"},
+                )
+
+            def _send_error(self, code: int, message: str) -> None:
+                self._send(
+                    json.dumps(
+                        {"type": "error", "error": message, "error_code": code}
+                    ).encode(),
+                    code=code,
+                    headers={"Content-Type": "application/json"},
+                )
+
+            do_GET = _handle  # noqa: N815
+            do_POST = _handle  # noqa: N815
+            do_PUT = _handle  # noqa: N815
+            do_PATCH = _handle  # noqa: N815
+            do_DELETE = _handle  # noqa: N815
+
+        class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        self._server = Server(str(self.socket_path), Handler)
+        threading.Thread(
+            target=self._server.serve_forever, args=(0.01,), daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def route(  # noqa: PLR0911, PLR0912, PLR0915
+        self,
+        handler: Any,
+        method: str,
+        path: str,
+        query: dict[str, str],
+        body: bytes,
+    ) -> None:
+        project = query.get("project", "default")
+
+        if path == "/1.0":
+            handler._send_sync(self.server_info)
+            return
+
+        if match := re.fullmatch(r"/1\.0/operations/([^/]+)/wait", path):
+            operation = f"/1.0/operations/{match.group(1)}"
+            err = self.operations.pop(operation, "")
+            handler._send_sync(
+                {
+                    "id": match.group(1),
+                    "status": "Failure" if err else "Success",
+                    "status_code": 400 if err else 200,
+                    "err": err,
+                    "metadata": {},
+                }
+            )
+            return
+
+        if path == "/1.0/instances":
+            if method == "GET":
+                # only the "name eq <name>" filter is supported
+                name = ""
+                if self.api_filtering:
+                    name = query.get("filter", "").partition("name eq ")[2]
+                handler._send_sync(
+                    [
+                        i
+                        for (p, n), i in self.instances.items()
+                        if p == project and (not name or n == name)
+                    ]
+                )
+                return
+            request = json.loads(body)
+            source = self.instances.get((project, request["source"]["source"]))
+            if source is None:
+                handler._send_error(404, "Instance not found")
+                return
+            copied = json.loads(json.dumps(source))
+            copied["name"] = request["name"]
+            self.instances[(project, request["name"])] = copied
+            handler._send_async()
+            return
+
+        if match := re.fullmatch(r"/1\.0/instances/([^/]+)(/state|/files)?", path):
+            name = parse.unquote(match.group(1))
+            instance = self.instances.get((project, name))
+            if instance is None:
+                handler._send_error(404, "Instance not found")
+                return
+            self._route_instance(
+                handler, method, match.group(2), instance, project, query, body
+            )
+            return
+
+        if path == "/1.0/projects":
+            if method == "GET":
+                handler._send_sync(list(self.projects.values()))
+                return
+            request = json.loads(body)
+            if request["name"] in self.projects:
+                handler._send_error(409, "Project already exists")
+                return
+            self.projects[request["name"]] = {"name": request["name"], "config": {}}
+            handler._send_sync()
+            return
+
+        if match := re.fullmatch(r"/1\.0/projects/([^/]+)", path):
+            self.projects.pop(parse.unquote(match.group(1)), None)
+            handler._send_sync()
+            return
+
+        if match := re.fullmatch(r"/1\.0/profiles/([^/]+)", path):
+            key = (project, parse.unquote(match.group(1)))
+            if method == "GET":
+                if key not in self.profiles:
+                    handler._send_error(404, "Profile not found")
+                    return
+                handler._send_sync(self.profiles[key])
+                return
+            self.profiles[key] = {"name": key[1], **json.loads(body)}
+            handler._send_sync()
+            return
+
+        if path == "/1.0/images":
+            handler._send_sync([i for (p, _), i in self.images.items() if p == project])
+            return
+
+        if path == "/1.0/images/aliases":
+            handler._send_sync(
+                [
+                    {"name": alias["name"], "target": image["fingerprint"]}
+                    for (p, _), image in self.images.items()
+                    if p == project
+                    for alias in image["aliases"]
+                ]
+            )
+            return
+
+        if match := re.fullmatch(r"/1\.0/images/([^/]+)", path):
+            if self.images.pop((project, match.group(1)), None) is None:
+                handler._send_error(404, "Image not found")
+                return
+            handler._send_async()
+            return
+
+        handler._send_error(404, "not found")
+
+    def _route_instance(
+        self,
+        handler: Any,
+        method: str,
+        sub_path: str | None,
+        instance: dict[str, Any],
+        project: str,
+        query: dict[str, str],
+        body: bytes,
+    ) -> None:
+        name = instance["name"]
+
+        if sub_path == "/state":
+            request = json.loads(body)
+            status = "Stopped" if request["action"] == "stop" else "Running"
+            instance["status"] = status
+            instance["state"]["status"] = status
+            handler._send_async()
+            return
+
+        if sub_path == "/files":
+            key = (project, name, query["path"])
+            if method == "GET":
+                if key not in self.files:
+                    handler._send_error(404, "Not found")
+                    return
+                entry = self.files[key]
+                handler._send(
+                    entry["content"],
+                    headers={
+                        "X-LXD-type": entry["type"],
+                        "X-LXD-mode": entry["mode"],
+                        "X-LXD-uid": entry["uid"],
+                        "X-LXD-gid": entry["gid"],
+                    },
+                )
+                return
+            self.files[key] = {
+                "content": body,
+                "type": handler.headers.get("X-LXD-type", "file"),
+                "mode": handler.headers.get("X-LXD-mode", "0644"),
+                "uid": handler.headers.get("X-LXD-uid", "0"),
+                "gid": handler.headers.get("X-LXD-gid", "0"),
+            }
+            handler._send_sync()
+            return
+
+        if method == "GET":
+            handler._send_sync(instance)
+        elif method == "PATCH":
+            request = json.loads(body)
+            instance["config"].update(request.get("config", {}))
+            instance["devices"].update(request.get("devices", {}))
+            handler._send_sync()
+        elif method == "PUT":
+            request = json.loads(body)
+            instance["config"] = request.get("config", {})
+            instance["devices"] = request.get("devices", {})
+            handler._send_async()
+        elif method == "DELETE":
+            if instance["status"] != "Stopped":
+                handler._send_error(400, "The instance is currently running")
+                return
+            del self.instances[(project, name)]
+            handler._send_async()
+
+
+@pytest.fixture
+def fake_lxd_server():
+    """Start an in-memory LXD REST API on a temporary unix socket."""
+    # unix socket paths are limited in length, so avoid pytest's tmp_path
+    socket_dir = pathlib.Path(tempfile.mkdtemp(prefix="lxd"))
+    server = FakeLXDServer(socket_dir / "unix.socket")
+    server.start()
+
+    yield server
+
+    server.stop()
+    shutil.rmtree(socket_dir, ignore_errors=True)
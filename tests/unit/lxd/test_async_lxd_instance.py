@@ -0,0 +1,81 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+import asyncio
+import pathlib
+
+import pytest
+from craft_providers.lxd import LXC, AsyncLXDInstance, LXDError, LXDInstance
+
+
+@pytest.fixture
+def async_instance():
+    instance = LXDInstance(
+        name="test-instance",
+        default_command_environment={"PATH": "/usr/bin"},
+        project="test-project",
+        remote="test-remote",
+        lxc=LXC(),
+    )
+    return AsyncLXDInstance(instance)
+
+
+def test_get_exec_command(async_instance):
+    assert async_instance.get_exec_command(
+        ["echo", "hi"], cwd=pathlib.PurePosixPath("/root"), env={"FOO": "bar"}
+    ) == [
+        "lxc",
+        "--project",
+        "test-project",
+        "exec",
+        "test-remote:test-instance",
+        "--cwd",
+        "/root",
+        "--",
+        "env",
+        "PATH=/usr/bin",
+        "FOO=bar",
+        "echo",
+        "hi",
+    ]
+
+
+def test_error_class(async_instance):
+    assert async_instance.error_class is LXDError
+
+
+def test_execute_run(async_instance, fake_process):
+    fake_process.register(
+        [*async_instance.get_exec_command(["echo", "hi"])], stdout=b"hi\n"
+    )
+
+    result = asyncio.run(
+        async_instance.execute_run(["echo", "hi"], capture_output=True)
+    )
+
+    assert result.returncode == 0
+    assert result.stdout == b"hi\n"
+
+
+def test_max_processes():
+    """The processes are capped like those of the LXC wrapper."""
+    instance = LXDInstance(name="test-instance", lxc=LXC(max_processes=3))
+
+    async_instance = AsyncLXDInstance(instance)
+
+    assert async_instance._process_slots is not None
+    assert async_instance._process_slots._value == 3
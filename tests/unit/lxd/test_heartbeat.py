@@ -0,0 +1,80 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+import os
+
+import pytest
+from craft_providers.lxd import heartbeat
+
+
+@pytest.fixture
+def heartbeat_file(tmp_path):
+    return heartbeat.heartbeat_path(
+        instance_name="test-instance",
+        project="test-project",
+        remote="test-remote",
+        directory=tmp_path / "heartbeats",
+    )
+
+
+def test_heartbeat_path(fake_runtime_directory):
+    assert heartbeat.heartbeat_path(
+        instance_name="test-instance", project="test-project", remote="test-remote"
+    ) == (
+        fake_runtime_directory
+        / "craft-providers"
+        / "heartbeats"
+        / "test-remote-test-project-test-instance.heartbeat"
+    )
+
+
+def test_default_heartbeat_directory_no_runtime_dir(monkeypatch, tmp_path):
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert heartbeat.default_heartbeat_directory() == (
+        tmp_path / "craft-providers" / "heartbeats"
+    )
+
+
+def test_beat(heartbeat_file):
+    assert heartbeat.read(heartbeat_file) is None
+
+    heartbeat.beat(heartbeat_file)
+    os.utime(heartbeat_file, ns=(0, 0))
+    assert heartbeat.read(heartbeat_file) == 0
+
+    heartbeat.beat(heartbeat_file)
+    assert heartbeat.read(heartbeat_file) != 0
+
+
+def test_beat_error(heartbeat_file, logs):
+    heartbeat_file.parent.touch()
+
+    heartbeat.beat(heartbeat_file)
+
+    assert heartbeat.read(heartbeat_file) is None
+    assert f"Failed to update heartbeat file {heartbeat_file}" in logs.debug
+
+
+def test_remove(heartbeat_file):
+    heartbeat.beat(heartbeat_file)
+
+    heartbeat.remove(heartbeat_file)
+    heartbeat.remove(heartbeat_file)
+
+    assert not heartbeat_file.exists()
@@ -0,0 +1,177 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+import pathlib
+from datetime import datetime, timezone
+
+import pytest
+from craft_providers.lxd.launch_history import (
+    LaunchHistory,
+    LaunchPath,
+    LaunchRecord,
+    default_history_path,
+)
+
+
+def _record(timestamp, path, *, tag="tag-v1", success=True, duration=1.0):
+    return LaunchRecord(
+        timestamp=timestamp,
+        instance_name=f"instance-{timestamp}",
+        base_instance_name="base-instance",
+        image="ubuntu:22.04",
+        compatibility_tag=tag,
+        path=path,
+        success=success,
+        duration=duration,
+    )
+
+
+@pytest.fixture
+def history(tmp_path):
+    return LaunchHistory(tmp_path / "cache" / "history.sqlite3")
+
+
+def test_default_history_path(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert default_history_path() == tmp_path / "craft-providers/launch-history.sqlite3"
+
+
+def test_default_history_path_home(monkeypatch, tmp_path):
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(pathlib.Path, "home", lambda: tmp_path)
+
+    assert default_history_path() == (
+        tmp_path / ".cache/craft-providers/launch-history.sqlite3"
+    )
+
+
+@pytest.mark.parametrize(
+    ("path", "base_hit"),
+    [
+        (None, None),
+        (LaunchPath.EXISTING, None),
+        (LaunchPath.CREATED, None),
+        (LaunchPath.BASE_CREATED, False),
+        (LaunchPath.BASE_REBUILT, False),
+        (LaunchPath.BASE_COPIED, True),
+    ],
+)
+def test_base_hit(path, base_hit):
+    assert _record(0.0, path).base_hit is base_hit
+
+
+def test_record_and_query(history):
+    record = _record(100.0, LaunchPath.BASE_COPIED)
+    record.phase_durations = {"copy": 2.0, "warmup": 3.0}
+    history.record(record)
+    history.record(_record(200.0, None, success=False))
+
+    assert history.query() == [_record(200.0, None, success=False), record]
+
+
+def test_query_empty(history):
+    assert history.query() == []
+
+
+def test_query_filters(history):
+    history.record(_record(100.0, LaunchPath.BASE_CREATED))
+    history.record(_record(200.0, LaunchPath.BASE_COPIED))
+    history.record(_record(300.0, LaunchPath.BASE_COPIED, tag="tag-v2"))
+    history.record(_record(400.0, LaunchPath.BASE_COPIED))
+
+    since = datetime.fromtimestamp(200.0, tz=timezone.utc)
+    assert [r.timestamp for r in history.query(since=since)] == [400.0, 300.0, 200.0]
+    assert [r.timestamp for r in history.query(compatibility_tag="tag-v2")] == [300.0]
+    assert [r.timestamp for r in history.query(path=LaunchPath.BASE_CREATED)] == [100.0]
+    assert [r.timestamp for r in history.query(limit=2)] == [400.0, 300.0]
+
+
+def test_record_error(history, logs):
+    """Errors writing the history are logged, not raised."""
+    history.path.parent.mkdir()
+    history.path.write_text("not a database" * 100)
+
+    history.record(_record(100.0, LaunchPath.CREATED))
+
+    assert "Failed to record launch" in logs.debug
+
+
+def test_hit_rate(history):
+    history.record(_record(100.0, LaunchPath.BASE_CREATED))
+    history.record(_record(200.0, LaunchPath.BASE_COPIED))
+    history.record(_record(300.0, LaunchPath.BASE_COPIED))
+    history.record(_record(400.0, LaunchPath.BASE_REBUILT, tag="tag-v2"))
+    history.record(_record(500.0, LaunchPath.EXISTING))
+
+    assert history.hit_rate() == 0.5
+    assert history.hit_rate(compatibility_tag="tag-v1") == pytest.approx(2 / 3)
+    assert history.hit_rate(since=datetime.fromtimestamp(200.0, tz=timezone.utc)) == (
+        pytest.approx(2 / 3)
+    )
+
+
+def test_hit_rate_no_base_instance(history):
+    history.record(_record(100.0, LaunchPath.CREATED))
+
+    assert history.hit_rate() is None
+
+
+def test_format_prometheus(history):
+    history.record(_record(100.0, LaunchPath.BASE_CREATED, duration=60.0))
+    history.record(_record(200.0, LaunchPath.BASE_COPIED, duration=5.0))
+    history.record(_record(300.0, LaunchPath.BASE_COPIED, duration=4.5))
+    history.record(_record(400.0, None, tag='tag"v2', success=False, duration=0.5))
+
+    assert history.format_prometheus() == (
+        "# HELP craft_providers_launches_total Launches of LXD instances.\n"
+        "# TYPE craft_providers_launches_total counter\n"
+        'craft_providers_launches_total{path="base_copied",'
+        'compatibility_tag="tag-v1",success="true"} 2\n'
+        'craft_providers_launches_total{path="base_created",'
+        'compatibility_tag="tag-v1",success="true"} 1\n'
+        'craft_providers_launches_total{path="unknown",'
+        'compatibility_tag="tag\\"v2",success="false"} 1\n'
+        "# HELP craft_providers_launch_duration_seconds_total "
+        "Time spent launching LXD instances.\n"
+        "# TYPE craft_providers_launch_duration_seconds_total counter\n"
+        'craft_providers_launch_duration_seconds_total{path="base_copied",'
+        'compatibility_tag="tag-v1"} 9.500\n'
+        'craft_providers_launch_duration_seconds_total{path="base_created",'
+        'compatibility_tag="tag-v1"} 60.000\n'
+        'craft_providers_launch_duration_seconds_total{path="unknown",'
+        'compatibility_tag="tag\\"v2"} 0.500\n'
+        "# HELP craft_providers_base_instance_hits_total "
+        "Launches that reuse a base instance.\n"
+        "# TYPE craft_providers_base_instance_hits_total counter\n"
+        'craft_providers_base_instance_hits_total{compatibility_tag="tag-v1"} 2\n'
+        "# HELP craft_providers_base_instance_misses_total "
+        "Launches that could not reuse a base instance.\n"
+        "# TYPE craft_providers_base_instance_misses_total counter\n"
+        'craft_providers_base_instance_misses_total{compatibility_tag="tag-v1"} 1\n'
+    )
+
+
+def test_write_prometheus_textfile(history, tmp_path):
+    history.record(_record(100.0, LaunchPath.BASE_COPIED))
+    textfile = tmp_path / "craft_providers.prom"
+    textfile.write_text("stale")
+
+    history.write_prometheus_textfile(textfile)
+
+    assert textfile.read_text() == history.format_prometheus()
+    assert list(tmp_path.glob("*.prom*")) == [textfile]
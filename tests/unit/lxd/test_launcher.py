@@ -18,13 +18,17 @@
 
 
 import sys
+import threading
+import time
 from datetime import timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, call
 
 import pytest
 from craft_providers import Base, Executor, ProviderError, bases, lxd
-from craft_providers.lxd import LXDError, lxd_instance_status
+from craft_providers.lxd import LXDError, heartbeat, lxd_instance_status
+from craft_providers.lxd.launch_history import LaunchHistory, LaunchPath
+from craft_providers.phases import PhaseEvent, PhaseEventType
 from freezegun import freeze_time
 from logassert import Exact  # type: ignore[import-untyped]
 
@@ -37,6 +41,7 @@ def mock_base_configuration():
     mock_base = Mock(spec=Base)
     mock_base.compatibility_tag = "mock-compat-tag-v200"
     mock_base.get_command_environment.return_value = {"foo": "bar"}
+    mock_base.phase_observers = ()
     return mock_base
 
 
@@ -47,6 +52,11 @@ def mock_lxc(mocker):
     return _mock_lxc.return_value
 
 
+@pytest.fixture(autouse=True)
+def mock_instance_lease(mocker):
+    return mocker.patch("craft_providers.lxd.launcher.instance_lease")
+
+
 @pytest.fixture
 def mock_platform(mocker):
     mocker.patch("sys.platform", "linux")
@@ -158,6 +168,7 @@ def test_launch_no_base_instance(
             project="default",
             remote="local",
             default_command_environment={"foo": "bar"},
+            lxc=mock_lxc,
         ),
     ]
     assert fake_instance.mock_calls == [
@@ -173,14 +184,13 @@ def test_launch_no_base_instance(
         call.config_get("user.craft_providers.status"),
         call.config_set("user.craft_providers.status", "PREPARING"),
         call.config_set("user.craft_providers.timer", "2023-01-01T00:00:00+00:00"),
-        call.lxc.config_set(
-            instance_name="test-instance-fa2d407652a1c51f6019",
-            key="environment.TZ",
-            value="fake/timezone",
-            project="default",
-            remote="local",
+        call.config_set_many(
+            {
+                "environment.TZ": "fake/timezone",
+                "user.craft_providers.status": "FINISHED",
+                "user.craft_providers.timer": "DONE",
+            }
         ),
-        call.config_set("user.craft_providers.status", "FINISHED"),
         call.stop(),
         call.start(),
     ]
@@ -215,13 +225,6 @@ def test_launch_use_base_instance(
 
     assert mock_lxc.mock_calls == [
         call.project_list("test-remote"),
-        call.copy(
-            source_remote="test-remote",
-            source_instance_name=fake_base_instance.instance_name,
-            destination_remote="test-remote",
-            destination_instance_name=fake_instance.instance_name,
-            project="test-project",
-        ),
     ]
     assert mock_lxd_instance.mock_calls == [
         call(
@@ -229,26 +232,24 @@ def test_launch_use_base_instance(
             project="test-project",
             remote="test-remote",
             default_command_environment={"foo": "bar"},
+            lxc=mock_lxc,
         ),
         call(
             name="base-instance-mock-compat-tag-v200-image-remote-image-name",
             project="test-project",
             remote="test-remote",
             default_command_environment={"foo": "bar"},
+            lxc=mock_lxc,
         ),
     ]
     assert fake_instance.mock_calls == [
         call.exists(),
-        call.lxc.config_set(
-            instance_name="test-instance-fa2d407652a1c51f6019",
-            key="environment.TZ",
-            value="fake/timezone",
-            project="test-project",
-            remote="test-remote",
-        ),
+        call.copy(source=fake_base_instance),
+        call.config_set_many({"environment.TZ": "fake/timezone"}),
         call.start(),
     ]
-    fake_base_instance.exists.assert_called_once()
+    # checked before taking the lease and again once it is held
+    assert fake_base_instance.exists.call_count == 2
     assert mock_base_configuration.mock_calls == [
         call.get_command_environment(),
         call.get_command_environment(),
@@ -268,7 +269,7 @@ def test_launch_use_base_instance_failed_lxc(
     mock_timezone,
 ):
     """Launch a base instance from an image, but lxc commands fail."""
-    fake_base_instance.lxc.config_set.side_effect = [
+    fake_base_instance.config_set_many.side_effect = [
         LXDError("test1"),
     ]
     with pytest.raises(LXDError):
@@ -284,6 +285,113 @@ def test_launch_use_base_instance_failed_lxc(
         )
 
 
+def test_launch_use_base_instance_lease(
+    *,
+    fake_instance,
+    fake_base_instance,
+    mock_base_configuration,
+    mock_instance_lease,
+    mock_is_valid,
+    mock_lxc,
+    mock_lxd_instance,
+    mock_platform,
+    mock_timezone,
+):
+    """The lease on the base instance is released once it is ready."""
+    lease = mock_instance_lease.return_value.__enter__.return_value
+
+    def _check_base_instance_ready():
+        fake_base_instance.stop.assert_called_once_with()
+        fake_instance.copy.assert_not_called()
+
+    lease.release.side_effect = _check_base_instance_ready
+
+    lxd.launch(
+        name=fake_instance.name,
+        base_configuration=mock_base_configuration,
+        image_name="image-name",
+        image_remote="image-remote",
+        use_base_instance=True,
+        project="test-project",
+        remote="test-remote",
+        lxc=mock_lxc,
+    )
+
+    mock_instance_lease.assert_called_once_with(
+        lxc=mock_lxc,
+        instance_name=fake_base_instance.instance_name,
+        project="test-project",
+        remote="test-remote",
+    )
+    lease.release.assert_called_once_with()
+    fake_instance.copy.assert_called_once_with(source=fake_base_instance)
+
+
+def test_launch_use_existing_base_instance_lease(
+    *,
+    fake_instance,
+    fake_base_instance,
+    mock_base_configuration,
+    mock_instance_lease,
+    mock_is_valid,
+    mock_lxc,
+    mock_lxd_instance,
+    mock_platform,
+    mock_timezone,
+):
+    """A valid base instance is copied without taking the lease."""
+    fake_base_instance.exists.return_value = True
+
+    lxd.launch(
+        name=fake_instance.name,
+        base_configuration=mock_base_configuration,
+        image_name="image-name",
+        image_remote="image-remote",
+        use_base_instance=True,
+        project="test-project",
+        remote="test-remote",
+        lxc=mock_lxc,
+    )
+
+    mock_instance_lease.assert_not_called()
+    fake_base_instance.delete.assert_not_called()
+    fake_instance.copy.assert_called_once_with(source=fake_base_instance)
+
+
+def test_launch_base_instance_created_while_waiting_for_lease(
+    *,
+    fake_instance,
+    fake_base_instance,
+    mock_base_configuration,
+    mock_instance_lease,
+    mock_is_valid,
+    mock_lxc,
+    mock_lxd_instance,
+    mock_platform,
+    mock_timezone,
+):
+    """The base instance is checked again once the lease is held."""
+    fake_base_instance.exists.side_effect = [False, True]
+    fake_instance.copy.side_effect = lambda **_: (
+        mock_instance_lease.return_value.__exit__.assert_called_once()
+    )
+
+    lxd.launch(
+        name=fake_instance.name,
+        base_configuration=mock_base_configuration,
+        image_name="image-name",
+        image_remote="image-remote",
+        use_base_instance=True,
+        project="test-project",
+        remote="test-remote",
+        lxc=mock_lxc,
+    )
+
+    mock_instance_lease.assert_called_once()
+    fake_base_instance.launch.assert_not_called()
+    fake_instance.copy.assert_called_once_with(source=fake_base_instance)
+
+
 @pytest.mark.parametrize(
     ("map_user_uid", "uid", "gid"),
     [
@@ -325,20 +433,15 @@ def test_launch_use_existing_base_instance(
 
     expected_mock_lxc_calls = [
         call.project_list("test-remote"),
-        call.copy(
-            source_remote="test-remote",
-            source_instance_name=fake_base_instance.instance_name,
-            destination_remote="test-remote",
-            destination_instance_name=fake_instance.instance_name,
-            project="test-project",
-        ),
     ]
     if map_user_uid:
         expected_mock_lxc_calls.append(
-            call.config_set(
+            call.config_set_many(
                 instance_name=fake_instance.instance_name,
-                key="raw.idmap",
-                value=f"uid {uid} 0\ngid {gid} 0",
+                config={
+                    "environment.TZ": "fake/timezone",
+                    "raw.idmap": f"uid {uid} 0\ngid {gid} 0",
+                },
                 project="test-project",
                 remote="test-remote",
             ),
@@ -351,15 +454,15 @@ def test_launch_use_existing_base_instance(
                 remote="test-remote",
             ),
         )
-    expected_mock_lxc_calls.append(
-        call.config_set(
-            instance_name="test-instance-fa2d407652a1c51f6019",
-            key="environment.TZ",
-            value="fake/timezone",
-            project="test-project",
-            remote="test-remote",
+    else:
+        expected_mock_lxc_calls.append(
+            call.config_set_many(
+                instance_name=fake_instance.instance_name,
+                config={"environment.TZ": "fake/timezone"},
+                project="test-project",
+                remote="test-remote",
+            )
         )
-    )
     assert mock_lxc.mock_calls == expected_mock_lxc_calls
     assert mock_lxd_instance.mock_calls == [
         call(
@@ -367,15 +470,22 @@ def test_launch_use_existing_base_instance(
             project="test-project",
             remote="test-remote",
             default_command_environment={"foo": "bar"},
+            lxc=mock_lxc,
         ),
         call(
             name="base-instance-mock-compat-tag-v200-image-remote-image-name",
             project="test-project",
             remote="test-remote",
             default_command_environment={"foo": "bar"},
+            lxc=mock_lxc,
         ),
     ]
-    assert fake_instance.mock_calls == [call.exists(), call.is_running(), call.start()]
+    assert fake_instance.mock_calls == [
+        call.exists(),
+        call.copy(source=fake_base_instance),
+        call.is_running(),
+        call.start(),
+    ]
     assert fake_base_instance.mock_calls == [call.exists(), call.is_running()]
     assert mock_base_configuration.mock_calls == [
         call.get_command_environment(),
@@ -418,6 +528,7 @@ def test_launch_use_existing_base_instance_already_running(
 
     assert fake_instance.mock_calls == [
         call.exists(),
+        call.copy(source=fake_base_instance),
         call.is_running(),
         call.stop(),
         call.start(),
@@ -454,24 +565,9 @@ def test_launch_existing_base_instance_invalid(
 
     assert mock_lxc.mock_calls == [
         call.project_list("test-remote"),
-        call.copy(
-            source_remote="test-remote",
-            source_instance_name=fake_base_instance.instance_name,
-            destination_remote="test-remote",
-            destination_instance_name=fake_instance.instance_name,
-            project="test-project",
-        ),
     ]
 
-    assert fake_base_instance.lxc.mock_calls == [
-        call.config_set(
-            instance_name="test-base-instance-e14661a426076717fa04",
-            key="environment.TZ",
-            value="fake/timezone",
-            project="test-project",
-            remote="test-remote",
-        ),
-    ]
+    assert fake_base_instance.lxc.mock_calls == []
 
     assert mock_lxd_instance.mock_calls == [
         call(
@@ -479,26 +575,24 @@ def test_launch_existing_base_instance_invalid(
             project="test-project",
             remote="test-remote",
             default_command_environment={"foo": "bar"},
+            lxc=mock_lxc,
         ),
         call(
             name="base-instance-mock-compat-tag-v200-image-remote-image-name",
             project="test-project",
             remote="test-remote",
             default_command_environment={"foo": "bar"},
+            lxc=mock_lxc,
         ),
     ]
     assert fake_instance.mock_calls == [
         call.exists(),
-        call.lxc.config_set(
-            instance_name="test-instance-fa2d407652a1c51f6019",
-            key="environment.TZ",
-            value="fake/timezone",
-            project="test-project",
-            remote="test-remote",
-        ),
+        call.copy(source=fake_base_instance),
+        call.config_set_many({"environment.TZ": "fake/timezone"}),
         call.start(),
     ]
     assert fake_base_instance.mock_calls == [
+        call.exists(),
         call.exists(),
         call.delete(),
         call.__bool__(),
@@ -513,15 +607,14 @@ def test_launch_existing_base_instance_invalid(
         call.config_get("user.craft_providers.status"),
         call.config_set("user.craft_providers.status", "PREPARING"),
         call.config_set("user.craft_providers.timer", "2023-01-01T00:00:00+00:00"),
-        call.lxc.config_set(
-            instance_name="test-base-instance-e14661a426076717fa04",
-            key="environment.TZ",
-            value="fake/timezone",
-            project="test-project",
-            remote="test-remote",
+        call.config_set_many(
+            {
+                "environment.TZ": "fake/timezone",
+                "image.description": "test-base-instance-$",
+                "user.craft_providers.status": "FINISHED",
+                "user.craft_providers.timer": "DONE",
+            }
         ),
-        call.config_set("image.description", "test-base-instance-$"),
-        call.config_set("user.craft_providers.status", "FINISHED"),
         call.stop(),
     ]
     assert mock_base_configuration.mock_calls == [
@@ -606,6 +699,7 @@ def test_launch_all_opts(
             project="test-project",
             remote="test-remote",
             default_command_environment={"foo": "bar"},
+            lxc=mock_lxc,
         ),
     ]
     assert fake_instance.mock_calls == [
@@ -620,18 +714,16 @@ def test_launch_all_opts(
         ),
         call.config_get("user.craft_providers.status"),
         call.config_set("user.craft_providers.status", "PREPARING"),
-        call.lxc.config_set(
-            instance_name="test-instance-fa2d407652a1c51f6019",
-            key="environment.TZ",
-            value="fake/timezone",
-            project="test-project",
-            remote="test-remote",
+        call.config_set_many(
+            {
+                "environment.TZ": "fake/timezone",
+                "user.craft_providers.status": "FINISHED",
+                "user.craft_providers.timer": "DONE",
+            }
         ),
-        call.config_set("user.craft_providers.status", "FINISHED"),
-        call.lxc.config_set(
+        call.lxc.config_set_many(
             instance_name=fake_instance.instance_name,
-            key="raw.idmap",
-            value="uid 1234 0\ngid 5678 0",
+            config={"raw.idmap": "uid 1234 0\ngid 5678 0"},
             project="test-project",
             remote="test-remote",
         ),
@@ -713,6 +805,7 @@ def test_launch_create_project(
             project="project-to-create",
             remote="test-remote",
             default_command_environment={"foo": "bar"},
+            lxc=mock_lxc,
         ),
     ]
     assert fake_instance.mock_calls == [
@@ -727,14 +820,13 @@ def test_launch_create_project(
         ),
         call.config_get("user.craft_providers.status"),
         call.config_set("user.craft_providers.status", "PREPARING"),
-        call.lxc.config_set(
-            instance_name="test-instance-fa2d407652a1c51f6019",
-            key="environment.TZ",
-            value="fake/timezone",
-            project="project-to-create",
-            remote="test-remote",
+        call.config_set_many(
+            {
+                "environment.TZ": "fake/timezone",
+                "user.craft_providers.status": "FINISHED",
+                "user.craft_providers.timer": "DONE",
+            }
         ),
-        call.config_set("user.craft_providers.status", "FINISHED"),
         call.stop(),
         call.start(),
     ]
@@ -772,9 +864,14 @@ def test_launch_with_existing_instance_not_running(
             project="default",
             remote="local",
             default_command_environment={"foo": "bar"},
+            lxc=mock_lxc,
         ),
     ]
-    assert fake_instance.mock_calls == [call.exists(), call.is_running(), call.start()]
+    assert fake_instance.mock_calls == [
+        call.exists(),
+        call.is_running(),
+        call.start(),
+    ]
     assert mock_base_configuration.mock_calls == [
         call.get_command_environment(),
         call.warmup(executor=fake_instance),
@@ -809,6 +906,7 @@ def test_launch_with_existing_instance_running(
             project="default",
             remote="local",
             default_command_environment={"foo": "bar"},
+            lxc=mock_lxc,
         ),
     ]
     assert fake_instance.mock_calls == [
@@ -861,6 +959,7 @@ def test_launch_with_existing_instance_incompatible_with_auto_clean(
             project="default",
             remote="local",
             default_command_environment={"foo": "bar"},
+            lxc=mock_lxc,
         ),
     ]
     assert fake_instance.mock_calls == [
@@ -878,14 +977,13 @@ def test_launch_with_existing_instance_incompatible_with_auto_clean(
         ),
         call.config_get("user.craft_providers.status"),
         call.config_set("user.craft_providers.status", "PREPARING"),
-        call.lxc.config_set(
-            instance_name="test-instance-fa2d407652a1c51f6019",
-            key="environment.TZ",
-            value="fake/timezone",
-            project="default",
-            remote="local",
+        call.config_set_many(
+            {
+                "environment.TZ": "fake/timezone",
+                "user.craft_providers.status": "FINISHED",
+                "user.craft_providers.timer": "DONE",
+            }
         ),
-        call.config_set("user.craft_providers.status", "FINISHED"),
         call.stop(),
         call.start(),
     ]
@@ -960,6 +1058,7 @@ def test_launch_with_existing_ephemeral_instance(
             project="default",
             remote="local",
             default_command_environment={"foo": "bar"},
+            lxc=mock_lxc,
         ),
     ]
     assert fake_instance.mock_calls == [
@@ -975,14 +1074,13 @@ def test_launch_with_existing_ephemeral_instance(
         ),
         call.config_get("user.craft_providers.status"),
         call.config_set("user.craft_providers.status", "PREPARING"),
-        call.lxc.config_set(
-            instance_name="test-instance-fa2d407652a1c51f6019",
-            key="environment.TZ",
-            value="fake/timezone",
-            project="default",
-            remote="local",
+        call.config_set_many(
+            {
+                "environment.TZ": "fake/timezone",
+                "user.craft_providers.status": "FINISHED",
+                "user.craft_providers.timer": "DONE",
+            }
         ),
-        call.config_set("user.craft_providers.status", "FINISHED"),
         call.restart(),
     ]
     assert mock_base_configuration.mock_calls == [
@@ -1087,6 +1185,148 @@ def test_name_matches_base_name(
     assert raised.value.resolution == "change name of instance"
 
 
+@pytest.mark.parametrize(
+    ("instance_exists", "use_base_instance", "base_exists", "base_valid", "path"),
+    [
+        (True, True, True, True, LaunchPath.EXISTING),
+        (False, False, False, False, LaunchPath.CREATED),
+        (False, True, False, False, LaunchPath.BASE_CREATED),
+        (False, True, True, False, LaunchPath.BASE_REBUILT),
+        (False, True, True, True, LaunchPath.BASE_COPIED),
+    ],
+)
+def test_launch_history(
+    *,
+    fake_instance,
+    fake_base_instance,
+    mock_base_configuration,
+    mock_is_valid,
+    mock_check_id_map,
+    mock_lxc,
+    mock_lxd_instance,
+    mock_platform,
+    mock_timezone,
+    mocker,
+    tmp_path,
+    instance_exists,
+    use_base_instance,
+    base_exists,
+    base_valid,
+    path,
+):
+    """Record the path taken by the launch in the history."""
+    mocker.patch("craft_providers.lxd.launcher._launch_existing_instance")
+    fake_instance.exists.return_value = instance_exists
+    fake_base_instance.exists.return_value = base_exists
+    mock_is_valid.return_value = base_valid
+    history = LaunchHistory(tmp_path / "history.sqlite3")
+
+    lxd.launch(
+        name=fake_instance.name,
+        base_configuration=mock_base_configuration,
+        image_name="image-name",
+        image_remote="image-remote",
+        use_base_instance=use_base_instance,
+        project="test-project",
+        remote="test-remote",
+        lxc=mock_lxc,
+        history=history,
+    )
+
+    [record] = history.query()
+    assert record.instance_name == fake_instance.instance_name
+    assert record.base_instance_name == (
+        fake_base_instance.instance_name
+        if use_base_instance and not instance_exists
+        else None
+    )
+    assert record.image == "image-remote:image-name"
+    assert record.compatibility_tag == "mock-compat-tag-v200"
+    assert record.path == path
+    assert record.success
+    assert record.duration >= 0
+    # the durations are observed on the instances, not on the shared base
+    mock_base_configuration.add_phase_observer.assert_not_called()
+    fake_instance.add_phase_observer.assert_called_once()
+
+
+def test_launch_history_failure(
+    *,
+    fake_instance,
+    fake_base_instance,
+    mock_base_configuration,
+    mock_is_valid,
+    mock_lxc,
+    mock_lxd_instance,
+    mock_platform,
+    mock_timezone,
+    tmp_path,
+):
+    """Record failed launches in the history."""
+    fake_base_instance.config_set_many.side_effect = [LXDError("test1")]
+    history = LaunchHistory(tmp_path / "history.sqlite3")
+
+    with pytest.raises(LXDError):
+        lxd.launch(
+            name=fake_instance.name,
+            base_configuration=mock_base_configuration,
+            image_name="image-name",
+            image_remote="image-remote",
+            use_base_instance=True,
+            project="test-project",
+            remote="test-remote",
+            lxc=mock_lxc,
+            history=history,
+        )
+
+    [record] = history.query()
+    assert record.path == LaunchPath.BASE_CREATED
+    assert not record.success
+
+
+def test_launch_history_phase_durations(
+    *,
+    fake_instance,
+    fake_base_instance,
+    mock_base_configuration,
+    mock_is_valid,
+    mock_lxc,
+    mock_lxd_instance,
+    mock_platform,
+    mock_timezone,
+    tmp_path,
+):
+    """Record the durations of the phases, summed by name."""
+
+    def setup(**_kwargs):
+        observer = fake_base_instance.add_phase_observer.call_args.args[0]
+        for duration in (1.0, 2.5):
+            observer(PhaseEvent("setup_os", PhaseEventType.START, timestamp=0.0))
+            observer(
+                PhaseEvent(
+                    "setup_os", PhaseEventType.END, timestamp=0.0, duration=duration
+                )
+            )
+
+    mock_base_configuration.setup.side_effect = setup
+    history = LaunchHistory(tmp_path / "history.sqlite3")
+
+    lxd.launch(
+        name=fake_instance.name,
+        base_configuration=mock_base_configuration,
+        image_name="image-name",
+        image_remote="image-remote",
+        use_base_instance=True,
+        project="test-project",
+        remote="test-remote",
+        lxc=mock_lxc,
+        history=history,
+    )
+
+    [record] = history.query()
+    assert record.phase_durations == {"setup_os": 3.5}
+
+
 @freeze_time("2022/12/07 11:05:00 UTC")
 @pytest.mark.parametrize(
     "creation_date",
@@ -1102,9 +1342,11 @@ def test_is_valid(creation_date, fake_instance):
         "Created": creation_date,
         "Status": lxd_instance_status.LXDInstanceState.STOPPED.value,
     }
-    fake_instance.config_get.return_value = (
-        lxd_instance_status.ProviderInstanceStatus.FINISHED.value
-    )
+    fake_instance.config_snapshot.return_value = {
+        "user.craft_providers.status": (
+            lxd_instance_status.ProviderInstanceStatus.FINISHED.value
+        )
+    }
 
     is_valid = lxd.launcher._is_valid(
         instance=fake_instance,
@@ -1122,9 +1364,11 @@ def test_is_valid_expired(fake_instance, mock_lxc):
         "Created": "2022/09/07 11:05 UTC",
         "Status": lxd_instance_status.LXDInstanceState.STOPPED.value,
     }
-    fake_instance.config_get.return_value = (
-        lxd_instance_status.ProviderInstanceStatus.FINISHED.value
-    )
+    fake_instance.config_snapshot.return_value = {
+        "user.craft_providers.status": (
+            lxd_instance_status.ProviderInstanceStatus.FINISHED.value
+        )
+    }
 
     is_valid = lxd.launcher._is_valid(
         instance=fake_instance,
@@ -1191,9 +1435,11 @@ def test_is_valid_wait_for_ready_error(logs, fake_instance, mocker):
         "Status": lxd_instance_status.LXDInstanceState.STOPPED.value,
     }
 
-    fake_instance.config_get.return_value = (
-        lxd_instance_status.ProviderInstanceStatus.FINISHED.value
-    )
+    fake_instance.config_snapshot.return_value = {
+        "user.craft_providers.status": (
+            lxd_instance_status.ProviderInstanceStatus.FINISHED.value
+        )
+    }
 
     is_valid = lxd.launcher._is_valid(
         instance=fake_instance,
@@ -1213,11 +1459,36 @@ def test_set_id_map_default(fake_base_instance, mock_lxc, mocker):
 
     lxd.launcher._set_id_map(instance=fake_base_instance, lxc=mock_lxc)
 
-    assert mock_lxc.config_set.mock_calls == [
+    assert mock_lxc.config_set_many.mock_calls == [
         call(
             instance_name=fake_base_instance.instance_name,
-            key="raw.idmap",
-            value="uid 101 0\ngid 123 0",
+            config={"raw.idmap": "uid 101 0\ngid 123 0"},
+            project="default",
+            remote="local",
+        )
+    ]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="unsupported on windows")
+def test_set_id_map_extra_config(fake_base_instance, mock_lxc, mocker):
+    """Verify `_set_id_map()` sets other configuration keys in the same call."""
+    mocker.patch("craft_providers.lxd.launcher.os.getuid", return_value=101)
+    mocker.patch("craft_providers.lxd.launcher.os.getgid", return_value=123)
+    mock_lxc.config_get.return_value = "uid 101 0\ngid 123 0"
+
+    lxd.launcher._set_id_map(
+        instance=fake_base_instance,
+        lxc=mock_lxc,
+        extra_config={"environment.TZ": "fake/timezone"},
+    )
+
+    assert mock_lxc.config_set_many.mock_calls == [
+        call(
+            instance_name=fake_base_instance.instance_name,
+            config={
+                "environment.TZ": "fake/timezone",
+                "raw.idmap": "uid 101 0\ngid 123 0",
+            },
             project="default",
             remote="local",
         )
@@ -1250,11 +1521,10 @@ def test_set_id_map_all_options(fake_base_instance, mock_lxc, mocker):
         gid=303,
     )
 
-    assert mock_lxc.config_set.mock_calls == [
+    assert mock_lxc.config_set_many.mock_calls == [
         call(
             instance_name=fake_base_instance.instance_name,
-            key="raw.idmap",
-            value="uid 202 0\ngid 303 0",
+            config={"raw.idmap": "uid 202 0\ngid 303 0"},
             project="test-project",
             remote="test-remote",
         )
@@ -1343,35 +1613,23 @@ def test_check_id_map_wrong_format(fake_base_instance, logs, mock_lxc, mocker):
 
 
 @pytest.mark.parametrize("platform", ["darwin", "win32", "other"])
-def test_timezone_non_linux_host(fake_instance, mocker, mock_lxc, logs, platform):
+def test_timezone_non_linux_host(mocker, logs, platform):
     """Log an error and no-op if host is not linux."""
     mocker.patch.object(sys, "platform", platform)
 
-    lxd.launcher._set_timezone(
-        instance=fake_instance,
-        project="test-project",
-        remote="test-remote",
-        lxc=mock_lxc,
-    )
+    assert lxd.launcher._get_timezone_config() == {}
 
     assert "Not setting timezone because host is not Linux." in logs.debug
 
 
-def test_timezone_host_error(
-    fake_instance, fake_process, mock_lxc, mock_platform, logs
-):
+def test_timezone_host_error(fake_process, mock_platform, logs):
     """Log an error and no-op if timezone cannot be collected from host."""
     fake_process.register_subprocess(
         ["timedatectl", "show", "-p", "Timezone", "--value"],
         returncode=1,
     )
 
-    lxd.launcher._set_timezone(
-        instance=fake_instance,
-        project="test-project",
-        remote="test-remote",
-        lxc=mock_lxc,
-    )
+    assert lxd.launcher._get_timezone_config() == {}
 
     assert (
         "Not setting instance's timezone because host timezone could not "
@@ -1379,6 +1637,11 @@ def test_timezone_host_error(
     ) in logs.debug
 
 
+def test_timezone(mock_platform, mock_timezone):
+    """Get the timezone configuration from the host."""
+    assert lxd.launcher._get_timezone_config() == {"environment.TZ": "fake/timezone"}
+
+
 def test_timer_error_ignore(fake_instance, fake_process, mock_lxc, mocker):
     """LXC timer should ignore errors."""
     mocker.patch("time.sleep")
@@ -1391,12 +1654,41 @@ def test_timer_error_ignore(fake_instance, fake_process, mock_lxc, mocker):
     assert fake_instance.config_set.call_count > 0
 
 
+def test_timer_heartbeat(fake_instance, fake_runtime_directory, mocker):
+    """The timer touches a heartbeat file and sets the instance timer less often."""
+    heartbeat_file = heartbeat.heartbeat_path(
+        instance_name=fake_instance.instance_name,
+        project=fake_instance.project,
+        remote=fake_instance.remote,
+    )
+    beats = []
+    fake_instance.config_set.side_effect = lambda *_: beats.append(
+        heartbeat.read(heartbeat_file)
+    )
+
+    timer = lxd.launcher.InstanceTimer(fake_instance, interval=0.01)
+    timer.start()
+    # wait for the file to be touched again after setting the instance timer
+    while heartbeat.read(heartbeat_file) in beats:
+        time.sleep(0.01)
+    timer.stop()
+
+    assert heartbeat_file.is_relative_to(fake_runtime_directory)
+    assert beats[0] is not None
+    fake_instance.config_set.assert_called_once_with(
+        "user.craft_providers.timer", mocker.ANY
+    )
+    assert not heartbeat_file.exists()
+
+
 def test_wait_for_instance_ready(fake_instance, logs):
     """Return if the instance is ready."""
     fake_instance.info.return_value = {
         "Status": lxd_instance_status.LXDInstanceState.STOPPED.value,
     }
-    fake_instance.config_get.return_value = "FINISHED"
+    fake_instance.config_snapshot.return_value = {
+        "user.craft_providers.status": "FINISHED"
+    }
 
     lxd.launcher._wait_for_instance_ready(fake_instance)
 
@@ -1408,8 +1700,10 @@ def test_wait_for_instance_pid_active(fake_instance, mocker):
     fake_instance.info.return_value = {
         "Status": lxd_instance_status.LXDInstanceState.STOPPED.value,
     }
-    # first call returns status, second returns the pid
-    fake_instance.config_get.side_effect = ["PREPARING", "123"]
+    fake_instance.config_snapshot.return_value = {
+        "user.craft_providers.status": "PREPARING",
+        "user.craft_providers.pid": "123",
+    }
     # mock for the call `Path("/proc/123").exists()
     mocker.patch.object(Path, "exists", return_value=True)
 
@@ -1425,8 +1719,10 @@ def test_wait_for_instance_skip_pid_check(platform, fake_instance, mocker, logs)
     fake_instance.info.return_value = {
         "Status": lxd_instance_status.LXDInstanceState.STOPPED.value,
     }
-    # first call returns status, second returns the pid
-    fake_instance.config_get.side_effect = ["PREPARING", "123"]
+    fake_instance.config_snapshot.return_value = {
+        "user.craft_providers.status": "PREPARING",
+        "user.craft_providers.pid": "123",
+    }
 
     lxd.launcher._wait_for_instance_ready(fake_instance)
 
@@ -1440,8 +1736,10 @@ def test_wait_for_instance_no_pid(fake_instance):
     fake_instance.info.return_value = {
         "Status": lxd_instance_status.LXDInstanceState.STOPPED.value,
     }
-    # first call returns status, second returns an empty string for the pid
-    fake_instance.config_get.side_effect = ["PREPARING", ""]
+    fake_instance.config_snapshot.return_value = {
+        "user.craft_providers.status": "PREPARING",
+        "user.craft_providers.pid": "",
+    }
 
     with pytest.raises(LXDError) as raised:
         lxd.launcher._wait_for_instance_ready(fake_instance)
@@ -1459,8 +1757,10 @@ def test_wait_for_instance_pid_inactive(fake_instance, mocker):
     fake_instance.info.return_value = {
         "Status": lxd_instance_status.LXDInstanceState.STOPPED.value,
     }
-    # first call returns status, second returns the pid
-    fake_instance.config_get.side_effect = ["PREPARING", "123"]
+    fake_instance.config_snapshot.return_value = {
+        "user.craft_providers.status": "PREPARING",
+        "user.craft_providers.pid": "123",
+    }
     # mock for the call `Path("/proc/123").exists()
     mocker.patch.object(Path, "exists", return_value=False)
 
@@ -1472,3 +1772,290 @@ def test_wait_for_instance_pid_inactive(fake_instance, mocker):
         "Instance 'test-instance-fa2d407652a1c51f6019' is not ready and "
         "the process (pid 123) that created the instance is inactive."
     )
+
+
+_BASE_INSTANCE_NAME = "base-instance-mock-compat-tag-v200-image-remote-image-name"
+
+
+class FakeFleet:
+    """Mock LXD instances, created on demand and stored by name."""
+
+    def __init__(self):
+        self.instances = {}
+        self.existing = set()
+
+    def __getitem__(self, name):
+        return self.instances[name]
+
+    def new_instance(self, *, name, **kwargs):
+        instance = MagicMock()
+        instance.name = name
+        instance.instance_name = name
+        instance.exists.return_value = name in self.existing
+        instance.is_running.return_value = False
+        self.instances[name] = instance
+        return instance
+
+
+@pytest.fixture
+def fleet(mocker):
+    fake_fleet = FakeFleet()
+    mocker.patch(
+        "craft_providers.lxd.launcher.LXDInstance", side_effect=fake_fleet.new_instance
+    )
+    return fake_fleet
+
+
+def _launch_many(names, base_configuration, lxc, **kwargs):
+    return list(
+        lxd.launch_many(
+            names,
+            base_configuration=base_configuration,
+            image_name="image-name",
+            image_remote="image-remote",
+            use_base_instance=True,
+            lxc=lxc,
+            **kwargs,
+        )
+    )
+
+
+def _executor_calls(base_configuration):
+    return sorted(
+        (method, kwargs["executor"].name)
+        for method, _, kwargs in base_configuration.mock_calls
+        if method != "get_command_environment"
+    )
+
+
+@pytest.mark.usefixtures(
+    "mock_platform", "mock_timezone", "mock_disable_timer_update_thread"
+)
+def test_launch_many_creates_base_instance_once(
+    fleet, mock_base_configuration, mock_lxc, mock_instance_lease
+):
+    names = ["instance-1", "instance-2", "instance-3"]
+
+    instances = _launch_many(names, mock_base_configuration, mock_lxc)
+
+    assert sorted(instance.name for instance in instances) == names
+    base_instance = fleet[_BASE_INSTANCE_NAME]
+    base_instance.launch.assert_called_once()
+    base_instance.stop.assert_called_once_with()
+    mock_instance_lease.assert_called_once()
+    assert mock_lxc.project_list.mock_calls == [call("local")]
+    for name in names:
+        assert fleet[name].mock_calls == [
+            call.exists(),
+            call.copy(source=base_instance),
+            call.is_running(),
+            call.start(),
+        ]
+    assert _executor_calls(mock_base_configuration) == [
+        ("setup", _BASE_INSTANCE_NAME),
+        ("setup_hostname", "instance-1"),
+        ("setup_hostname", "instance-2"),
+        ("setup_hostname", "instance-3"),
+        ("warmup", "instance-1"),
+        ("warmup", "instance-2"),
+        ("warmup", "instance-3"),
+    ]
+
+
+@pytest.mark.usefixtures("mock_platform", "mock_timezone")
+def test_launch_many_valid_base_instance(
+    fleet, mock_base_configuration, mock_lxc, mock_is_valid
+):
+    fleet.existing.add(_BASE_INSTANCE_NAME)
+
+    instances = _launch_many(
+        ["instance-1", "instance-2"], mock_base_configuration, mock_lxc
+    )
+
+    assert len(instances) == 2
+    mock_is_valid.assert_called_once_with(
+        instance=fleet[_BASE_INSTANCE_NAME], expiration=timedelta(days=90)
+    )
+    fleet[_BASE_INSTANCE_NAME].launch.assert_not_called()
+    assert _executor_calls(mock_base_configuration) == [
+        ("setup_hostname", "instance-1"),
+        ("setup_hostname", "instance-2"),
+        ("warmup", "instance-1"),
+        ("warmup", "instance-2"),
+    ]
+
+
+@pytest.mark.usefixtures(
+    "mock_platform", "mock_timezone", "mock_disable_timer_update_thread"
+)
+def test_launch_many_invalid_base_instance(
+    fleet, mock_base_configuration, mock_lxc, mock_is_valid
+):
+    fleet.existing.add(_BASE_INSTANCE_NAME)
+    mock_is_valid.return_value = False
+
+    _launch_many(["instance-1"], mock_base_configuration, mock_lxc)
+
+    base_instance = fleet[_BASE_INSTANCE_NAME]
+    base_instance.delete.assert_called_once_with()
+    base_instance.launch.assert_called_once()
+
+
+@pytest.mark.usefixtures("mock_platform", "mock_timezone", "mock_check_id_map")
+def test_launch_many_existing_instance(
+    fleet, mock_base_configuration, mock_lxc, mock_is_valid
+):
+    fleet.existing.update({_BASE_INSTANCE_NAME, "instance-1"})
+
+    _launch_many(["instance-1", "instance-2"], mock_base_configuration, mock_lxc)
+
+    fleet["instance-1"].copy.assert_not_called()
+    fleet["instance-1"].start.assert_called_once_with()
+    fleet["instance-2"].copy.assert_called_once_with(source=fleet[_BASE_INSTANCE_NAME])
+
+
+@pytest.mark.usefixtures("mock_platform", "mock_timezone")
+def test_launch_many_concurrent(
+    fleet, mock_base_configuration, mock_lxc, mock_is_valid
+):
+    """The instances are started at the same time."""
+    fleet.existing.add(_BASE_INSTANCE_NAME)
+    barrier = threading.Barrier(3, timeout=5)
+    mock_base_configuration.warmup.side_effect = lambda executor: barrier.wait()
+
+    instances = _launch_many(
+        ["instance-1", "instance-2", "instance-3"],
+        mock_base_configuration,
+        mock_lxc,
+        max_workers=3,
+    )
+
+    assert len(instances) == 3
+
+
+@pytest.mark.usefixtures("mock_platform", "mock_timezone")
+def test_launch_many_error(fleet, mock_base_configuration, mock_lxc, mock_is_valid):
+    """Instances ready before an instance fails are yielded, then the error raised."""
+    fleet.existing.add(_BASE_INSTANCE_NAME)
+
+    def warmup(executor):
+        if executor.name == "instance-2":
+            raise LXDError("failed")
+
+    mock_base_configuration.warmup.side_effect = warmup
+    instances = lxd.launch_many(
+        ["instance-1", "instance-2"],
+        base_configuration=mock_base_configuration,
+        image_name="image-name",
+        image_remote="image-remote",
+        use_base_instance=True,
+        lxc=mock_lxc,
+        max_workers=1,
+    )
+
+    assert next(instances) is fleet["instance-1"]
+    with pytest.raises(LXDError, match="failed"):
+        next(instances)
+
+
+@pytest.mark.usefixtures(
+    "mock_platform", "mock_timezone", "mock_disable_timer_update_thread"
+)
+def test_launch_many_history(fleet, mock_base_configuration, mock_lxc, tmp_path):
+    """Each launch is recorded, and the first one includes the base instance."""
+
+    def setup(executor, **_kwargs):
+        [observer] = executor.add_phase_observer.call_args.args
+        observer(PhaseEvent("setup_os", PhaseEventType.END, timestamp=0.0, duration=2))
+
+    mock_base_configuration.setup.side_effect = setup
+    history = LaunchHistory(tmp_path / "history.sqlite3")
+
+    _launch_many(
+        ["instance-1", "instance-2"],
+        mock_base_configuration,
+        mock_lxc,
+        history=history,
+    )
+
+    records = {record.instance_name: record for record in history.query()}
+    assert records["instance-1"].path == LaunchPath.BASE_CREATED
+    assert records["instance-1"].phase_durations == {"setup_os": 2}
+    assert records["instance-2"].path == LaunchPath.BASE_COPIED
+    assert records["instance-2"].phase_durations == {}
+    assert all(record.success for record in records.values())
+    assert {record.base_instance_name for record in records.values()} == {
+        _BASE_INSTANCE_NAME
+    }
+    mock_base_configuration.add_phase_observer.assert_not_called()
+
+
+def test_launch_many_name_matches_base_instance(
+    fleet, mock_base_configuration, mock_lxc
+):
+    """The names are checked when called, before the iterator is consumed."""
+    with pytest.raises(ProviderError) as raised:
+        lxd.launch_many(
+            ["instance-1", _BASE_INSTANCE_NAME],
+            base_configuration=mock_base_configuration,
+            image_name="image-name",
+            image_remote="image-remote",
+            use_base_instance=True,
+            lxc=mock_lxc,
+        )
+
+    assert raised.value.brief == (
+        f"instance name cannot match the base instance name: {_BASE_INSTANCE_NAME!r}"
+    )
+    fleet[_BASE_INSTANCE_NAME].launch.assert_not_called()
+
+
+@pytest.mark.parametrize("use_base_instance", [True, False])
+def test_launch_many_duplicate_names(
+    fleet, mock_base_configuration, mock_lxc, use_base_instance
+):
+    """Repeated names are rejected before anything is launched."""
+    with pytest.raises(ProviderError) as raised:
+        lxd.launch_many(
+            ["instance-1", "instance-2", "instance-1"],
+            base_configuration=mock_base_configuration,
+            image_name="image-name",
+            image_remote="image-remote",
+            use_base_instance=use_base_instance,
+            lxc=mock_lxc,
+        )
+
+    assert raised.value.brief == "instance names must be unique: instance-1"
+    mock_lxc.project_list.assert_not_called()
+    assert fleet.instances == {}
+
+
+def test_launch_many_no_base_instance(mock_base_configuration, mock_lxc, mocker):
+    mock_launch = mocker.patch("craft_providers.lxd.launcher.launch")
+    mock_launch.side_effect = lambda name, **kwargs: name
+
+    instances = lxd.launch_many(
+        ["instance-1", "instance-2"],
+        base_configuration=mock_base_configuration,
+        image_name="image-name",
+        image_remote="image-remote",
+        project="test-project",
+        lxc=mock_lxc,
+    )
+
+    assert sorted(instances) == ["instance-1", "instance-2"]
+    assert mock_launch.call_count == 2
+    assert mock_launch.mock_calls[0].kwargs == {
+        "base_configuration": mock_base_configuration,
+        "image_name": "image-name",
+        "image_remote": "image-remote",
+        "auto_clean": False,
+        "map_user_uid": False,
+        "uid": None,
+        "gid": None,
+        "project": "test-project",
+        "remote": "local",
+        "lxc": mock_lxc,
+        "prepare_instance": None,
+        "history": None,
+    }
@@ -0,0 +1,398 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+import fcntl
+import pathlib
+import threading
+import time
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from craft_providers.lxd import LXC, LXDError, lease
+from craft_providers.lxd.lease import HostLease, Lease, ProjectLease
+
+
+@pytest.fixture(autouse=True)
+def fast_checks(monkeypatch):
+    monkeypatch.setattr(lease, "LEASE_CHECK_INTERVAL", 0.01)
+
+
+@pytest.fixture
+def host_lease(tmp_path):
+    def _host_lease(**kwargs):
+        return HostLease(
+            instance_name="base-instance",
+            project="default",
+            remote="local",
+            directory=tmp_path,
+            **kwargs,
+        )
+
+    return _host_lease
+
+
+class FakeProfiles:
+    """Profiles of a fake LXD, which are created and renamed atomically."""
+
+    def __init__(self):
+        self.profiles = {}
+        self.lxc = mock.Mock(spec=LXC)
+        self.lxc.monitor.return_value = None
+        self.lxc.profile_create.side_effect = self.create
+        self.lxc.profile_delete.side_effect = self.delete
+        self.lxc.profile_edit.side_effect = self.edit
+        self.lxc.profile_rename.side_effect = self.rename
+        self.lxc.profile_show.side_effect = self.show
+
+    @property
+    def lease(self):
+        profile = self.profiles.get("craft-providers-lease-base-instance")
+        return profile and profile["config"]["user.craft_providers.lease"]
+
+    @lease.setter
+    def lease(self, value):
+        self.profiles["craft-providers-lease-base-instance"] = {
+            "config": {"user.craft_providers.lease": value}
+        }
+
+    def create(self, *, profile, config, project, remote):
+        if profile in self.profiles:
+            return False
+        self.profiles[profile] = {"config": config}
+        return True
+
+    def delete(self, *, profile, project, remote):
+        del self.profiles[profile]
+
+    def edit(self, *, profile, config, project, remote):
+        self.profiles[profile] = config
+
+    def rename(self, *, profile, new_name, project, remote):
+        if profile not in self.profiles or new_name in self.profiles:
+            return False
+        self.profiles[new_name] = self.profiles.pop(profile)
+        return True
+
+    def show(self, *, profile, project, remote):
+        if profile not in self.profiles:
+            raise LXDError(f"Failed to show profile {profile!r}.")
+        return self.profiles[profile]
+
+
+@pytest.fixture
+def profiles():
+    return FakeProfiles()
+
+
+@pytest.fixture
+def project_lease(profiles):
+    def _project_lease(**kwargs):
+        return ProjectLease(
+            lxc=profiles.lxc,
+            instance_name="base-instance",
+            project="default",
+            remote="remote",
+            **kwargs,
+        )
+
+    return _project_lease
+
+
+def _in_thread(function):
+    thread = threading.Thread(target=function, daemon=True)
+    thread.start()
+    return thread
+
+
+def _wait_for_holder(leases):
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        for held in leases:
+            if held.held:
+                return held
+        time.sleep(0.01)
+    raise AssertionError("No lease was taken.")
+
+
+def test_lease_round_trip():
+    held = Lease(owner="host:42", expires=time.time() + 60)
+
+    assert Lease.loads(held.dumps()) == held
+    assert not held.is_expired()
+    assert Lease(owner="host:42", expires=time.time() - 1).is_expired()
+
+
+@pytest.mark.parametrize("data", ["", "{", "[]", '{"owner": "host:42"}'])
+def test_lease_loads_invalid(data):
+    assert Lease.loads(data) is None
+
+
+def test_default_lease_directory(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+    assert lease.default_lease_directory() == tmp_path / "craft-providers" / "leases"
+
+
+def test_default_lease_directory_no_runtime_dir(monkeypatch, tmp_path):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert lease.default_lease_directory() == tmp_path / "craft-providers" / "leases"
+
+
+def test_instance_lease_local(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+    instance_lease = lease.instance_lease(
+        lxc=LXC(), instance_name="base-instance", project="default", remote="local"
+    )
+
+    assert isinstance(instance_lease, HostLease)
+    assert instance_lease.path == (
+        tmp_path / "craft-providers" / "leases" / "local-default-base-instance.lease"
+    )
+
+
+def test_instance_lease_remote():
+    lxc = LXC()
+
+    instance_lease = lease.instance_lease(
+        lxc=lxc, instance_name="base-instance", project="default", remote="remote"
+    )
+
+    assert isinstance(instance_lease, ProjectLease)
+    assert instance_lease.lxc is lxc
+    assert instance_lease.profile == "craft-providers-lease-base-instance"
+
+
+def test_host_lease(host_lease):
+    with host_lease(owner="host:42") as held:
+        assert held.held
+        assert held.read() == held.lease
+        assert held.lease is not None
+        assert held.lease.owner == "host:42"
+
+    assert not held.held
+    # releasing again is a no-op
+    held.release()
+
+
+def test_host_lease_waits_for_release(host_lease):
+    first = host_lease(owner="host:1")
+    second = host_lease(owner="host:2")
+    first.acquire()
+
+    waiter = _in_thread(second.acquire)
+    waiter.join(timeout=0.1)
+    assert waiter.is_alive()
+
+    first.release()
+    waiter.join(timeout=5)
+    assert second.held
+    assert second.read() == second.lease
+    second.release()
+
+
+def test_host_lease_takes_over_expired(host_lease, logs):
+    """A waiter takes over the lease once it expires while its owner is stuck."""
+    stuck = host_lease(owner="host:1", duration=timedelta(seconds=60))
+    stuck.acquire()
+    # the owner stops renewing the lease
+    stuck._released.set()
+    stuck_file = stuck._file
+    assert stuck_file is not None
+    stuck_file.seek(0)
+    stuck_file.truncate()
+    stuck_file.write(Lease(owner="host:1", expires=time.time() - 1).dumps())
+    stuck_file.flush()
+
+    with host_lease(owner="host:2") as held:
+        assert held.held
+        assert held.read() == held.lease
+
+        # the stuck owner finds the lease lost when it resumes
+        stuck.renew()
+        assert (
+            "Lost the lease on instance 'base-instance' to another process."
+            in logs.warning
+        )
+        assert held.read() == held.lease
+
+    stuck.release()
+
+
+def test_host_lease_takeover_once(host_lease):
+    """A single waiter takes over an expired lease."""
+    holder = host_lease()
+    holder.path.parent.mkdir(parents=True, exist_ok=True)
+    with holder.path.open("w") as stuck:
+        fcntl.flock(stuck, fcntl.LOCK_EX)
+        stuck.write(Lease(owner="host:1", expires=time.time() - 1).dumps())
+        stuck.flush()
+
+        waiters = [host_lease(owner=f"host:{i}") for i in range(2, 5)]
+        threads = [_in_thread(waiter.acquire) for waiter in waiters]
+
+        # the waiters hold the lease one at a time
+        for _ in waiters:
+            holder = _wait_for_holder(waiters)
+            time.sleep(0.05)
+            assert [waiter for waiter in waiters if waiter.held] == [holder]
+            holder.release()
+            waiters.remove(holder)
+
+    for thread in threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+
+def test_host_lease_renewed(host_lease):
+    with host_lease(duration=timedelta(seconds=0.03)) as held:
+        assert held.lease is not None
+        expires = held.lease.expires
+        time.sleep(0.1)
+
+        renewed = held.read()
+        assert renewed is not None
+        assert renewed.expires > expires
+
+
+def test_project_lease(project_lease, profiles):
+    with project_lease(owner="host:42") as held:
+        stored = Lease.loads(profiles.lease)
+        assert stored == held.lease
+        assert stored is not None
+        assert stored.owner == "host:42"
+
+    assert profiles.profiles == {}
+
+
+def test_project_lease_waits_for_release(project_lease):
+    first = project_lease(owner="host:1")
+    second = project_lease(owner="host:2")
+    first.acquire()
+
+    waiter = _in_thread(second.acquire)
+    waiter.join(timeout=0.1)
+    assert waiter.is_alive()
+
+    first.release()
+    waiter.join(timeout=5)
+    assert second.held
+    second.release()
+
+
+def test_project_lease_waits_for_event(project_lease, profiles):
+    """Waiters check the lease again on each event about the instance."""
+    profiles.lease = Lease(owner="host:1", expires=time.time() + 60).dumps()
+    events = []
+
+    def wait(instance_name, condition, **kwargs):
+        events.append(instance_name)
+        if len(events) > 1:
+            # the holder released the lease
+            profiles.profiles.clear()
+        return condition()
+
+    monitor = profiles.lxc.monitor.return_value = mock.Mock()
+    monitor.wait.side_effect = wait
+
+    with project_lease() as held:
+        assert held.held
+
+    assert events == ["base-instance", "base-instance"]
+
+
+def test_project_lease_takes_over_expired(project_lease, profiles):
+    profiles.lease = Lease(owner="host:1", expires=time.time() - 1).dumps()
+
+    with project_lease(owner="host:2") as held:
+        stored = Lease.loads(profiles.lease)
+        assert stored is not None
+        assert stored.owner == "host:2"
+        assert held.held
+
+    assert profiles.profiles == {}
+
+
+def test_project_lease_takeover_race(project_lease, profiles):
+    """An expired lease renewed by another waiter meanwhile is given back."""
+    expired = Lease(owner="host:1", expires=time.time() - 1).dumps()
+    renewed = Lease(owner="host:3", expires=time.time() + 60).dumps()
+    profiles.lease = expired
+    rename = profiles.rename
+
+    def _rename(**kwargs):
+        # another waiter took over the lease before this one removes it
+        if kwargs["profile"] == "craft-providers-lease-base-instance":
+            profiles.lease = renewed
+        return rename(**kwargs)
+
+    profiles.lxc.profile_rename.side_effect = _rename
+    waiter = project_lease(owner="host:2")
+
+    assert not waiter._try_acquire()
+    assert not waiter.held
+    assert list(profiles.profiles) == ["craft-providers-lease-base-instance"]
+    assert profiles.lease == renewed
+
+
+def test_project_lease_lost(project_lease, profiles, logs):
+    held = project_lease(owner="host:1")
+    held.acquire()
+    profiles.lease = "taken over"
+
+    held.renew()
+
+    assert (
+        "Lost the lease on instance 'base-instance' to another process." in logs.warning
+    )
+    held.release()
+    # the lease of the other owner is kept
+    assert profiles.lease == "taken over"
+
+
+def test_project_lease_renewed(project_lease, profiles):
+    held = project_lease()
+    held.acquire()
+
+    held.renew()
+
+    profiles.lxc.profile_edit.assert_called_once()
+    assert held.lease is not None
+    assert profiles.lease == held.lease.dumps()
+    held.release()
+
+
+def test_project_lease_renew_error(project_lease, profiles):
+    held = project_lease()
+    held.acquire()
+    lease_before = held.lease
+    profiles.lxc.profile_edit.side_effect = LXDError("error")
+
+    held.renew()
+
+    assert held.lease == lease_before
+    held.release()
+    assert held.lease is None
+
+
+def test_lease_file_name(host_lease, tmp_path):
+    assert host_lease().path == pathlib.Path(
+        tmp_path, "local-default-base-instance.lease"
+    )
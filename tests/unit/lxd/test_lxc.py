@@ -14,16 +14,23 @@
 # along with this program; if not, write to the Free Software Foundation,
 # Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 #
+import itertools
+import json
 import pathlib
 import re
 import subprocess
+import threading
+import time
+from collections import Counter
 from textwrap import dedent
 from unittest.mock import call
 
 import pytest
+import yaml
 from craft_providers.lxd import LXC, LXDError, lxc
 from craft_providers.lxd.lxc import StdinType
 from craft_providers.lxd.lxd_instance_status import LXDInstanceState
+from craft_providers.lxd.lxd_monitor import LXDMonitor
 from freezegun import freeze_time
 
 
@@ -348,6 +355,150 @@ def test_config_get_error(fake_process):
         )
 
 
+@pytest.mark.parametrize(
+    ("keys", "expected"),
+    [
+        (
+            ["raw.idmap", "user.craft_providers.status", "environment.TZ"],
+            {
+                "raw.idmap": "uid 1000 0\ngid 1000 0",
+                "user.craft_providers.status": "FINISHED",
+                "environment.TZ": "",
+            },
+        ),
+        (
+            None,
+            {
+                "raw.idmap": "uid 1000 0\ngid 1000 0",
+                "user.craft_providers.status": "FINISHED",
+                "user.craft_providers.pid": "123",
+            },
+        ),
+    ],
+)
+def test_config_get_many(fake_process, keys, expected):
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "--project",
+            "test-project",
+            "config",
+            "show",
+            "test-remote:test-instance",
+        ],
+        stdout=dedent(
+            """\
+            architecture: x86_64
+            config:
+              raw.idmap: |-
+                uid 1000 0
+                gid 1000 0
+              user.craft_providers.status: FINISHED
+              user.craft_providers.pid: "123"
+            devices: {}
+            ephemeral: false
+            profiles:
+            - default
+            """
+        ),
+    )
+
+    config = LXC().config_get_many(
+        instance_name="test-instance",
+        keys=keys,
+        project="test-project",
+        remote="test-remote",
+    )
+
+    assert config == expected
+    assert len(fake_process.calls) == 1
+
+
+def test_config_get_many_error(fake_process):
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "--project",
+            "test-project",
+            "config",
+            "show",
+            "test-remote:test-instance",
+        ],
+        returncode=1,
+    )
+
+    with pytest.raises(
+        LXDError, match="Failed to get config for instance 'test-instance'."
+    ):
+        LXC().config_get_many(
+            instance_name="test-instance",
+            keys=["test-key"],
+            project="test-project",
+            remote="test-remote",
+        )
+
+
+def test_config_set_many(fake_process):
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "--project",
+            "test-project",
+            "config",
+            "set",
+            "test-remote:test-instance",
+            "environment.TZ=Europe/London",
+            "user.craft_providers.status=FINISHED",
+        ],
+    )
+
+    LXC().config_set_many(
+        instance_name="test-instance",
+        config={
+            "environment.TZ": "Europe/London",
+            "user.craft_providers.status": "FINISHED",
+        },
+        project="test-project",
+        remote="test-remote",
+    )
+
+    assert len(fake_process.calls) == 1
+
+
+def test_config_set_many_empty(fake_process):
+    LXC().config_set_many(instance_name="test-instance", config={})
+
+    assert len(fake_process.calls) == 0
+
+
+def test_config_set_many_error(fake_process):
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "--project",
+            "test-project",
+            "config",
+            "set",
+            "test-remote:test-instance",
+            "test-key=test-value",
+        ],
+        returncode=1,
+    )
+
+    with pytest.raises(
+        LXDError,
+        match=re.escape(
+            "Failed to set config keys ['test-key'] for instance 'test-instance'."
+        ),
+    ):
+        LXC().config_set_many(
+            instance_name="test-instance",
+            config={"test-key": "test-value"},
+            project="test-project",
+            remote="test-remote",
+        )
+
+
 def test_config_set(fake_process):
     fake_process.register_subprocess(
         [
@@ -590,6 +741,71 @@ def test_exec_all_opts(fake_process):
     assert len(fake_process.calls) == 1
 
 
+def test_exec_traced(fake_process, tracer):
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "--project",
+            "test-project",
+            "exec",
+            "test-remote:test-instance",
+            "--",
+            "echo",
+            "hi",
+        ],
+        stdout=b"hi\n",
+    )
+
+    LXC().exec(
+        instance_name="test-instance",
+        project="test-project",
+        remote="test-remote",
+        command=["echo", "hi"],
+        capture_output=True,
+    )
+
+    [event] = tracer.events
+    assert event.name == "lxc exec"
+    assert event.instance == "test-instance"
+    assert event.exit_code == 0
+    assert event.bytes_out == 3
+
+
+@pytest.mark.parametrize(
+    ("command", "name", "instance"),
+    [
+        (["list", "--format", "json"], "lxc list", None),
+        (["delete", "test-remote:test-instance"], "lxc delete", "test-instance"),
+        (
+            ["config", "set", "test-remote:test-instance", "key", "a:b"],
+            "lxc config set",
+            "test-instance",
+        ),
+        (
+            ["file", "push", "/src", "test-remote:test-instance/dst"],
+            "lxc file push",
+            "test-instance",
+        ),
+        (
+            ["launch", "image-remote:image", "test-remote:test-instance"],
+            "lxc launch",
+            "test-instance",
+        ),
+        (["image", "delete", "test-remote:image"], "lxc image delete", None),
+    ],
+)
+def test_run_lxc_traced(fake_process, tracer, command, name, instance):
+    fake_process.register_subprocess(["lxc", *command])
+
+    LXC()._run_lxc(command, capture_output=True)
+
+    [event] = tracer.events
+    assert event.category == "lxc"
+    assert event.name == name
+    assert event.instance == instance
+    assert event.command == ["lxc", *command]
+
+
 def test_exec_error(fake_process):
     fake_process.register_subprocess(
         [
@@ -698,6 +914,92 @@ def test_file_pull_error(fake_process, tmp_path):
         )
 
 
+def test_file_pull_not_found(fake_process, tmp_path):
+    source = pathlib.PurePosixPath("/root/foo")
+
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "--project",
+            "test-project",
+            "file",
+            "pull",
+            "test-remote:test-instance/root/foo",
+            tmp_path.as_posix(),
+        ],
+        stderr="Error: Not Found",
+        returncode=1,
+    )
+
+    with pytest.raises(FileNotFoundError, match="File not found: '/root/foo'"):
+        LXC().file_pull(
+            instance_name="test-instance",
+            project="test-project",
+            remote="test-remote",
+            source=source,
+            destination=tmp_path,
+        )
+
+
+def test_file_read(fake_process):
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "--project",
+            "test-project",
+            "file",
+            "pull",
+            "test-remote:test-instance/root/foo",
+            "-",
+        ],
+        stdout=b"content",
+    )
+
+    content = LXC().file_read(
+        instance_name="test-instance",
+        project="test-project",
+        remote="test-remote",
+        source=pathlib.PurePosixPath("/root/foo"),
+    )
+
+    assert content == b"content"
+    assert len(fake_process.calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("stderr", "error"),
+    [
+        ("Error: Not Found", FileNotFoundError),
+        ("Error: open /root/foo: no such file or directory", FileNotFoundError),
+        ("Error: Forbidden", LXDError),
+        ("Error: Instance not found", LXDError),
+        ("Error: Project not found", LXDError),
+    ],
+)
+def test_file_read_error(fake_process, stderr, error):
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "--project",
+            "test-project",
+            "file",
+            "pull",
+            "test-remote:test-instance/root/foo",
+            "-",
+        ],
+        stderr=stderr,
+        returncode=1,
+    )
+
+    with pytest.raises(error):
+        LXC().file_read(
+            instance_name="test-instance",
+            project="test-project",
+            remote="test-remote",
+            source=pathlib.PurePosixPath("/root/foo"),
+        )
+
+
 def test_file_push(fake_process, tmp_path):
     destination = pathlib.PurePosixPath("/root/foo")
 
@@ -788,14 +1090,8 @@ def test_file_push_error(fake_process):
 
 def test_info(fake_process):
     fake_process.register_subprocess(
-        [
-            "lxc",
-            "--project",
-            "test-project",
-            "info",
-            "test-remote:",
-        ],
-        stdout="config: {}\napi_extensions:\n - foo\n",
+        ["lxc", "query", "test-remote:/1.0?project=test-project"],
+        stdout='{"config": {}, "api_extensions": ["foo"], "public": false}',
     )
 
     info = LXC().info(
@@ -804,7 +1100,7 @@ def test_info(fake_process):
     )
 
     assert len(fake_process.calls) == 1
-    assert info == {"config": {}, "api_extensions": ["foo"]}
+    assert info == {"config": {}, "api_extensions": ["foo"], "public": "false"}
 
 
 def test_info_with_instance(fake_process):
@@ -816,7 +1112,20 @@ def test_info_with_instance(fake_process):
             "info",
             "test-remote:test-instance",
         ],
-        stdout="Name: test-instance\nLocation: none\n",
+        stdout=dedent(
+            """\
+            Name: test-instance
+            Status: RUNNING
+            Type: container
+            Architecture: x86_64
+            PID: 1234
+            Created: 2023/01/02 03:04 UTC
+            Last Used: 2023/01/02 04:05 UTC
+
+            Resources:
+              Processes: 42
+            """
+        ),
     )
 
     info = LXC().info(
@@ -826,18 +1135,41 @@ def test_info_with_instance(fake_process):
     )
 
     assert len(fake_process.calls) == 1
-    assert info == {"Name": "test-instance", "Location": "none"}
+    assert info == {
+        "Name": "test-instance",
+        "Status": "RUNNING",
+        "Type": "container",
+        "Architecture": "x86_64",
+        "PID": "1234",
+        "Created": "2023/01/02 03:04 UTC",
+        "Last Used": "2023/01/02 04:05 UTC",
+        "Resources": {"Processes": "42"},
+    }
 
 
-def test_info_error(fake_process):
+def test_info_with_instance_parse_error(fake_process):
     fake_process.register_subprocess(
         [
             "lxc",
             "--project",
             "test-project",
             "info",
-            "test-remote:",
+            "test-remote:test-instance",
         ],
+        stdout="fail:\nthis\n",
+    )
+
+    with pytest.raises(LXDError, match="Failed to parse lxc info."):
+        LXC().info(
+            project="test-project",
+            remote="test-remote",
+            instance_name="test-instance",
+        )
+
+
+def test_info_error(fake_process):
+    fake_process.register_subprocess(
+        ["lxc", "query", "test-remote:/1.0?project=test-project"],
         returncode=1,
     )
 
@@ -848,16 +1180,11 @@ def test_info_error(fake_process):
         )
 
 
-def test_info_parse_error(fake_process):
+@pytest.mark.parametrize("stdout", ["fail:\nthis\n", "[]"])
+def test_info_parse_error(fake_process, stdout):
     fake_process.register_subprocess(
-        [
-            "lxc",
-            "--project",
-            "test-project",
-            "info",
-            "test-remote:",
-        ],
-        stdout="fail:\nthis\n",
+        ["lxc", "query", "test-remote:/1.0?project=test-project"],
+        stdout=stdout,
     )
 
     with pytest.raises(LXDError) as exc_info:
@@ -869,8 +1196,9 @@ def test_info_parse_error(fake_process):
     assert exc_info.value == LXDError(
         brief="Failed to parse lxc info.",
         details=(
-            "* Command that failed: 'lxc --project test-project info test-remote:'\n"
-            "* Command output: 'fail:\\nthis\\n'"
+            "* Command that failed: "
+            "\"lxc query 'test-remote:/1.0?project=test-project'\"\n"
+            f"* Command output: {stdout!r}"
         ),
     )
 
@@ -1221,30 +1549,7 @@ def test_check_instance_status(fake_process):
             "test-remote:test-instance",
         ],
         returncode=0,
-        stdout=dedent(
-            """\
-            Name: test-instance
-            Status: STOPPED
-            Type: container
-            Architecture: x86_64
-            Created: 2023/08/02 14:04 EDT
-            Last Used: 2023/08/08 09:44 EDT
-            """
-        ),
-    )
-
-    fake_process.register_subprocess(
-        [
-            "lxc",
-            "--project",
-            "test-project",
-            "config",
-            "get",
-            "test-remote:test-instance",
-            "user.craft_providers.status",
-        ],
-        returncode=0,
-        stdout="FINISHED",
+        stdout="Name: test-instance\nStatus: STOPPED\n",
     )
 
     fake_process.register_subprocess(
@@ -1253,12 +1558,20 @@ def test_check_instance_status(fake_process):
             "--project",
             "test-project",
             "config",
-            "get",
+            "show",
             "test-remote:test-instance",
-            "user.craft_providers.timer",
         ],
         returncode=0,
-        stdout="2023-01-01T00:00:00+00:00",
+        stdout=dedent(
+            """\
+            architecture: x86_64
+            config:
+              user.craft_providers.status: FINISHED
+              user.craft_providers.timer: "2023-01-01T00:00:00+00:00"
+            devices: {}
+            ephemeral: false
+            """
+        ),
     )
 
     LXC().check_instance_status(
@@ -1275,12 +1588,16 @@ def test_check_instance_status_retry(fake_process, mocker):
         {"Status": LXDInstanceState.STOPPED.value},
         {"Status": LXDInstanceState.STOPPED.value},
     ]
-    mock_instance_config = mocker.patch("craft_providers.lxd.lxc.LXC.config_get")
+    mock_instance_config = mocker.patch("craft_providers.lxd.lxc.LXC.config_get_many")
     mock_instance_config.side_effect = [
-        "STARTING",
-        "10",
-        "FINISHED",
-        "20",
+        {
+            "user.craft_providers.status": "STARTING",
+            "user.craft_providers.timer": "10",
+        },
+        {
+            "user.craft_providers.status": "FINISHED",
+            "user.craft_providers.timer": "20",
+        },
     ]
 
     LXC().check_instance_status(
@@ -1288,16 +1605,53 @@ def test_check_instance_status_retry(fake_process, mocker):
     )
 
 
+def test_check_instance_status_wait_for_events(fake_process, mocker):
+    """Check the instance again when an event arrives instead of sleeping."""
+    mock_sleep = mocker.patch("time.sleep")
+    mock_monitor = mocker.Mock(spec=LXDMonitor)
+    mock_monitor.is_alive = True
+    mock_monitor.generation.side_effect = [0, 1]
+    mocker.patch("craft_providers.lxd.lxc.LXC.monitor", return_value=mock_monitor)
+    mocker.patch(
+        "craft_providers.lxd.lxc.LXC.info",
+        return_value={"Status": LXDInstanceState.STOPPED.value},
+    )
+    mocker.patch(
+        "craft_providers.lxd.lxc.LXC.config_get_many",
+        side_effect=[
+            {
+                "user.craft_providers.status": "PREPARING",
+                "user.craft_providers.timer": "10",
+            },
+            {
+                "user.craft_providers.status": "FINISHED",
+                "user.craft_providers.timer": "DONE",
+            },
+        ],
+    )
+
+    LXC().check_instance_status(
+        instance_name="test-instance", project="test-project", remote="test-remote"
+    )
+
+    mock_monitor.wait_for_event.assert_called_once_with(
+        "test-instance", since=0, timeout=3
+    )
+    mock_sleep.assert_not_called()
+
+
 def test_check_instance_status_boot_failed(fake_process, mocker):
-    time_time = mocker.patch("time.time")
-    time_time.return_value = 0
+    # each check of the time takes 10 seconds
+    mocker.patch("time.monotonic", side_effect=itertools.count(step=10))
     mocker.patch("time.sleep")
     mock_instance = mocker.patch("craft_providers.lxd.lxc.LXC.info")
     mock_instance.return_value = {"Status": LXDInstanceState.STOPPED.value}
-    mock_instance_config = mocker.patch("craft_providers.lxd.lxc.LXC.config_get")
+    mock_instance_config = mocker.patch("craft_providers.lxd.lxc.LXC.config_get_many")
     mock_instance_config.side_effect = [
-        "STARTING",
-        "2023-01-01T00:00:00+00:00",
+        {
+            "user.craft_providers.status": "STARTING",
+            "user.craft_providers.timer": "2023-01-01T00:00:00+00:00",
+        },
     ] * 20
 
     with pytest.raises(LXDError):
@@ -1306,6 +1660,41 @@ def test_check_instance_status_boot_failed(fake_process, mocker):
         )
 
 
+def test_check_instance_status_heartbeat_file(fake_process, mocker):
+    """Keep waiting while the heartbeat file is updated, even if the timer is not."""
+    mocker.patch("time.monotonic", side_effect=itertools.count(step=10))
+    mocker.patch("time.sleep")
+    mocker.patch(
+        "craft_providers.lxd.lxc.LXC.info",
+        return_value={"Status": LXDInstanceState.STOPPED.value},
+    )
+    mocker.patch(
+        "craft_providers.lxd.lxc.LXC.config_get_many",
+        side_effect=[
+            {
+                "user.craft_providers.status": "PREPARING",
+                "user.craft_providers.timer": "2023-01-01T00:00:00+00:00",
+            }
+        ]
+        * 10
+        + [
+            {
+                "user.craft_providers.status": "FINISHED",
+                "user.craft_providers.timer": "DONE",
+            }
+        ],
+    )
+    mock_read = mocker.patch(
+        "craft_providers.lxd.heartbeat.read", side_effect=itertools.count()
+    )
+
+    LXC().check_instance_status(
+        instance_name="test-instance", project="test-project", remote="test-remote"
+    )
+
+    assert mock_read.call_count == 11
+
+
 def test_check_instance_status_wait(fake_process, mocker):
     time_time = mocker.patch("time.time")
     time_time.return_value = 0
@@ -1319,27 +1708,39 @@ def test_check_instance_status_wait(fake_process, mocker):
         {"Status": LXDInstanceState.RUNNING.value},  # FINISHED
         {"Status": LXDInstanceState.STOPPED.value},  # FINISHED
     ]
-    mock_instance_config = mocker.patch("craft_providers.lxd.lxc.LXC.config_get")
+    mock_instance_config = mocker.patch("craft_providers.lxd.lxc.LXC.config_get_many")
     mock_instance_config.side_effect = [
-        "STARTING",
-        "2023-01-01T00:00:00+00:00",
-        "STARTING",
-        "2023-01-01T00:00:05+00:00",
-        "PREPARING",
-        "2023-01-01T00:00:10+00:00",
-        "PREPARING",
-        "2023-01-01T00:00:15+00:00",
-        "FINISHED",
-        "2023-01-01T00:00:20+00:00",
-        "FINISHED",
-        "2023-01-01T00:00:30+00:00",
+        {
+            "user.craft_providers.status": "STARTING",
+            "user.craft_providers.timer": "2023-01-01T00:00:00+00:00",
+        },
+        {
+            "user.craft_providers.status": "STARTING",
+            "user.craft_providers.timer": "2023-01-01T00:00:05+00:00",
+        },
+        {
+            "user.craft_providers.status": "PREPARING",
+            "user.craft_providers.timer": "2023-01-01T00:00:10+00:00",
+        },
+        {
+            "user.craft_providers.status": "PREPARING",
+            "user.craft_providers.timer": "2023-01-01T00:00:15+00:00",
+        },
+        {
+            "user.craft_providers.status": "FINISHED",
+            "user.craft_providers.timer": "2023-01-01T00:00:20+00:00",
+        },
+        {
+            "user.craft_providers.status": "FINISHED",
+            "user.craft_providers.timer": "2023-01-01T00:00:30+00:00",
+        },
     ]
 
     LXC().check_instance_status(
         instance_name="test-instance", project="test-project", remote="test-remote"
     )
     assert mock_instance.call_count == 6
-    assert mock_instance_config.call_count == 12
+    assert mock_instance_config.call_count == 6
 
 
 def test_check_instance_status_lxd_error(fake_process, mocker):
@@ -1356,31 +1757,7 @@ def test_check_instance_status_lxd_error(fake_process, mocker):
             "test-remote:test-instance",
         ],
         returncode=0,
-        stdout=dedent(
-            """\
-            Name: test-instance
-            Status: STOPPED
-            Type: container
-            Architecture: x86_64
-            Created: 2023/08/02 14:04 EDT
-            Last Used: 2023/08/08 09:44 EDT
-            """
-        ),
-        occurrences=1000,
-    )
-
-    fake_process.register_subprocess(
-        [
-            "lxc",
-            "--project",
-            "test-project",
-            "config",
-            "get",
-            "test-remote:test-instance",
-            "user.craft_providers.status",
-        ],
-        returncode=1,
-        stdout="",
+        stdout="Name: test-instance\nStatus: STOPPED\n",
         occurrences=1000,
     )
 
@@ -1390,9 +1767,8 @@ def test_check_instance_status_lxd_error(fake_process, mocker):
             "--project",
             "test-project",
             "config",
-            "get",
+            "show",
             "test-remote:test-instance",
-            "user.craft_providers.timer",
         ],
         returncode=1,
         stdout="",
@@ -1405,8 +1781,8 @@ def test_check_instance_status_lxd_error(fake_process, mocker):
         )
 
     assert exc_info.value == LXDError(
-        brief="Failed to get value for config key 'user.craft_providers.status' for instance 'test-instance'.",
-        details="* Command that failed: 'lxc --project test-project config get test-remote:test-instance user.craft_providers.status'\n* Command exit code: 1",
+        brief="Failed to get config for instance 'test-instance'.",
+        details="* Command that failed: 'lxc --project test-project config show test-remote:test-instance'\n* Command exit code: 1",
         resolution=None,
     )
 
@@ -1435,7 +1811,7 @@ def test_check_instance_status_lxd_error_retry(fake_process, mocker):
         {"Status": LXDInstanceState.RUNNING.value},
         {"Status": LXDInstanceState.STOPPED.value},
     ]
-    mock_instance_config = mocker.patch("craft_providers.lxd.lxc.LXC.config_get")
+    mock_instance_config = mocker.patch("craft_providers.lxd.lxc.LXC.config_get_many")
     mock_instance_config.side_effect = [
         LXDError(
             brief="Failed to get instance info.",
@@ -1447,21 +1823,31 @@ def test_check_instance_status_lxd_error_retry(fake_process, mocker):
             details="* Command that failed: 'lxc --project test-project info test-remote:test-instance'\n* Command exit code: 1",
             resolution=None,
         ),
-        "STARTING",
-        "2023-01-01T00:00:00+00:00",
-        "STARTING",
-        "2023-01-01T00:00:10+00:00",
-        "PREPARING",
-        "2023-01-01T00:00:20+00:00",
+        {
+            "user.craft_providers.status": "STARTING",
+            "user.craft_providers.timer": "2023-01-01T00:00:00+00:00",
+        },
+        {
+            "user.craft_providers.status": "STARTING",
+            "user.craft_providers.timer": "2023-01-01T00:00:10+00:00",
+        },
+        {
+            "user.craft_providers.status": "PREPARING",
+            "user.craft_providers.timer": "2023-01-01T00:00:20+00:00",
+        },
         LXDError(
             brief="Failed to get instance info.",
             details="* Command that failed: 'lxc --project test-project info test-remote:test-instance'\n* Command exit code: 1",
             resolution=None,
         ),
-        "FINISHED",
-        "2023-01-01T00:00:40+00:00",
-        "FINISHED",
-        "2023-01-01T00:00:50+00:00",
+        {
+            "user.craft_providers.status": "FINISHED",
+            "user.craft_providers.timer": "2023-01-01T00:00:40+00:00",
+        },
+        {
+            "user.craft_providers.status": "FINISHED",
+            "user.craft_providers.timer": "2023-01-01T00:00:50+00:00",
+        },
     ]
 
     LXC().check_instance_status(
@@ -1470,8 +1856,7 @@ def test_check_instance_status_lxd_error_retry(fake_process, mocker):
 
 
 def test_check_instance_status_error_timeout(fake_process, mocker):
-    time_time = mocker.patch("time.time")
-    time_time.side_effect = [0, 1000, 2000]
+    mocker.patch("time.monotonic", side_effect=itertools.count(step=10))
     mocker.patch("time.sleep")
 
     fake_process.register_subprocess(
@@ -1483,31 +1868,7 @@ def test_check_instance_status_error_timeout(fake_process, mocker):
             "test-remote:test-instance",
         ],
         returncode=0,
-        stdout=dedent(
-            """\
-            Name: test-instance
-            Status: STOPPED
-            Type: container
-            Architecture: x86_64
-            Created: 2023/08/02 14:04 EDT
-            Last Used: 2023/08/08 09:44 EDT
-            """
-        ),
-        occurrences=1000,
-    )
-
-    fake_process.register_subprocess(
-        [
-            "lxc",
-            "--project",
-            "test-project",
-            "config",
-            "get",
-            "test-remote:test-instance",
-            "user.craft_providers.status",
-        ],
-        returncode=0,
-        stdout="STARTING",
+        stdout="Name: test-instance\nStatus: STOPPED\n",
         occurrences=1000,
     )
 
@@ -1517,12 +1878,20 @@ def test_check_instance_status_error_timeout(fake_process, mocker):
             "--project",
             "test-project",
             "config",
-            "get",
+            "show",
             "test-remote:test-instance",
-            "user.craft_providers.timer",
         ],
         returncode=0,
-        stdout="2023-01-01T00:00:00+00:00",
+        stdout=dedent(
+            """\
+            architecture: x86_64
+            config:
+              user.craft_providers.status: STARTING
+              user.craft_providers.timer: "2023-01-01T00:00:00+00:00"
+            devices: {}
+            ephemeral: false
+            """
+        ),
         occurrences=1000,
     )
 
@@ -1548,9 +1917,9 @@ def test_has_image(fake_process):
             "image",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
-        stdout="- aliases:\n  - name: image1\n- aliases:\n  - name: image2\n",
+        stdout='[{"aliases": [{"name": "image1"}]}, {"aliases": [{"name": "image2"}]}]',
         occurrences=3,
     )
     fake_process.keep_last_process(keep=True)
@@ -1684,9 +2053,9 @@ def test_image_list(fake_process):
             "image",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
-        stdout="- image1: stuff\n- image2: stuff\n",
+        stdout='[{"image1": "stuff"}, {"image2": "stuff"}]',
     )
 
     images = LXC().image_list(
@@ -1707,7 +2076,7 @@ def test_image_list_error(fake_process):
             "image",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
         returncode=1,
     )
@@ -1730,7 +2099,7 @@ def test_image_list_parse_error(fake_process):
             "image",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
         stdout="fail:\nthis\n",
     )
@@ -1745,7 +2114,7 @@ def test_image_list_parse_error(fake_process):
         brief="Failed to parse lxc image list.",
         details=(
             "* Command that failed:"
-            " 'lxc --project test-project image list test-remote: --format=yaml'\n"
+            " 'lxc --project test-project image list test-remote: --format=json'\n"
             "* Command output: 'fail:\\nthis\\n'"
         ),
     )
@@ -1759,9 +2128,9 @@ def test_list(fake_process):
             "test-project",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
-        stdout="- name: test1\n- name: test2\n",
+        stdout='[{"name": "test1"}, {"name": "test2"}]',
     )
 
     container_names = LXC().list(
@@ -1773,6 +2142,29 @@ def test_list(fake_process):
     assert container_names == [{"name": "test1"}, {"name": "test2"}]
 
 
+def test_list_instance_name(fake_process):
+    """Only list the requested instance, not instances with the name as a prefix."""
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "--project",
+            "test-project",
+            "list",
+            "test-remote:",
+            "^test1$",
+            "--format=json",
+        ],
+        stdout='[{"name": "test1"}, {"name": "test10"}]',
+    )
+
+    instances = LXC().list(
+        project="test-project", remote="test-remote", instance_name="test1"
+    )
+
+    assert len(fake_process.calls) == 1
+    assert instances == [{"name": "test1"}]
+
+
 def test_list_error(fake_process):
     fake_process.register_subprocess(
         [
@@ -1781,7 +2173,7 @@ def test_list_error(fake_process):
             "test-project",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
         returncode=1,
     )
@@ -1803,7 +2195,7 @@ def test_list_parse_error(fake_process):
             "test-project",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
         stdout="fail:\nthis\n",
     )
@@ -1818,7 +2210,7 @@ def test_list_parse_error(fake_process):
         brief="Failed to parse lxc list.",
         details=(
             "* Command that failed:"
-            " 'lxc --project test-project list test-remote: --format=yaml'\n"
+            " 'lxc --project test-project list test-remote: --format=json'\n"
             "* Command output: 'fail:\\nthis\\n'"
         ),
     )
@@ -1832,9 +2224,9 @@ def test_list_names(fake_process):
             "test-project",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
-        stdout="- name: test1\n- name: test2\n",
+        stdout='[{"name": "test1"}, {"name": "test2"}]',
     )
 
     container_names = LXC().list_names(
@@ -1854,9 +2246,9 @@ def test_list_names_parse_error(fake_process):
             "test-project",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
-        stdout="- foo: bar",
+        stdout='[{"foo": "bar"}]',
     )
 
     with pytest.raises(LXDError) as exc_info:
@@ -1871,6 +2263,76 @@ def test_list_names_parse_error(fake_process):
     )
 
 
+def test_profile_create(fake_process):
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "query",
+            "--request",
+            "POST",
+            "--data",
+            '{"name": "test-profile", "config": {"user.key": "value"}}',
+            "test-remote:/1.0/profiles?project=test-project",
+        ],
+    )
+
+    assert LXC().profile_create(
+        profile="test-profile",
+        config={"user.key": "value"},
+        project="test-project",
+        remote="test-remote",
+    )
+    assert len(fake_process.calls) == 1
+
+
+def test_profile_create_exists(fake_process):
+    fake_process.register_subprocess(
+        ["lxc", "query", fake_process.any()],
+        returncode=1,
+        stderr='Error: Profile "test-profile" already exists',
+    )
+
+    assert not LXC().profile_create(profile="test-profile", config={})
+
+
+def test_profile_create_error(fake_process):
+    fake_process.register_subprocess(
+        ["lxc", "query", fake_process.any()], returncode=1, stderr="Error: Forbidden"
+    )
+
+    with pytest.raises(LXDError, match="Failed to create profile 'test-profile'."):
+        LXC().profile_create(profile="test-profile", config={})
+
+
+def test_profile_delete(fake_process):
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "--project",
+            "test-project",
+            "profile",
+            "delete",
+            "test-remote:test-profile",
+        ],
+    )
+
+    LXC().profile_delete(
+        profile="test-profile", project="test-project", remote="test-remote"
+    )
+
+    assert len(fake_process.calls) == 1
+
+
+def test_profile_delete_error(fake_process):
+    fake_process.register_subprocess(
+        ["lxc", "--project", "default", "profile", "delete", "local:test-profile"],
+        returncode=1,
+    )
+
+    with pytest.raises(LXDError, match="Failed to delete profile 'test-profile'."):
+        LXC().profile_delete(profile="test-profile")
+
+
 def test_profile_edit(fake_process):
     stdin_records = []
     fake_process.register_subprocess(
@@ -1883,7 +2345,7 @@ def test_profile_edit(fake_process):
             "test-remote:test-profile",
         ],
         stdin_callable=stdin_records.append,
-        stdout="- name: test1\n- name: test2\n",
+        stdout='[{"name": "test1"}, {"name": "test2"}]',
     )
 
     LXC().profile_edit(
@@ -1919,17 +2381,79 @@ def test_profile_edit_error(fake_process):
         )
 
 
-def test_profile_show(fake_process):
+def test_profile_rename(fake_process):
     fake_process.register_subprocess(
         [
             "lxc",
             "--project",
             "test-project",
             "profile",
-            "show",
+            "rename",
             "test-remote:test-profile",
+            "new-profile",
+        ],
+    )
+
+    assert LXC().profile_rename(
+        profile="test-profile",
+        new_name="new-profile",
+        project="test-project",
+        remote="test-remote",
+    )
+    assert len(fake_process.calls) == 1
+
+
+@pytest.mark.parametrize(
+    "stderr",
+    ["Error: Profile not found", 'Error: Name "new-profile" already in use'],
+)
+def test_profile_rename_conflict(fake_process, stderr):
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "--project",
+            "default",
+            "profile",
+            "rename",
+            "local:test-profile",
+            "new-profile",
+        ],
+        returncode=1,
+        stderr=stderr,
+    )
+
+    assert not LXC().profile_rename(profile="test-profile", new_name="new-profile")
+
+
+def test_profile_rename_error(fake_process):
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "--project",
+            "default",
+            "profile",
+            "rename",
+            "local:test-profile",
+            "new-profile",
+        ],
+        returncode=1,
+        stderr="Error: Forbidden",
+    )
+
+    with pytest.raises(
+        LXDError, match="Failed to rename profile 'test-profile' to 'new-profile'."
+    ):
+        LXC().profile_rename(profile="test-profile", new_name="new-profile")
+
+
+def test_profile_show(fake_process):
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "query",
+            "test-remote:/1.0/profiles/test-profile?project=test-project",
         ],
-        stdout="config: {}\ndescription: LXD profile\n",
+        stdout='{"config": {}, "description": "LXD profile", "used_by": null}',
     )
 
     profile = LXC().profile_show(
@@ -1939,18 +2463,15 @@ def test_profile_show(fake_process):
     )
 
     assert len(fake_process.calls) == 1
-    assert profile == {"config": {}, "description": "LXD profile"}
+    assert profile == {"config": {}, "description": "LXD profile", "used_by": ""}
 
 
 def test_profile_show_error(fake_process):
     fake_process.register_subprocess(
         [
             "lxc",
-            "--project",
-            "test-project",
-            "profile",
-            "show",
-            "test-remote:test-profile",
+            "query",
+            "test-remote:/1.0/profiles/test-profile?project=test-project",
         ],
         returncode=1,
     )
@@ -1963,6 +2484,24 @@ def test_profile_show_error(fake_process):
         )
 
 
+def test_profile_show_parse_error(fake_process):
+    fake_process.register_subprocess(
+        [
+            "lxc",
+            "query",
+            "test-remote:/1.0/profiles/test-profile?project=test-project",
+        ],
+        stdout="not json",
+    )
+
+    with pytest.raises(LXDError, match="Failed to parse lxc profile."):
+        LXC().profile_show(
+            profile="test-profile",
+            project="test-project",
+            remote="test-remote",
+        )
+
+
 def test_project_create(fake_process):
     fake_process.register_subprocess(
         [
@@ -2001,9 +2540,9 @@ def test_project_create_error(fake_process):
             "project",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
-        stdout="- config:\n  name: default\n",
+        stdout='[{"config": {}, "name": "default"}]',
         returncode=0,
     )
 
@@ -2032,9 +2571,9 @@ def test_project_create_error_race(fake_process):
             "project",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
-        stdout="- config:\n  name: default\n- config:\n  name: test-project\n",
+        stdout='[{"config": {}, "name": "default"}, {"config": {}, "name": "test-project"}]',
         returncode=0,
     )
 
@@ -2092,9 +2631,9 @@ def test_project_list(fake_process):
             "project",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
-        stdout="- name: default\n- name: myproject\n",
+        stdout='[{"name": "default"}, {"name": "myproject"}]',
     )
 
     projects = LXC().project_list(
@@ -2112,7 +2651,7 @@ def test_project_list_error(fake_process):
             "project",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
         returncode=1,
     )
@@ -2132,7 +2671,7 @@ def test_project_list_parse_error(fake_process):
             "project",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
         stdout="fail:\nthis\n",
     )
@@ -2145,7 +2684,7 @@ def test_project_list_parse_error(fake_process):
     assert exc_info.value == LXDError(
         brief="Failed to parse lxc project list.",
         details=(
-            "* Command that failed: 'lxc project list test-remote: --format=yaml'\n"
+            "* Command that failed: 'lxc project list test-remote: --format=json'\n"
             "* Command output: 'fail:\\nthis\\n'"
         ),
     )
@@ -2158,9 +2697,9 @@ def test_project_list_parse_error_missing_name(fake_process):
             "project",
             "list",
             "test-remote:",
-            "--format=yaml",
+            "--format=json",
         ],
-        stdout="- foo: bar",
+        stdout='[{"foo": "bar"}]',
     )
 
     with pytest.raises(LXDError) as exc_info:
@@ -2171,8 +2710,8 @@ def test_project_list_parse_error_missing_name(fake_process):
     assert exc_info.value == LXDError(
         brief="Failed to parse lxc project list.",
         details=(
-            "* Command that failed: 'lxc project list test-remote: --format=yaml'\n"
-            "* Command output: '- foo: bar'"
+            "* Command that failed: 'lxc project list test-remote: --format=json'\n"
+            '* Command output: \'[{"foo": "bar"}]\''
         ),
     )
 
@@ -2499,6 +3038,68 @@ def test_yaml_loader_invalid_timestamp():
     assert isinstance(obj["last_used_at"], str)
 
 
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ('{"a": 1, "b": true, "c": null}', {"a": "1", "b": "true", "c": ""}),
+        ('{"a": {"b": [1.5, false]}}', {"a": {"b": ["1.5", "false"]}}),
+    ],
+)
+def test_json_loader_flat(data, expected):
+    """Scalars are strings, like with the YAML loader."""
+    assert lxc.load_json_flat(data) == expected
+
+
+@pytest.mark.parametrize(
+    ("loader", "data"),
+    [
+        (lxc.load_json_flat, "[]"),
+        (lxc.load_json_flat, "not json"),
+        (lxc.load_json_list, "{}"),
+        (lxc.load_json_list, "not json"),
+    ],
+)
+def test_json_loader_error(loader, data):
+    with pytest.raises(ValueError):  # noqa: PT011
+        loader(data)
+
+
+def test_list_parse_scales():
+    """Benchmark parsing the listing of 1000 instances."""
+    instances = [
+        {
+            "name": f"instance-{i}",
+            "status": "Running",
+            "type": "container",
+            "architecture": "x86_64",
+            "ephemeral": False,
+            "created_at": "2023-01-02T03:04:05.123456Z",
+            "profiles": ["default"],
+            "config": {
+                "image.os": "ubuntu",
+                "user.craft_providers.status": "FINISHED",
+                "volatile.base_image": "a" * 64,
+            },
+            "devices": {"root": {"path": "/", "pool": "default", "type": "disk"}},
+        }
+        for i in range(1000)
+    ]
+    json_data = json.dumps(instances)
+    yaml_data = yaml.safe_dump(instances)
+
+    start = time.perf_counter()
+    from_json = lxc.load_json_list(json_data)
+    json_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from_yaml = lxc.load_yaml_list(yaml_data)
+    yaml_elapsed = time.perf_counter() - start
+
+    print(f"parsed 1000 instances: json {json_elapsed:.4f}s, yaml {yaml_elapsed:.4f}s")
+    assert from_json == from_yaml
+    assert json_elapsed < yaml_elapsed
+
+
 def test_is_pro_enabled_success_true(fake_process):
     fake_process.register_subprocess(
         [
@@ -2693,3 +3294,155 @@ def test_is_pro_installed_failure(fake_process):
     )
 
     assert len(fake_process.calls) == 1
+
+
+class SlowLXC:
+    """Fake for `subprocess.run` that keeps every lxc process busy for a while.
+
+    Records how many fake processes run at the same time, overall and per instance.
+    """
+
+    def __init__(self, duration=0.2):
+        self.duration = duration
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.running_per_instance = Counter()
+        self.peak_per_instance = Counter()
+
+    def __call__(self, command, **kwargs):
+        instance = next((arg for arg in command if arg.startswith("local:")), "")
+        with self.lock:
+            self.running += 1
+            self.running_per_instance[instance] += 1
+            self.peak = max(self.peak, self.running)
+            self.peak_per_instance[instance] = max(
+                self.peak_per_instance[instance], self.running_per_instance[instance]
+            )
+        time.sleep(self.duration)
+        with self.lock:
+            self.running -= 1
+            self.running_per_instance[instance] -= 1
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+
+def _run_threads(targets):
+    threads = [threading.Thread(target=target) for target in targets]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.monotonic() - start
+
+
+def test_concurrent_reads_are_not_serialized(mocker):
+    """Read-only queries from many threads run at the same time."""
+    slow_lxc = SlowLXC()
+    mocker.patch("subprocess.run", side_effect=slow_lxc)
+    lxc_wrapper = LXC(max_processes=None)
+
+    elapsed = _run_threads(
+        [
+            lambda: lxc_wrapper.config_get(instance_name="test-instance", key="foo"),
+        ]
+        * 8
+    )
+
+    assert slow_lxc.peak == 8
+    assert elapsed < 8 * slow_lxc.duration
+
+
+def test_concurrent_processes_are_capped(mocker):
+    slow_lxc = SlowLXC(duration=0.05)
+    mocker.patch("subprocess.run", side_effect=slow_lxc)
+    lxc_wrapper = LXC(max_processes=3)
+
+    _run_threads(
+        [lambda: lxc_wrapper.config_get(instance_name="test-instance", key="foo")] * 12,
+    )
+
+    assert slow_lxc.peak == 3
+
+
+def test_writes_are_serialized_per_instance(mocker):
+    """Writes to one instance are serialized, writes to others are not."""
+    slow_lxc = SlowLXC(duration=0.05)
+    mocker.patch("subprocess.run", side_effect=slow_lxc)
+    lxc_wrapper = LXC()
+
+    def set_config(instance_name):
+        return lambda: lxc_wrapper.config_set(
+            instance_name=instance_name, key="user.foo", value="bar"
+        )
+
+    _run_threads(
+        [set_config(f"test-instance-{i % 4}") for i in range(16)],
+    )
+
+    assert slow_lxc.peak == 4
+    assert set(slow_lxc.peak_per_instance.values()) == {1}
+
+
+def test_long_operation_does_not_block_other_instances(mocker):
+    """A long copy does not hold up heartbeats and queries on other instances."""
+    copy_started = threading.Event()
+    copy_released = threading.Event()
+
+    def fake_run(command, **kwargs):
+        if "copy" in command:
+            copy_started.set()
+            assert copy_released.wait(timeout=10)
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+    mocker.patch("subprocess.run", side_effect=fake_run)
+    lxc_wrapper = LXC()
+    copy_thread = threading.Thread(
+        target=lambda: lxc_wrapper.copy(
+            source_instance_name="base-instance",
+            destination_instance_name="test-instance-1",
+        )
+    )
+    copy_thread.start()
+    assert copy_started.wait(timeout=10)
+
+    try:
+        for _ in range(10):
+            lxc_wrapper.config_set(
+                instance_name="test-instance-2",
+                key="user.craft_providers.timer",
+                value="2026-01-01T00:00:00",
+            )
+            lxc_wrapper.config_get(
+                instance_name="test-instance-1", key="user.craft_providers.status"
+            )
+    finally:
+        copy_released.set()
+        copy_thread.join()
+
+
+def test_instance_locks_are_dropped(mocker):
+    """Instance locks only live while an operation holds or waits for them."""
+    slow_lxc = SlowLXC(duration=0.01)
+    mocker.patch("subprocess.run", side_effect=slow_lxc)
+    lxc_wrapper = LXC()
+
+    _run_threads(
+        [
+            lambda i=i: lxc_wrapper.config_set(
+                instance_name=f"test-instance-{i % 4}", key="user.foo", value="bar"
+            )
+            for i in range(16)
+        ],
+    )
+
+    assert len(lxc_wrapper._instance_locks) == 0
+
+
+def test_lxc_lock_deprecated():
+    lxc_wrapper = LXC()
+
+    with pytest.warns(DeprecationWarning, match="LXC.lxc_lock is deprecated"):
+        lock = lxc_wrapper.lxc_lock
+
+    assert isinstance(lock, type(threading.Lock()))
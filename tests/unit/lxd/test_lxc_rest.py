@@ -0,0 +1,619 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+import pathlib
+import threading
+import time
+from collections import Counter
+
+import pytest
+from craft_providers.lxd import LXC, LXDError, LXDInstance, RestLXC, lxc_rest
+
+
+@pytest.fixture
+def rest_lxc(fake_lxd_server):
+    lxc = RestLXC(socket_path=fake_lxd_server.socket_path)
+    yield lxc
+    lxc.close()
+
+
+@pytest.fixture
+def mock_run_lxc(mocker):
+    return mocker.patch.object(LXC, "_run_lxc")
+
+
+def test_default_socket_path_lxd_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("LXD_DIR", str(tmp_path))
+
+    assert lxc_rest.default_socket_path() == tmp_path / "unix.socket"
+
+
+def test_default_socket_path_snap(monkeypatch, mocker):
+    monkeypatch.delenv("LXD_DIR", raising=False)
+    mocker.patch("pathlib.Path.exists", return_value=True)
+
+    assert lxc_rest.default_socket_path() == pathlib.Path(
+        "/var/snap/lxd/common/lxd/unix.socket"
+    )
+
+
+def test_connection_is_pooled(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_instance("test-instance")
+
+    for _ in range(5):
+        rest_lxc.config_get(instance_name="test-instance", key="user.foo")
+    rest_lxc.list()
+    rest_lxc.get_server_version()
+
+    assert len(fake_lxd_server.requests) == 7
+    assert fake_lxd_server.connections == 1
+
+
+def test_config_get_set(fake_lxd_server, rest_lxc, mock_run_lxc):
+    fake_lxd_server.add_instance("test-instance", project="test-project")
+
+    rest_lxc.config_set(
+        instance_name="test-instance",
+        key="user.craft_providers.status",
+        value="PREPARING",
+        project="test-project",
+    )
+
+    assert (
+        rest_lxc.config_get(
+            instance_name="test-instance",
+            key="user.craft_providers.status",
+            project="test-project",
+        )
+        == "PREPARING"
+    )
+    assert fake_lxd_server.requests == [
+        ("PATCH", "/1.0/instances/test-instance", {"project": "test-project"}),
+        ("GET", "/1.0/instances/test-instance", {"project": "test-project"}),
+    ]
+    mock_run_lxc.assert_not_called()
+
+
+def test_config_get_missing_key(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_instance("test-instance")
+
+    assert rest_lxc.config_get(instance_name="test-instance", key="missing") == ""
+
+
+def test_config_get_error(rest_lxc):
+    with pytest.raises(LXDError) as raised:
+        rest_lxc.config_get(instance_name="missing-instance", key="user.foo")
+
+    assert raised.value.brief == (
+        "Failed to get value for config key 'user.foo' for instance 'missing-instance'."
+    )
+    assert raised.value.details == "* LXD API error (404): Instance not found"
+
+
+def test_config_get_set_many(fake_lxd_server, rest_lxc, mock_run_lxc):
+    fake_lxd_server.add_instance("test-instance", config={"limits.cpu": 2})
+
+    rest_lxc.config_set_many(
+        instance_name="test-instance",
+        config={"user.craft_providers.status": "FINISHED", "environment.TZ": "UTC"},
+    )
+    rest_lxc.config_set_many(instance_name="test-instance", config={})
+
+    assert rest_lxc.config_get_many(
+        instance_name="test-instance",
+        keys=["user.craft_providers.status", "user.craft_providers.pid"],
+    ) == {"user.craft_providers.status": "FINISHED", "user.craft_providers.pid": ""}
+    assert rest_lxc.config_get_many(instance_name="test-instance") == {
+        "limits.cpu": "2",
+        "user.craft_providers.status": "FINISHED",
+        "environment.TZ": "UTC",
+    }
+    assert fake_lxd_server.requests == [
+        ("PATCH", "/1.0/instances/test-instance", {"project": "default"}),
+        ("GET", "/1.0/instances/test-instance", {"project": "default"}),
+        ("GET", "/1.0/instances/test-instance", {"project": "default"}),
+    ]
+    mock_run_lxc.assert_not_called()
+
+
+def test_config_get_many_error(rest_lxc):
+    with pytest.raises(LXDError) as raised:
+        rest_lxc.config_get_many(instance_name="missing-instance")
+
+    assert raised.value.brief == "Failed to get config for instance 'missing-instance'."
+    assert raised.value.details == "* LXD API error (404): Instance not found"
+
+
+def test_unreachable_socket(tmp_path):
+    lxc = RestLXC(socket_path=tmp_path / "missing.socket")
+
+    with pytest.raises(LXDError) as raised:
+        lxc.get_server_version()
+
+    assert raised.value.brief == "Could not determine lxd version."
+    assert raised.value.resolution == "Ensure LXD is installed and running."
+
+
+def test_config_devices(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_instance("test-instance")
+
+    rest_lxc.config_device_add_disk(
+        instance_name="test-instance",
+        source=pathlib.Path("/home/user/project"),
+        path=pathlib.PurePosixPath("/root/project"),
+        device="disk-/root/project",
+    )
+
+    assert rest_lxc.config_device_show(instance_name="test-instance") == {
+        "disk-/root/project": {
+            "type": "disk",
+            "source": "/home/user/project",
+            "path": "/root/project",
+        }
+    }
+
+    rest_lxc.config_device_remove(
+        instance_name="test-instance", device="disk-/root/project"
+    )
+
+    assert rest_lxc.config_device_show(instance_name="test-instance") == {}
+
+
+def test_config_device_remove_missing(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_instance("test-instance")
+
+    with pytest.raises(LXDError) as raised:
+        rest_lxc.config_device_remove(instance_name="test-instance", device="foo")
+
+    assert raised.value.brief == (
+        "Failed to remove device from instance 'test-instance'."
+    )
+
+
+def test_copy(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_instance("base-instance", config={"user.foo": "bar"})
+
+    rest_lxc.copy(
+        source_instance_name="base-instance",
+        destination_instance_name="test-instance",
+    )
+
+    assert fake_lxd_server.instances["default", "test-instance"]["config"] == {
+        "user.foo": "bar"
+    }
+    assert ("POST", "/1.0/instances", {"project": "default"}) in (
+        fake_lxd_server.requests
+    )
+
+
+@pytest.mark.parametrize(
+    ("force", "status", "stopped"),
+    [
+        (True, "Running", True),
+        (True, "Stopped", False),
+        (False, "Stopped", False),
+    ],
+)
+def test_delete(fake_lxd_server, rest_lxc, force, status, stopped):
+    fake_lxd_server.add_instance("test-instance", status=status)
+
+    rest_lxc.delete(instance_name="test-instance", force=force)
+
+    assert ("default", "test-instance") not in fake_lxd_server.instances
+    assert (
+        "PUT",
+        "/1.0/instances/test-instance/state",
+        {"project": "default"},
+    ) in fake_lxd_server.requests or not stopped
+
+
+def test_delete_running_error(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_instance("test-instance", status="Running")
+
+    with pytest.raises(LXDError) as raised:
+        rest_lxc.delete(instance_name="test-instance")
+
+    assert raised.value.brief == "Failed to delete instance 'test-instance'."
+    assert raised.value.details == (
+        "* LXD API error (400): The instance is currently running"
+    )
+
+
+def test_file_push_pull(fake_lxd_server, rest_lxc, tmp_path):
+    fake_lxd_server.add_instance("test-instance")
+    source = tmp_path / "source"
+    source.write_bytes(b"file content")
+
+    rest_lxc.file_push(
+        instance_name="test-instance",
+        source=source,
+        destination=pathlib.PurePosixPath("/etc/test.conf"),
+        mode="0600",
+        uid=1000,
+        gid=1001,
+    )
+
+    entry = fake_lxd_server.files["default", "test-instance", "/etc/test.conf"]
+    assert entry == {
+        "content": b"file content",
+        "type": "file",
+        "mode": "0600",
+        "uid": "1000",
+        "gid": "1001",
+    }
+
+    destination = tmp_path / "nested" / "destination"
+    rest_lxc.file_pull(
+        instance_name="test-instance",
+        source=pathlib.PurePosixPath("/etc/test.conf"),
+        destination=destination,
+        create_dirs=True,
+    )
+
+    assert destination.read_bytes() == b"file content"
+
+
+def test_file_pull_missing(fake_lxd_server, rest_lxc, tmp_path):
+    fake_lxd_server.add_instance("test-instance")
+
+    with pytest.raises(FileNotFoundError, match="File not found: '/missing'"):
+        rest_lxc.file_pull(
+            instance_name="test-instance",
+            source=pathlib.PurePosixPath("/missing"),
+            destination=tmp_path / "destination",
+        )
+
+    assert not (tmp_path / "destination").exists()
+
+
+def test_file_read(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_instance("test-instance")
+    fake_lxd_server.files["default", "test-instance", "/etc/test.conf"] = {
+        "content": b"file content",
+        "type": "file",
+        "mode": "0644",
+        "uid": "0",
+        "gid": "0",
+    }
+
+    content = rest_lxc.file_read(
+        instance_name="test-instance",
+        source=pathlib.PurePosixPath("/etc/test.conf"),
+    )
+
+    assert content == b"file content"
+
+
+def test_file_read_missing(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_instance("test-instance")
+
+    with pytest.raises(FileNotFoundError, match="File not found: '/missing'"):
+        rest_lxc.file_read(
+            instance_name="test-instance",
+            source=pathlib.PurePosixPath("/missing"),
+        )
+
+
+@pytest.mark.parametrize("method", ["file_read", "file_pull"])
+def test_file_missing_instance(fake_lxd_server, rest_lxc, tmp_path, method):
+    """A missing instance is an LXDError, not a missing file."""
+    kwargs = {"destination": tmp_path / "destination"} if method == "file_pull" else {}
+
+    with pytest.raises(LXDError) as raised:
+        getattr(rest_lxc, method)(
+            instance_name="test-instance",
+            source=pathlib.PurePosixPath("/missing"),
+            **kwargs,
+        )
+
+    assert raised.value.details == "* LXD API error (404): Instance not found"
+
+
+def test_file_read_directory(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_instance("test-instance")
+    fake_lxd_server.files["default", "test-instance", "/etc"] = {
+        "content": b"",
+        "type": "directory",
+        "mode": "0755",
+        "uid": "0",
+        "gid": "0",
+    }
+
+    with pytest.raises(LXDError) as raised:
+        rest_lxc.file_read(
+            instance_name="test-instance",
+            source=pathlib.PurePosixPath("/etc"),
+        )
+
+    assert raised.value.details == "* '/etc' is not a regular file."
+
+
+def test_file_push_recursive_uses_cli(rest_lxc, mock_run_lxc, tmp_path):
+    rest_lxc.file_push(
+        instance_name="test-instance",
+        source=tmp_path,
+        destination=pathlib.PurePosixPath("/root/dir"),
+        recursive=True,
+    )
+
+    mock_run_lxc.assert_called_once_with(
+        [
+            "file",
+            "push",
+            tmp_path.as_posix(),
+            "local:test-instance/root/dir",
+            "--recursive",
+        ],
+        capture_output=True,
+        project="default",
+    )
+
+
+def test_info_instance_uses_cli(rest_lxc, mock_run_lxc):
+    """The instance info of `lxc info` is assembled by the client."""
+    mock_run_lxc.return_value.stdout = "Name: test-instance\nStatus: RUNNING\n"
+
+    info = rest_lxc.info(instance_name="test-instance")
+
+    assert info == {"Name": "test-instance", "Status": "RUNNING"}
+    mock_run_lxc.assert_called_once_with(
+        ["info", "local:test-instance"],
+        capture_output=True,
+        text=True,
+        project="default",
+    )
+
+
+def test_info_server(rest_lxc):
+    info = rest_lxc.info()
+
+    assert info["environment"]["kernel_features"] == {"seccomp_listener": "true"}
+    assert info["api_extensions"] == ["projects"]
+
+
+def test_list_matches_cli_types(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_instance("test-instance", project="test-project")
+
+    instances = rest_lxc.list(project="test-project")
+
+    assert [i["name"] for i in instances] == ["test-instance"]
+    # scalars are strings, as with `lxc list`
+    assert instances[0]["ephemeral"] == "false"
+    assert instances[0]["state"]["pid"] == "0"
+    assert rest_lxc.list_names(project="test-project") == ["test-instance"]
+    assert rest_lxc.list() == []
+
+
+def test_list_instance_name(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_instance("test-instance")
+    fake_lxd_server.add_instance("test-instance-2")
+
+    instances = rest_lxc.list(instance_name="test-instance")
+
+    assert [i["name"] for i in instances] == ["test-instance"]
+    assert fake_lxd_server.requests == [
+        (
+            "GET",
+            "/1.0/instances",
+            {
+                "filter": "name eq test-instance",
+                "project": "default",
+                "recursion": "2",
+            },
+        )
+    ]
+    assert rest_lxc.list(instance_name="missing") == []
+
+
+def test_list_instance_name_unfiltered(fake_lxd_server, rest_lxc):
+    """Filter on the client if the server ignores the filter."""
+    fake_lxd_server.api_filtering = False
+    fake_lxd_server.add_instance("test-instance")
+    fake_lxd_server.add_instance("test-instance-2")
+
+    instances = rest_lxc.list(instance_name="test-instance")
+
+    assert [i["name"] for i in instances] == ["test-instance"]
+
+
+def test_state_check_scales(fake_lxd_server, rest_lxc):
+    """Benchmark checking an instance's state in a project with 500 instances.
+
+    The amount of data transferred must not depend on the number of instances.
+    """
+    fake_lxd_server.add_instance("test-instance", status="Running")
+    instance = LXDInstance(name="test-instance", lxc=rest_lxc)
+
+    def _measure() -> tuple[int, float]:
+        bytes_sent = fake_lxd_server.bytes_sent
+        start = time.perf_counter()
+        for _ in range(20):
+            instance._invalidate_state()
+            assert instance.is_running()
+        return fake_lxd_server.bytes_sent - bytes_sent, time.perf_counter() - start
+
+    small_bytes, _ = _measure()
+    for i in range(500):
+        fake_lxd_server.add_instance(f"other-instance-{i}", status="Running")
+    large_bytes, elapsed = _measure()
+
+    assert large_bytes == small_bytes
+    # generous bound; listing 500 instances 20 times takes far longer
+    assert elapsed < 5
+
+
+@pytest.mark.parametrize(
+    ("action", "method"), [("start", "start"), ("restart", "restart")]
+)
+def test_state_changes(fake_lxd_server, rest_lxc, action, method):
+    fake_lxd_server.add_instance("test-instance")
+
+    getattr(rest_lxc, method)(instance_name="test-instance")
+
+    assert fake_lxd_server.instances["default", "test-instance"]["status"] == (
+        "Running"
+    )
+    # the operation is waited on
+    assert fake_lxd_server.operations == {}
+
+
+def test_stop(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_instance("test-instance", status="Running")
+
+    rest_lxc.stop(instance_name="test-instance", force=True, timeout=30)
+
+    assert fake_lxd_server.instances["default", "test-instance"]["status"] == (
+        "Stopped"
+    )
+
+
+def test_writes_are_serialized_per_instance(mocker, rest_lxc):
+    """Writes to one instance are serialized, writes to others are not."""
+    lock = threading.Lock()
+    running = Counter()
+    peak = Counter()
+
+    def slow_call(method, path, **kwargs):
+        instance_name = path.split("/")[3]
+        with lock:
+            running[instance_name] += 1
+            peak[instance_name] = max(peak[instance_name], running[instance_name])
+        time.sleep(0.02)
+        with lock:
+            running[instance_name] -= 1
+        return {}
+
+    mocker.patch.object(rest_lxc, "_call", side_effect=slow_call)
+    operations = [
+        lambda name: rest_lxc.config_set(
+            instance_name=name, key="user.foo", value="bar"
+        ),
+        lambda name: rest_lxc.start(instance_name=name),
+        lambda name: rest_lxc.stop(instance_name=name),
+    ]
+    threads = [
+        threading.Thread(target=operation, args=(f"test-instance-{i}",))
+        for operation in operations
+        for i in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == {"test-instance-0": 1, "test-instance-1": 1}
+
+
+def test_operation_failure(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_instance("test-instance")
+    fake_lxd_server.operation_error = "Failed to run: forkstart"
+
+    with pytest.raises(LXDError) as raised:
+        rest_lxc.start(instance_name="test-instance")
+
+    assert raised.value.brief == "Failed to start 'test-instance'."
+    assert raised.value.details == "* LXD operation failed: Failed to run: forkstart"
+
+
+def test_images(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_image("abc123", aliases=["snapshot-1"])
+    fake_lxd_server.add_image("def456", aliases=[])
+
+    assert rest_lxc.has_image("snapshot-1")
+    assert [i["fingerprint"] for i in rest_lxc.image_list()] == ["abc123", "def456"]
+
+    rest_lxc.image_delete(image="snapshot-1")
+    rest_lxc.image_delete(image="def456")
+
+    assert rest_lxc.image_list() == []
+
+
+def test_projects(fake_lxd_server, rest_lxc):
+    rest_lxc.project_create(project="test-project")
+    # creating an existing project is not an error
+    rest_lxc.project_create(project="test-project")
+
+    assert rest_lxc.project_list() == ["default", "test-project"]
+
+    rest_lxc.project_delete(project="test-project")
+
+    assert rest_lxc.project_list() == ["default"]
+
+
+def test_project_create_error(fake_lxd_server, rest_lxc):
+    fake_lxd_server.fail("POST", "/1.0/projects", code=403, message="Forbidden")
+
+    with pytest.raises(LXDError) as raised:
+        rest_lxc.project_create(project="test-project")
+
+    assert raised.value.brief == "Failed to create project 'test-project'."
+
+
+def test_profiles(fake_lxd_server, rest_lxc):
+    profile = rest_lxc.profile_show(profile="default")
+    fake_lxd_server.projects["test-project"] = {"name": "test-project"}
+
+    rest_lxc.profile_edit(profile="default", config=profile, project="test-project")
+
+    assert rest_lxc.profile_show(profile="default", project="test-project") == {
+        "name": "default",
+        "config": {},
+        "description": "Default LXD profile",
+        "devices": {"root": {"path": "/", "pool": "default", "type": "disk"}},
+    }
+
+
+def test_get_server_version(rest_lxc):
+    assert rest_lxc.get_server_version() == "5.21.1"
+
+
+@pytest.mark.parametrize(
+    ("method", "kwargs", "command"),
+    [
+        (
+            "config_get",
+            {"instance_name": "test-instance", "key": "user.foo"},
+            ["config", "get", "remote:test-instance", "user.foo"],
+        ),
+        (
+            "start",
+            {"instance_name": "test-instance"},
+            ["start", "remote:test-instance"],
+        ),
+        (
+            "delete",
+            {"instance_name": "test-instance"},
+            ["delete", "remote:test-instance"],
+        ),
+    ],
+)
+def test_other_remotes_use_cli(
+    fake_lxd_server, rest_lxc, mock_run_lxc, method, kwargs, command
+):
+    getattr(rest_lxc, method)(**kwargs, remote="remote")
+
+    assert mock_run_lxc.mock_calls[0].args[0] == command
+    assert fake_lxd_server.requests == []
+
+
+def test_lxd_instance_shares_client(fake_lxd_server, rest_lxc):
+    fake_lxd_server.add_instance("test-instance", project="test-project")
+
+    instance = LXDInstance(name="test-instance", project="test-project", lxc=rest_lxc)
+
+    assert instance._client is rest_lxc.get_client("test-project")
+    assert instance.exists()
+    assert fake_lxd_server.connections == 1
@@ -19,22 +19,22 @@ import io
 import os
 import pathlib
 import re
-import shutil
 import subprocess
 import sys
-import tempfile
 from unittest import mock
 from unittest.mock import call
 
 import pylxd
 import pytest
 import yaml
-from craft_providers import errors
-from craft_providers.lxd import LXC, LXDError, LXDInstance
+from craft_providers import errors, executor
+from craft_providers.exec_agent import ExecAgent
+from craft_providers.lxd import LXC, LXDError, LXDInstance, lxd_instance
 from craft_providers.lxd.lxd_instance_status import (
     LXDInstanceState,
     ProviderInstanceStatus,
 )
+from craft_providers.lxd.lxd_monitor import LXDMonitor
 
 # These names include invalid characters so a lxd-compatible instance_name
 # is generated. This ensures an Instance's `name` and `instance_name` are
@@ -98,31 +98,11 @@ def mock_lxc(project_path):
         lxc.info.return_value = {
             "environment": {"kernel_features": {}},
         }
+        # poll instead of waiting for events unless a test sets up a monitor
+        lxc.monitor.return_value = None
         yield lxc
 
 
-@pytest.fixture
-def mock_named_temporary_file():
-    with mock.patch(
-        "craft_providers.lxd.lxd_instance.tempfile.NamedTemporaryFile",
-        spec=tempfile.NamedTemporaryFile,
-    ) as mock_tf:
-        mock_tf.return_value.__enter__.return_value.name = "test-tmp-file"
-        yield mock_tf.return_value
-
-
-@pytest.fixture
-def mock_shutil_copyfileobj():
-    with mock.patch.object(shutil, "copyfileobj") as mock_copyfileobj:
-        yield mock_copyfileobj
-
-
-@pytest.fixture
-def mock_os_unlink():
-    with mock.patch.object(os, "unlink") as mock_unlink:
-        yield mock_unlink
-
-
 @pytest.fixture(scope="session")
 def _pylxd_client() -> pylxd.Client:
     return pylxd.Client()
@@ -167,6 +147,33 @@ def test_config_set(mock_lxc, instance):
     ]
 
 
+def test_config_set_many(mock_lxc, instance):
+    instance.config_set_many({"test-key": "test-value"})
+
+    assert mock_lxc.mock_calls == [
+        call.config_set_many(
+            instance_name="test-instance-fa2d407652a1c51f6019",
+            config={"test-key": "test-value"},
+            project="default",
+            remote="local",
+        )
+    ]
+
+
+def test_config_snapshot(mock_lxc, instance):
+    mock_lxc.config_get_many.return_value = {"user.craft_providers.status": "FINISHED"}
+
+    assert instance.config_snapshot() == {"user.craft_providers.status": "FINISHED"}
+    assert mock_lxc.mock_calls == [
+        call.config_get_many(
+            instance_name="test-instance-fa2d407652a1c51f6019",
+            keys=lxd_instance.CONFIG_SNAPSHOT_KEYS,
+            project="default",
+            remote="local",
+        )
+    ]
+
+
 def test_info(mock_lxc, instance):
     instance.info()
 
@@ -179,68 +186,72 @@ def test_info(mock_lxc, instance):
     ]
 
 
-def test_push_file_io(
-    mock_lxc,
-    mock_named_temporary_file,
-    mock_shutil_copyfileobj,
-    mock_os_unlink,
-    instance,
-):
-    mock_lxc.exec.side_effect = [
-        None,
-        None,
-        None,
-        None,
-    ]
+_PUSH_FILE_COMMAND = [
+    "sh",
+    "-c",
+    executor.PUSH_FILE_SCRIPT,
+    "sh",
+    "/etc/test.conf",
+    "0644",
+    "root:root",
+]
+
 
+@pytest.fixture
+def mock_push_process(mock_lxc):
+    process = mock.Mock(spec=subprocess.Popen)
+    process.stdin = io.BytesIO()
+    process.stdin.close = mock.Mock()
+    process.stdout = None
+    process.stderr = io.BytesIO(b"")
+    process.wait.return_value = 0
+    mock_lxc.exec.return_value = process
+    return process
+
+
+def test_push_file_io(mock_lxc, mock_push_process, instance):
     instance.push_file_io(
         destination=pathlib.PurePosixPath("/etc/test.conf"),
         content=io.BytesIO(b"foo"),
         file_mode="0644",
     )
 
-    assert mock_lxc.mock_calls == [
-        mock.call.file_push(
+    assert mock_lxc.exec.mock_calls[:1] == [
+        mock.call(
             instance_name=instance.instance_name,
-            source=pathlib.Path("test-tmp-file"),
-            destination=pathlib.PurePosixPath("/etc/test.conf"),
-            mode="0644",
-            project=instance.project,
-            remote=instance.remote,
-        ),
-        mock.call.exec(
-            instance_name=instance.instance_name,
-            command=[
-                "chown",
-                "root:root",
-                "/etc/test.conf",
-            ],
+            command=_PUSH_FILE_COMMAND,
             cwd=None,
             project=instance.project,
             remote=instance.remote,
-            runner=subprocess.run,
-            capture_output=True,
-            check=True,
-            timeout=60,
-        ),
-    ]
-
-    assert mock_named_temporary_file.mock_calls == [
-        mock.call.__enter__(),
-        mock.call.__enter__().flush(),
-        mock.call.__exit__(None, None, None),
-    ]
-    assert mock_shutil_copyfileobj.mock_calls == [
-        mock.call(mock.ANY, mock_named_temporary_file.__enter__.return_value)
+            runner=subprocess.Popen,
+            timeout=None,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
     ]
+    assert mock_push_process.stdin.getvalue() == b"foo"
+    mock_push_process.stdin.close.assert_called_once_with()
 
 
-def test_push_file_io_error(mock_lxc, instance):
-    error = subprocess.CalledProcessError(
-        -1, ["chown", "root:root", "/etc/test.conf"], "test stdout", "test stderr"
+def test_push_file_io_chunks(mock_lxc, mock_push_process, instance):
+    """Stream an iterable of bytes."""
+    instance.push_file_io(
+        destination=pathlib.PurePosixPath("/etc/test.conf"),
+        content=iter([b"foo", b"bar"]),
+        file_mode="0755",
+        user="user",
+        group="users",
     )
 
-    mock_lxc.exec.side_effect = error
+    assert mock_lxc.exec.call_args.kwargs["command"][-2:] == ["0755", "user:users"]
+    assert mock_push_process.stdin.getvalue() == b"foobar"
+
+
+def test_push_file_io_error(mock_lxc, mock_push_process, instance):
+    mock_push_process.stdin.write = mock.Mock(side_effect=BrokenPipeError)
+    mock_push_process.stderr = io.BytesIO(b"test stderr")
+    mock_push_process.wait.return_value = 1
 
     with pytest.raises(LXDError) as exc_info:
         instance.push_file_io(
@@ -254,8 +265,49 @@ def test_push_file_io_error(mock_lxc, instance):
             "Failed to create file '/etc/test.conf' "
             f"in instance '{_TEST_INSTANCE['instance-name']}'."
         ),
-        details=errors.details_from_called_process_error(error),
+        details=errors.details_from_called_process_error(
+            subprocess.CalledProcessError(1, _PUSH_FILE_COMMAND, stderr=b"test stderr")
+        ),
+    )
+
+
+def test_push_file_io_timeout(mock_lxc, mock_push_process, instance):
+    mock_push_process.wait.side_effect = [
+        subprocess.TimeoutExpired(_PUSH_FILE_COMMAND, 60),
+        -9,
+    ]
+
+    with pytest.raises(LXDError) as exc_info:
+        instance.push_file_io(
+            destination=pathlib.PurePosixPath("/etc/test.conf"),
+            content=io.BytesIO(b"foo"),
+            file_mode="0644",
+        )
+
+    assert exc_info.value.brief == (
+        "Failed to create file '/etc/test.conf' "
+        f"in instance '{_TEST_INSTANCE['instance-name']}'."
     )
+    assert mock_push_process.wait.mock_calls == [mock.call(timeout=60), mock.call()]
+    mock_push_process.kill.assert_called_once_with()
+
+
+def test_push_file_io_content_error(mock_lxc, mock_push_process, instance):
+    """The process is reaped if reading the content fails."""
+
+    def content():
+        yield b"foo"
+        raise OSError("test error")
+
+    with pytest.raises(OSError, match="test error"):
+        instance.push_file_io(
+            destination=pathlib.PurePosixPath("/etc/test.conf"),
+            content=content(),
+            file_mode="0644",
+        )
+
+    mock_push_process.kill.assert_called_once_with()
+    mock_push_process.wait.assert_called_once_with()
 
 
 def test_delete(mock_lxc, instance):
@@ -384,6 +436,68 @@ def test_execute_run_with_check(check, mock_lxc, instance):
     ]
 
 
+@pytest.fixture
+def mock_exec_agent(instance):
+    agent = mock.Mock(spec=ExecAgent, is_alive=True)
+    instance._exec_agent = agent
+    return agent
+
+
+def test_execute_run_exec_agent(mock_lxc, mock_exec_agent, instance):
+    """Run commands through the exec agent when it is running."""
+    result = instance.execute_run(
+        command=["test-command", "flags"],
+        env={"A": "b"},
+        capture_output=True,
+        check=True,
+    )
+
+    assert result == mock_exec_agent.execute_run.return_value
+    assert mock_exec_agent.mock_calls == [
+        call.execute_run(
+            ["env", "A=b", "test-command", "flags"],
+            cwd=None,
+            timeout=None,
+            check=True,
+            capture_output=True,
+        )
+    ]
+    assert mock_lxc.mock_calls == []
+
+
+def test_execute_run_exec_agent_unsupported(mock_lxc, mock_exec_agent, instance):
+    """Fall back to lxc exec if the agent cannot run the command."""
+    mock_exec_agent.execute_run.return_value = None
+
+    instance.execute_run(command=["test-command", "flags"], stdin=subprocess.PIPE)
+
+    assert mock_lxc.mock_calls == [
+        mock.call.exec(
+            instance_name=instance.instance_name,
+            command=["test-command", "flags"],
+            cwd=None,
+            project=instance.project,
+            remote=instance.remote,
+            runner=subprocess.run,
+            stdin=subprocess.PIPE,
+            timeout=None,
+            check=False,
+        )
+    ]
+
+
+@pytest.mark.parametrize("method", ["delete", "restart", "stop"])
+def test_exec_agent_stopped(mock_lxc, mock_exec_agent, instance, method):
+    """The agent is stopped with the instance."""
+    mock_lxc.monitor.return_value = mock.Mock(spec=LXDMonitor)
+    mock_lxc.monitor.return_value.wait.return_value = True
+
+    getattr(instance, method)()
+
+    assert mock_exec_agent.mock_calls == [call.close()]
+    assert instance.exec_agent is None
+
+
 def test_execute_run_with_default_command_env(mock_lxc):
     instance = LXDInstance(
         name=_TEST_INSTANCE["name"],
@@ -482,6 +596,18 @@ def test_exists_uses_api(instance: LXDInstance, should_exist: bool) -> None:
     assert instance.exists() is should_exist
 
 
+def test_client_created_on_first_use(mocker, mock_lxc):
+    client_class = mocker.patch("craft_providers.lxd.lxd_instance.pylxd.Client")
+    instance = LXDInstance(name="test", project="test-project", lxc=mock_lxc)
+
+    client_class.assert_not_called()
+
+    instance.exists()
+    instance.exists()
+
+    client_class.assert_called_once_with(project="test-project")
+
+
 def test_get_disk_devices_path_parse_error(mock_lxc, instance):
     mock_lxc.config_device_show.return_value = {
         "mount_missing_path": {
@@ -566,7 +692,11 @@ def test_is_running_false(mock_lxc):
     assert instance.is_running() is False
 
     assert mock_lxc.mock_calls == [
-        mock.call.list(project=instance.project, remote=instance.remote)
+        mock.call.list(
+            project=instance.project,
+            remote=instance.remote,
+            instance_name=instance.instance_name,
+        )
     ]
 
 
@@ -574,7 +704,11 @@ def test_is_running_true(mock_lxc, instance):
     assert instance.is_running() is True
 
     assert mock_lxc.mock_calls == [
-        mock.call.list(project=instance.project, remote=instance.remote)
+        mock.call.list(
+            project=instance.project,
+            remote=instance.remote,
+            instance_name=instance.instance_name,
+        )
     ]
 
 
@@ -589,6 +723,48 @@ def test_is_running_error(mock_lxc):
     )
 
 
+def test_is_running_cached(mock_lxc, instance):
+    """The state of the instance is cached for a short time."""
+    assert instance.is_running() is True
+    assert instance.is_running() is True
+
+    assert mock_lxc.list.call_count == 1
+
+
+def test_is_running_cache_expired(mock_lxc, instance, mocker):
+    mocker.patch("craft_providers.lxd.lxd_instance.STATE_CACHE_TTL", 0)
+
+    assert instance.is_running() is True
+    assert instance.is_running() is True
+
+    assert mock_lxc.list.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("method", "before", "after"),
+    [
+        (lambda instance: instance.delete(), "Running", "Stopped"),
+        (
+            lambda instance: instance.launch(image="22.04", image_remote="ubuntu"),
+            "Stopped",
+            "Running",
+        ),
+        (lambda instance: instance.restart(), "Stopped", "Running"),
+        (lambda instance: instance.stop(), "Running", "Stopped"),
+    ],
+)
+def test_state_cache_invalidated(mock_lxc, instance, mocker, method, before, after):
+    """Methods that change the state of the instance invalidate the cache."""
+    mocker.patch.object(instance, "exists", return_value=True)
+    mock_lxc.list.return_value = [{"name": instance.instance_name, "status": before}]
+    assert instance.is_running() is (before == "Running")
+
+    mock_lxc.list.return_value = [{"name": instance.instance_name, "status": after}]
+    method(instance)
+
+    assert instance.is_running() is (after == "Running")
+
+
 def test_launch(mock_lxc, instance):
     instance.launch(
         image="22.04",
@@ -609,6 +785,42 @@ def test_launch(mock_lxc, instance):
     ]
 
 
+def test_launch_phase_events(mock_lxc, instance):
+    events = []
+    instance.add_phase_observer(events.append)
+
+    instance.launch(image="22.04", image_remote="ubuntu")
+
+    assert [(event.name, event.type.value) for event in events] == [
+        ("launch", "start"),
+        ("launch", "end"),
+    ]
+
+
+def test_copy(mock_lxc, instance, mock_lxd_client):
+    source = LXDInstance(
+        name="source", remote="source-remote", lxc=mock_lxc, client=mock_lxd_client
+    )
+    events = []
+    instance.add_phase_observer(events.append)
+
+    instance.copy(source=source)
+
+    assert mock_lxc.mock_calls == [
+        mock.call.copy(
+            source_remote="source-remote",
+            source_instance_name=source.instance_name,
+            destination_remote=instance.remote,
+            destination_instance_name=instance.instance_name,
+            project=instance.project,
+        ),
+    ]
+    assert [(event.name, event.type.value) for event in events] == [
+        ("copy", "start"),
+        ("copy", "end"),
+    ]
+
+
 @pytest.mark.skipif(sys.platform == "win32", reason="unsupported on windows")
 def test_launch_all_opts(mock_lxc, instance):
     instance.launch(
@@ -697,8 +909,6 @@ def test_mount_already_mounted(mock_lxc, instance, project_path):
 
 
 def test_pull_file(mock_lxc, instance, tmp_path):
-    mock_lxc.exec.return_value = mock.Mock(returncode=0)
-
     source = pathlib.PurePosixPath("/tmp/src.txt")
     destination = tmp_path / "dst.txt"
 
@@ -708,16 +918,6 @@ def test_pull_file(mock_lxc, instance, tmp_path):
     )
 
     assert mock_lxc.mock_calls == [
-        mock.call.exec(
-            instance_name=instance.instance_name,
-            command=["test", "-f", "/tmp/src.txt"],
-            cwd=None,
-            project=instance.project,
-            remote=instance.remote,
-            runner=subprocess.run,
-            check=False,
-            timeout=60,
-        ),
         mock.call.file_pull(
             instance_name=instance.instance_name,
             source=source,
@@ -729,7 +929,7 @@ def test_pull_file(mock_lxc, instance, tmp_path):
 
 
 def test_pull_file_no_source(mock_lxc, instance, tmp_path):
-    mock_lxc.exec.return_value = mock.Mock(returncode=1)
+    mock_lxc.file_pull.side_effect = FileNotFoundError("File not found: '/tmp/src.txt'")
 
     source = pathlib.PurePosixPath("/tmp/src.txt")
     destination = tmp_path / "dst.txt"
@@ -740,24 +940,10 @@ def test_pull_file_no_source(mock_lxc, instance, tmp_path):
             destination=destination,
         )
 
-    assert mock_lxc.mock_calls == [
-        mock.call.exec(
-            instance_name=instance.instance_name,
-            command=["test", "-f", "/tmp/src.txt"],
-            cwd=None,
-            project=instance.project,
-            remote=instance.remote,
-            runner=subprocess.run,
-            check=False,
-            timeout=60,
-        ),
-    ]
     assert str(exc_info.value) == "File not found: '/tmp/src.txt'"
 
 
 def test_pull_file_no_parent_directory(mock_lxc, instance, tmp_path):
-    mock_lxc.exec.return_value = mock.Mock(returncode=0)
-
     source = pathlib.PurePosixPath("/tmp/src.txt")
     destination = tmp_path / "not-created" / "dst.txt"
 
@@ -767,19 +953,42 @@ def test_pull_file_no_parent_directory(mock_lxc, instance, tmp_path):
             destination=destination,
         )
 
+    assert mock_lxc.mock_calls == []
+    assert str(exc_info.value) == f"Directory not found: {str(destination.parent)!r}"
+
+
+def test_read_file(mock_lxc, instance):
+    mock_lxc.file_read.return_value = b"content"
+    source = pathlib.PurePosixPath("/tmp/src.txt")
+
+    assert instance.read_file(source=source) == b"content"
+
     assert mock_lxc.mock_calls == [
-        mock.call.exec(
+        mock.call.file_read(
             instance_name=instance.instance_name,
-            command=["test", "-f", "/tmp/src.txt"],
-            cwd=None,
+            source=source,
             project=instance.project,
             remote=instance.remote,
-            runner=subprocess.run,
-            check=False,
-            timeout=60,
         ),
     ]
-    assert str(exc_info.value) == f"Directory not found: {str(destination.parent)!r}"
+
+
+@pytest.mark.parametrize(
+    ("is_directory", "error"), [(True, FileNotFoundError), (False, LXDError)]
+)
+@pytest.mark.parametrize("method", ["pull_file", "read_file"])
+def test_pull_file_error(mock_lxc, instance, tmp_path, method, is_directory, error):
+    """A directory is reported as a missing file, other errors are unchanged."""
+    mock_lxc.file_pull.side_effect = LXDError("Failed to pull file.")
+    mock_lxc.file_read.side_effect = LXDError("Failed to read file.")
+    mock_lxc.exec.return_value = mock.Mock(returncode=0 if is_directory else 1)
+    source = pathlib.PurePosixPath("/tmp/src")
+    kwargs = {"destination": tmp_path / "dst"} if method == "pull_file" else {}
+
+    with pytest.raises(error):
+        getattr(instance, method)(source=source, **kwargs)
+
+    assert mock_lxc.exec.mock_calls[0].kwargs["command"] == ["test", "-d", "/tmp/src"]
 
 
 def test_push_file(mock_lxc, instance, tmp_path):
@@ -868,6 +1077,7 @@ def test_start_from_stopped(mock_lxc, instance):
             project=instance.project,
             remote=instance.remote,
         ),
+        mock.call.monitor(project=instance.project, remote=instance.remote),
         mock.call.start(
             instance_name=instance.instance_name,
             project=instance.project,
@@ -876,6 +1086,7 @@ def test_start_from_stopped(mock_lxc, instance):
         mock.call.list(
             project=instance.project,
             remote=instance.remote,
+            instance_name=instance.instance_name,
         ),
         mock.call.config_set(
             instance_name=instance.instance_name,
@@ -887,6 +1098,20 @@ def test_start_from_stopped(mock_lxc, instance):
     ]
 
 
+def test_start_phase_events(mock_lxc, instance):
+    events = []
+    instance.add_phase_observer(events.append)
+    mock_lxc.start.side_effect = LXDError("error")
+
+    with pytest.raises(LXDError):
+        instance.start()
+
+    assert [(event.name, event.failed) for event in events] == [
+        ("start", False),
+        ("start", True),
+    ]
+
+
 def test_start_from_running(mock_lxc, instance):
     mock_lxc.info.return_value = {"Status": LXDInstanceState.RUNNING.value}
     mock_lxc.config_get.return_value = ProviderInstanceStatus.FINISHED.value
@@ -956,11 +1181,58 @@ def test_start_timeout(mocker, mock_lxc, instance):
         instance.start()
 
 
+def test_start_wait_for_events(mock_lxc, instance):
+    """Wait for the instance to start using LXD events."""
+    mock_monitor = mock.Mock(spec=LXDMonitor)
+    mock_monitor.wait.return_value = True
+    mock_lxc.monitor.return_value = mock_monitor
+
+    instance.start()
+
+    assert mock_monitor.mock_calls == [
+        call.wait(
+            instance.instance_name,
+            mock.ANY,
+            timeout=60,
+            poll_interval=lxd_instance.START_RETRY_POLICY,
+        ),
+    ]
+    mock_lxc.list.assert_not_called()
+
+
+def test_start_wait_for_events_timeout(mock_lxc, instance):
+    """Timeout if no event shows the instance started."""
+    mock_monitor = mock.Mock(spec=LXDMonitor)
+    mock_monitor.wait.return_value = False
+    mock_lxc.monitor.return_value = mock_monitor
+
+    with pytest.raises(LXDError, match="Instance failed to start."):
+        instance.start()
+
+
+def test_stop_wait_for_events(mock_lxc, instance):
+    """Wait for the instance to stop using LXD events."""
+    mock_monitor = mock.Mock(spec=LXDMonitor)
+    mock_monitor.wait.return_value = True
+    mock_lxc.monitor.return_value = mock_monitor
+
+    instance.stop()
+
+    mock_monitor.wait.assert_called_once_with(
+        instance.instance_name,
+        mock.ANY,
+        timeout=60,
+        poll_interval=lxd_instance.STOP_RETRY_POLICY,
+    )
+    mock_lxc.list.assert_not_called()
+
+
 def test_restart(mock_lxc, instance):
     """Restart an instance."""
     instance.restart()
 
     assert mock_lxc.mock_calls == [
+        mock.call.monitor(project=instance.project, remote=instance.remote),
         call.restart(
             instance_name="test-instance-fa2d407652a1c51f6019",
             project="default",
@@ -969,6 +1241,7 @@ def test_restart(mock_lxc, instance):
         mock.call.list(
             project=instance.project,
             remote=instance.remote,
+            instance_name=instance.instance_name,
         ),
     ]
 
@@ -1012,6 +1285,7 @@ def test_stop_immediately(mock_lxc, mocker):
     instance.stop()
 
     assert mock_lxc.mock_calls == [
+        mock.call.monitor(project=instance.project, remote=instance.remote),
         mock.call.stop(
             instance_name=instance.instance_name,
             project=instance.project,
@@ -1020,6 +1294,7 @@ def test_stop_immediately(mock_lxc, mocker):
         mock.call.list(
             project=instance.project,
             remote=instance.remote,
+            instance_name=instance.instance_name,
         ),
         mock.call.config_set(
             instance_name=instance.instance_name,
@@ -1068,11 +1343,12 @@ def test_stop_ephemeral(mock_lxc, instance, mocker):
     instance.stop()
 
     assert mock_lxc.mock_calls == [
+        mock.call.monitor(project=instance.project, remote=instance.remote),
         mock.call.stop(
             instance_name=instance.instance_name,
             project=instance.project,
             remote=instance.remote,
-        )
+        ),
     ]
 
 
@@ -1233,30 +1509,24 @@ def test_is_pro_enabled(mock_lxc, instance):
     ]
 
 
-def test_attach_pro_subscription_success(mock_lxc, instance):
+@pytest.fixture
+def mock_push_file_io(instance):
+    with mock.patch.object(instance, "push_file_io") as push_file_io:
+        yield push_file_io
+
+
+def test_attach_pro_subscription_success(mock_lxc, mock_push_file_io, instance):
     mock_lxc.exec.return_value = mock.Mock(returncode=0)
     instance.attach_pro_subscription()
 
-    assert mock_lxc.mock_calls == [
-        mock.call.file_push(
-            instance_name=instance.instance_name,
-            source=mock.ANY,
+    assert mock_push_file_io.mock_calls == [
+        mock.call(
             destination=pathlib.Path("/usr/local/bin/cloud-id"),
-            mode="0775",
-            project=instance.project,
-            remote=instance.remote,
-        ),
-        mock.call.exec(
-            instance_name=instance.instance_name,
-            command=["chown", "root:root", "/usr/local/bin/cloud-id"],
-            cwd=None,
-            project=instance.project,
-            remote=instance.remote,
-            runner=subprocess.run,
-            capture_output=True,
-            check=True,
-            timeout=60,
-        ),
+            content=mock.ANY,
+            file_mode="0775",
+        )
+    ]
+    assert mock_lxc.mock_calls == [
         mock.call.exec(
             instance_name=instance.instance_name,
             command=["pro", "auto-attach"],
@@ -1282,9 +1552,8 @@ def test_attach_pro_subscription_success(mock_lxc, instance):
     ]
 
 
-def test_attach_pro_subscription_failed(mock_lxc, instance):
+def test_attach_pro_subscription_failed(mock_lxc, mock_push_file_io, instance):
     mock_lxc.exec.side_effect = [
-        mock.Mock(returncode=0),
         mock.Mock(returncode=1),
         mock.Mock(returncode=0),
     ]
@@ -1293,18 +1562,19 @@ def test_attach_pro_subscription_failed(mock_lxc, instance):
 
     with pytest.raises(LXDError, match=expected):
         instance.attach_pro_subscription()
-    assert len(mock_lxc.exec.mock_calls) == 3
+    assert len(mock_lxc.exec.mock_calls) == 2
 
 
-def test_attach_pro_subscription_already_attached(mock_lxc, instance):
+def test_attach_pro_subscription_already_attached(
+    mock_lxc, mock_push_file_io, instance
+):
     mock_lxc.exec.return_value = mock.Mock(returncode=2)
     instance.attach_pro_subscription()
-    assert len(mock_lxc.mock_calls) == 4
+    assert len(mock_lxc.mock_calls) == 2
 
 
-def test_attach_pro_subscription_process_error(mock_lxc, instance):
+def test_attach_pro_subscription_process_error(mock_lxc, mock_push_file_io, instance):
     mock_lxc.exec.side_effect = [
-        mock.Mock(returncode=0),
         mock.Mock(returncode=127),
         mock.Mock(returncode=0),
     ]
@@ -1313,7 +1583,7 @@ def test_attach_pro_subscription_process_error(mock_lxc, instance):
 
     with pytest.raises(LXDError, match=expected):
         instance.attach_pro_subscription()
-    assert len(mock_lxc.exec.mock_calls) == 3
+    assert len(mock_lxc.exec.mock_calls) == 2
 
 
 def test_enable_pro_service_success(mock_lxc, instance):
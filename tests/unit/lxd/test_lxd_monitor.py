@@ -0,0 +1,285 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+import json
+import sys
+import time
+from textwrap import dedent
+
+import pytest
+from craft_providers import replay
+from craft_providers.lxd import LXC, LXDError, lxd_monitor
+from craft_providers.lxd.lxd_monitor import LXDMonitor, _get_instance_name
+from craft_providers.util import retry
+
+pytestmark = [
+    pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as lxc")
+]
+
+
+def _event(source: str, action: str = "instance-updated") -> dict[str, object]:
+    return {
+        "type": "lifecycle",
+        "project": "test-project",
+        "metadata": {"action": action, "source": source, "context": {}},
+    }
+
+
+@pytest.fixture
+def fake_lxc(tmp_path):
+    """Write an lxc executable that prints events to stdout.
+
+    Each event is printed after a delay, then the script keeps running until
+    it is terminated unless `exit_after` is set.
+    """
+
+    def _fake_lxc(events, *, delay: float = 0.2, exit_after: bool = False):
+        lines = [f"sleep {delay}\necho '{json.dumps(event)}'" for event in events]
+        if not exit_after:
+            lines.append("exec sleep 60")
+        path = tmp_path / "lxc"
+        path.write_text("#!/bin/sh\n" + "\n".join(lines) + "\n")
+        path.chmod(0o755)
+        return path
+
+    return _fake_lxc
+
+
+@pytest.mark.parametrize(
+    ("event", "expected"),
+    [
+        (_event("/1.0/instances/test-instance"), "test-instance"),
+        (_event("/1.0/instances/test-instance?project=p"), "test-instance"),
+        (_event("/1.0/instances/test-instance/logs/lxc.log"), "test-instance"),
+        (_event("/1.0/instances/test%2Dinstance"), "test-instance"),
+        (_event("/1.0/images/abc"), None),
+        (_event("/1.0/instances"), None),
+        ({**_event("/1.0/instances/test-instance"), "type": "logging"}, None),
+        ({"type": "lifecycle", "metadata": None}, None),
+        ({"type": "lifecycle", "metadata": {"source": 1}}, None),
+        ([], None),
+    ],
+)
+def test_get_instance_name(event, expected):
+    assert _get_instance_name(event) == expected
+
+
+def test_start_unavailable(tmp_path):
+    monitor = LXDMonitor(lxc_path=tmp_path / "missing-lxc")
+
+    assert not monitor.start()
+    assert not monitor.is_alive
+
+
+def test_command(tmp_path):
+    """Run `lxc monitor` for the project and remote."""
+    args = tmp_path / "args"
+    lxc_path = tmp_path / "lxc"
+    lxc_path.write_text(
+        f'#!/bin/sh\necho "$@" > {args}.tmp\nmv {args}.tmp {args}\nexec sleep 60\n'
+    )
+    lxc_path.chmod(0o755)
+    monitor = LXDMonitor(
+        lxc_path=lxc_path, project="test-project", remote="test-remote"
+    )
+
+    assert monitor.start()
+    try:
+        deadline = time.monotonic() + 10
+        while not args.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        monitor.close()
+
+    assert args.read_text() == dedent(
+        """\
+        --project test-project monitor test-remote: --type=lifecycle --format=json
+        """
+    )
+
+
+def test_wait_woken_by_event(fake_lxc):
+    """A waiter checks again as soon as an event arrives for its instance."""
+    monitor = LXDMonitor(
+        lxc_path=fake_lxc(
+            [
+                _event("/1.0/instances/other-instance"),
+                _event("/1.0/instances/test-instance"),
+            ]
+        )
+    )
+    checks = []
+
+    def _condition():
+        checks.append(monitor.generation("test-instance"))
+        return len(checks) > 1
+
+    assert monitor.start()
+    try:
+        start = time.monotonic()
+        assert monitor.wait("test-instance", _condition, timeout=30, poll_interval=30)
+        elapsed = time.monotonic() - start
+    finally:
+        monitor.close()
+
+    # woken by the event rather than the 5 second recheck interval
+    assert elapsed < 4
+    assert checks == [0, 1]
+    assert monitor.generation("other-instance") == 1
+
+
+def test_connected_after_first_event(fake_lxc):
+    monitor = LXDMonitor(lxc_path=fake_lxc([_event("/1.0/images/abc")], delay=0.5))
+
+    assert monitor.start()
+    try:
+        assert monitor.is_alive
+        assert not monitor.is_connected
+        deadline = time.monotonic() + 10
+        while not monitor.is_connected and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert monitor.is_connected
+    finally:
+        monitor.close()
+
+    assert not monitor.is_connected
+
+
+def test_wait_polls_until_connected(fake_lxc, mocker):
+    """Events may be missed before the monitor is connected, so waiters poll."""
+    monitor = LXDMonitor(lxc_path=fake_lxc([], delay=0))
+    wait_for_event = mocker.spy(monitor, "wait_for_event")
+    checks = []
+
+    def _condition():
+        checks.append(None)
+        return len(checks) == 3
+
+    assert monitor.start()
+    try:
+        assert monitor.wait("test-instance", _condition, timeout=30, poll_interval=0.01)
+    finally:
+        monitor.close()
+
+    assert [c.kwargs["timeout"] for c in wait_for_event.mock_calls] == [0.01, 0.01]
+
+
+def test_wait_timeout(fake_lxc):
+    monitor = LXDMonitor(lxc_path=fake_lxc([_event("/1.0/instances/test-instance")]))
+
+    assert monitor.start()
+    try:
+        assert not monitor.wait(
+            "test-instance", lambda: False, timeout=0.5, poll_interval=0.1
+        )
+    finally:
+        monitor.close()
+
+
+def test_wait_condition_error(fake_lxc):
+    """Errors from the condition mean it is not met yet."""
+    monitor = LXDMonitor(lxc_path=fake_lxc([], delay=0, exit_after=True))
+    results = iter([LXDError("not yet"), True])
+
+    def _condition():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    assert monitor.start()
+    assert monitor.wait("test-instance", _condition, timeout=10, poll_interval=0.01)
+
+
+def test_fallback_to_polling(fake_lxc):
+    """Waiters poll once `lxc monitor` exits."""
+    monitor = LXDMonitor(lxc_path=fake_lxc([], delay=0, exit_after=True))
+    checks = []
+
+    def _condition():
+        checks.append(None)
+        return len(checks) == 5
+
+    assert monitor.start()
+    start = time.monotonic()
+    assert monitor.wait("test-instance", _condition, timeout=30, poll_interval=0.01)
+
+    assert time.monotonic() - start < 4
+    assert not monitor.is_alive
+    assert not monitor.wait_for_event("test-instance", since=0, timeout=0.01)
+
+
+def test_fallback_to_polling_retry_policy(fake_lxc, mocker):
+    """Waiters poll with the delays of a retry policy once `lxc monitor` exits."""
+    monitor = LXDMonitor(lxc_path=fake_lxc([], delay=0, exit_after=True))
+    checks = []
+
+    def _condition():
+        checks.append(None)
+        return len(checks) == 4
+
+    assert monitor.start()
+    while monitor.is_alive:
+        time.sleep(0.01)
+    wait_for_event = mocker.spy(monitor, "wait_for_event")
+    policy = retry.FastThenSlow(fast_delay=0.01, fast_attempts=2, slow_delay=0.02)
+
+    assert monitor.wait("test-instance", _condition, timeout=30, poll_interval=policy)
+
+    assert [c.kwargs["timeout"] for c in wait_for_event.mock_calls] == [
+        0.01,
+        0.01,
+        0.02,
+    ]
+
+
+def test_lxc_monitor_shared(fake_lxc):
+    """One monitor per project is shared by the whole process."""
+    lxc = LXC(lxc_path=fake_lxc([]))
+    monitor = lxc.monitor(project="test-project", remote="test-remote")
+
+    assert monitor is not None
+    assert monitor.is_alive
+    assert lxc.monitor(project="test-project", remote="test-remote") is monitor
+    assert LXC().monitor(project="test-project", remote="test-remote") is monitor
+    assert lxc.monitor(project="other-project", remote="test-remote") not in (
+        None,
+        monitor,
+    )
+
+    # closing an LXC object leaves the shared monitors running
+    lxc.close()
+    assert monitor.is_alive
+
+    lxd_monitor.close_monitors()
+    assert not monitor.is_alive
+
+
+def test_lxc_monitor_unavailable(tmp_path):
+    lxc = LXC(lxc_path=tmp_path / "missing-lxc")
+
+    assert lxc.monitor() is None
+    assert lxc.monitor() is None
+
+
+def test_start_while_recording(fake_lxc, monkeypatch):
+    """Events are not used while recording, to poll the same way in the replay."""
+    monkeypatch.setattr(replay, "_session", replay.Recorder())
+    monkeypatch.setattr(replay, "_env_checked", True)
+    monitor = LXDMonitor(lxc_path=fake_lxc([]))
+
+    assert not monitor.start()
@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
 from datetime import timedelta
 from unittest.mock import MagicMock, call
 
@@ -21,7 +22,13 @@ import pytest
 from craft_providers import Executor
 from craft_providers.bases import ubuntu
 from craft_providers.errors import BaseConfigurationError
-from craft_providers.lxd import LXDError, LXDProvider, LXDUnstableImageError
+from craft_providers.lxd import (
+    AsyncLXDInstance,
+    LaunchHistory,
+    LXDError,
+    LXDProvider,
+    LXDUnstableImageError,
+)
 
 
 @pytest.fixture
@@ -131,7 +138,11 @@ def test_create_environment(mocker):
     provider.create_environment(instance_name="test-name")
 
     mock_lxd_instance.assert_called_once_with(
-        name="test-name", project="default", remote="local", intercept_mknod=True
+        name="test-name",
+        project="default",
+        remote="local",
+        lxc=provider.lxc,
+        intercept_mknod=True,
     )
 
 
@@ -183,8 +194,10 @@ def test_launched_environment(
                 use_base_instance=True,
                 project="default",
                 remote="local",
+                lxc=mock_lxc,
                 expiration=expiration,
                 prepare_instance=None,
+                history=None,
             ),
         ]
 
@@ -196,6 +209,165 @@ def test_launched_environment(
     ]
 
 
+def test_async_launched_environment(
+    mock_buildd_base_configuration,
+    mock_get_remote_image,
+    mock_remote_image,
+    mock_launch,
+    mock_lxc,
+    tmp_path,
+):
+    mock_launch.return_value.lxc.max_processes = None
+    provider = LXDProvider(lxc=mock_lxc)
+
+    async def launch():
+        async with provider.async_launched_environment(
+            project_name="test-project",
+            project_path=tmp_path,
+            base_configuration=mock_buildd_base_configuration,
+            instance_name="test-instance-name",
+        ) as executor:
+            assert isinstance(executor, AsyncLXDInstance)
+            assert executor.instance is mock_launch.return_value
+            mock_launch.reset_mock()
+
+    asyncio.run(launch())
+
+    assert mock_launch.mock_calls == [
+        call().unmount_all(),
+        call().stop(delay_mins=None),
+    ]
+
+
+def test_async_launched_environment_error(
+    mock_buildd_base_configuration,
+    mock_get_remote_image,
+    mock_remote_image,
+    mock_launch,
+    mock_lxc,
+    tmp_path,
+):
+    """The instance is stopped when the caller fails."""
+    mock_launch.return_value.lxc.max_processes = None
+    provider = LXDProvider(lxc=mock_lxc)
+
+    async def launch():
+        async with provider.async_launched_environment(
+            project_name="test-project",
+            project_path=tmp_path,
+            base_configuration=mock_buildd_base_configuration,
+            instance_name="test-instance-name",
+        ):
+            mock_launch.reset_mock()
+            raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError, match="failed"):
+        asyncio.run(launch())
+
+    assert mock_launch.mock_calls == [
+        call().unmount_all(),
+        call().stop(delay_mins=None),
+    ]
+
+
+def test_launch_many(
+    mock_buildd_base_configuration,
+    mock_get_remote_image,
+    mock_remote_image,
+    mock_lxc,
+    mocker,
+    tmp_path,
+):
+    instances = [MagicMock(), MagicMock()]
+    mock_launch_many = mocker.patch(
+        "craft_providers.lxd.lxd_provider.launch_many", return_value=iter(instances)
+    )
+    mock_ensure_guest_compatible = mocker.patch(
+        "craft_providers.bases.ensure_guest_compatible"
+    )
+    provider = LXDProvider(lxc=mock_lxc)
+
+    launched = provider.launch_many(
+        project_name="test-project",
+        project_path=tmp_path,
+        base_configuration=mock_buildd_base_configuration,
+        instance_names=["instance-1", "instance-2"],
+        instance_architecture="arm64",
+    )
+
+    assert list(launched) == instances
+    assert mock_launch_many.mock_calls == [
+        call(
+            ["instance-1", "instance-2"],
+            base_configuration=mock_buildd_base_configuration,
+            image_name="test-image-name/arm64",
+            image_remote="test-remote-name",
+            auto_clean=True,
+            auto_create_project=True,
+            map_user_uid=True,
+            uid=tmp_path.stat().st_uid,
+            use_base_instance=True,
+            project="default",
+            remote="local",
+            lxc=mock_lxc,
+            expiration=timedelta(days=90),
+            prepare_instance=None,
+            max_workers=8,
+            history=None,
+        )
+    ]
+    # the instances share an image, so only the first one is checked
+    mock_ensure_guest_compatible.assert_called_once_with(
+        mock_buildd_base_configuration,
+        instances[0],
+        mock_lxc.get_server_version.return_value,
+    )
+
+
+def test_launch_many_base_configuration_error(
+    mock_buildd_base_configuration,
+    mock_get_remote_image,
+    mock_remote_image,
+    mock_lxc,
+    mocker,
+    tmp_path,
+):
+    error = BaseConfigurationError(brief="fail")
+    mocker.patch("craft_providers.lxd.lxd_provider.launch_many", side_effect=error)
+    provider = LXDProvider(lxc=mock_lxc)
+
+    with pytest.raises(LXDError, match="fail") as raised:
+        provider.launch_many(
+            project_name="test-project",
+            project_path=tmp_path,
+            base_configuration=mock_buildd_base_configuration,
+            instance_names=["instance-1"],
+        )
+
+    assert raised.value.__cause__ is error
+
+
+def test_launched_environment_launch_history(
+    mock_buildd_base_configuration,
+    mock_get_remote_image,
+    mock_remote_image,
+    mock_launch,
+    mock_lxc,
+    tmp_path,
+):
+    """Launches are recorded in the provider's launch history."""
+    history = LaunchHistory(tmp_path / "history.sqlite3")
+    provider = LXDProvider(lxc=mock_lxc, launch_history=history)
+
+    with provider.launched_environment(
+        project_name="test-project",
+        project_path=tmp_path,
+        base_configuration=mock_buildd_base_configuration,
+        instance_name="test-instance-name",
+    ):
+        assert mock_launch.call_args.kwargs["history"] is history
+
+
 def test_launched_environment_prepare_instance(
     mock_buildd_base_configuration,
     mock_get_remote_image,
@@ -233,8 +405,10 @@ def test_launched_environment_prepare_instance(
                 use_base_instance=True,
                 project="default",
                 remote="local",
+                lxc=mock_lxc,
                 expiration=expiration,
                 prepare_instance=_prepare_instance,
+                history=None,
             ),
         ]
 
@@ -452,3 +626,33 @@ def test_lxd_prune_all_without_pruning_templates(mock_lxc_container):
     mock_lxc_container.delete.assert_any_call(
         instance_name="test-instance-2", project="default", remote="local", force=True
     )
+
+
+def test_lxd_prune_failures(mock_lxc_container, logs):
+    """Verify a failed deletion does not stop the others and is reported."""
+    provider = LXDProvider(
+        lxc=mock_lxc_container,
+        lxd_project="default",
+        lxd_remote="local",
+    )
+    mock_lxc_container.list_names.return_value = [
+        "test-instance-1",
+        "test-instance-2",
+        "test-instance-3",
+    ]
+
+    def delete(*, instance_name, **kwargs):
+        if instance_name == "test-instance-2":
+            raise LXDError(brief="Failed to delete instance.")
+
+    mock_lxc_container.delete.side_effect = delete
+
+    with pytest.raises(LXDError) as raised:
+        provider.prune(project_name="default")
+
+    assert raised.value == LXDError(
+        brief="Failed to prune 1 of 3 instances.",
+        details="* test-instance-2: Failed to delete instance.",
+    )
+    assert mock_lxc_container.delete.call_count == 3
+    assert "Failed to prune test-instance-2 " in logs.debug
@@ -19,7 +19,7 @@ from unittest import mock
 
 import pytest
 from craft_providers import lxd
-from craft_providers.lxd import project
+from craft_providers.lxd import LXDError, project
 
 
 @pytest.fixture(autouse=True)
@@ -59,30 +59,73 @@ def test_purge(mock_lxc):
 
     project.purge(lxc=mock_lxc, project="test-project", remote="test-remote")
 
-    assert mock_lxc.mock_calls == [
-        mock.call.project_list(remote="test-remote"),
-        mock.call.list_names(project="test-project", remote="test-remote"),
-        mock.call.delete(
-            instance_name="test-instance1",
-            project="test-project",
-            remote="test-remote",
-            force=True,
-        ),
-        mock.call.delete(
-            instance_name="test-instance2",
-            project="test-project",
-            remote="test-remote",
-            force=True,
-        ),
-        mock.call.image_list(project="test-project"),
-        mock.call.image_delete(
-            image="i1", project="test-project", remote="test-remote"
-        ),
-        mock.call.image_delete(
-            image="i2", project="test-project", remote="test-remote"
-        ),
-        mock.call.project_delete(project="test-project", remote="test-remote"),
+    # instances and images are deleted concurrently, in any order
+    mock_lxc.delete.assert_has_calls(
+        [
+            mock.call(
+                instance_name="test-instance1",
+                project="test-project",
+                remote="test-remote",
+                force=True,
+            ),
+            mock.call(
+                instance_name="test-instance2",
+                project="test-project",
+                remote="test-remote",
+                force=True,
+            ),
+        ],
+        any_order=True,
+    )
+    mock_lxc.image_delete.assert_has_calls(
+        [
+            mock.call(image="i1", project="test-project", remote="test-remote"),
+            mock.call(image="i2", project="test-project", remote="test-remote"),
+        ],
+        any_order=True,
+    )
+    assert [call[0] for call in mock_lxc.mock_calls] == [
+        "project_list",
+        "list_names",
+        "delete",
+        "delete",
+        "image_list",
+        "image_delete",
+        "image_delete",
+        "project_delete",
     ]
+    mock_lxc.project_delete.assert_called_once_with(
+        project="test-project", remote="test-remote"
+    )
+
+
+def test_purge_failures(mock_lxc):
+    """A failed deletion does not stop the others, and keeps the project."""
+    mock_lxc.project_list.return_value = ["test-project", "default"]
+    mock_lxc.list_names.return_value = ["test-instance1", "test-instance2"]
+    mock_lxc.image_list.return_value = [{"fingerprint": "i1"}, {"fingerprint": "i2"}]
+
+    def delete(*, instance_name, **kwargs):
+        if instance_name == "test-instance1":
+            raise LXDError(brief="Failed to delete instance 'test-instance1'.")
+
+    mock_lxc.delete.side_effect = delete
+    mock_lxc.image_delete.side_effect = [None, LXDError(brief="Image in use.")]
+
+    with pytest.raises(LXDError) as raised:
+        project.purge(lxc=mock_lxc, project="test-project", remote="test-remote")
+
+    assert raised.value.brief == (
+        "Failed to purge project 'test-project' on remote 'test-remote'."
+    )
+    assert raised.value.details is not None
+    details = raised.value.details.splitlines()
+    assert details[0] == "* test-instance1: Failed to delete instance 'test-instance1'."
+    assert len(details) == 2
+    assert details[1] in ("* i1: Image in use.", "* i2: Image in use.")
+    assert mock_lxc.delete.call_count == 2
+    assert mock_lxc.image_delete.call_count == 2
+    mock_lxc.project_delete.assert_not_called()
 
 
 def test_purge_no_project(mock_lxc):
@@ -18,7 +18,7 @@
 from unittest import mock
 
 import pytest
-from craft_providers import Base, bases, multipass
+from craft_providers import Base, ProviderError, bases, multipass
 
 
 @pytest.fixture
@@ -126,3 +126,32 @@ def test_launch_with_existing_instance_incompatible_without_auto_clean(
     assert mock_base_configuration.mock_calls == [
         mock.call.warmup(executor=mock_multipass_instance)
     ]
+
+
+def test_launch_many(mock_base_configuration, mock_multipass_instance):
+    mock_multipass_instance.exists.return_value = False
+
+    instances = multipass.launch_many(
+        ["instance-1", "instance-2"],
+        base_configuration=mock_base_configuration,
+        image_name="30.04",
+    )
+
+    assert list(instances) == [mock_multipass_instance, mock_multipass_instance]
+    assert mock_base_configuration.mock_calls == [
+        mock.call.setup(executor=mock_multipass_instance),
+        mock.call.setup(executor=mock_multipass_instance),
+    ]
+
+
+def test_launch_many_duplicate_names(mock_base_configuration, mock_multipass_instance):
+    """The names are checked when called, before the iterator is consumed."""
+    with pytest.raises(ProviderError) as raised:
+        multipass.launch_many(
+            ["instance-1", "instance-2", "instance-1"],
+            base_configuration=mock_base_configuration,
+            image_name="30.04",
+        )
+
+    assert raised.value.brief == "instance names must be unique: instance-1"
+    mock_multipass_instance.launch.assert_not_called()
@@ -125,6 +125,28 @@ def test_delete_purge(fake_process):
     assert len(fake_process.calls) == 1
 
 
+@pytest.mark.parametrize(
+    ("command", "instance"),
+    [
+        (["delete", "test-instance", "--purge"], "test-instance"),
+        (["launch", "snapcraft:22.04", "--name", "test-instance"], "test-instance"),
+        (["transfer", "/src", "test-instance:/dst"], "test-instance"),
+        (["list", "--format", "json"], None),
+    ],
+)
+def test_run_traced(fake_process, tracer, command, instance):
+    fake_process.register_subprocess(["multipass", *command], stdout=b"out")
+
+    Multipass()._run(command)
+
+    [event] = tracer.events
+    assert event.category == "multipass"
+    assert event.name == f"multipass {command[0]}"
+    assert event.instance == instance
+    assert event.exit_code == 0
+    assert event.bytes_out == 3
+
+
 def test_delete_error(fake_process, mock_details_from_process_error):
     fake_process.register_subprocess(
         ["multipass", "delete", "test-instance", "--purge"],
@@ -496,6 +518,19 @@ def test_transfer_error(fake_process, mock_details_from_process_error):
     )
 
 
+def test_transfer_not_found(fake_process):
+    fake_process.register_subprocess(
+        ["multipass", "transfer", "test-instance:/test1", "/test2"],
+        stderr=b"[sftp] remote file does not exist",
+        returncode=1,
+    )
+
+    with pytest.raises(FileNotFoundError) as exc_info:
+        Multipass().transfer(source="test-instance:/test1", destination="/test2")
+
+    assert str(exc_info.value) == "File not found: 'test-instance:/test1'"
+
+
 def test_transfer_destination_io(fake_process):
     stream = mock.Mock()
     fake_process.register_subprocess(
@@ -510,6 +545,22 @@ def test_transfer_destination_io(fake_process):
     assert stream.mock_calls == [mock.call.write(b"Hello World!\n")]
 
 
+def test_transfer_destination_io_traced(fake_process, tracer):
+    fake_process.register_subprocess(
+        ["multipass", "transfer", "test-instance:/test1", "-"], stdout=b"Hello World!\n"
+    )
+
+    Multipass().transfer_destination_io(
+        source="test-instance:/test1", destination=io.BytesIO()
+    )
+
+    [event] = tracer.events
+    assert event.name == "multipass transfer"
+    assert event.instance == "test-instance"
+    assert event.exit_code == 0
+    assert event.bytes_out == 13
+
+
 def test_transfer_destination_io_chunk_size(fake_process):
     stream = mock.Mock()
     fake_process.register_subprocess(
@@ -555,6 +606,21 @@ def test_transfer_destination_io_error(fake_process):
     )
 
 
+def test_transfer_destination_io_not_found(fake_process):
+    fake_process.register_subprocess(
+        ["multipass", "transfer", "test-instance:/test1", "-"],
+        stderr=b"[sftp] remote file does not exist",
+        returncode=1,
+    )
+
+    with io.BytesIO() as stream, pytest.raises(FileNotFoundError) as exc_info:
+        Multipass().transfer_destination_io(
+            source="test-instance:/test1", destination=stream
+        )
+
+    assert str(exc_info.value) == "File not found: 'test-instance:/test1'"
+
+
 @mock.patch("subprocess.Popen")
 def test_transfer_source_io(mock_popen):
     mock_popen.return_value.__enter__.return_value.returncode = 0
@@ -480,8 +480,6 @@ def test_mount_already_mounted(mock_multipass, instance, project_path):
 
 
 def test_pull_file(mock_multipass, instance, tmp_path):
-    mock_multipass.exec.return_value = mock.Mock(returncode=0)
-
     source = pathlib.PurePosixPath("/tmp/src.txt")
     destination = tmp_path / "dst.txt"
 
@@ -491,13 +489,6 @@ def test_pull_file(mock_multipass, instance, tmp_path):
     )
 
     assert mock_multipass.mock_calls == [
-        mock.call.exec(
-            instance_name="test-instance",
-            command=["sudo", "-H", "--", "test", "-f", "/tmp/src.txt"],
-            runner=subprocess.run,
-            check=False,
-            timeout=60,
-        ),
         mock.call.transfer(
             source="test-instance:/tmp/src.txt", destination=str(destination)
         ),
@@ -505,7 +496,9 @@ def test_pull_file(mock_multipass, instance, tmp_path):
 
 
 def test_pull_file_no_source(mock_multipass, instance, tmp_path):
-    mock_multipass.exec.return_value = mock.Mock(returncode=1)
+    mock_multipass.transfer.side_effect = FileNotFoundError(
+        "File not found: 'test-instance:/tmp/src.txt'"
+    )
 
     source = pathlib.PurePosixPath("/tmp/src.txt")
     destination = tmp_path / "dst.txt"
@@ -516,21 +509,10 @@ def test_pull_file_no_source(mock_multipass, instance, tmp_path):
             destination=destination,
         )
 
-    assert mock_multipass.mock_calls == [
-        mock.call.exec(
-            instance_name="test-instance",
-            command=["sudo", "-H", "--", "test", "-f", "/tmp/src.txt"],
-            runner=subprocess.run,
-            check=False,
-            timeout=60,
-        ),
-    ]
-    assert str(exc_info.value) == "File not found: '/tmp/src.txt'"
+    assert str(exc_info.value) == "File not found: 'test-instance:/tmp/src.txt'"
 
 
 def test_pull_file_no_parent_directory(mock_multipass, instance, tmp_path):
-    mock_multipass.exec.return_value = mock.Mock(returncode=0)
-
     source = pathlib.PurePosixPath("/tmp/src.txt")
     destination = tmp_path / "not-created" / "dst.txt"
 
@@ -540,16 +522,24 @@ def test_pull_file_no_parent_directory(mock_multipass, instance, tmp_path):
             destination=destination,
         )
 
+    assert mock_multipass.mock_calls == []
+    assert str(exc_info.value) == f"Directory not found: {str(destination.parent)!r}"
+
+
+def test_read_file(mock_multipass, instance):
+    def transfer_destination_io(*, source, destination):
+        destination.write(b"content")
+
+    mock_multipass.transfer_destination_io.side_effect = transfer_destination_io
+
+    content = instance.read_file(source=pathlib.PurePosixPath("/tmp/src.txt"))
+
+    assert content == b"content"
     assert mock_multipass.mock_calls == [
-        mock.call.exec(
-            instance_name="test-instance",
-            command=["sudo", "-H", "--", "test", "-f", "/tmp/src.txt"],
-            runner=subprocess.run,
-            check=False,
-            timeout=60,
+        mock.call.transfer_destination_io(
+            source="test-instance:/tmp/src.txt", destination=mock.ANY
         ),
     ]
-    assert str(exc_info.value) == f"Directory not found: {str(destination.parent)!r}"
 
 
 def test_push_file(mock_multipass, instance, simple_file):
@@ -13,6 +13,7 @@
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import asyncio
 import pathlib
 from unittest.mock import call
 
@@ -20,7 +21,11 @@ import pytest
 from craft_providers import Executor, ProviderError
 from craft_providers.bases import ubuntu
 from craft_providers.errors import BaseConfigurationError
-from craft_providers.multipass import MultipassError, MultipassProvider
+from craft_providers.multipass import (
+    AsyncMultipassInstance,
+    MultipassError,
+    MultipassProvider,
+)
 from craft_providers.multipass.multipass_instance import MultipassInstance
 from craft_providers.multipass.multipass_provider import (
     _BUILD_BASE_TO_MULTIPASS_REMOTE_IMAGE,
@@ -170,6 +175,63 @@ def test_launched_environment(
     ]
 
 
+def test_async_launched_environment(mock_launch, tmp_path):
+    provider = MultipassProvider()
+    base_configuration = ubuntu.BuilddBase(alias=ubuntu.BuilddBaseAlias.JAMMY)
+
+    async def launch():
+        async with provider.async_launched_environment(
+            project_name="test-project",
+            project_path=tmp_path,
+            base_configuration=base_configuration,
+            instance_name="test-instance-name",
+        ) as executor:
+            assert isinstance(executor, AsyncMultipassInstance)
+            assert executor.instance is mock_launch.return_value
+            mock_launch.reset_mock()
+
+    asyncio.run(launch())
+
+    assert mock_launch.mock_calls == [
+        call().unmount_all(),
+        call().stop(delay_mins=0),
+    ]
+
+
+def test_launch_many(mocker, tmp_path):
+    instances = [mocker.Mock(), mocker.Mock()]
+    mock_launch_many = mocker.patch(
+        "craft_providers.multipass.multipass_provider.launch_many",
+        return_value=iter(instances),
+    )
+    provider = MultipassProvider()
+    base_configuration = ubuntu.BuilddBase(alias=ubuntu.BuilddBaseAlias.JAMMY)
+
+    launched = provider.launch_many(
+        project_name="test-project",
+        project_path=tmp_path,
+        base_configuration=base_configuration,
+        instance_names=["instance-1", "instance-2"],
+        max_workers=2,
+    )
+
+    # the instances are set up for launching before the iterator is consumed
+    assert mock_launch_many.mock_calls == [
+        call(
+            ["instance-1", "instance-2"],
+            base_configuration=base_configuration,
+            image_name="snapcraft:22.04",
+            cpus=2,
+            disk_gb=64,
+            mem_gb=2,
+            auto_clean=True,
+            prepare_instance=None,
+            max_workers=2,
+        )
+    ]
+    assert list(launched) == instances
+
+
 @pytest.mark.parametrize(
     ("is_stable", "allow_unstable"),
     [
@@ -0,0 +1,310 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+import asyncio
+import io
+import os
+import subprocess
+import time
+
+import pytest
+from craft_providers import ProviderError
+from craft_providers.async_executor import AsyncExecutor
+from craft_providers.util import env_cmd
+from typing_extensions import override
+
+
+class HostAsyncExecutor(AsyncExecutor):
+    """Run the commands on the host, as if it was the environment."""
+
+    def __init__(self, max_processes=None) -> None:
+        super().__init__(instance_name="host", max_processes=max_processes)
+
+    @override
+    def get_exec_command(self, command, *, cwd=None, env=None):
+        if env is None and cwd is None:
+            return command
+        return [*env_cmd.formulate_command(env, chdir=cwd), *command]
+
+
+@pytest.fixture
+def executor():
+    return HostAsyncExecutor()
+
+
+@pytest.fixture
+def owner():
+    return {"user": str(os.getuid()), "group": str(os.getgid())}
+
+
+def test_execute_run(executor):
+    result = asyncio.run(
+        executor.execute_run(
+            ["sh", "-c", "echo $FOO; echo error >&2"],
+            env={"FOO": "bar"},
+            capture_output=True,
+            text=True,
+        )
+    )
+
+    assert result.returncode == 0
+    assert result.stdout == "bar\n"
+    assert result.stderr == "error\n"
+
+
+def test_execute_run_input(executor):
+    result = asyncio.run(
+        executor.execute_run(["cat"], input=b"data", capture_output=True)
+    )
+
+    assert result.stdout == b"data"
+
+
+def test_execute_run_cwd(executor, tmp_path):
+    result = asyncio.run(
+        executor.execute_run(["pwd"], cwd=tmp_path, capture_output=True, text=True)
+    )
+
+    assert result.stdout == f"{tmp_path}\n"
+
+
+def test_execute_run_check(executor):
+    result = asyncio.run(executor.execute_run(["false"]))
+    assert result.returncode == 1
+
+    with pytest.raises(subprocess.CalledProcessError) as raised:
+        asyncio.run(executor.execute_run(["false"], check=True))
+
+    assert raised.value.cmd == ["false"]
+
+
+def test_execute_run_timeout(executor):
+    with pytest.raises(subprocess.TimeoutExpired) as raised:
+        asyncio.run(executor.execute_run(["sleep", "10"], timeout=0.1))
+
+    assert raised.value.timeout == 0.1
+
+
+def test_execute_run_concurrent(executor):
+    """Commands run concurrently on one event loop."""
+
+    async def run_all():
+        return await asyncio.gather(
+            *(executor.execute_run(["sleep", "0.5"]) for _ in range(20))
+        )
+
+    start = time.monotonic()
+    results = asyncio.run(run_all())
+
+    assert [result.returncode for result in results] == [0] * 20
+    assert time.monotonic() - start < 5
+
+
+def test_execute_run_capped():
+    """No more than max_processes commands run at once."""
+    executor = HostAsyncExecutor(max_processes=2)
+
+    async def run_all():
+        return await asyncio.gather(
+            *(executor.execute_run(["sleep", "0.2"]) for _ in range(6))
+        )
+
+    start = time.monotonic()
+    results = asyncio.run(run_all())
+
+    assert [result.returncode for result in results] == [0] * 6
+    assert time.monotonic() - start >= 0.6
+
+
+@pytest.mark.parametrize("operation", ["execute_run", "push_file_io", "pull_file"])
+def test_process_slot(owner, tmp_path, operation):
+    """Each operation waits for a free process slot before spawning a process."""
+    executor = HostAsyncExecutor(max_processes=1)
+    source = tmp_path / "source"
+    source.write_bytes(b"content")
+    destination = tmp_path / "destination"
+    calls = {
+        "execute_run": lambda: executor.execute_run(
+            ["cp", str(source), str(destination)]
+        ),
+        "push_file_io": lambda: executor.push_file_io(
+            destination=destination,
+            content=io.BytesIO(b"content"),
+            file_mode="0644",
+            **owner,
+        ),
+        "pull_file": lambda: executor.pull_file(source=source, destination=destination),
+    }
+
+    async def run():
+        async with executor._process_slots:
+            task = asyncio.create_task(calls[operation]())
+            await asyncio.sleep(0.2)
+            assert not task.done()
+            assert not destination.exists()
+        await task
+
+    asyncio.run(run())
+
+    assert destination.read_bytes() == b"content"
+
+
+def test_execute_run_traced(executor, tracer):
+    asyncio.run(executor.execute_run(["cat"], input="data", capture_output=True))
+
+    assert [
+        (event.name, event.exit_code, event.bytes_in, event.bytes_out)
+        for event in tracer.events
+    ] == [("exec exec", 0, 4, 4)]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [io.BytesIO(b"content"), [b"con", b"tent"]],
+)
+def test_push_file_io(executor, owner, tmp_path, content):
+    destination = tmp_path / "file"
+
+    asyncio.run(
+        executor.push_file_io(
+            destination=destination, content=content, file_mode="0640", **owner
+        )
+    )
+
+    assert destination.read_bytes() == b"content"
+    assert oct(destination.stat().st_mode & 0o777) == "0o640"
+
+
+def test_push_file_io_error(executor, owner, tmp_path):
+    destination = tmp_path / "missing" / "file"
+
+    with pytest.raises(ProviderError) as raised:
+        asyncio.run(
+            executor.push_file_io(
+                destination=destination,
+                content=io.BytesIO(b"content"),
+                file_mode="0644",
+                **owner,
+            )
+        )
+
+    assert raised.value.brief == (
+        f"Failed to create file {destination.as_posix()!r} in instance 'host'."
+    )
+
+
+def test_push_file_io_timeout(owner, tmp_path, monkeypatch):
+    """The exec is killed if it does not finish once the content is written."""
+
+    class HangingAsyncExecutor(HostAsyncExecutor):
+        @override
+        def get_exec_command(self, command, *, cwd=None, env=None):
+            return ["sh", "-c", "cat >/dev/null; exec sleep 10"]
+
+    monkeypatch.setattr("craft_providers.async_executor.TIMEOUT_SIMPLE", 0.1)
+    destination = tmp_path / "file"
+    start = time.monotonic()
+
+    with pytest.raises(ProviderError) as raised:
+        asyncio.run(
+            HangingAsyncExecutor().push_file_io(
+                destination=destination,
+                content=io.BytesIO(b"content"),
+                file_mode="0644",
+                **owner,
+            )
+        )
+
+    assert time.monotonic() - start < 5
+    assert raised.value.brief == (
+        f"Failed to create file {destination.as_posix()!r} in instance 'host'."
+    )
+    assert "timed out after 0.1 seconds" in str(raised.value.details)
+
+
+def test_pull_file(executor, tmp_path):
+    source = tmp_path / "source"
+    source.write_bytes(b"content")
+    destination = tmp_path / "destination"
+
+    asyncio.run(executor.pull_file(source=source, destination=destination))
+
+    assert destination.read_bytes() == b"content"
+
+
+def test_pull_file_replaces_destination(executor, tmp_path):
+    source = tmp_path / "source"
+    source.write_bytes(b"content")
+    destination = tmp_path / "destination"
+    destination.write_bytes(b"previous content")
+
+    asyncio.run(executor.pull_file(source=source, destination=destination))
+
+    assert destination.read_bytes() == b"content"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "destination",
+        "source",
+    ]
+
+
+def test_pull_file_error_keeps_destination(executor, tmp_path):
+    """A failed pull does not touch an existing host file."""
+    destination = tmp_path / "destination"
+    destination.write_bytes(b"previous content")
+
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(
+            executor.pull_file(source=tmp_path / "missing", destination=destination)
+        )
+
+    assert destination.read_bytes() == b"previous content"
+    assert [path.name for path in tmp_path.iterdir()] == ["destination"]
+
+
+def test_pull_file_not_found(executor, tmp_path):
+    destination = tmp_path / "destination"
+
+    with pytest.raises(FileNotFoundError) as raised:
+        asyncio.run(
+            executor.pull_file(source=tmp_path / "missing", destination=destination)
+        )
+
+    assert str(raised.value) == f"File not found: {(tmp_path / 'missing').as_posix()!r}"
+    assert not destination.exists()
+
+
+def test_pull_file_no_parent(executor, tmp_path):
+    with pytest.raises(FileNotFoundError) as raised:
+        asyncio.run(
+            executor.pull_file(
+                source=tmp_path / "source", destination=tmp_path / "dir" / "file"
+            )
+        )
+
+    assert str(raised.value) == f"Directory not found: {str(tmp_path / 'dir')!r}"
+
+
+def test_pull_file_error(executor, tmp_path):
+    with pytest.raises(ProviderError) as raised:
+        asyncio.run(
+            executor.pull_file(source=tmp_path, destination=tmp_path / "destination")
+        )
+
+    assert raised.value.brief == (
+        f"Failed to pull file {tmp_path.as_posix()!r} from instance 'host'."
+    )
+    assert not (tmp_path / "destination").exists()
@@ -20,12 +20,16 @@ import enum
 import logging
 import pathlib
 import subprocess
+import threading
+import time
 from unittest import mock
 
 import pytest
 import pytest_subprocess.fake_popen
 from craft_providers import Executor, base
 from craft_providers.errors import BaseConfigurationError, ProviderError
+from craft_providers.phases import PhaseEmitter
+from craft_providers.util import retry
 
 from tests.unit.conftest import DEFAULT_FAKE_CMD
 
@@ -62,6 +66,10 @@ class FakeBase(base.Base[enum.Enum]):
         pass
 
 
+class FakeEmitterExecutor(PhaseEmitter):
+    """An executor with phase observers, such as an LXD instance."""
+
+
 @pytest.fixture
 def fake_base() -> base.Base[enum.Enum]:
     return FakeBase()
@@ -323,6 +331,43 @@ def test_get_os_release_exception(fake_base, mock_executor):
         fake_base.get_os_release(executor=mock_executor)
 
 
+@pytest.mark.parametrize(
+    ("wait", "expected"),
+    [
+        (
+            "os_release",
+            retry.FastThenSlow(fast_delay=0.002, fast_attempts=10, slow_delay=0.02),
+        ),
+        ("system_ready", retry.ExponentialBackoff(initial=0.005, maximum=0.04)),
+        ("network", retry.ExponentialBackoff(initial=0.01, maximum=0.08)),
+        (
+            "snap_refresh",
+            retry.FastThenSlow(fast_delay=0.01, fast_attempts=4, slow_delay=0.08),
+        ),
+        ("http", retry.ExponentialBackoff(initial=0.04, maximum=0.4, jitter=0.5)),
+    ],
+)
+def test_get_retry_policy(fake_base, wait, expected):
+    """The default retry policies scale with `_retry_wait`."""
+    assert fake_base._get_retry_policy(wait) == expected
+
+
+def test_retry_policy_override(fake_process, fake_executor, fake_base, mocker, logs):
+    """Subclasses can replace the retry policy of a kind of wait."""
+    policy = retry.FixedDelay(0.001)
+    mocker.patch.object(fake_base, "_get_retry_policy", return_value=policy)
+    cmd = [*DEFAULT_FAKE_CMD, *WAIT_FOR_NETWORK_CMD]
+    fake_process.register(cmd, returncode=1)
+    fake_process.register(cmd, returncode=0)
+    sleep = mocker.spy(time, "sleep")
+
+    fake_base._setup_wait_for_network(fake_executor)
+
+    fake_base._get_retry_policy.assert_called_once_with("network")
+    sleep.assert_called_once_with(0.001)
+    assert "Wait for network succeeded after 2 attempt" in logs.debug
+
+
 def test_set_hostname(fake_base):
     bad_name = "bad_123-ABC%-"
     fake_base._set_hostname(bad_name)
@@ -397,3 +442,200 @@ def test_snap_refresh_watch_retry(fake_process, fake_executor, fake_base):
         fake_process.register_subprocess(snap_watch, returncode=returncode)
 
     fake_base._disable_and_wait_for_snap_refresh(executor=fake_executor)
+
+
+WARMUP_PHASES = [
+    "ensure_setup_completed",
+    "pre_image_check",
+    "image_check",
+    "post_image_check",
+    "mount_shared_cache_dirs",
+    "setup_wait_for_system_ready",
+    "setup_wait_for_network",
+    "setup_permissions",
+    "warmup_snapd",
+    "pre_setup_snaps",
+    "setup_snaps",
+    "post_setup_snaps",
+]
+
+
+@pytest.fixture
+def mock_warmup_steps(fake_base, mocker):
+    return {
+        name: mocker.patch.object(
+            fake_base, name if name == "setup_permissions" else f"_{name}"
+        )
+        for name in WARMUP_PHASES
+    }
+
+
+def test_warmup_phase_events(fake_base, mock_executor, mock_warmup_steps):
+    events = []
+    fake_base.add_phase_observer(events.append)
+
+    fake_base.warmup(executor=mock_executor)
+
+    assert [(event.name, event.type.value) for event in events] == [
+        ("warmup", "start"),
+        *(
+            (name, event_type)
+            for name in WARMUP_PHASES
+            for event_type in ("start", "end")
+        ),
+        ("warmup", "end"),
+    ]
+    mock_warmup_steps["setup_snaps"].assert_called_once_with(executor=mock_executor)
+    assert events[-1].duration == events[-1].timestamp - events[0].timestamp
+    assert not any(event.failed for event in events)
+
+
+def test_warmup_phase_events_error(fake_base, mock_executor, mock_warmup_steps):
+    events = []
+    fake_base.add_phase_observer(events.append)
+    mock_warmup_steps["image_check"].side_effect = BaseConfigurationError("error")
+
+    with pytest.raises(BaseConfigurationError):
+        fake_base.warmup(executor=mock_executor)
+
+    assert [(event.name, event.failed) for event in events[-2:]] == [
+        ("image_check", True),
+        ("warmup", True),
+    ]
+
+
+def test_warmup_phase_events_executor(fake_base, mock_warmup_steps):
+    """The phases of a run are reported to the observers of its executor."""
+    first, second = FakeEmitterExecutor(), FakeEmitterExecutor()
+    base_events, first_events, second_events = [], [], []
+    fake_base.add_phase_observer(base_events.append)
+    first.add_phase_observer(first_events.append)
+    # observers of the base added to the executor are called once
+    first.add_phase_observer(base_events.append)
+    second.add_phase_observer(second_events.append)
+
+    fake_base.warmup(executor=first)
+
+    assert len(first_events) == len(WARMUP_PHASES) * 2 + 2
+    assert base_events == first_events
+    assert second_events == []
+
+
+@pytest.mark.parametrize("timeout", [0, -1])
+def test_warmup_invalid_timeout(fake_base, mock_executor, mock_warmup_steps, timeout):
+    with pytest.raises(BaseConfigurationError, match="Invalid timeout value"):
+        fake_base.warmup(executor=mock_executor, timeout=timeout)
+
+    mock_warmup_steps["ensure_setup_completed"].assert_not_called()
+
+
+def test_warmup_run_context(fake_base, mock_executor, mock_warmup_steps):
+    runs = []
+    mock_warmup_steps["image_check"].side_effect = lambda executor: runs.append(
+        fake_base._run_context
+    )
+
+    fake_base.warmup(executor=mock_executor, timeout=None)
+
+    assert len(runs) == 1
+    assert runs[0].executor is mock_executor
+    assert runs[0].timeout_simple is None
+    assert runs[0].timeout_complex is None
+    assert runs[0].timeout_unpredictable is None
+    # the timeouts of the base are unchanged
+    assert fake_base._run_context.executor is None
+    assert fake_base._run_context.timeout_simple == 1
+    assert fake_base._timeout_unpredictable == 4
+
+
+def test_warmup_concurrent_run_contexts(fake_base, mock_warmup_steps):
+    """One base can warm up several instances at once, each with its own state."""
+    executors = [mock.Mock(spec=Executor) for _ in range(4)]
+    all_started = threading.Barrier(len(executors), timeout=5)
+    seen = {}
+
+    def image_check(executor):
+        all_started.wait()
+        run = fake_base._run_context
+        seen[executors.index(executor)] = (run.executor, run.timeout_unpredictable)
+
+    mock_warmup_steps["image_check"].side_effect = image_check
+
+    threads = [
+        threading.Thread(
+            target=fake_base.warmup,
+            kwargs={"executor": executor, "timeout": index + 1},
+        )
+        for index, executor in enumerate(executors)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == {
+        index: (executor, index + 1) for index, executor in enumerate(executors)
+    }
+    assert fake_base._timeout_unpredictable == 4
+
+
+def test_warmup_deadline_passed(fake_base, mock_executor, mock_warmup_steps):
+    mock_warmup_steps["image_check"].side_effect = lambda executor: time.sleep(0.2)
+
+    with pytest.raises(BaseConfigurationError, match="Timed out configuring"):
+        fake_base.warmup(executor=mock_executor, deadline=time.monotonic() + 0.1)
+
+    mock_warmup_steps["image_check"].assert_called_once()
+    mock_warmup_steps["post_image_check"].assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("timeout", "expected"),
+    [(None, 10), (5, 5), (100, 10)],
+)
+def test_run_context_timeouts_until_deadline(monkeypatch, timeout, expected):
+    monkeypatch.setattr(time, "monotonic", lambda: 1000.0)
+    run = base.RunContext(
+        simple_timeout=timeout,
+        complex_timeout=timeout,
+        unpredictable_timeout=timeout,
+        deadline=1010.0,
+    )
+
+    assert run.timeout_simple == expected
+    assert run.timeout_complex == expected
+    assert run.timeout_unpredictable == expected
+
+
+def test_run_context_deadline_passed(monkeypatch):
+    monkeypatch.setattr(time, "monotonic", lambda: 1000.0)
+    run = base.RunContext(deadline=1000.0)
+
+    with pytest.raises(BaseConfigurationError, match="Timed out configuring"):
+        run.check_deadline()
+    with pytest.raises(BaseConfigurationError, match="Timed out configuring"):
+        _ = run.timeout_simple
+
+
+def test_get_os_release_cached_during_run(
+    fake_process, fake_executor, fake_base, mock_warmup_steps
+):
+    """os-release is read once per run, and again in other runs."""
+    fake_process.register_subprocess(
+        [*DEFAULT_FAKE_CMD, "cat", "/etc/os-release"],
+        stdout="NAME=Ubuntu\n",
+        occurrences=2,
+    )
+    results = []
+
+    def image_check(executor):
+        results.append(fake_base.get_os_release(executor=executor))
+        results.append(fake_base.get_os_release(executor=executor))
+
+    mock_warmup_steps["image_check"].side_effect = image_check
+
+    fake_base.warmup(executor=fake_executor)
+    fake_base.warmup(executor=fake_executor)
+
+    assert results == [{"NAME": "Ubuntu"}] * 4
+    assert fake_process.call_count([*DEFAULT_FAKE_CMD, "cat", "/etc/os-release"]) == 2
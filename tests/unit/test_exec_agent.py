@@ -0,0 +1,315 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+import ast
+import shutil
+import subprocess
+import sys
+
+import pytest
+from craft_providers.errors import ExecAgentError
+from craft_providers.exec_agent import ExecAgent, get_agent_command
+from typing_extensions import override
+
+from .conftest import FakeExecutor
+
+pytestmark = [
+    pytest.mark.skipif(
+        shutil.which("python3") is None or sys.platform == "win32",
+        reason="runs the agent with the local python3",
+    )
+]
+
+
+class LocalExecutor(FakeExecutor):
+    """Executor that runs commands on the host, standing in for an instance."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.popen_calls: list[list[str]] = []
+
+    @override
+    def execute_popen(self, command, *, cwd=None, env=None, timeout=None, **kwargs):
+        self.popen_calls.append(command)
+        return subprocess.Popen(command, cwd=cwd, **kwargs)
+
+
+@pytest.fixture
+def executor():
+    executor = LocalExecutor()
+    yield executor
+    executor.stop_exec_agent()
+
+
+@pytest.fixture
+def agent(executor):
+    assert executor.start_exec_agent()
+    assert executor.exec_agent is not None
+    return executor.exec_agent
+
+
+def test_get_agent_command():
+    command = get_agent_command()
+
+    assert command[:2] == ["python3", "-c"]
+    # the agent runs in instances with Python as old as 3.5
+    ast.parse(command[2], feature_version=(3, 5))
+
+
+def test_start_once(executor):
+    assert executor.start_exec_agent()
+    assert executor.start_exec_agent()
+
+    assert len(executor.popen_calls) == 1
+
+
+def test_start_error(executor, mocker):
+    mocker.patch.object(executor, "execute_popen", side_effect=FileNotFoundError)
+
+    assert not executor.start_exec_agent()
+    assert executor.exec_agent is None
+
+
+def test_start_bad_agent(executor, mocker):
+    """Fall back if the agent does not start, e.g. without python3."""
+    mocker.patch("craft_providers.exec_agent.get_agent_command", return_value=["false"])
+
+    assert not executor.start_exec_agent()
+    assert executor.exec_agent is None
+
+
+def test_session(executor):
+    with executor.exec_agent_session() as started:
+        assert started
+        agent = executor.exec_agent
+        assert agent is not None
+        assert agent.is_alive
+
+    assert executor.exec_agent is None
+    assert not agent.is_alive
+
+
+def test_session_keeps_running_agent(executor, agent):
+    with executor.exec_agent_session() as started:
+        assert started
+
+    assert executor.exec_agent is agent
+
+
+def test_run(agent, tmp_path):
+    returncode, stdout, stderr = agent.run(
+        ["sh", "-c", "cat; pwd; echo error >&2; exit 3"],
+        cwd=tmp_path,
+        input=b"input\n",
+    )
+
+    assert returncode == 3
+    assert stdout == f"input\n{tmp_path}\n".encode()
+    assert stderr == b"error\n"
+
+
+def test_run_many(agent):
+    """Run many commands over the same process."""
+    for i in range(50):
+        assert agent.run(["echo", str(i)]) == (0, f"{i}\n".encode(), b"")
+
+
+def test_run_stderr_to_stdout(agent):
+    returncode, stdout, stderr = agent.run(
+        ["sh", "-c", "echo out; echo err >&2"], stderr_to_stdout=True
+    )
+
+    assert returncode == 0
+    assert stdout == b"out\nerr\n"
+    assert stderr == b""
+
+
+@pytest.mark.parametrize(
+    ("command", "expected"), [(["does-not-exist"], 127), (["/"], 126)]
+)
+def test_run_not_executable(agent, command, expected):
+    returncode, stdout, stderr = agent.run(command)
+
+    assert returncode == expected
+    assert stdout == b""
+    assert stderr
+
+
+def test_run_timeout(agent):
+    with pytest.raises(subprocess.TimeoutExpired):
+        agent.run(["sleep", "10"], timeout=0.1)
+
+    assert agent.run(["true"]) == (0, b"", b"")
+
+
+def test_write_read_file(agent, tmp_path):
+    path = tmp_path / "file"
+
+    agent.write_file(path, b"\x00content\xff", mode=0o600)
+
+    assert path.read_bytes() == b"\x00content\xff"
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert agent.read_file(path) == b"\x00content\xff"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_write_file_owner(agent, tmp_path):
+    path = tmp_path / "file"
+    user = subprocess.run(
+        ["id", "-un"], check=True, capture_output=True, text=True
+    ).stdout.strip()
+    group = subprocess.run(
+        ["id", "-gn"], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+    agent.write_file(path, b"content", user=user, group=group)
+
+    assert path.read_bytes() == b"content"
+
+
+def test_write_file_unknown_user(agent, tmp_path):
+    path = tmp_path / "file"
+
+    with pytest.raises(ExecAgentError, match="failed to access"):
+        agent.write_file(path, b"content", user="no-such-user-for-craft")
+
+    assert list(tmp_path.iterdir()) == []
+    assert agent.is_alive
+
+
+def test_read_file_not_found(agent, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        agent.read_file(tmp_path / "missing")
+
+
+def test_write_file_error(agent, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        agent.write_file(tmp_path / "missing" / "file", b"content")
+
+
+def test_agent_exited(executor, agent):
+    agent._process.kill()
+    agent._process.wait()
+
+    assert not agent.is_alive
+    assert executor.exec_agent is None
+    with pytest.raises(ExecAgentError, match="not running"):
+        agent.run(["true"])
+
+
+def test_agent_broken_channel(agent):
+    agent._process.stdout.close()
+
+    with pytest.raises(ExecAgentError, match="Failed to receive"):
+        agent.run(["true"])
+
+    assert not agent.is_alive
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        (
+            {"capture_output": True},
+            subprocess.CompletedProcess([], 0, b"out\n", b"err\n"),
+        ),
+        (
+            {"capture_output": True, "text": True},
+            subprocess.CompletedProcess([], 0, "out\n", "err\n"),
+        ),
+        (
+            {"stdout": subprocess.PIPE, "stderr": subprocess.STDOUT},
+            subprocess.CompletedProcess([], 0, b"out\nerr\n", None),
+        ),
+        (
+            {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL},
+            subprocess.CompletedProcess([], 0, None, None),
+        ),
+        (
+            {"stdout": subprocess.PIPE, "stderr": subprocess.DEVNULL, "input": b"in"},
+            subprocess.CompletedProcess([], 0, b"out\n", None),
+        ),
+    ],
+)
+def test_execute_run(agent, kwargs, expected):
+    command = ["sh", "-c", "echo out; echo err >&2"]
+
+    result = agent.execute_run(command, **kwargs)
+
+    expected.args = command
+    assert result is not None
+    assert (result.args, result.returncode, result.stdout, result.stderr) == (
+        expected.args,
+        expected.returncode,
+        expected.stdout,
+        expected.stderr,
+    )
+
+
+def test_execute_run_input(agent):
+    result = agent.execute_run(
+        ["cat"], input="text\r\n", capture_output=True, text=True
+    )
+
+    assert result is not None
+    assert result.stdout == "text\n"
+
+
+def test_execute_run_check(agent):
+    with pytest.raises(subprocess.CalledProcessError) as raised:
+        agent.execute_run(
+            ["sh", "-c", "echo out; exit 2"], capture_output=True, check=True
+        )
+
+    assert raised.value.returncode == 2
+    assert raised.value.stdout == b"out\n"
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"stdout": subprocess.PIPE},
+        {"capture_output": True, "stdout": subprocess.PIPE},
+        {"capture_output": True, "stdin": subprocess.PIPE},
+        {"capture_output": True, "env": {}},
+    ],
+)
+def test_execute_run_unsupported(agent, kwargs):
+    """Return None for arguments the agent cannot handle, such as no capture."""
+    assert agent.execute_run(["true"], **kwargs) is None
+
+
+def test_execute_run_not_running(agent):
+    agent.close()
+
+    assert agent.execute_run(["true"], capture_output=True) is None
+
+
+def test_agent_from_process():
+    """The agent can be used with any process that runs it."""
+    process = subprocess.Popen(
+        get_agent_command(), stdin=subprocess.PIPE, stdout=subprocess.PIPE
+    )
+    agent = ExecAgent(process)
+    try:
+        agent._receive()
+        assert agent.run(["echo", "hi"]) == (0, b"hi\n", b"")
+    finally:
+        agent.close()
+
+    assert process.returncode == 0
@@ -17,13 +17,17 @@
 
 import contextlib
 import hashlib
+import io
 import re
 import shutil
-from pathlib import Path
+import subprocess
+import tarfile
+from pathlib import Path, PurePosixPath
 
 import pytest
 from craft_providers.errors import ProviderError
-from craft_providers.executor import get_instance_name
+from craft_providers.executor import Executor, FileEntry, get_instance_name
+from craft_providers.util import dir_pull, dir_sync
 
 
 @pytest.fixture
@@ -52,6 +56,22 @@ def fake_executor_edit_file(fake_executor, tmp_path):
     return fake_executor
 
 
+@pytest.fixture
+def fake_executor_local_exec(fake_executor, fake_process):
+    """Provide an executor that runs commands in the host."""
+    fake_process.allow_unregistered(allow=True)
+
+    def execute_run(command, *, timeout=None, **kwargs):
+        return subprocess.run(command, timeout=timeout, **kwargs)  # noqa: PLW1510
+
+    def execute_popen(command, **kwargs):
+        return subprocess.Popen(command, **kwargs)
+
+    fake_executor.execute_run = execute_run
+    fake_executor.execute_popen = execute_popen
+    return fake_executor
+
+
 @pytest.fixture
 def mock_home_temp_file(mocker, tmp_path):
     """Mock `home_temporary_file()`."""
@@ -125,6 +145,226 @@ def test_temporarypull_temp_file_cleaned(
     assert not localfilepath.exists()
 
 
+def test_read_file(fake_executor_local_pull, tmp_path):
+    source = tmp_path / "src.txt"
+    source.write_bytes(b"content")
+
+    assert fake_executor_local_pull.read_file(source=source) == b"content"
+
+
+def test_read_file_missing(fake_executor_local_pull, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        fake_executor_local_pull.read_file(source=tmp_path / "missing.txt")
+
+
+@pytest.fixture
+def sync_source(tmp_path):
+    source = tmp_path / "source"
+    (source / "dir" / "empty").mkdir(parents=True)
+    (source / "same.txt").write_text("same")
+    (source / "changed.txt").write_text("new content")
+    (source / "dir" / "new.txt").write_text("new")
+    (source / "link").symlink_to("same.txt")
+    return source
+
+
+def test_sync_directory(fake_executor_local_exec, sync_source, tmp_path):
+    destination = tmp_path / "destination"
+    (destination / "stale-dir" / "empty").mkdir(parents=True)
+    (destination / "same.txt").write_text("same")
+    (destination / "changed.txt").write_text("old content")
+    (destination / "stale.txt").write_text("stale")
+    (destination / "stale-dir" / "stale.txt").write_text("stale")
+
+    fake_executor_local_exec.sync_directory(source=sync_source, destination=destination)
+
+    assert sorted(
+        path.relative_to(destination).as_posix() for path in destination.rglob("*")
+    ) == [
+        "changed.txt",
+        "dir",
+        "dir/empty",
+        "dir/new.txt",
+        "link",
+        "same.txt",
+    ]
+    assert (destination / "changed.txt").read_text() == "new content"
+    assert (destination / "dir" / "new.txt").read_text() == "new"
+    assert (destination / "link").readlink() == Path("same.txt")
+
+
+def test_sync_directory_transfers_changes_only(
+    fake_executor_local_exec, sync_source, tmp_path, mocker
+):
+    destination = tmp_path / "destination"
+    fake_executor_local_exec.sync_directory(source=sync_source, destination=destination)
+    (sync_source / "changed.txt").write_text("changed again")
+    spy = mocker.spy(dir_sync, "write_archive")
+
+    fake_executor_local_exec.sync_directory(source=sync_source, destination=destination)
+
+    assert spy.call_args.args[3] == ["changed.txt", "link"]
+    assert (destination / "changed.txt").read_text() == "changed again"
+
+
+def test_sync_directory_removed_directory(
+    fake_executor_local_exec, sync_source, tmp_path
+):
+    """A directory removed from the source is removed from the destination."""
+    destination = tmp_path / "destination"
+    fake_executor_local_exec.sync_directory(source=sync_source, destination=destination)
+    shutil.rmtree(sync_source / "dir")
+
+    fake_executor_local_exec.sync_directory(source=sync_source, destination=destination)
+
+    assert sorted(
+        path.relative_to(destination).as_posix() for path in destination.rglob("*")
+    ) == ["changed.txt", "link", "same.txt"]
+
+
+def test_sync_directory_missing_source(fake_executor, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        fake_executor.sync_directory(
+            source=tmp_path / "missing", destination=PurePosixPath("/root/project")
+        )
+
+
+def test_sync_directory_error(fake_executor, fake_process, tmp_path):
+    fake_process.register(
+        [
+            "fake-executor",
+            "sh",
+            "-c",
+            dir_sync.MANIFEST_SCRIPT,
+            "sh",
+            "/root/project",
+        ],
+        returncode=1,
+    )
+
+    with pytest.raises(ProviderError) as raised:
+        fake_executor.sync_directory(
+            source=tmp_path, destination=PurePosixPath("/root/project")
+        )
+
+    assert raised.value.brief == (
+        f"Failed to synchronize {str(tmp_path)!r} to '/root/project'."
+    )
+
+
+def test_pull_directory(fake_executor_local_exec, sync_source, tmp_path):
+    destination = tmp_path / "destination"
+
+    fake_executor_local_exec.pull_directory(source=sync_source, destination=destination)
+
+    assert sorted(
+        path.relative_to(destination).as_posix() for path in destination.rglob("*")
+    ) == ["changed.txt", "dir", "dir/empty", "dir/new.txt", "link", "same.txt"]
+    assert (destination / "dir" / "new.txt").read_text() == "new"
+    assert (destination / "link").readlink() == Path("same.txt")
+
+
+def test_pull_directory_missing_source(fake_executor_local_exec, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        fake_executor_local_exec.pull_directory(
+            source=tmp_path / "missing", destination=tmp_path / "destination"
+        )
+
+
+def test_pull_directory_error(fake_executor, fake_process, tmp_path):
+    fake_process.register(
+        [
+            "fake-executor",
+            "sh",
+            "-c",
+            dir_pull.ARCHIVE_SCRIPT,
+            "sh",
+            "/root/project",
+        ],
+        stdout=b"not an archive",
+        stderr=b"tar: error",
+        returncode=2,
+    )
+
+    with pytest.raises(ProviderError) as raised:
+        fake_executor.pull_directory(
+            source=PurePosixPath("/root/project"), destination=tmp_path
+        )
+
+    assert raised.value.brief == f"Failed to copy '/root/project' to {str(tmp_path)!r}."
+    assert raised.value.details is not None
+    assert "tar: error" in raised.value.details
+
+
+def test_pull_directory_invalid_archive(fake_executor, fake_process, tmp_path):
+    fake_process.register(
+        [
+            "fake-executor",
+            "sh",
+            "-c",
+            dir_pull.ARCHIVE_SCRIPT,
+            "sh",
+            "/root/project",
+        ],
+        stdout=b"not an archive",
+    )
+
+    with pytest.raises(ProviderError) as raised:
+        fake_executor.pull_directory(
+            source=PurePosixPath("/root/project"), destination=tmp_path
+        )
+
+    assert raised.value.brief == f"Failed to copy '/root/project' to {str(tmp_path)!r}."
+
+
+def test_pull_glob(fake_executor_local_exec, sync_source, tmp_path):
+    destination = tmp_path / "destination"
+    (sync_source / "with space.txt").write_text("space")
+
+    paths = fake_executor_local_exec.pull_glob(
+        source=sync_source,
+        patterns=["*.txt", "d*", "*.missing"],
+        destination=destination,
+    )
+
+    assert sorted(paths) == [
+        destination / "changed.txt",
+        destination / "dir" / "new.txt",
+        destination / "same.txt",
+        destination / "with space.txt",
+    ]
+    assert sorted(
+        path.relative_to(destination).as_posix() for path in destination.rglob("*")
+    ) == [
+        "changed.txt",
+        "dir",
+        "dir/empty",
+        "dir/new.txt",
+        "same.txt",
+        "with space.txt",
+    ]
+
+
+def test_pull_glob_no_match(fake_executor_local_exec, sync_source, tmp_path):
+    destination = tmp_path / "destination"
+
+    paths = fake_executor_local_exec.pull_glob(
+        source=sync_source, patterns=["*.missing"], destination=destination
+    )
+
+    assert paths == []
+    assert list(destination.iterdir()) == []
+
+
+def test_pull_glob_missing_source(fake_executor_local_exec, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        fake_executor_local_exec.pull_glob(
+            source=tmp_path / "missing",
+            patterns=["*"],
+            destination=tmp_path / "destination",
+        )
+
+
 def test_edit_file_ok(mock_home_temp_file, fake_executor_edit_file, tmp_path):
     """Edit an existing file."""
     source = tmp_path / "source.txt"
@@ -211,6 +451,93 @@ def test_edit_file_pushes_on_error(
     mock_home_temp_file.assert_called_once()
 
 
+def test_push_files(fake_executor, mocker):
+    """Files are streamed as one tar archive and extracted by a single command."""
+    mock_run = mocker.patch.object(fake_executor, "execute_run")
+    files = [
+        FileEntry(destination=PurePosixPath("/etc/environment"), content=b"A=B\n"),
+        FileEntry(
+            destination=PurePosixPath("/home/user/script.sh"),
+            content=b"#!/bin/sh\n",
+            file_mode="0755",
+            user="user",
+            group="users",
+        ),
+    ]
+
+    Executor.push_files(fake_executor, files)
+
+    mock_run.assert_called_once()
+    assert mock_run.call_args.args == (["tar", "-x", "-p", "-f", "-", "-C", "/"],)
+    archive = io.BytesIO(mock_run.call_args.kwargs["input"])
+    with tarfile.open(fileobj=archive) as tar:
+        members = tar.getmembers()
+        assert [
+            (m.name, m.mode, m.uname, m.gname, tar.extractfile(m).read())  # type: ignore[union-attr]
+            for m in members
+        ] == [
+            ("etc/environment", 0o644, "root", "root", b"A=B\n"),
+            ("home/user/script.sh", 0o755, "user", "users", b"#!/bin/sh\n"),
+        ]
+    assert fake_executor.records_of_push_file_io == []
+
+
+def test_push_files_empty(fake_executor, mocker):
+    """Nothing is run when there are no files."""
+    mock_run = mocker.patch.object(fake_executor, "execute_run")
+
+    Executor.push_files(fake_executor, [])
+
+    mock_run.assert_not_called()
+
+
+def test_push_files_no_tar(fake_executor, mocker):
+    """Files are pushed one at a time if tar is not available."""
+    mocker.patch.object(
+        fake_executor,
+        "execute_run",
+        side_effect=subprocess.CalledProcessError(127, ["tar"]),
+    )
+    files = [
+        FileEntry(destination=PurePosixPath("/etc/hostname"), content=b"host\n"),
+        FileEntry(destination=PurePosixPath("/etc/environment"), content=b"A=B\n"),
+    ]
+
+    Executor.push_files(fake_executor, files)
+
+    assert fake_executor.records_of_push_file_io == [
+        {
+            "destination": "/etc/hostname",
+            "content": b"host\n",
+            "file_mode": "0644",
+            "group": "root",
+            "user": "root",
+        },
+        {
+            "destination": "/etc/environment",
+            "content": b"A=B\n",
+            "file_mode": "0644",
+            "group": "root",
+            "user": "root",
+        },
+    ]
+
+
+def test_push_files_error(fake_executor, mocker):
+    """Raise a ProviderError if the files can't be extracted."""
+    mocker.patch.object(
+        fake_executor,
+        "execute_run",
+        side_effect=subprocess.CalledProcessError(2, ["tar"]),
+    )
+    files = [FileEntry(destination=PurePosixPath("/etc/hostname"), content=b"h\n")]
+
+    with pytest.raises(ProviderError) as raised:
+        Executor.push_files(fake_executor, files)
+
+    assert raised.value.brief == "Failed to create files '/etc/hostname'."
+
+
 @pytest.mark.parametrize(
     "name",
     [
@@ -175,3 +175,113 @@ def test_remove_simple_delete(fake_hookhelper):
     assert_instances_deleted(helper, instances)
     helper.delete_all_images.assert_called_once()
     helper.delete_project.assert_called_once()
+
+
+def test_configure_deletes_superseded_and_derived(fake_hookhelper):
+    """Superseded base instances and their derived instances are deleted."""
+    instances = [
+        {
+            "name": f"base-instance-{PROJECT_NAME}-buildd-base-v7-c-a839ea97c42df2065713",
+            "expanded_config": {
+                "image.description": f"base-instance-{PROJECT_NAME}-buildd-base-v7-craft-com.ubuntu.cloud-buildd-daily-core24",
+            },
+        },
+        {
+            "name": f"base-instance-{PROJECT_NAME}-buildd-base-v6-c-a839ea97c42df2065712",
+            "expanded_config": {
+                "image.description": f"base-instance-{PROJECT_NAME}-buildd-base-v6-craft-com.ubuntu.cloud-buildd-daily-core22",
+            },
+        },
+        {
+            "name": f"{PROJECT_NAME}-busybox-gadget-on-amd64-for-amd64-13389832",
+            "expanded_config": {
+                "image.description": f"base-instance-{PROJECT_NAME}-buildd-base-v6-craft-com.ubuntu.cloud-buildd-daily-core22",
+            },
+        },
+    ]
+    helper = fake_hookhelper(instances)
+
+    configure_hook(helper)
+
+    assert helper.delete_instance.call_count == 2
+    assert_instances_deleted(helper, instances[1:])
+
+
+def test_delete_instances_failure(fake_hookhelper):
+    """A failed deletion does not stop the others, and is reported at the end."""
+    instances = [
+        LXDInstance(name=f"instance-{i}", expanded_config={}) for i in range(3)
+    ]
+    helper = fake_hookhelper([])
+
+    def delete_instance(instance):
+        if instance.name == "instance-1":
+            raise HookError("Failed")
+
+    helper.delete_instance.side_effect = delete_instance
+
+    with pytest.raises(HookError, match=r"Failed to remove 1 of 3 LXD instances"):
+        helper.delete_instances(instances)
+
+    assert helper.delete_instance.call_count == 3
+
+
+@pytest.fixture
+def image_hookhelper(monkeypatch: pytest.MonkeyPatch):
+    def image_hookhelper(*, simulate, fail=()):
+        monkeypatch.setattr(HookHelper, "_check_project_exists", MagicMock())
+        monkeypatch.setattr(HookHelper, "_check_has_lxd", MagicMock())
+        helper = HookHelper(project_name=PROJECT_NAME, simulate=simulate, debug=True)
+
+        def fake_lxc(*args, **kwargs):
+            if args == ("image", "list"):
+                return [{"fingerprint": "i1"}, {"fingerprint": "i2"}]
+            if args[:2] == ("image", "delete") and args[2] in fail:
+                raise HookError(kwargs["fail_msg"])
+            return ""
+
+        monkeypatch.setattr(helper, "lxc", MagicMock(side_effect=fake_lxc))
+        return helper
+
+    return image_hookhelper
+
+
+def test_delete_all_images(image_hookhelper):
+    helper = image_hookhelper(simulate=False)
+
+    helper.delete_all_images()
+
+    helper.lxc.assert_has_calls(
+        [
+            call(
+                "image",
+                "delete",
+                fingerprint,
+                fail_msg=f"Failed to remove LXD image {fingerprint}.",
+                json_out=False,
+            )
+            for fingerprint in ("i1", "i2")
+        ],
+        any_order=True,
+    )
+
+
+def test_delete_all_images_simulate(image_hookhelper, capsys):
+    helper = image_hookhelper(simulate=True)
+
+    helper.delete_all_images()
+
+    assert helper.lxc.mock_calls == [call("image", "list")]
+    out = capsys.readouterr().out
+    assert f" > Removing image i1 in LXD {PROJECT_NAME} project..." in out
+    assert f" > Removing image i2 in LXD {PROJECT_NAME} project..." in out
+
+
+def test_delete_all_images_failure(image_hookhelper, capsys):
+    helper = image_hookhelper(simulate=False, fail={"i1"})
+
+    with pytest.raises(HookError, match=r"Failed to remove 1 of 2 LXD images"):
+        helper.delete_all_images()
+
+    assert helper.lxc.call_count == 3
+    assert " > Failed to remove i1 (" in capsys.readouterr().out
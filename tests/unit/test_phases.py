@@ -0,0 +1,116 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+
+import threading
+
+import pytest
+from craft_providers.phases import PhaseEmitter, PhaseEventType
+
+
+@pytest.fixture
+def emitter():
+    return PhaseEmitter()
+
+
+def test_phase_events(emitter):
+    events = []
+    emitter.add_phase_observer(events.append)
+
+    with emitter._phase("test"):
+        pass
+
+    start, end = events
+    assert (start.name, start.type, start.duration) == (
+        "test",
+        PhaseEventType.START,
+        None,
+    )
+    assert (end.name, end.type, end.failed) == ("test", PhaseEventType.END, False)
+    assert end.duration == end.timestamp - start.timestamp
+
+
+def test_phase_events_failed(emitter):
+    events = []
+    emitter.add_phase_observer(events.append)
+
+    with pytest.raises(RuntimeError), emitter._phase("test"):
+        raise RuntimeError("error")
+
+    assert [event.failed for event in events] == [False, True]
+
+
+def test_phase_observer_error(emitter):
+    events = []
+
+    def fail(event):
+        raise RuntimeError("error")
+
+    emitter.add_phase_observer(fail)
+    emitter.add_phase_observer(events.append)
+
+    with emitter._phase("test"):
+        pass
+
+    assert len(events) == 2
+
+
+def test_remove_phase_observer(emitter):
+    events = []
+    emitter.add_phase_observer(events.append)
+    emitter.remove_phase_observer(events.append)
+
+    with emitter._phase("test"):
+        pass
+
+    assert events == []
+    assert emitter.phase_observers == ()
+
+
+def test_remove_phase_observer_missing(emitter):
+    with pytest.raises(ValueError):  # noqa: PT011
+        emitter.remove_phase_observer(print)
+
+
+def test_phase_observers_per_object():
+    first, second = PhaseEmitter(), PhaseEmitter()
+
+    first.add_phase_observer(print)
+
+    assert first.phase_observers == (print,)
+    assert second.phase_observers == ()
+
+
+def test_phase_observers_concurrent(emitter):
+    """Observers added and removed from several threads are all kept."""
+    observers = [lambda event, i=i: i for i in range(200)]
+    kept = observers[::2]
+
+    def change(observer):
+        emitter.add_phase_observer(observer)
+        if observer not in kept:
+            emitter.remove_phase_observer(observer)
+
+    threads = [
+        threading.Thread(target=change, args=(observer,)) for observer in observers
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(emitter.phase_observers, key=observers.index) == kept
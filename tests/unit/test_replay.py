@@ -0,0 +1,275 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+import json
+import subprocess
+
+import pytest
+from craft_providers import replay
+from craft_providers.errors import ReplayError
+
+
+@pytest.fixture(autouse=True)
+def no_session(monkeypatch):
+    monkeypatch.setattr(replay, "_session", None)
+    monkeypatch.setattr(replay, "_env_checked", False)
+    monkeypatch.delenv(replay.RECORD_ENV, raising=False)
+    monkeypatch.delenv(replay.REPLAY_ENV, raising=False)
+    yield
+    replay.stop()
+
+
+def _write_recording(path, interactions):
+    path.write_text(
+        json.dumps(
+            {
+                "version": replay.RECORDING_VERSION,
+                "interactions": [item.to_dict() for item in interactions],
+            }
+        )
+    )
+    return path
+
+
+@pytest.fixture
+def recording(tmp_path):
+    return _write_recording(
+        tmp_path / "recording.json",
+        [
+            replay.Interaction(
+                name="lxc list",
+                command=["lxc", "list"],
+                returncode=0,
+                stdout="listing",
+                stderr="",
+            ),
+            replay.Interaction(
+                name="lxc start",
+                command=["lxc", "start", "local:test"],
+                returncode=1,
+                stdout=b"",
+                stderr=b"error",
+            ),
+            replay.Interaction(
+                name="lxc config set",
+                command=["lxc", "config", "set", "local:test", "timer", "1"],
+                returncode=0,
+            ),
+            replay.Interaction(
+                name="lxc exec",
+                command=["lxc", "exec", "local:test", "--", "cat", "/etc/hostname"],
+                returncode=0,
+                stdout=b"test\n",
+                stderr=b"",
+            ),
+            replay.Interaction(
+                name="lxd instances exists",
+                command=["default", "test"],
+                value=True,
+            ),
+        ],
+    )
+
+
+def test_get_session_disabled():
+    assert replay.get_session() is None
+    assert replay.wrap(subprocess.run, name="lxc list") is subprocess.run
+    assert replay.call(lambda: 42, name="answer", command=[]) == 42
+
+
+def test_get_session_record_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv(replay.RECORD_ENV, str(tmp_path / "recording.json"))
+
+    session = replay.get_session()
+
+    assert isinstance(session, replay.Recorder)
+    assert replay.stop() is session
+    assert replay.load(tmp_path / "recording.json") == []
+
+
+def test_get_session_replay_from_env(monkeypatch, recording):
+    monkeypatch.setenv(replay.REPLAY_ENV, str(recording))
+
+    session = replay.get_session()
+
+    assert isinstance(session, replay.Replayer)
+    assert session.path == recording
+
+
+def test_load_unsupported_version(tmp_path):
+    path = tmp_path / "recording.json"
+    path.write_text(json.dumps({"version": 0, "interactions": []}))
+
+    with pytest.raises(ReplayError, match="Unsupported recording"):
+        replay.load(path)
+
+
+def test_record_run(fake_process, tmp_path):
+    fake_process.register(["lxc", "list"], stdout="listing", stderr="warning")
+    recorder = replay.start_recording(tmp_path / "recording.json")
+
+    replay.wrap(subprocess.run, name="lxc list")(
+        ["lxc", "list"], capture_output=True, text=True
+    )
+    replay.stop()
+
+    [interaction] = replay.load(tmp_path / "recording.json")
+    assert interaction == recorder.interactions[0]
+    assert interaction.name == "lxc list"
+    assert interaction.command == ["lxc", "list"]
+    assert interaction.returncode == 0
+    assert interaction.stdout == "listing"
+    assert interaction.stderr == "warning"
+
+
+def test_record_run_error(fake_process):
+    fake_process.register(["lxc", "start"], stderr=b"error", returncode=1)
+    recorder = replay.start_recording()
+
+    with pytest.raises(subprocess.CalledProcessError):
+        replay.wrap(subprocess.run, name="lxc start")(
+            ["lxc", "start"], capture_output=True, check=True
+        )
+
+    [interaction] = recorder.interactions
+    assert interaction.returncode == 1
+    assert interaction.stderr == b"error"
+
+
+def test_record_popen(fake_process):
+    fake_process.register(["lxc", "exec"], stdout=[b"line 1", b"line 2"])
+    recorder = replay.start_recording()
+
+    process = replay.wrap(subprocess.Popen, name="lxc exec")(
+        ["lxc", "exec"], stdout=subprocess.PIPE
+    )
+    assert process.stdout is not None
+    assert list(process.stdout) == [b"line 1\n", b"line 2\n"]
+    process.wait()
+    process.wait()
+
+    [interaction] = recorder.interactions
+    assert interaction.returncode == 0
+    assert interaction.stdout == b"line 1\nline 2\n"
+    assert interaction.stderr is None
+
+
+def test_record_call():
+    recorder = replay.start_recording()
+
+    assert replay.call(lambda: True, name="lxd instances exists", command=["a"])
+
+    [interaction] = recorder.interactions
+    assert interaction.value is True
+    assert interaction.command == ["a"]
+
+
+def test_replay_run(fake_process, recording):
+    replayer = replay.start_replay(recording)
+
+    result = replay.wrap(subprocess.run, name="lxc list")(
+        ["lxc", "list"], capture_output=True, text=True
+    )
+
+    assert result.returncode == 0
+    assert result.stdout == "listing"
+    assert len(replayer.unused) == 4
+    # no command is run
+    assert not fake_process.calls
+
+
+def test_replay_run_error(fake_process, recording):
+    replay.start_replay(recording)
+    runner = replay.wrap(subprocess.run, name="lxc start")
+
+    with pytest.raises(subprocess.CalledProcessError) as raised:
+        runner(["lxc", "start", "local:test"], capture_output=True, check=True)
+
+    assert raised.value.returncode == 1
+    assert raised.value.stderr == b"error"
+
+
+def test_replay_run_similar_command(fake_process, recording):
+    """Commands with a different argument use a call of the same type."""
+    replayer = replay.start_replay(recording)
+
+    result = replay.wrap(subprocess.run, name="lxc config set")(
+        ["lxc", "config", "set", "local:test", "timer", "2"]
+    )
+
+    assert result.returncode == 0
+    assert [item.name for item in replayer.unused] == [
+        "lxc list",
+        "lxc start",
+        "lxc exec",
+        "lxd instances exists",
+    ]
+
+
+def test_replay_no_match(fake_process, recording):
+    replay.start_replay(recording)
+    runner = replay.wrap(subprocess.run, name="lxc list")
+    runner(["lxc", "list"])
+
+    with pytest.raises(ReplayError, match="No recorded call matches 'lxc list'"):
+        runner(["lxc", "list"])
+
+
+def test_replay_popen(fake_process, recording):
+    replay.start_replay(recording)
+
+    with replay.wrap(subprocess.Popen, name="lxc exec")(
+        ["lxc", "exec", "local:test", "--", "cat", "/etc/hostname"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    ) as process:
+        assert process.stdin is not None
+        process.stdin.write(b"ignored")
+        assert process.communicate() == (b"test\n", b"")
+
+    assert process.returncode == 0
+
+
+def test_replay_call(recording):
+    replay.start_replay(recording)
+
+    def _fail():
+        raise AssertionError("not called")
+
+    assert replay.call(_fail, name="lxd instances exists", command=["default", "test"])
+
+
+def test_round_trip(fake_process, tmp_path):
+    """A recorded session is replayed without running any command."""
+    fake_process.register(["lxc", "exec"], stdout=b"\x00binary\xff")
+    path = tmp_path / "recording.json"
+
+    def _session():
+        return replay.wrap(subprocess.run, name="lxc exec")(
+            ["lxc", "exec"], capture_output=True, check=True
+        )
+
+    replay.start_recording(path)
+    recorded = _session()
+    replay.stop()
+    replayer = replay.start_replay(path)
+    replayed = _session()
+
+    assert replayed.stdout == recorded.stdout == b"\x00binary\xff"
+    assert replayer.unused == []
+    assert len(fake_process.calls) == 1
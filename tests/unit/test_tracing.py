@@ -0,0 +1,157 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+
+import json
+import subprocess
+
+import pytest
+from craft_providers import tracing
+
+
+@pytest.fixture
+def no_tracer(monkeypatch):
+    monkeypatch.setattr(tracing, "_tracer", None)
+    monkeypatch.setattr(tracing, "_env_checked", False)
+
+
+def test_get_tracer_disabled(no_tracer, monkeypatch):
+    monkeypatch.delenv(tracing.TRACE_ENV, raising=False)
+
+    assert tracing.get_tracer() is None
+
+
+def test_get_tracer_from_env(no_tracer, monkeypatch, tmp_path):
+    monkeypatch.setenv(tracing.TRACE_ENV, str(tmp_path / "trace.json"))
+
+    tracer = tracing.get_tracer()
+
+    assert tracer is not None
+    assert tracer.path == tmp_path / "trace.json"
+    assert tracing.disable() is tracer
+    assert (tmp_path / "trace.json").exists()
+
+
+def test_traced_disabled(no_tracer, monkeypatch):
+    monkeypatch.delenv(tracing.TRACE_ENV, raising=False)
+
+    assert tracing.traced(subprocess.run, category="lxc", name="lxc list") is (
+        subprocess.run
+    )
+
+
+def test_traced_run(tracer, fake_process):
+    fake_process.register(["lxc", "list"], stdout="listing", stderr="warning")
+
+    tracing.traced(subprocess.run, category="lxc", name="lxc list")(
+        ["lxc", "list"], input="input", capture_output=True, text=True
+    )
+
+    [event] = tracer.events
+    assert event.category == "lxc"
+    assert event.name == "lxc list"
+    assert event.command == ["lxc", "list"]
+    assert event.instance is None
+    assert event.exit_code == 0
+    assert event.bytes_in == 5
+    assert event.bytes_out == 14
+
+
+def test_traced_run_error(tracer, fake_process):
+    fake_process.register(["lxc", "start"], stderr=b"error", returncode=1)
+    runner = tracing.traced(
+        subprocess.run, category="lxc", name="lxc start", instance="test-instance"
+    )
+
+    with pytest.raises(subprocess.CalledProcessError):
+        runner(["lxc", "start"], capture_output=True, check=True)
+
+    [event] = tracer.events
+    assert event.instance == "test-instance"
+    assert event.exit_code == 1
+    assert event.bytes_out == 5
+
+
+def test_traced_popen(tracer, fake_process):
+    fake_process.register(["lxc", "exec"], returncode=2)
+
+    process = tracing.traced(subprocess.Popen, category="lxc", name="lxc exec")(
+        ["lxc", "exec"]
+    )
+    process.wait()
+    process.wait()
+
+    [event] = tracer.events
+    assert event.exit_code == 2
+
+
+def test_span(tracer):
+    with tracing.span(category="snapd", name="snapd GET", command=["GET", "/"]) as span:
+        assert span is not None
+        span.exit_code = 200
+        span.add_bytes_out(3)
+        span.add_bytes_out(4)
+
+    [event] = tracer.events
+    assert event.exit_code == 200
+    assert event.bytes_in is None
+    assert event.bytes_out == 7
+
+
+def test_span_disabled(no_tracer, monkeypatch):
+    monkeypatch.delenv(tracing.TRACE_ENV, raising=False)
+
+    with tracing.span(category="snapd", name="snapd GET", command=["GET"]) as span:
+        assert span is None
+
+
+def test_summary(tracer):
+    for name in ["lxc list", "lxc exec", "lxc list"]:
+        with tracer.span(category="lxc", name=name, command=[]):
+            pass
+
+    summary = tracer.summary()
+
+    assert {name: calls.count for name, calls in summary.items()} == {
+        "lxc list": 2,
+        "lxc exec": 1,
+    }
+    assert summary["lxc list"].longest <= summary["lxc list"].total
+    assert tracer.format_summary().splitlines()[1].startswith("lxc list")
+
+
+def test_write(tracer, tmp_path):
+    with tracer.span(
+        category="lxc", name="lxc exec", command=["lxc", "exec"], instance="test"
+    ) as span:
+        span.exit_code = 0
+
+    tracer.write(tmp_path / "trace.json")
+
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    [event] = trace["traceEvents"]
+    assert event["name"] == "lxc exec"
+    assert event["cat"] == "lxc"
+    assert event["ph"] == "X"
+    assert event["ts"] >= 0
+    assert event["dur"] >= 0
+    assert event["args"] == {
+        "command": ["lxc", "exec"],
+        "instance": "test",
+        "exit_code": 0,
+    }
+    assert trace["otherData"]["lxc exec"]["count"] == 1
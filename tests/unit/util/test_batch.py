@@ -0,0 +1,115 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+"""Tests for running operations on batches of items."""
+
+import threading
+
+import pytest
+from craft_providers.util import batch
+
+
+def test_run_batch_empty():
+    result = batch.run_batch(pytest.fail, [])
+
+    assert result == batch.BatchResult(succeeded=[], failed=[])
+
+
+def test_run_batch_success():
+    done = []
+
+    result = batch.run_batch(done.append, range(20))
+
+    assert sorted(done) == list(range(20))
+    assert sorted(result.succeeded) == list(range(20))
+    assert result.failed == []
+    assert result.format_failures() == ""
+
+
+def test_run_batch_failures_do_not_abort():
+    error = ValueError("odd")
+
+    def operation(item):
+        if item % 2:
+            raise error
+
+    result = batch.run_batch(operation, range(6))
+
+    assert sorted(result.succeeded) == [0, 2, 4]
+    assert sorted(result.failed, key=lambda failure: failure[0]) == [
+        (1, error),
+        (3, error),
+        (5, error),
+    ]
+    assert sorted(result.format_failures().splitlines()) == [
+        "* 1: odd",
+        "* 3: odd",
+        "* 5: odd",
+    ]
+
+
+def test_run_batch_concurrency():
+    """Items are processed concurrently, up to max_workers at a time."""
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+    all_started = threading.Barrier(3, timeout=5)
+
+    def operation(item):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        all_started.wait()
+        with lock:
+            running -= 1
+
+    result = batch.run_batch(operation, range(9), max_workers=3)
+
+    assert peak == 3
+    assert sorted(result.succeeded) == list(range(9))
+
+
+def test_run_batch_progress():
+    calls = []
+    error = ValueError("fail")
+
+    def operation(item):
+        if item == "b":
+            raise error
+
+    def progress(item, error, done, total):
+        calls.append((threading.current_thread(), item, error, done, total))
+
+    batch.run_batch(operation, ["a", "b", "c"], progress=progress)
+
+    assert {call[0] for call in calls} == {threading.current_thread()}
+    assert [call[3:] for call in calls] == [(1, 3), (2, 3), (3, 3)]
+    assert sorted(call[1:3] for call in calls) == [
+        ("a", None),
+        ("b", error),
+        ("c", None),
+    ]
+
+
+def test_run_batch_base_exception():
+    """Errors that are not exceptions, like interrupts, are raised."""
+
+    def operation(item):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        batch.run_batch(operation, [1])
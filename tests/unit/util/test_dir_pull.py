@@ -0,0 +1,118 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+
+import io
+import tarfile
+
+import pytest
+from craft_providers.util import dir_pull
+
+
+def _archive(*members: tuple[tarfile.TarInfo, bytes]) -> io.BytesIO:
+    stream = io.BytesIO()
+    with tarfile.open(fileobj=stream, mode="w:gz") as tar:
+        for info, content in members:
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    stream.seek(0)
+    return stream
+
+
+@pytest.fixture(params=["data_filter", "fallback"])
+def extraction_filter(request, monkeypatch):
+    """Extract with `tarfile.data_filter`, or as if it was unavailable."""
+    if request.param == "fallback":
+        monkeypatch.delattr(tarfile, "data_filter")
+
+
+@pytest.mark.usefixtures("extraction_filter")
+def test_extract_archive(tmp_path):
+    directory = tarfile.TarInfo("./dir")
+    directory.type = tarfile.DIRTYPE
+    stream = _archive(
+        (directory, b""),
+        (tarfile.TarInfo("./dir/file.txt"), b"content"),
+    )
+
+    paths = dir_pull.extract_archive(stream, tmp_path / "destination")
+
+    assert paths == [tmp_path / "destination" / "dir" / "file.txt"]
+    assert paths[0].read_bytes() == b"content"
+
+
+@pytest.mark.usefixtures("extraction_filter")
+def test_extract_archive_absolute_member(tmp_path):
+    stream = _archive((tarfile.TarInfo("/file.txt"), b"content"))
+
+    paths = dir_pull.extract_archive(stream, tmp_path / "destination")
+
+    assert paths == [tmp_path / "destination" / "file.txt"]
+    assert paths[0].read_bytes() == b"content"
+
+
+@pytest.mark.usefixtures("extraction_filter")
+def test_extract_archive_unsafe_member(tmp_path):
+    stream = _archive((tarfile.TarInfo("../outside.txt"), b"content"))
+
+    with pytest.raises(tarfile.TarError):
+        dir_pull.extract_archive(stream, tmp_path / "destination")
+
+    assert not (tmp_path / "outside.txt").exists()
+
+
+@pytest.mark.usefixtures("extraction_filter")
+@pytest.mark.parametrize(
+    ("name", "linkname", "link_type"),
+    [
+        ("link", "../outside.txt", tarfile.SYMTYPE),
+        ("link", "/etc/passwd", tarfile.SYMTYPE),
+        ("dir/link", "../../outside.txt", tarfile.SYMTYPE),
+        ("link", "../outside.txt", tarfile.LNKTYPE),
+    ],
+)
+def test_extract_archive_unsafe_link(tmp_path, name, linkname, link_type):
+    link = tarfile.TarInfo(name)
+    link.type = link_type
+    link.linkname = linkname
+    stream = _archive((link, b""))
+
+    with pytest.raises(tarfile.TarError):
+        dir_pull.extract_archive(stream, tmp_path / "destination")
+
+    assert not (tmp_path / "destination" / name).exists()
+
+
+@pytest.mark.usefixtures("extraction_filter")
+def test_extract_archive_special_file(tmp_path):
+    fifo = tarfile.TarInfo("fifo")
+    fifo.type = tarfile.FIFOTYPE
+    stream = _archive((fifo, b""))
+
+    with pytest.raises(tarfile.TarError):
+        dir_pull.extract_archive(stream, tmp_path / "destination")
+
+
+@pytest.mark.usefixtures("extraction_filter")
+def test_extract_archive_clears_unsafe_mode(tmp_path):
+    info = tarfile.TarInfo("file.txt")
+    info.mode = 0o4777
+    stream = _archive((info, b"content"))
+
+    paths = dir_pull.extract_archive(stream, tmp_path / "destination")
+
+    assert paths[0].stat().st_mode & 0o7777 == 0o755
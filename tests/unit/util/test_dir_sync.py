@@ -0,0 +1,128 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+
+import hashlib
+import io
+import subprocess
+import tarfile
+
+import pytest
+from craft_providers.util import dir_sync
+
+
+def _sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+@pytest.fixture
+def source(tmp_path):
+    source = tmp_path / "source"
+    (source / "dir" / "empty").mkdir(parents=True)
+    (source / "file.txt").write_bytes(b"file")
+    (source / "dir" / "nested.txt").write_bytes(b"nested")
+    (source / "link").symlink_to("file.txt")
+    (source / "dir-link").symlink_to("dir")
+    return source
+
+
+def test_get_host_manifest(source):
+    manifest = dir_sync.get_host_manifest(source)
+
+    assert manifest.files == {
+        "file.txt": _sha256(b"file"),
+        "dir/nested.txt": _sha256(b"nested"),
+        "link": None,
+        "dir-link": None,
+    }
+    assert sorted(manifest.directories) == ["dir", "dir/empty"]
+
+
+def test_parse_manifest():
+    output = (
+        b"./a.txt\0./dir/b.txt\0./link\0\0"
+        b"./dir\0./dir/sub\0\0"
+        b"1111  ./a.txt\n"
+        b"2222  ./dir/b.txt\n"
+        b"\\3333  ./back\\\\slash\\nnewline\n"
+    )
+
+    paths, directories, hashes = dir_sync.parse_manifest(output)
+
+    assert paths == {"a.txt", "dir/b.txt", "link"}
+    assert directories == {"dir", "dir/sub"}
+    assert hashes == {
+        "a.txt": "1111",
+        "dir/b.txt": "2222",
+        "back\\slash\nnewline": "3333",
+    }
+
+
+@pytest.mark.parametrize("output", [b"", b"\0", b"\0\0"])
+def test_parse_manifest_empty(output):
+    assert dir_sync.parse_manifest(output) == (set(), set(), {})
+
+
+def test_parse_manifest_from_script(source):
+    """The manifest script output is parsed into the host manifest."""
+    proc = subprocess.run(
+        ["sh", "-c", dir_sync.MANIFEST_SCRIPT, "sh", str(source)],
+        capture_output=True,
+        check=True,
+    )
+
+    paths, directories, hashes = dir_sync.parse_manifest(proc.stdout)
+
+    assert paths == {"file.txt", "dir/nested.txt", "link", "dir-link"}
+    assert directories == {"dir", "dir/empty"}
+    assert hashes == {
+        "file.txt": _sha256(b"file"),
+        "dir/nested.txt": _sha256(b"nested"),
+    }
+
+
+def test_plan_sync():
+    manifest = dir_sync.Manifest(
+        files={"same": "1", "changed": "2", "new": "3", "link": None},
+        directories=["dir"],
+    )
+
+    plan = dir_sync.plan_sync(
+        manifest,
+        {"same", "changed", "link", "stale", "old/stale"},
+        {"dir", "old", "old/sub", "old/sub/deeper", "other"},
+        {"same": "1", "changed": "0", "stale": "4", "old/stale": "5"},
+    )
+
+    assert plan == dir_sync.SyncPlan(
+        transfer=["changed", "link", "new"],
+        delete=["old/stale", "stale"],
+        delete_directories=["old/sub/deeper", "old/sub", "old", "other"],
+    )
+
+
+def test_write_archive(source):
+    stream = io.BytesIO()
+
+    dir_sync.write_archive(stream, source, ["dir"], ["dir/nested.txt", "link"])
+
+    stream.seek(0)
+    with tarfile.open(fileobj=stream, mode="r:gz") as tar:
+        members = {member.name: member for member in tar.getmembers()}
+        assert list(members) == ["dir", "dir/nested.txt", "link"]
+        assert members["dir"].isdir()
+        assert members["link"].issym()
+        assert members["link"].linkname == "file.txt"
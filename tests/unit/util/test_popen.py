@@ -0,0 +1,93 @@
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+#
+"""Tests for streaming data to or from a running process."""
+
+import subprocess
+
+import pytest
+from craft_providers.util import popen
+
+
+def _start(script):
+    return subprocess.Popen(
+        ["sh", "-c", script],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+
+def test_streaming_stdin():
+    process = _start("cat >&2; exit 3")
+
+    with popen.streaming(process) as result:
+        process.stdin.write(b"content")
+
+    assert result == popen.StreamResult(returncode=3, stderr=b"content")
+
+
+def test_streaming_stdout():
+    process = _start("echo content; echo error >&2")
+
+    with popen.streaming(process) as result:
+        output = process.stdout.read()
+
+    assert output == b"content\n"
+    assert result == popen.StreamResult(returncode=0, stderr=b"error\n")
+
+
+def test_streaming_drains_stderr():
+    """The process does not block on stderr while its stdin is written."""
+    process = _start("head -c 1048576 /dev/zero >&2; cat >/dev/null")
+
+    with popen.streaming(process) as result:
+        process.stdin.write(bytes(1024 * 1024))
+
+    assert result.returncode == 0
+    assert len(result.stderr) == 1024 * 1024
+
+
+def test_streaming_broken_pipe():
+    process = _start("echo error >&2; exit 1")
+
+    with popen.streaming(process) as result:
+        process.wait()
+        process.stdin.write(bytes(1024 * 1024))
+        process.stdin.flush()
+
+    assert result == popen.StreamResult(returncode=1, stderr=b"error\n")
+
+
+def test_streaming_error_kills_process():
+    process = _start("exec sleep 10")
+
+    with pytest.raises(ValueError, match="boom"), popen.streaming(process):
+        raise ValueError("boom")
+
+    assert process.returncode is not None
+
+
+def test_streaming_timeout_kills_process():
+    process = _start("exec sleep 10")
+
+    with (
+        pytest.raises(subprocess.TimeoutExpired),
+        popen.streaming(process, timeout=0.1),
+    ):
+        pass
+
+    assert process.returncode is not None
@@ -146,3 +146,87 @@ def test_retry_until_timeout_times_out_deterministic_branches(
     assert mock_function.mock_calls == expected_func_calls
     assert monotonic_mock.call_count == len(monotonic_values)
     assert mock_instant_sleep.sleep.mock_calls == expected_sleep_calls
+
+
+def test_fixed_delay():
+    delays = retry.FixedDelay(0.5).delays()
+
+    assert [next(delays) for _ in range(3)] == [0.5, 0.5, 0.5]
+
+
+def test_exponential_backoff():
+    policy = retry.ExponentialBackoff(initial=0.1, maximum=1.0, jitter=0)
+    delays = policy.delays()
+
+    assert [next(delays) for _ in range(6)] == pytest.approx(
+        [0.1, 0.2, 0.4, 0.8, 1.0, 1.0]
+    )
+
+
+def test_exponential_backoff_initial_over_maximum():
+    delays = retry.ExponentialBackoff(initial=2.0, maximum=1.0, jitter=0).delays()
+
+    assert next(delays) == 1.0
+
+
+def test_exponential_backoff_jitter():
+    """The jitter shortens each wait by up to the given fraction."""
+    policy = retry.ExponentialBackoff(initial=1.0, maximum=1.0, jitter=0.5)
+    delays = policy.delays()
+
+    waits = [next(delays) for _ in range(100)]
+
+    assert all(0.5 <= wait <= 1.0 for wait in waits)
+    assert len(set(waits)) > 1
+
+
+def test_fast_then_slow():
+    policy = retry.FastThenSlow(fast_delay=0.1, fast_attempts=2, slow_delay=1.0)
+    delays = policy.delays()
+
+    assert [next(delays) for _ in range(4)] == [0.1, 0.1, 1.0, 1.0]
+
+
+def test_retry_until_timeout_policy(monkeypatch, mock_instant_sleep):
+    """Wait according to the policy before each retry."""
+    monkeypatch.setattr("time.monotonic", mock.Mock(return_value=0))
+    mock_function = mock.Mock(side_effect=[Exception(), Exception(), Exception(), 42])
+    policy = retry.ExponentialBackoff(initial=0.1, maximum=0.3, jitter=0)
+
+    assert retry.retry_until_timeout(10, policy, mock_function) == 42
+
+    assert mock_instant_sleep.sleep.mock_calls == [
+        mock.call(0.1),
+        mock.call(0.2),
+        mock.call(0.3),
+    ]
+
+
+def test_retry_until_timeout_stats(monkeypatch, mock_instant_sleep):
+    monkeypatch.setattr("time.monotonic", mock.Mock(return_value=0))
+    mock_function = mock.Mock(side_effect=[Exception(), Exception(), 42])
+    stats = retry.RetryStats()
+
+    retry.retry_until_timeout(10, 0.5, mock_function, stats=stats)
+
+    assert stats.attempts == 3
+    assert stats.succeeded
+    assert stats.wait_time == 1.0
+    assert stats.elapsed >= sum(stats.latencies)
+    assert str(stats).startswith("succeeded after 3 attempt(s) in ")
+
+
+def test_retry_until_timeout_stats_timeout(monkeypatch, mock_instant_sleep):
+    monkeypatch.setattr("time.monotonic", mock.Mock(side_effect=[0, 1, 2, 10]))
+    mock_function = mock.Mock(side_effect=Exception())
+    stats = retry.RetryStats()
+
+    with pytest.raises(TimeoutError):
+        retry.retry_until_timeout(
+            5, 1.0, mock_function, error=TimeoutError(), stats=stats
+        )
+
+    assert stats.attempts == 2
+    assert not stats.succeeded
+    assert stats.wait_time == 1.0
+    assert str(stats).startswith("failed after 2 attempt(s) in ")